@@ -4,15 +4,25 @@
 
 __version__ = "21.9+dev1"
 
+import argparse
 import os
+import pstats
+import random
+import shutil
+import socket
+import statistics
 import subprocess
 import sys
+import tempfile
 import textwrap
+import threading
 import time
+from contextlib import ExitStack
 from dataclasses import dataclass, replace
 from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple, Union
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
 
 import click
 import cloup
@@ -21,10 +31,62 @@
 from cloup import HelpFormatter, HelpTheme
 
 from blackbench import resources
+from blackbench.counting import BACKENDS, count_instructions, detect_backend, probe_perf
+from blackbench.formats import (
+    COMPRESSIONS,
+    append_to_stream,
+    dump_compact,
+    load_results,
+    read_stream,
+    stream_path,
+)
+from blackbench.history import ResultsStore
+from blackbench.hooks import (
+    GC_MODES,
+    PERF_EVENTS,
+    GCMetricsHook,
+    GCModeHook,
+    PerfCountersHook,
+    WorkerHook,
+)
+from blackbench.host import HostInfo, fingerprint, measure_noise, stability_hints
+from blackbench.interpreters import (
+    Interpreter,
+    black_build,
+    black_venv,
+    default_cache_dir,
+    is_compiled,
+    probe_interpreter,
+    tag_interpreters,
+)
+from blackbench.mining import count_tokens, generate_candidates, time_formatting
+from blackbench.modes import expand_mode_matrix, mode_configs
+from blackbench.profiling import diff_stats, profile_benchmark
+from blackbench.reduction import FormattingTimer, reduce_source
+from blackbench.report import write_report
 from blackbench.resources import FormatTask, Target, Task
-from blackbench.utils import err, log, managed_workdir, warn
+from blackbench.stats import (
+    compare_suites,
+    geometric_mean,
+    latency_percentiles,
+    scaling_exponent,
+    summarize_suite,
+)
+from blackbench.utils import err, format_value, log, managed_workdir, print_table, warn
+from blackbench.workqueue import (
+    HEARTBEAT_INTERVAL,
+    HOST_KEYS,
+    Job,
+    WorkQueue,
+    group_by_host,
+)
 
 THIS_DIR = Path(__file__).parent
+F = TypeVar("F", bound=Callable)
+LINE_LENGTHS = (40, 60, 79, 88, 100, 120, 160, 200)
+TARGET_GROUPS = ("micro", "normal", "stress", "all")
+# Below this the slowdown is likely just noise, see `blackbench reduce`.
+MIN_REDUCIBLE_SLOWDOWN = 0.05
 
 
 # ============ #
@@ -34,21 +96,135 @@
 
 @dataclass(init=False)
 class Benchmark:
-    def __init__(self, task: Task, target: Target) -> None:
-        self.name = f"{task.name}-{target.name}"
-        self.code = task.create_benchmark_script(self.name, target)
+    def __init__(
+        self,
+        task: Task,
+        target: Target,
+        hooks: Sequence[WorkerHook] = (),
+        interpreter: Optional[Interpreter] = None,
+    ) -> None:
+        tags = [hook.tag for hook in hooks if hook.tag]
+        if isinstance(task, FormatTask) and task.mode_tag:
+            tags.insert(0, task.mode_tag)
+        if interpreter is not None and interpreter.tag:
+            tags.insert(0, interpreter.tag)
+        self.variant = ",".join(tags)
+        self.name = (
+            f"{task.name}[{self.variant}]-{target.name}" if tags else f"{task.name}-{target.name}"
+        )
+        prologue = "".join(hook.render() + "\n\n" for hook in hooks)
+        self.code = prologue + task.create_benchmark_script(self.name, target)
         self.micro = target.micro
         self.description = f"{task.description} + {target.description}"
         self.task = task
         self.target = target
+        self.hooks = hooks
+        self.interpreter = interpreter
+        self.python = interpreter.path if interpreter else sys.executable
+
+
+def benchmark_metadata(bm: Benchmark, black_version: str, black_compiled: bool) -> Dict[str, str]:
+    # fmt: off
+    metadata = {
+        "description": bm.description,
+        "blackbench-version": __version__,
+        "black-version": black_version,
+        "black-build": black_build(black_compiled),
+        "task": bm.task.name,
+        "target-group": "micro" if bm.micro else "stress" if bm.target.stress else "normal",
+    }
+    # fmt: on
+    if bm.variant:
+        metadata["variant"] = bm.variant
+    if isinstance(bm.task, FormatTask) and bm.task.mode_tag:
+        metadata["format-config"] = bm.task.custom_mode
+    return metadata
+
+
+def latency_metadata(result: pyperf.Benchmark) -> Dict[str, float]:
+    """The percentiles of a benchmark whose values are single calls, see Task.latency."""
+    percentiles = latency_percentiles(result.get_values())
+    return {f"latency-{p}": value for p, value in percentiles.items()}
+
+
+def format_latencies(metadata: Dict[str, float]) -> str:
+    latencies = ", ".join(
+        f"{key.replace('latency-', '')} {format_value(value)}" for key, value in metadata.items()
+    )
+    return f"Latency per call: {latencies}."
+
+
+# The user's own --processes / --values, if any (see run_capped).
+RUN_COUNTS_PARSER = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+RUN_COUNTS_PARSER.add_argument("-p", "--processes", type=int)
+RUN_COUNTS_PARSER.add_argument("-n", "--values", type=int)
+
+
+def run_capped(
+    cmd: List[str], result_file: Path, pyperf_args: Sequence[str], max_time: float
+) -> None:
+    """
+    Run a benchmark (`cmd` being the interpreter and script) in about `max_time` seconds.
+
+    A single timed call estimates how many worker processes fit in the time budget and
+    pyperf is told to spawn no more than that (the number of processes in `pyperf_args`
+    is only ever lowered). If not even one fits, or the full run runs out of time anyway,
+    the value of that single call is all that's kept.
+    """
+    probe_file = result_file.with_suffix(".probe.json")
+    # --debug-single-value is ignored with --fast or --rigorous.
+    base_args = [arg for arg in pyperf_args if arg not in ("--fast", "--rigorous")]
+    counts, other_args = RUN_COUNTS_PARSER.parse_known_args(base_args)
+    t0 = time.perf_counter()
+    probe_cmd = [*cmd, "--output", str(probe_file), *base_args, "--debug-single-value"]
+    subprocess.run(probe_cmd, check=True)
+    elapsed = time.perf_counter() - t0
+    value = pyperf.Benchmark.loads(probe_file.read_text(encoding="utf8")).get_values()[0]
+
+    # Start from what pyperf would do, values are calibrated to take at least 100ms.
+    # --fast and --rigorous take precedence over --processes / --values, as in pyperf.
+    processes, values = counts.processes or 20, counts.values or 3
+    if "--fast" in pyperf_args:
+        processes, values = 10, 2
+    elif "--rigorous" in pyperf_args:
+        processes = 40
+    per_value = max(value, 0.1)
+    startup = max(elapsed - value, 0.0)
+    remaining = max_time - elapsed
+    # Loop calibration costs about one more value (and process) on top.
+    fits = int((remaining - per_value - startup) // ((1 + values) * per_value + startup))
+    if fits < 1:
+        warn("Only timed a single call since a full run wouldn't fit in --max-time.")
+        probe_file.replace(result_file)
+        return
+
+    args = list(pyperf_args)
+    if fits < processes:
+        log(f"Capping to {fits} processes (instead of {processes}) to fit in --max-time.")
+        args = [*other_args, "--processes", str(fits), "--values", str(values)]
+    try:
+        subprocess.run([*cmd, "--output", str(result_file), *args], check=True, timeout=remaining)
+    except subprocess.TimeoutExpired:
+        warn("Ran out of --max-time, only keeping the single call timed upfront.")
+        if result_file.exists():
+            result_file.unlink()
+        probe_file.replace(result_file)
 
 
 def run_suite(
-    benchmarks: List[Benchmark], pyperf_args: Sequence[str], workdir: Path
+    benchmarks: List[Benchmark],
+    pyperf_args: Sequence[str],
+    workdir: Path,
+    stream: Path,
+    max_time: Optional[float] = None,
 ) -> Tuple[Optional[pyperf.BenchmarkSuite], bool]:
+    """
+    Run the benchmarks, appending each result to `stream` as soon as it's available.
+    The results are only read back (and consolidated into a suite) at the very end.
+    Every benchmark is capped to `max_time` seconds (roughly) if given.
+    """
     import black
 
-    results: List[pyperf.Benchmark] = []
     errored = False
     for i, bm in enumerate(benchmarks, start=1):
         bm_type = f"{'micro' if bm.micro else ''}benchmark"
@@ -58,10 +234,13 @@ def run_suite(
         script.write_text(bm.code, encoding="utf8")
         result_file = workdir / f"{i}.json"
 
-        cmd = [sys.executable, str(script), "--output", str(result_file), *pyperf_args]
         t0 = time.perf_counter()
         try:
-            subprocess.run(cmd, check=True)
+            if max_time is not None:
+                run_capped([bm.python, str(script)], result_file, pyperf_args, max_time)
+            else:
+                cmd = [bm.python, str(script), "--output", str(result_file), *pyperf_args]
+                subprocess.run(cmd, check=True)
         except subprocess.CalledProcessError:
             err("Failed to run benchmark ^^^")
             errored = True
@@ -70,19 +249,220 @@ def run_suite(
             log(f"Took {round(t1 - t0, 3)} seconds.", bold=True)
 
             result = pyperf.Benchmark.loads(result_file.read_text(encoding="utf8"))
-            # fmt: off
-            result.update_metadata({
-                "description": bm.description,
-                "blackbench-version": __version__,
-                "black-version": black.__version__
-            })
-            # fmt: on
-            results.append(result)
-    else:
-        if results:
-            return pyperf.BenchmarkSuite(results), errored
+            if bm.interpreter is not None:
+                black_version, compiled = (
+                    bm.interpreter.black_version,
+                    bm.interpreter.black_compiled,
+                )
+            else:
+                black_version, compiled = black.__version__, is_compiled(black)
+            result.update_metadata(benchmark_metadata(bm, black_version, compiled))
+            if bm.task.latency:
+                latencies = latency_metadata(result)
+                result.update_metadata(latencies)
+                log(format_latencies(latencies))
+            for hook in bm.hooks:
+                metadata = hook.collect(script)
+                result.update_metadata(metadata)
+                summary = hook.summarize(metadata)
+                if summary:
+                    log(summary)
+            append_to_stream(stream, result)
+
+    suite = read_stream(stream) if stream.exists() else None
+    return suite, errored or suite is None
+
+
+def run_job(
+    job: Job, pyperf_args: Sequence[str], workdir: Path
+) -> Tuple[Optional[pyperf.Benchmark], str]:
+    """Run a queued benchmark job, returning its result or why it failed."""
+    import black
+
+    script = workdir / f"{job.id}.py"
+    script.write_text(job.code, encoding="utf8")
+    result_file = workdir / f"{job.id}.json"
+    cmd = [sys.executable, str(script), "--output", str(result_file), *pyperf_args]
+    try:
+        subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError as e:
+        return None, f"benchmark exited with code {e.returncode}"
+
+    result = pyperf.Benchmark.loads(result_file.read_text(encoding="utf8"))
+    # The worker's version of Black is what was measured, not the coordinator's.
+    # fmt: off
+    result.update_metadata({
+        **job.metadata,
+        "black-version": black.__version__, "black-build": black_build(is_compiled(black)),
+    })
+    # fmt: on
+    task = resources.tasks.get(job.metadata.get("task", ""))
+    if task is not None and task.latency:
+        result.update_metadata(latency_metadata(result))
+    return result, ""
+
+
+def print_suite_summary(suite: pyperf.BenchmarkSuite) -> None:
+    """Print the suite's summaries, also storing them as metadata of every benchmark."""
+    log("Suite summary (geometric mean of the benchmark means, 95% CI):", bold=True)
+    for summary in summarize_suite(suite):
+        geomean = format_value(summary.geomean, summary.unit)
+        low = format_value(summary.low, summary.unit)
+        high = format_value(summary.high, summary.unit)
+        click.echo(f"    {summary.group} ({summary.count}): {geomean} [{low} - {high}]")
+        for bm in suite.get_benchmarks():
+            bm.update_metadata(summary.as_metadata())
+
+
+def print_variant_comparison(benchmarks: List[Benchmark], suite: pyperf.BenchmarkSuite) -> None:
+    """Compare the variants of every task + target pair against the first one run."""
+    means = {bm.get_name(): bm.mean() for bm in suite.get_benchmarks()}
+    units = {bm.get_name(): bm.get_unit() for bm in suite.get_benchmarks()}
+    groups: Dict[Tuple[str, str], List[Benchmark]] = {}
+    for bm in benchmarks:
+        if bm.name in means:
+            groups.setdefault((bm.task.name, bm.target.name), []).append(bm)
+
+    rows = [["Benchmark", "Variant", "Mean", "Change"]]
+    for (task_name, target_name), variants in groups.items():
+        reference = means[variants[0].name]
+        for bm in variants:
+            change = "" if bm is variants[0] else f"{means[bm.name] / reference - 1:+.1%}"
+            mean = format_value(means[bm.name], units[bm.name])
+            rows.append([f"{task_name}-{target_name}", bm.variant or "default", mean, change])
+    print_table(rows)
+
+
+def print_line_length_scaling(
+    benchmarks: List[Benchmark],
+    line_lengths: Dict[str, int],
+    suite: pyperf.BenchmarkSuite,
+    reference: int,
+    threshold: float,
+) -> List[str]:
+    """
+    Print the runtime of every target at each line length relative to the reference line
+    length, and the fitted scaling exponent. Returns the targets that are more than
+    `threshold` times slower at their narrowest than at the reference line length.
+    """
+    means = {bm.get_name(): bm.mean() for bm in suite.get_benchmarks()}
+    targets: Dict[str, Dict[int, float]] = {}
+    for bm in benchmarks:
+        if bm.name in means:
+            targets.setdefault(bm.target.name, {})[line_lengths[bm.name]] = means[bm.name]
+
+    columns = sorted(set(line_lengths.values()))
+    rows = [["Target", *(f"ll={n}" for n in columns), "Exponent"]]
+    pathological = []
+    for target_name, by_length in targets.items():
+        row = [target_name]
+        for length in columns:
+            if length not in by_length or reference not in by_length:
+                row.append("-")
+            else:
+                row.append(f"{by_length[length] / by_length[reference]:.2f}x")
+        lengths = sorted(by_length)
+        if len(lengths) > 1:
+            row.append(f"{scaling_exponent(lengths, [by_length[n] for n in lengths]):+.2f}")
         else:
-            return None, True
+            row.append("-")
+        rows.append(row)
+        if reference in by_length and by_length[lengths[0]] / by_length[reference] > threshold:
+            pathological.append(target_name)
+    print_table(rows)
+    return pathological
+
+
+def check_host(noise_check: str, noise_threshold: float) -> HostInfo:
+    """Fingerprint the host and (unless disabled) make sure it's quiet enough."""
+    host_info = fingerprint()
+    details = ", ".join(f"{key[5:]}: {value}" for key, value in host_info.items())
+    log(f"Host: {details}")
+    if noise_check == "off":
+        return host_info
+
+    noise = measure_noise()
+    host_info["host-noise"] = round(noise, 4)
+    if noise <= noise_threshold:
+        log(f"Host noise: {noise:.1%} (threshold: {noise_threshold:.1%}).")
+        return host_info
+
+    hints = stability_hints(host_info)
+    message = (
+        f"Host noise is {noise:.1%}, above the {noise_threshold:.1%} threshold"
+        + (f" ({'; '.join(hints)})" if hints else "")
+        + ". Consider tuning the system with `pyperf system tune`."
+    )
+    if noise_check == "refuse":
+        err(message)
+        sys.exit(2)
+    warn(message)
+    return host_info
+
+
+def run_and_dump(
+    benchmarks: List[Benchmark],
+    pyperf_args: Sequence[str],
+    dump_path: Path,
+    *,
+    metadata: Dict[str, Union[int, float, str]],
+    store: Optional[Path],
+    config: Dict[str, Any],
+    max_time: Optional[float] = None,
+) -> Tuple[Optional[pyperf.BenchmarkSuite], bool]:
+    """
+    Run the benchmarks, summarize the results, and dump them (also recording them into
+    the history store if given). `metadata` is added to every benchmark.
+    """
+    stream = stream_path(dump_path)
+    if stream.exists():
+        warn(
+            f"Results of an interrupted run are still in `{stream}`, they can be"
+            f" recovered with `blackbench consolidate {stream}`."
+        )
+        click.confirm("[*] Do you want to discard them and continue?", abort=True)
+        stream.unlink()
+
+    with managed_workdir() as workdir:
+        log("Alright, let's start!", fg="green", bold=True)
+        log(f"Results are streamed to `{stream}` as they come in.")
+        suite_results, errored = run_suite(benchmarks, pyperf_args, workdir, stream, max_time)
+
+    if not suite_results:
+        err("No results were collected.")
+        return None, errored
+
+    for result in suite_results.get_benchmarks():
+        result.update_metadata(metadata)
+    print_suite_summary(suite_results)
+    if any(bm.variant for bm in benchmarks):
+        log("Variant comparison (relative to the first variant of each benchmark):", bold=True)
+        print_variant_comparison(benchmarks, suite_results)
+    suite_results.dump(str(dump_path), replace=True)
+    if not errored:
+        log("Results dumped.")
+    else:
+        warn("Results dumped (at least one benchmark is missing due to failure).")
+    stream.unlink()
+    if store:
+        record_results(store, suite_results, config)
+    return suite_results, errored
+
+
+def confirm_overwrite(dump_path: Path) -> None:
+    if dump_path.exists():
+        try:
+            pretty_dump_path = dump_path.relative_to(os.getcwd())
+        except ValueError:
+            pretty_dump_path = dump_path
+        warn(f"A file / directory already exists at `{pretty_dump_path}`.")
+        click.confirm("[*] Do you want to overwrite and continue?", abort=True)
+
+
+def record_results(store: Path, suite: pyperf.BenchmarkSuite, config: Dict[str, Any]) -> None:
+    with ResultsStore(store) as results_store:
+        results_store.record_suite(suite, config)
+    log(f"Results recorded in history store `{store}`.")
 
 
 # ================= #
@@ -90,12 +470,12 @@ def run_suite(
 # ================= #
 
 
-def check_pyperf_args(args: Sequence[str]) -> None:
+def check_pyperf_args(args: Sequence[str], python: str = sys.executable) -> None:
     benchmark = Path(THIS_DIR, "misc", "dummy-benchmark.py")
     try:
         # fmt: off
         subprocess.run(
-            [sys.executable, str(benchmark), "--processes", "1", "--loops", "1", *args],
+            [python, str(benchmark), "--processes", "1", "--loops", "1", *args],
             check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf8"
         )
         # fmt: on
@@ -106,6 +486,46 @@ def check_pyperf_args(args: Sequence[str]) -> None:
         sys.exit(2)
 
 
+# pyperf's --loops, abbreviations included (see check_latency_loops).
+LOOPS_PARSER = argparse.ArgumentParser(add_help=False)
+LOOPS_PARSER.add_argument("-l", "--loops", type=int)
+
+
+def check_latency_loops(tasks: Sequence[Task], args: Sequence[str]) -> None:
+    # The latency percentiles assume every value is a single call.
+    latency_tasks = [task.name for task in tasks if task.latency]
+    loops = LOOPS_PARSER.parse_known_args(args)[0].loops
+    if latency_tasks and loops not in (None, 1):
+        err(f"The `{latency_tasks[0]}` task times every call on its own, --loops can't be used.")
+        sys.exit(2)
+
+
+def check_worker_hooks(hooks: Sequence[WorkerHook], python: str = sys.executable) -> None:
+    # Hooks can only be combined with different hooks (the patched functions would
+    # otherwise recurse), so each benchmark variant has to be checked separately.
+    if not hooks:
+        return
+
+    benchmark = Path(THIS_DIR, "misc", "dummy-benchmark.py")
+    prologue = "".join(hook.render() + "\n\n" for hook in hooks)
+    with tempfile.TemporaryDirectory(prefix="blackbench-") as tmpdir:
+        script = Path(tmpdir, "hooks-check.py")
+        script.write_text(prologue + benchmark.read_text("utf8"), encoding="utf8")
+        try:
+            # fmt: off
+            subprocess.run(
+                [python, str(script), "--processes", "1", "--loops", "1", "--values", "1",
+                 "--warmups", "0"],
+                check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf8"
+            )
+            # fmt: on
+        except subprocess.CalledProcessError as e:
+            err("The benchmark instrumentation (eg. --perf-counters) doesn't work here:")
+            pretty = textwrap.indent(e.stdout.strip(), " " * 4)
+            click.secho(pretty)
+            sys.exit(2)
+
+
 def check_mode_config(config: str) -> None:
     import black
 
@@ -165,22 +585,25 @@ def convert(
         self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
     ) -> str:
         normalized = value.casefold()
-        if normalized in ("all", "normal", "micro") or normalized in resources.targets.keys():
+        if normalized in TARGET_GROUPS or normalized in resources.targets.keys():
+            return normalized
+        if any(name.startswith(f"{normalized}/") for name in resources.targets.keys()):
             return normalized
 
         self.fail(
-            f"'{normalized}' is not one of the target groups (micro, normal, and all)"
-            " nor the ID of a specific target (run 'blackbench info' for a list)."
+            f"'{normalized}' is not one of the target groups (micro, normal, stress, all, or"
+            " a directory like stubs) nor the ID of a specific target (run 'blackbench info'"
+            " for a list)."
         )
 
     def get_metavar(self, param: click.Parameter) -> str:  # pragma: no cover
-        return "[$target-name|micro|normal|all]"
+        return "[$target-name|micro|normal|stress|all]"
 
     def shell_complete(
         self, ctx: click.Context, param: click.Parameter, incomplete: str
     ) -> List[CompletionItem]:  # pragma: no cover
         items = [CompletionItem(t.name, help=t.description) for t in resources.targets.values()]
-        items.extend(CompletionItem(group) for group in ("micro", "normal", "all"))
+        items.extend(CompletionItem(group) for group in TARGET_GROUPS)
         return items
 
 
@@ -193,15 +616,206 @@ def targets_callback(
             selected.extend(resources.micro_targets)
         elif specifier == "normal":
             selected.extend(resources.normal_targets)
+        elif specifier == "stress":
+            selected.extend(resources.stress_targets)
         elif specifier == "all":
-            selected.extend(resources.targets.values())
-        else:
+            # The stress (and ungrouped) targets aren't included by default.
+            selected.extend([*resources.normal_targets, *resources.micro_targets])
+        elif specifier in resources.targets:
             selected.append(resources.targets[specifier])
+        else:
+            # A directory of targets, eg. stubs or black.
+            targets = resources.targets.values()
+            selected.extend(t for t in targets if t.name.startswith(f"{specifier}/"))
 
     selected = list(set(selected))
     return sorted(selected, key=attrgetter("name"))
 
 
+def compatible_targets(ctx: click.Context, task: Task, targets: List[Target]) -> List[Target]:
+    """Drop the targets the task can't take as input (eg. notebooks for the fmt task)."""
+    compatible = [t for t in targets if task.supports(t)]
+    if not compatible:
+        err(
+            f"None of the selected targets can be used with the `{task.name}` task"
+            f" (it takes {', '.join(task.suffixes)} files)."
+        )
+        ctx.exit(2)
+    return compatible
+
+
+def import_black(ctx: click.Context) -> ModuleType:
+    """Return the Black package of the current environment, exit if it isn't importable."""
+    try:
+        import black
+    except ImportError as e:
+        err(f"Black isn't importable in the current environment: {e}")
+        ctx.exit(1)
+    return black
+
+
+def log_versions(black: ModuleType) -> None:
+    log(
+        f"Versions: blackbench: {__version__}, pyperf: {pyperf.__version__}"
+        f", black: {black.__version__} ({black_build(is_compiled(black))})",
+        fg="cyan",
+    )
+
+
+def warn_ignored_format_config(task: Task, format_config: str) -> None:
+    if not isinstance(task, FormatTask) and format_config:
+        warn(
+            "Ignoring `--format-config` option since it doesn't make sense"
+            f" for the `{task.name}` task."
+        )
+
+
+def prep_pyperf_args(pyperf_args: Sequence[str], fast: bool) -> List[str]:
+    prepped_pyperf_args = list(pyperf_args)
+    if fast and "--fast" not in pyperf_args:
+        prepped_pyperf_args.append("--fast")
+    return prepped_pyperf_args
+
+
+def run_config(
+    task: Task, targets: Sequence[Target], format_config: str, **options: Any
+) -> Dict[str, Any]:
+    """
+    The run configuration recorded along with the results (see --store): the benchmark
+    selection plus the command's own options (eg. max_time is stored as max-time).
+    """
+    config: Dict[str, Any] = {
+        "task": task.name,
+        "targets": [t.name for t in targets],
+        "format-config": format_config,
+    }
+    config.update({name.replace("_", "-"): value for name, value in options.items()})
+    return config
+
+
+class PercentageType(click.ParamType):
+    """A percentage like "3%" (the percent sign is optional), converted to a ratio."""
+
+    name = "percentage"
+
+    def convert(
+        self,
+        value: Union[str, float],
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> float:
+        if isinstance(value, float):
+            return value
+
+        try:
+            return float(value.strip().rstrip("%")) / 100
+        except ValueError:
+            self.fail(f"{value!r} is not a valid percentage.")
+
+
+class GCModeType(click.ParamType):
+    """A garbage collector mode for benchmarking, see GC_MODES."""
+
+    name = "gc-mode"
+
+    def convert(
+        self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> str:
+        normalized = value.strip().casefold()
+        if normalized in ("default", "disabled", "frozen"):
+            return normalized
+        if normalized.startswith("threshold="):
+            threshold = normalized.split("=", 1)[1]
+            if threshold.isdigit() and int(threshold) > 0:
+                return f"threshold={int(threshold)}"
+        self.fail(f"{value!r} is not a valid GC mode (choose from {', '.join(GC_MODES)}).")
+
+
+class ModeMatrixType(click.ParamType):
+    """A grid of black.Mode configurations, see blackbench.modes."""
+
+    name = "matrix"
+
+    def convert(
+        self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> str:
+        try:
+            expand_mode_matrix(value)
+        except ValueError as e:
+            self.fail(f"{value!r} is not a valid mode matrix: {e}.")
+        return value
+
+
+class LineLengthsType(click.ParamType):
+    """A comma separated list of line lengths."""
+
+    name = "lengths"
+
+    def convert(
+        self,
+        value: Union[str, Tuple[int, ...]],
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> Tuple[int, ...]:
+        if isinstance(value, tuple):
+            return value
+
+        parts = [p.strip() for p in value.split(",") if p.strip()]
+        if not parts or not all(p.isdigit() and int(p) > 0 for p in parts):
+            self.fail(f"{value!r} isn't a comma separated list of positive line lengths.")
+        lengths = tuple(sorted({int(p) for p in parts}))
+        if len(lengths) < 2:
+            self.fail("At least two different line lengths are needed to measure scaling.")
+        return lengths
+
+
+class PerfEventsType(click.ParamType):
+    """A comma separated list of Linux perf events, see PERF_EVENTS."""
+
+    name = "events"
+
+    def convert(
+        self,
+        value: Union[str, Tuple[str, ...]],
+        param: Optional[click.Parameter],
+        ctx: Optional[click.Context],
+    ) -> Tuple[str, ...]:
+        if isinstance(value, tuple):
+            return value
+
+        if not sys.platform.startswith("linux"):
+            self.fail("Performance counters are only supported on Linux.")
+        events = tuple(dict.fromkeys(e.strip().casefold() for e in value.split(",") if e.strip()))
+        unknown = [e for e in events if e not in PERF_EVENTS]
+        if unknown or not events:
+            self.fail(
+                f"{', '.join(unknown) or repr(value)} isn't a supported perf event (choose"
+                f" from {', '.join(PERF_EVENTS)})."
+            )
+        return events
+
+
+class InterpreterType(click.ParamType):
+    """A Python interpreter, either given directly or as a virtual environment directory."""
+
+    name = "interpreter"
+
+    def convert(
+        self, value: str, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> str:
+        path = Path(value)
+        if path.is_dir():
+            for candidate in (path / "bin" / "python", path / "Scripts" / "python.exe"):
+                if candidate.is_file():
+                    return str(candidate.absolute())
+            self.fail(f"{value} is a directory but not a virtual environment.")
+
+        found = shutil.which(value)
+        if found is None:
+            self.fail(f"{value} is neither a virtual environment nor a Python interpreter.")
+        return str(Path(found).absolute())
+
+
 class ResourceType(click.ParamType):
     """Really basic type that only provides shell completion."""
 
@@ -213,6 +827,82 @@ def shell_complete(
         return items
 
 
+def benchmark_selection_options(default_task: str = "fmt") -> Callable[[F], F]:
+    """Options shared by all commands that set up benchmarks from tasks and targets."""
+    return cloup.option_group(
+        "Benchmark selection & customization",
+        click.option(
+            "--task",
+            default=default_task,
+            type=TaskType(),
+            help=f"The area of concern to benchmark.  [default: {default_task}]",
+        ),
+        click.option(
+            "-t",
+            "--targets",
+            default=["all"],
+            show_default=True,
+            multiple=True,
+            type=TargetSpecifierType(),
+            callback=targets_callback,
+            help=(
+                "The code files to use as the task's input."
+                " Normal targets are real-world code files and therefore lead to data that"
+                " more represents real-life scenarios. On the other hand, micro targets "
+                " usually are very focused on specific parts of Black."
+            ),
+        ),
+        click.option(
+            "--format-config",
+            default="",
+            is_eager=True,
+            help=(
+                "Arguments to pass to black.Mode for format tasks. Must be valid argument"
+                ' Python code. For example: "experimental_string_processing=True". The context the'
+                " value will be substituted in has the Black package imported."
+            ),
+        ),
+    )
+
+
+def result_storage_options() -> Callable[[F], F]:
+    return cloup.option_group(
+        "Result storage",
+        click.option(
+            "--store",
+            type=click.Path(dir_okay=False, resolve_path=True, path_type=Path),
+            help=(
+                "Also record the results (raw values, metadata, and run configuration) into"
+                " this SQLite history database. It's created if it doesn't exist yet."
+            ),
+        ),
+    )
+
+
+def host_check_options() -> Callable[[F], F]:
+    """Options shared by all commands that time benchmarks on this host, see check_host."""
+    return cloup.option_group(
+        "Host checks",
+        click.option(
+            "--noise-check",
+            type=click.Choice(["warn", "refuse", "off"]),
+            default="warn",
+            show_default=True,
+            help=(
+                "Before running, time a short calibration microbenchmark to estimate the host"
+                " noise and warn (or refuse to run) if it's above --noise-threshold."
+            ),
+        ),
+        click.option(
+            "--noise-threshold",
+            default="10%",
+            show_default=True,
+            type=PercentageType(),
+            help="The acceptable host noise (coefficient of variation of the calibration).",
+        ),
+    )
+
+
 @cloup.group(formatter_settings=HelpFormatter.settings(theme=HelpTheme.light(), max_width=85))
 @click.version_option(
     __version__, package_name=__file__, message="%(prog)s %(version)s, from %(package)s"
@@ -251,53 +941,87 @@ def main(ctx: click.Context) -> None:
     ),
 )
 @click.argument("pyperf-args", metavar="[-- pyperf-args]", nargs=-1, type=click.UNPROCESSED)
+@benchmark_selection_options()
 @cloup.option_group(
-    "Benchmark selection & customization",
+    "Benchmarking parameters",
     click.option(
-        "--task",
-        default="fmt",
-        type=TaskType(),
-        help="The area of concern to benchmark.  [default: fmt]",
+        "--fast",
+        default=False,
+        is_flag=True,
+        help=(
+            "Collect less data values for faster result turnaround, at the price of quality."
+            " Although with a tuned system, the reduction in execution time far usually outstrips"
+            " the drop in result quality. An alias for `-- --fast`."
+        ),
     ),
     click.option(
-        "-t",
-        "--targets",
-        default=["all"],
-        show_default=True,
-        multiple=True,
-        type=TargetSpecifierType(),
-        callback=targets_callback,
+        "--max-time",
+        type=click.FloatRange(min=1),
         help=(
-            "The code files to use as the task's input."
-            " Normal targets are real-world code files and therefore lead to data that"
-            " more represents real-life scenarios. On the other hand, micro targets "
-            " usually are very focused on specific parts of Black."
+            "Cap every benchmark to about this many seconds by spawning fewer pyperf worker"
+            " processes (estimated from a single timed call), keeping just that single call"
+            " if need be. Meant for slow targets like the stress group."
         ),
     ),
     click.option(
-        "--format-config",
-        default="",
-        is_eager=True,
+        "--python",
+        "pythons",
+        type=InterpreterType(),
+        multiple=True,
         help=(
-            "Arguments to pass to black.Mode for format tasks. Must be valid argument"
-            ' Python code. For example: "experimental_string_processing=True". The context the'
-            " value will be substituted in has the Black package imported."
+            "Run the benchmarks under this Python interpreter (or virtual environment), which"
+            " needs Black and pyperf installed. Can be passed multiple times to run every"
+            " benchmark under each interpreter (eg. fmt[py=3.11]-black/lines) and compare"
+            " them. Defaults to the interpreter blackbench runs under."
         ),
     ),
-)
-@cloup.option_group(
-    "Benchmarking parameters",
     click.option(
-        "--fast",
+        "--gc-metrics",
         default=False,
         is_flag=True,
         help=(
-            "Collect less data values for faster result turnaround, at the price of quality."
-            " Although with a tuned system, the reduction in execution time far usually outstrips"
-            " the drop in result quality. An alias for `-- --fast`."
+            "Also record allocated blocks, GC collections (per generation), and time spent in"
+            " GC while the benchmarked function runs. Stored as benchmark metadata."
+        ),
+    ),
+    click.option(
+        "--gc-mode",
+        "gc_modes",
+        type=GCModeType(),
+        multiple=True,
+        default=["default"],
+        show_default=True,
+        help=(
+            f"Garbage collector configuration while the benchmarked function runs: one of"
+            f" {', '.join(GC_MODES)} (generation 0 threshold). Non-default modes get their"
+            " own benchmark names (eg. fmt[gc=disabled]-black/lines). Can be passed multiple"
+            " times to run every target under each mode."
+        ),
+    ),
+    click.option(
+        "--mode-matrix",
+        type=ModeMatrixType(),
+        multiple=True,
+        help=(
+            "Run format tasks under every black.Mode configuration of this grid. Written like"
+            " --format-config but a list of values makes that argument an axis, eg."
+            ' "line_length=[88, 120], magic_trailing_comma=[True, False]". Each configuration'
+            " gets its own benchmark names (eg. fmt[ll=120]-black/lines). Can be passed"
+            " multiple times, --format-config applies to all configurations."
+        ),
+    ),
+    click.option(
+        "--perf-counters",
+        type=PerfEventsType(),
+        help=(
+            "Also count these Linux perf events (comma separated, eg."
+            " instructions,cycles,cache-misses,branch-misses) while the benchmarked function"
+            f" runs. Stored per loop as benchmark metadata. Supported: {', '.join(PERF_EVENTS)}."
         ),
     ),
 )
+@host_check_options()
+@result_storage_options()
 @click.pass_context
 def cmd_run(
     ctx: click.Context,
@@ -306,7 +1030,16 @@ def cmd_run(
     task: Task,
     targets: List[Target],
     fast: bool,
+    max_time: Optional[float],
+    pythons: Tuple[str, ...],
+    noise_check: str,
+    noise_threshold: float,
+    gc_metrics: bool,
+    gc_modes: Tuple[str, ...],
+    mode_matrix: Tuple[str, ...],
+    perf_counters: Optional[Tuple[str, ...]],
     format_config: str,
+    store: Optional[Path],
 ) -> None:
     """
     Run benchmarks and dump results. The produced JSON file can be analyzed with
@@ -316,70 +1049,1352 @@ def cmd_run(
     system tuning and/or benchmarking parameter tuning (eg. --affinity).
     """
     start_time = time.perf_counter()
+    targets = compatible_targets(ctx, task, targets)
+    black = import_black(ctx)
+    log_versions(black)
 
-    try:
-        import black
-    except ImportError as e:
-        err(f"Black isn't importable in the current environment: {e}")
-        ctx.exit(1)
-
-    log(
-        f"Versions: blackbench: {__version__}, pyperf: {pyperf.__version__}"
-        f", black: {black.__version__}",
-        fg="cyan",
-    )
-
-    if not isinstance(task, FormatTask) and format_config:
+    warn_ignored_format_config(task, format_config)
+    tasks = [task]
+    if not isinstance(task, FormatTask) and mode_matrix:
         warn(
-            "Ignoring `--format-config` option since it doesn't make sense"
+            "Ignoring `--mode-matrix` option since it doesn't make sense"
             f" for the `{task.name}` task."
         )
-    check_pyperf_args(pyperf_args)
+    elif isinstance(task, FormatTask) and mode_matrix:
+        modes = mode_configs(mode_matrix, format_config)
+        tasks = [replace(task, custom_mode=m.config, mode_tag=m.tag) for m in modes]
+    # The GC mode hook goes first so any metrics are collected under that mode.
+    variants = [[GCModeHook(mode)] if mode != "default" else [] for mode in dict.fromkeys(gc_modes)]
+    observers: List[WorkerHook] = []
+    if gc_metrics:
+        observers.append(GCMetricsHook())
+    if perf_counters:
+        observers.append(PerfCountersHook(perf_counters))
+
+    interpreters: List[Optional[Interpreter]] = [None]
+    if pythons:
+        probed = []
+        for python in dict.fromkeys(pythons):
+            try:
+                probed.append(probe_interpreter(python))
+            except RuntimeError as e:
+                err(f"Can't benchmark under {python} (are Black and pyperf installed?):")
+                click.secho(textwrap.indent(str(e), " " * 4))
+                ctx.exit(2)
+        interpreters = [*tag_interpreters(probed)] if len(probed) > 1 else [*probed]
+
+    for interpreter in interpreters:
+        python = interpreter.path if interpreter else sys.executable
+        check_pyperf_args(pyperf_args, python)
+        for variant in variants:
+            check_worker_hooks([*variant, *observers], python)
+    check_latency_loops(tasks, pyperf_args)
     check_mode_config(format_config)
+    for mode_task in tasks:
+        if isinstance(mode_task, FormatTask) and mode_task.mode_tag:
+            check_mode_config(mode_task.custom_mode)
     log("Checked configuration and everything's all good!")
-
-    if dump_path.exists():
-        try:
-            pretty_dump_path = dump_path.relative_to(os.getcwd())
-        except ValueError:
-            pretty_dump_path = dump_path
-        warn(f"A file / directory already exists at `{pretty_dump_path}`.")
-        click.confirm("[*] Do you want to overwrite and continue?", abort=True)
-
-    benchmarks = [Benchmark(task, target) for target in targets]
-
-    prepped_pyperf_args = list(pyperf_args)
-    if fast and "--fast" not in pyperf_args:
-        prepped_pyperf_args.append("--fast")
-
-    with managed_workdir() as workdir:
-        log("Alright, let's start!", fg="green", bold=True)
-        suite_results, errored = run_suite(benchmarks, prepped_pyperf_args, workdir)
-
-    if suite_results:
-        suite_results.dump(str(dump_path), replace=True)
-        if not errored:
-            log("Results dumped.")
-        else:
-            warn("Results dumped (at least one benchmark is missing due to failure).")
-    else:
-        err("No results were collected.")
+    for interpreter in interpreters:
+        if interpreter is not None:
+            log(f"Interpreter: {interpreter.description}")
+    host_info = check_host(noise_check, noise_threshold)
+
+    confirm_overwrite(dump_path)
+
+    benchmarks = [
+        Benchmark(mode_task, target, [*variant, *observers], interpreter)
+        for target in targets
+        for mode_task in tasks
+        for interpreter in interpreters
+        for variant in variants
+    ]
+
+    prepped_pyperf_args = prep_pyperf_args(pyperf_args, fast)
+    # fmt: off
+    config = run_config(
+        task, targets, format_config, pyperf_args=prepped_pyperf_args, gc_metrics=gc_metrics,
+        gc_modes=list(gc_modes), mode_matrix=list(mode_matrix),
+        perf_counters=list(perf_counters or ()), noise_check=noise_check,
+        noise_threshold=noise_threshold, pythons=list(pythons), max_time=max_time,
+    )
+    # fmt: on
+    _, errored = run_and_dump(
+        benchmarks,
+        prepped_pyperf_args,
+        dump_path,
+        metadata=host_info,
+        store=store,
+        config=config,
+        max_time=max_time,
+    )
 
     end_time = time.perf_counter()
     log(f"Blackbench run finished in {end_time - start_time:.3f} seconds.", fg="green", bold=True)
     ctx.exit(errored)
 
 
-@main.command("info")
-@click.pass_context
-def cmd_info(ctx: click.Context) -> None:
-    """Show available targets and tasks."""
-
-    def print_item(index: int, name: str, desc: str, lines: Optional[int] = None) -> None:
-        assert desc, "tasks / targets should have a non-empty description"
-        lines_str = click.style(f"[{lines} lines] ", fg="cyan") if lines else ""
-        prepped_desc = click.style(desc, dim=True)
-        click.echo(f"  {i}. {name} {lines_str}- {prepped_desc}")
+@main.command(
+    "line-length-sweep",
+    short_help="Measure how runtime scales with the line length.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "dump_path",
+    metavar="result-filepath",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=True, writable=True, path_type=Path
+    ),
+)
+@click.argument("pyperf-args", metavar="[-- pyperf-args]", nargs=-1, type=click.UNPROCESSED)
+@benchmark_selection_options(default_task="fmt-fast")
+@cloup.option_group(
+    "Sweep parameters",
+    click.option(
+        "--line-lengths",
+        default=",".join(map(str, LINE_LENGTHS)),
+        show_default=True,
+        type=LineLengthsType(),
+        help="The line lengths to run every target with (comma separated).",
+    ),
+    click.option(
+        "--reference",
+        default=88,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="The line length the others are compared against (must be one of them).",
+    ),
+    click.option(
+        "--threshold",
+        default=1.5,
+        show_default=True,
+        type=click.FloatRange(min=1),
+        help=(
+            "Flag targets which are more than this many times slower at the narrowest line"
+            " length than at the reference one."
+        ),
+    ),
+    click.option(
+        "--fast",
+        default=False,
+        is_flag=True,
+        help="Collect less data values for faster result turnaround. An alias for `-- --fast`.",
+    ),
+)
+@host_check_options()
+@result_storage_options()
+@click.pass_context
+def cmd_line_length_sweep(
+    ctx: click.Context,
+    dump_path: Path,
+    pyperf_args: Tuple[str, ...],
+    task: Task,
+    targets: List[Target],
+    format_config: str,
+    line_lengths: Tuple[int, ...],
+    reference: int,
+    threshold: float,
+    fast: bool,
+    noise_check: str,
+    noise_threshold: float,
+    store: Optional[Path],
+) -> None:
+    """
+    Run format benchmarks at a range of line lengths and report how runtime scales.
+
+    Every target is run at each line length (named eg. fmt-fast[ll=40]-black/lines). The
+    runtimes are then reported relative to the reference line length, along with the
+    exponent of a power law fit (0 means the line length doesn't matter, -1 that halving
+    it doubles the runtime). Narrow widths exercise the right-hand and delimiter splits a
+    lot harder, so targets that blow up there are flagged.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    black = import_black(ctx)
+
+    if not isinstance(task, FormatTask):
+        err(f"The line length doesn't matter for the `{task.name}` task, use a format task.")
+        ctx.exit(2)
+    if reference not in line_lengths:
+        err(f"The reference line length ({reference}) must be one of the swept line lengths.")
+        ctx.exit(2)
+
+    log_versions(black)
+    check_pyperf_args(pyperf_args)
+    check_latency_loops([task], pyperf_args)
+    modes = mode_configs([f"line_length={list(line_lengths)}"], format_config)
+    for mode in modes:
+        check_mode_config(mode.config)
+    log("Checked configuration and everything's all good!")
+    host_info = check_host(noise_check, noise_threshold)
+    confirm_overwrite(dump_path)
+
+    benchmarks = []
+    lengths_by_name = {}
+    for target in targets:
+        for length, mode in zip(line_lengths, modes):
+            bm = Benchmark(replace(task, custom_mode=mode.config, mode_tag=mode.tag), target)
+            benchmarks.append(bm)
+            lengths_by_name[bm.name] = length
+
+    prepped_pyperf_args = prep_pyperf_args(pyperf_args, fast)
+    # fmt: off
+    config = run_config(
+        task, targets, format_config, pyperf_args=prepped_pyperf_args,
+        line_lengths=list(line_lengths), noise_check=noise_check,
+        noise_threshold=noise_threshold,
+    )
+    # fmt: on
+    suite, errored = run_and_dump(
+        benchmarks, prepped_pyperf_args, dump_path, metadata=host_info, store=store, config=config
+    )
+    if suite:
+        log(f"Line length scaling (relative to a line length of {reference}):", bold=True)
+        pathological = print_line_length_scaling(
+            benchmarks, lengths_by_name, suite, reference, threshold
+        )
+        if pathological:
+            warn(
+                f"More than {threshold:g}x slower at a line length of {line_lengths[0]}:"
+                f" {', '.join(pathological)}"
+            )
+    ctx.exit(errored)
+
+
+@main.command(
+    "compare-compiled",
+    short_help="Compare compiled (mypyc) and pure Python builds of Black.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "dump_path",
+    metavar="result-filepath",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=True, writable=True, path_type=Path
+    ),
+)
+@click.argument("pyperf-args", metavar="[-- pyperf-args]", nargs=-1, type=click.UNPROCESSED)
+@benchmark_selection_options()
+@cloup.option_group(
+    "Environments",
+    click.option(
+        "--black-version",
+        help="The version of Black to compare (from PyPI). Defaults to the installed one.",
+    ),
+    click.option(
+        "--base-python",
+        type=InterpreterType(),
+        help="The interpreter to create the environments with. Defaults to the current one.",
+    ),
+    click.option(
+        "--cache-dir",
+        default=default_cache_dir,
+        show_default="~/.cache/blackbench",
+        type=click.Path(file_okay=False, writable=True, path_type=Path),
+        help="Where the environments are kept around for later comparisons.",
+    ),
+)
+@cloup.option_group(
+    "Benchmarking parameters",
+    click.option(
+        "--fast",
+        default=False,
+        is_flag=True,
+        help="Collect less data values for faster result turnaround. An alias for `-- --fast`.",
+    ),
+)
+@host_check_options()
+@result_storage_options()
+@click.pass_context
+def cmd_compare_compiled(
+    ctx: click.Context,
+    dump_path: Path,
+    pyperf_args: Tuple[str, ...],
+    task: Task,
+    targets: List[Target],
+    format_config: str,
+    black_version: Optional[str],
+    base_python: Optional[str],
+    cache_dir: Path,
+    fast: bool,
+    noise_check: str,
+    noise_threshold: float,
+    store: Optional[Path],
+) -> None:
+    """
+    Run benchmarks against compiled (mypyc) and pure Python Black and compare them.
+
+    Both builds of the same version of Black are installed into virtual environments
+    (cached for later runs), then every benchmark is run under each (named eg.
+    fmt[black=compiled]-black/lines). The results carry the build as the `black-build`
+    metadata.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    black = import_black(ctx)
+    warn_ignored_format_config(task, format_config)
+    version = black_version or black.__version__
+    check_latency_loops([task], pyperf_args)
+    check_mode_config(format_config)
+    interpreters = []
+    for compiled in (False, True):
+        log(f"Setting up {black_build(compiled)} Black {version} (cached in `{cache_dir}`) ...")
+        try:
+            interpreter = black_venv(
+                cache_dir, version, compiled=compiled, python=base_python or sys.executable
+            )
+        except RuntimeError as e:
+            err(f"Couldn't set up {black_build(compiled)} Black {version}: {e}")
+            ctx.exit(2)
+        check_pyperf_args(pyperf_args, interpreter.path)
+        interpreters.append(replace(interpreter, tag=f"black={black_build(compiled)}"))
+        log(f"Interpreter: {interpreter.description}")
+    host_info = check_host(noise_check, noise_threshold)
+    confirm_overwrite(dump_path)
+
+    benchmarks = [
+        Benchmark(task, target, interpreter=interpreter)
+        for target in targets
+        for interpreter in interpreters
+    ]
+    prepped_pyperf_args = prep_pyperf_args(pyperf_args, fast)
+    # fmt: off
+    config = run_config(
+        task, targets, format_config, pyperf_args=prepped_pyperf_args, compare_compiled=version,
+        noise_check=noise_check, noise_threshold=noise_threshold,
+    )
+    # fmt: on
+    suite, errored = run_and_dump(
+        benchmarks, prepped_pyperf_args, dump_path, metadata=host_info, store=store, config=config
+    )
+    if suite:
+        # The benchmarks alternate between the pure and compiled build of each target.
+        means = {bm.get_name(): bm.mean() for bm in suite.get_benchmarks()}
+        speedups = [
+            means[pure_bm.name] / means[compiled_bm.name]
+            for pure_bm, compiled_bm in zip(benchmarks[::2], benchmarks[1::2])
+            if pure_bm.name in means and compiled_bm.name in means
+        ]
+        if speedups:
+            log(
+                f"Compiled speedup: {geometric_mean(speedups):.2f}x overall (geometric mean),"
+                f" {min(speedups):.2f}x - {max(speedups):.2f}x per target.",
+                bold=True,
+            )
+    ctx.exit(errored)
+
+
+@main.command(
+    "count",
+    short_help="Count instructions per benchmark (deterministic mode).",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "dump_path",
+    metavar="result-filepath",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=True, writable=True, path_type=Path
+    ),
+)
+@benchmark_selection_options()
+@cloup.option_group(
+    "Counting parameters",
+    click.option(
+        "--backend",
+        type=click.Choice(["auto", *BACKENDS]),
+        default="auto",
+        show_default=True,
+        help=(
+            "How to count instructions: perf uses the Linux perf_event_open hardware counters,"
+            " cachegrind runs the benchmarks under Valgrind (much slower, but works anywhere"
+            " Valgrind does, including VMs without counters). auto picks the first that works."
+        ),
+    ),
+    click.option(
+        "--loops",
+        default=5,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="How many times to call the benchmarked function (after one warmup call).",
+    ),
+)
+@result_storage_options()
+@click.pass_context
+def cmd_count(
+    ctx: click.Context,
+    dump_path: Path,
+    task: Task,
+    targets: List[Target],
+    format_config: str,
+    backend: str,
+    loops: int,
+    store: Optional[Path],
+) -> None:
+    """
+    Count the instructions every benchmark executes and dump them as pyperf results.
+
+    Unlike timings, instruction counts are practically unaffected by other load on the
+    machine, so they can be compared across commits at sub-percent resolution even on
+    noisy (eg. shared CI) machines. They don't capture everything though (eg. cache
+    misses), so confirm important changes with `blackbench run` on a quiet machine.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    black = import_black(ctx)
+    warn_ignored_format_config(task, format_config)
+    check_mode_config(format_config)
+    if backend == "auto":
+        detected = detect_backend()
+        if detected is None:
+            err("Can't count instructions: no hardware counters and Valgrind isn't installed.")
+            ctx.exit(2)
+        backend = detected
+    elif backend == "perf" and (reason := probe_perf()):
+        err(f"Can't count instructions with perf: {reason}")
+        ctx.exit(2)
+    elif backend == "cachegrind" and not shutil.which("valgrind"):
+        err("Can't count instructions with cachegrind: Valgrind isn't installed.")
+        ctx.exit(2)
+    log(f"Counting instructions with the {backend} backend.")
+    confirm_overwrite(dump_path)
+
+    benchmarks = [Benchmark(task, target) for target in targets]
+    results = []
+    errored = False
+    with managed_workdir() as workdir:
+        for i, bm in enumerate(benchmarks, start=1):
+            log(f"Counting `{bm.name}` ({i}/{len(benchmarks)})", bold=True)
+            count = count_instructions(bm, workdir / f"{i}.py", loops=loops, backend=backend)
+            if count is None:
+                errored = True
+                continue
+            click.echo(f"{bm.name}: {format_value(count, 'integer')} instructions")
+            # fmt: off
+            run = pyperf.Run([count], metadata={
+                "name": bm.name, "unit": "integer", "loops": loops,
+                "instructions-backend": backend,
+            })
+            # fmt: on
+            result = pyperf.Benchmark([run])
+            result.update_metadata(benchmark_metadata(bm, black.__version__, is_compiled(black)))
+            results.append(result)
+
+    if not results:
+        err("No results were collected.")
+        ctx.exit(1)
+
+    suite = pyperf.BenchmarkSuite(results)
+    print_suite_summary(suite)
+    suite.dump(str(dump_path), replace=True)
+    log("Results dumped.")
+    if store:
+        config = run_config(task, targets, format_config, instructions_backend=backend, loops=loops)
+        record_results(store, suite, config)
+    ctx.exit(errored)
+
+
+def send_heartbeats(queue: WorkQueue, job: Job, stop: threading.Event) -> None:
+    while not stop.wait(HEARTBEAT_INTERVAL):
+        queue.heartbeat(job)
+
+
+def poll_interval_option() -> Callable[[F], F]:
+    return click.option(
+        "--poll-interval",
+        default=5.0,
+        show_default=True,
+        type=click.FloatRange(min=0, min_open=True),
+        help="How often to check the queue for changes, in seconds.",
+    )
+
+
+@main.command(
+    "coordinator",
+    short_help="Shard benchmarks into a work queue and merge the results.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "queue_dir",
+    metavar="queue-directory",
+    type=click.Path(file_okay=False, resolve_path=True, writable=True, path_type=Path),
+)
+@click.argument(
+    "dump_path",
+    metavar="result-filepath",
+    type=click.Path(
+        file_okay=True, dir_okay=False, resolve_path=True, writable=True, path_type=Path
+    ),
+)
+@click.argument("pyperf-args", metavar="[-- pyperf-args]", nargs=-1, type=click.UNPROCESSED)
+@benchmark_selection_options()
+@cloup.option_group(
+    "Benchmarking parameters",
+    click.option(
+        "--fast",
+        default=False,
+        is_flag=True,
+        help="Collect less data values for faster result turnaround. An alias for `-- --fast`.",
+    ),
+    poll_interval_option(),
+    click.option(
+        "--claim-timeout",
+        default=300.0,
+        show_default=True,
+        type=click.FloatRange(min=HEARTBEAT_INTERVAL, min_open=True),
+        help=(
+            "Queue a job again if its worker hasn't sent a heartbeat for this long, in"
+            f" seconds. Workers send one every {HEARTBEAT_INTERVAL:g} seconds."
+        ),
+    ),
+)
+@result_storage_options()
+@click.pass_context
+def cmd_coordinator(
+    ctx: click.Context,
+    queue_dir: Path,
+    dump_path: Path,
+    pyperf_args: Tuple[str, ...],
+    task: Task,
+    targets: List[Target],
+    fast: bool,
+    poll_interval: float,
+    claim_timeout: float,
+    format_config: str,
+    store: Optional[Path],
+) -> None:
+    """
+    Queue benchmarks for workers (possibly on other machines) and merge their results.
+
+    Every benchmark becomes a job in the queue directory, which should be on a
+    filesystem shared with the workers (see `blackbench worker`). Once all jobs are
+    done, the results are merged into one result file. Results from workers with a
+    different CPU model, Python, or version of Black aren't comparable, so they're
+    refused instead. Jobs whose worker stopped responding are queued again. Running the
+    coordinator again on an existing queue resumes it.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    black = import_black(ctx)
+
+    queue = WorkQueue(queue_dir)
+    if queue.exists():
+        log(f"Resuming the existing queue in `{queue_dir}` (the queued jobs are kept as is).")
+    else:
+        warn_ignored_format_config(task, format_config)
+        check_pyperf_args(pyperf_args)
+        check_latency_loops([task], pyperf_args)
+        check_mode_config(format_config)
+        prepped_pyperf_args = prep_pyperf_args(pyperf_args, fast)
+
+        jobs = []
+        for i, target in enumerate(targets, start=1):
+            bm = Benchmark(task, target)
+            metadata = benchmark_metadata(bm, black.__version__, is_compiled(black))
+            jobs.append(Job(f"{i:04d}", bm.name, bm.code, metadata))
+        queue.create(jobs, prepped_pyperf_args)
+        log(f"Queued {len(jobs)} benchmarks in `{queue_dir}`.")
+    confirm_overwrite(dump_path)
+    log(f"Start workers with `blackbench worker {queue_dir}`, waiting for results ...")
+
+    total = len(queue.manifest["jobs"])
+    last_counts: Dict[str, int] = {}
+    while True:
+        counts = queue.counts()
+        if counts != last_counts:
+            click.echo(
+                f"    {counts['done']}/{total} done, {counts['failed']} failed,"
+                f" {counts['claimed']} running, {counts['pending']} pending"
+            )
+            last_counts = counts
+        if counts["done"] + counts["failed"] >= total:
+            break
+        for job in queue.requeue_stale(claim_timeout):
+            warn(f"Re-queued `{job.name}` (job {job.id}) since its worker stopped responding.")
+        time.sleep(poll_interval)
+
+    errored = False
+    for failure in queue.failures():
+        err(f"`{failure['name']}` failed on worker {failure['worker']}: {failure['reason']}")
+        errored = True
+    results = queue.results()
+    if not results:
+        err("No results were collected.")
+        ctx.exit(1)
+
+    hosts = group_by_host(results)
+    if len(hosts) > 1:
+        err("Refusing to merge results from incompatible hosts:")
+        for signature, names in hosts.items():
+            details = ", ".join(f"{key}={value}" for key, value in zip(HOST_KEYS, signature))
+            click.echo(f"    {details}: {', '.join(names)}")
+        ctx.exit(1)
+
+    suite = pyperf.BenchmarkSuite(results)
+    print_suite_summary(suite)
+    suite.dump(str(dump_path), replace=True)
+    if not errored:
+        log("Results dumped.")
+    else:
+        warn("Results dumped (at least one benchmark is missing due to failure).")
+    if store:
+        workers = sorted({bm.get_metadata().get("worker", "") for bm in results})
+        config = run_config(
+            task, targets, format_config, pyperf_args=queue.manifest["pyperf-args"], workers=workers
+        )
+        record_results(store, suite, config)
+    ctx.exit(errored)
+
+
+@main.command("worker")
+@click.argument(
+    "queue_dir",
+    metavar="queue-directory",
+    type=click.Path(file_okay=False, resolve_path=True, path_type=Path),
+)
+@click.option(
+    "--name",
+    default=f"{socket.gethostname()}-{os.getpid()}",
+    show_default="$hostname-$pid",
+    help="The worker's name, recorded in its results' metadata.",
+)
+@poll_interval_option()
+@click.pass_context
+def cmd_worker(ctx: click.Context, queue_dir: Path, name: str, poll_interval: float) -> None:
+    """
+    Run benchmarks from a coordinator's work queue until it's empty.
+
+    The worker waits for the queue to be created if the coordinator hasn't been started
+    yet. Run one worker per machine (or per isolated CPU) so they don't disturb each
+    other's timings.
+    """
+    import_black(ctx)
+
+    queue = WorkQueue(queue_dir)
+    if not queue.exists():
+        log(f"Waiting for the queue in `{queue_dir}` to be created ...")
+        while not queue.exists():
+            time.sleep(poll_interval)
+    pyperf_args = queue.manifest["pyperf-args"]
+
+    completed = 0
+    errored = False
+    with managed_workdir() as workdir:
+        while True:
+            job = queue.claim(name)
+            if job is None:
+                # Jobs claimed by other workers are re-queued if those workers die.
+                if not queue.counts()["claimed"]:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            log(f"Running `{job.name}` benchmark (job {job.id})", bold=True)
+            stop = threading.Event()
+            heartbeat = threading.Thread(target=send_heartbeats, args=(queue, job, stop))
+            heartbeat.start()
+            try:
+                result, reason = run_job(job, pyperf_args, workdir)
+            finally:
+                stop.set()
+                heartbeat.join()
+            if result is None:
+                err(f"Failed to run benchmark ^^^ ({reason})")
+                queue.fail(job, name, reason)
+                errored = True
+                continue
+            result.update_metadata({"worker": name})
+            queue.complete(job, result)
+            completed += 1
+
+    log(f"The queue is empty, ran {completed} benchmarks.", fg="green", bold=True)
+    ctx.exit(errored)
+
+
+@main.command(
+    "profile",
+    short_help="Profile benchmarks with cProfile.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "output_dir",
+    metavar="output-directory",
+    type=click.Path(file_okay=False, resolve_path=True, writable=True, path_type=Path),
+)
+@benchmark_selection_options()
+@cloup.option_group(
+    "Profiling parameters",
+    click.option(
+        "--loops",
+        default=10,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="How many times to call the benchmarked function under the profiler.",
+    ),
+    click.option(
+        "--sampling",
+        is_flag=True,
+        help=(
+            "Also run the benchmarked function under a sampling profiler to collect real"
+            " stacks for the collapsed stack file. Otherwise the stacks are derived from the"
+            " cProfile call graph."
+        ),
+    ),
+    click.option(
+        "--sampling-interval",
+        default=1.0,
+        show_default=True,
+        type=click.FloatRange(min=0, min_open=True),
+        help="How often to sample the stack, in milliseconds.",
+    ),
+)
+@click.pass_context
+def cmd_profile(
+    ctx: click.Context,
+    output_dir: Path,
+    task: Task,
+    targets: List[Target],
+    format_config: str,
+    loops: int,
+    sampling: bool,
+    sampling_interval: float,
+) -> None:
+    """
+    Profile benchmarks and write the profiles to a directory.
+
+    The benchmarked function is called under cProfile instead of being timed by pyperf.
+    For every benchmark a pstats file (for tools like snakeviz) and a collapsed stack file
+    (for flamegraph.pl, speedscope, and friends) are written.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    warn_ignored_format_config(task, format_config)
+    check_mode_config(format_config)
+
+    benchmarks = [Benchmark(task, target) for target in targets]
+    errored = False
+    with managed_workdir() as workdir:
+        for i, bm in enumerate(benchmarks, start=1):
+            log(f"Profiling `{bm.name}` ({i}/{len(benchmarks)})", bold=True)
+            stats_path = profile_benchmark(
+                bm,
+                workdir / f"{i}.py",
+                output_dir / bm.name,
+                loops=loops,
+                sampling_interval=sampling_interval / 1000 if sampling else None,
+            )
+            errored |= stats_path is None
+
+    log(f"Profiles written to `{output_dir}`.", fg="green", bold=True)
+    ctx.exit(errored)
+
+
+@main.command(
+    "profile-diff",
+    short_help="Compare profiles between two environments.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.argument(
+    "output_dir",
+    metavar="output-directory",
+    type=click.Path(file_okay=False, resolve_path=True, writable=True, path_type=Path),
+)
+@cloup.option_group(
+    "Environments",
+    click.option(
+        "--baseline",
+        required=True,
+        type=InterpreterType(),
+        help="The baseline virtual environment (or Python interpreter).",
+    ),
+    click.option(
+        "--candidate",
+        required=True,
+        type=InterpreterType(),
+        help="The candidate virtual environment (or Python interpreter).",
+    ),
+)
+@benchmark_selection_options()
+@cloup.option_group(
+    "Profiling & reporting parameters",
+    click.option(
+        "--loops",
+        default=10,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="How many times to call the benchmarked function under the profiler.",
+    ),
+    click.option(
+        "--top",
+        default=15,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="How many functions to show per benchmark.",
+    ),
+)
+@click.pass_context
+def cmd_profile_diff(
+    ctx: click.Context,
+    output_dir: Path,
+    baseline: str,
+    candidate: str,
+    task: Task,
+    targets: List[Target],
+    format_config: str,
+    loops: int,
+    top: int,
+) -> None:
+    """
+    Profile benchmarks in two environments and compare them function by function.
+
+    Both environments need Black and pyperf installed. Functions are matched by their
+    module path and name. The functions that contributed the most to the total change
+    (i.e. whose self time changed the most) are shown, and a full report per benchmark
+    is written to the output directory as a TSV file alongside the profiles.
+    """
+    targets = compatible_targets(ctx, task, targets)
+    check_mode_config(format_config)
+    benchmarks = [Benchmark(task, target) for target in targets]
+    errored = False
+    with managed_workdir() as workdir:
+        for i, bm in enumerate(benchmarks, start=1):
+            log(f"Profiling `{bm.name}` ({i}/{len(benchmarks)})", bold=True)
+            profiles = []
+            for env, python in (("baseline", baseline), ("candidate", candidate)):
+                # The scripts need the same filename so the functions in them match up.
+                (workdir / env).mkdir(exist_ok=True)
+                # fmt: off
+                profiles.append(profile_benchmark(
+                    bm, workdir / env / f"{i}.py", output_dir / env / bm.name,
+                    loops=loops, python=python,
+                ))
+                # fmt: on
+            base_path, cand_path = profiles
+            if base_path is None or cand_path is None:
+                errored = True
+                continue
+
+            deltas = diff_stats(pstats.Stats(str(base_path)), pstats.Stats(str(cand_path)), loops)
+            report = output_dir / f"{bm.name}.diff.tsv"
+            report.parent.mkdir(parents=True, exist_ok=True)
+            with open(report, "w", encoding="utf8") as f:
+                f.write("function\tbaseline-self\tcandidate-self")
+                f.write("\tbaseline-cumulative\tcandidate-cumulative\n")
+                for d in deltas:
+                    f.write(f"{d.label}\t{d.baseline_self}\t{d.candidate_self}")
+                    f.write(f"\t{d.baseline_cumulative}\t{d.candidate_cumulative}\n")
+
+            base_total = sum(d.baseline_self for d in deltas)
+            cand_total = sum(d.candidate_self for d in deltas)
+            total_delta = cand_total - base_total
+            # Eg. a trivial target where no function took measurable time.
+            change = f"{total_delta / base_total:+.1%}" if base_total else "n/a"
+            log(
+                f"Total (per loop): {format_value(base_total)} -> {format_value(cand_total)}"
+                f" ({change})"
+            )
+            rows = [("Function", "Self", "Self delta", "Cumulative delta", "Share")]
+            for d in deltas[:top] if total_delta >= 0 else deltas[::-1][:top]:
+                # fmt: off
+                rows.append((
+                    d.label,
+                    f"{format_value(d.baseline_self)} -> {format_value(d.candidate_self)}",
+                    f"{d.self_delta * 1e3:+.3f} ms", f"{d.cumulative_delta * 1e3:+.3f} ms",
+                    f"{d.self_delta / total_delta:.1%}" if total_delta else "n/a",
+                ))
+                # fmt: on
+            print_table(rows)
+            click.echo()
+
+    log(f"Profiles and reports written to `{output_dir}`.", fg="green", bold=True)
+    ctx.exit(errored)
+
+
+@main.command("mine")
+@click.option(
+    "-t",
+    "--targets",
+    default=["normal"],
+    show_default=True,
+    multiple=True,
+    type=TargetSpecifierType(),
+    callback=targets_callback,
+    help="The targets to seed the candidates from (notebooks are skipped).",
+)
+@click.option(
+    "-o",
+    "--output-dir",
+    type=click.Path(file_okay=False, resolve_path=True, writable=True, path_type=Path),
+    help="Where to write the mined targets. Defaults to the current directory.",
+)
+@click.option(
+    "--candidates",
+    default=200,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="How many candidates to generate and time.",
+)
+@click.option(
+    "--keep",
+    default=3,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="How many of the slowest (per token) candidates to keep.",
+)
+@click.option(
+    "--max-lines",
+    default=60,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="The most seed lines a candidate starts from (mutations make it grow).",
+)
+@click.option("--seed", default=0, show_default=True, help="Seed for the random mutations.")
+@click.option("--format-config", default="", help="Arguments to pass to black.Mode.")
+@click.pass_context
+def cmd_mine(
+    ctx: click.Context,
+    targets: List[Target],
+    output_dir: Optional[Path],
+    candidates: int,
+    keep: int,
+    max_lines: int,
+    seed: int,
+    format_config: str,
+) -> None:
+    """
+    Mine targets Black is unusually slow on.
+
+    Candidates are generated by mutating (nesting, adding brackets, commas, comments ...)
+    snippets of the seed targets and timed with the fmt-fast task's formatting (in this
+    process, the best of 3 calls). The candidates with the worst time per token are
+    written out (to the current directory by default). Copied into the mined directory
+    of the micro targets, they're picked up as targets named mined/$digest which are only
+    run when selected by name or directory (-t mined).
+    """
+    black = import_black(ctx)
+    check_mode_config(format_config)
+    mode = eval(f"black.FileMode({format_config})", {"black": black})
+    targets = compatible_targets(ctx, resources.tasks["fmt-fast"], targets)
+    output_dir = output_dir or Path.cwd()
+    seeds = {t.name: t.path.read_text("utf8") for t in targets}
+
+    # The seeds' own cost per token is what the candidates are compared against.
+    seed_costs = [
+        time_formatting(code, mode, repeat=1) / count_tokens(code) for code in seeds.values()
+    ]
+    baseline = statistics.median(seed_costs)
+    log(f"Seeded from {len(seeds)} targets, median cost per token: {format_value(baseline)}.")
+
+    rng = random.Random(seed)
+    generated = generate_candidates(seeds, candidates, rng, max_lines=max_lines)
+    costs = {}
+    failures = 0
+    for i, candidate in enumerate(generated, start=1):
+        try:
+            costs[candidate] = time_formatting(candidate.code, mode) / candidate.tokens
+        except Exception:
+            # Crashing Black is a different kind of finding, this is about performance.
+            failures += 1
+        if not i % 50 or i == len(generated):
+            log(f"Timed {i}/{len(generated)} candidates.")
+    if failures:
+        warn(f"Black failed to format {failures} candidates, they were skipped.")
+    if not costs:
+        err("No candidates could be timed.")
+        ctx.exit(1)
+
+    worst = sorted(costs, key=costs.__getitem__, reverse=True)[:keep]
+    output_dir.mkdir(parents=True, exist_ok=True)
+    rows = [("Target", "Lines", "Per token", "vs. seeds", "Origin")]
+    for candidate in worst:
+        cost = costs[candidate]
+        path = output_dir / f"{candidate.digest}.py"
+        header = (
+            f"# Mined with `blackbench mine --seed {seed}` from {candidate.origin}.\n"
+            f"# Formatting took {format_value(cost)} per token, {cost / baseline:.1f}x the"
+            " seeds' median.\n\n"
+        )
+        path.write_text(header + candidate.code, encoding="utf8")
+        # fmt: off
+        rows.append((
+            f"mined/{candidate.digest}", str(candidate.lines), format_value(cost),
+            f"{cost / baseline:.1f}x", candidate.origin,
+        ))
+        # fmt: on
+    print_table(rows)
+    log(f"Wrote {len(worst)} micro targets to `{output_dir}`.", fg="green", bold=True)
+
+
+@main.command(
+    "reduce",
+    short_help="Minimize a target while keeping a slowdown.",
+    formatter_settings=HelpFormatter.settings(
+        max_width=85, theme=HelpTheme.light(), col2_min_width=10 * 10
+    ),
+)
+@click.option(
+    "-t",
+    "--target",
+    required=True,
+    type=TargetSpecifierType(),
+    help="The target to reduce (a single target, not a group).",
+)
+@cloup.option_group(
+    "Environments",
+    click.option(
+        "--baseline",
+        required=True,
+        type=InterpreterType(),
+        help="The baseline virtual environment (or Python interpreter).",
+    ),
+    click.option(
+        "--candidate",
+        required=True,
+        type=InterpreterType(),
+        help="The candidate virtual environment (or Python interpreter).",
+    ),
+)
+@cloup.option_group(
+    "Reduction parameters",
+    click.option(
+        "--keep-slowdown",
+        default="80%",
+        show_default=True,
+        type=PercentageType(),
+        help="How much of the original slowdown a reduced target has to keep.",
+    ),
+    click.option(
+        "--repeat",
+        default=5,
+        show_default=True,
+        type=click.IntRange(min=1),
+        help="How many times to format each version of the target (the best time is used).",
+    ),
+    click.option("--format-config", default="", help="Arguments to pass to black.Mode."),
+    click.option(
+        "-o",
+        "--output",
+        type=click.Path(dir_okay=False, resolve_path=True, writable=True, path_type=Path),
+        help="Where to write the reduced target. Defaults to reduced-$target.py in the"
+        " current directory.",
+    ),
+)
+@click.pass_context
+def cmd_reduce(
+    ctx: click.Context,
+    target: str,
+    baseline: str,
+    candidate: str,
+    keep_slowdown: float,
+    repeat: int,
+    format_config: str,
+    output: Optional[Path],
+) -> None:
+    """
+    Reduce a target to what's needed to reproduce a slowdown between two environments.
+
+    Statements are removed (large chunks first, then one by one) as long as the code
+    still parses and the candidate is still slower than the baseline by at least
+    --keep-slowdown of the original slowdown. Formatting is timed like the fmt-fast task
+    does (best of --repeat calls) in both environments, which need Black installed. The
+    result is written to the current directory by default. Copied into the reduced
+    directory of the micro targets, it's picked up as a target named reduced/$target to
+    be profiled with `blackbench profile-diff` for example.
+    """
+    if target not in resources.targets:
+        err(f"Only a single target can be reduced, '{target}' is a group of targets.")
+        ctx.exit(2)
+    check_mode_config(format_config)
+    (source_target,) = compatible_targets(
+        ctx, resources.tasks["fmt-fast"], [resources.targets[target]]
+    )
+    source = source_target.path.read_text("utf8")
+    output = output or Path.cwd() / f"reduced-{target.replace('/', '-')}.py"
+
+    with ExitStack() as stack:
+        time_baseline = stack.enter_context(FormattingTimer(baseline, format_config, repeat=repeat))
+        time_candidate = stack.enter_context(
+            FormattingTimer(candidate, format_config, repeat=repeat)
+        )
+
+        def measure(code: str) -> Optional[float]:
+            base_time, cand_time = time_baseline(code), time_candidate(code)
+            if not base_time or cand_time is None:
+                # Black crashing in either environment is a different kind of bug.
+                return None
+            return cand_time / base_time
+
+        try:
+            original = measure(source)
+        except RuntimeError as e:
+            err(f"Couldn't time formatting: {e}")
+            ctx.exit(1)
+        if original is None:
+            err(f"Black failed to format `{target}` in one of the environments.")
+            ctx.exit(1)
+        if original < 1 + MIN_REDUCIBLE_SLOWDOWN:
+            err(
+                f"The candidate isn't slower than the baseline on `{target}` ({original:.2f}x),"
+                " there's nothing to reduce."
+            )
+            ctx.exit(1)
+
+        threshold = 1 + (original - 1) * keep_slowdown
+        lines = len(source.splitlines())
+        log(f"Reducing `{target}` ({lines} lines, {original:.2f}x slower).", bold=True)
+
+        def interesting(code: str) -> bool:
+            ratio = measure(code)
+            return ratio is not None and ratio >= threshold
+
+        def on_reduction(code: str) -> None:
+            log(f"Reduced to {len(code.splitlines())} lines.")
+
+        reduced = reduce_source(source, interesting, on_reduction=on_reduction)
+        final = measure(reduced) or 0.0
+
+    header = (
+        f"# Reduced with `blackbench reduce -t {target}` from {lines} lines.\n"
+        f"# Formatting it was {final:.2f}x slower in the candidate environment than in"
+        f" the baseline one\n# (originally {original:.2f}x).\n\n"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(header + reduced, encoding="utf8")
+    log(
+        f"Reduced `{target}` from {lines} to {len(reduced.splitlines())} lines,"
+        f" {original:.2f}x -> {final:.2f}x slower.",
+    )
+    log(f"Wrote the reduced target to `{output}`.", fg="green", bold=True)
+
+
+@main.command("consolidate")
+@click.argument("stream", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument(
+    "dump_path",
+    metavar="[result-filepath]",
+    required=False,
+    type=click.Path(dir_okay=False, resolve_path=True, writable=True, path_type=Path),
+)
+@click.pass_context
+def cmd_consolidate(ctx: click.Context, stream: Path, dump_path: Optional[Path]) -> None:
+    """
+    Turn a results stream into a regular result file.
+
+    `blackbench run` streams results to `{result-filepath}.jsonl` as it goes and
+    consolidates them at the end. Use this for streams of runs that were interrupted.
+    By default the result file is written next to the stream, minus the .jsonl suffix.
+    """
+    if dump_path is None:
+        dump_path = (
+            stream.with_suffix("") if stream.suffix == ".jsonl" else stream.with_suffix(".json")
+        )
+    confirm_overwrite(dump_path)
+    suite = read_stream(stream)
+    if suite is None:
+        err(f"No results found in `{stream}`.")
+        ctx.exit(1)
+    suite.dump(str(dump_path), replace=True)
+    log(f"Consolidated {len(suite)} benchmarks into `{dump_path}`.")
+
+
+@main.command("convert")
+@click.argument("source", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument(
+    "destination",
+    type=click.Path(dir_okay=False, resolve_path=True, writable=True, path_type=Path),
+)
+@click.option(
+    "--compression",
+    type=click.Choice(COMPRESSIONS),
+    default="none",
+    show_default=True,
+    help=(
+        "How to compress compact result files. Compressed files are smaller but can't be"
+        " memory-mapped. zstd needs Python 3.14+ or the zstandard package."
+    ),
+)
+@click.pass_context
+def cmd_convert(ctx: click.Context, source: Path, destination: Path, compression: str) -> None:
+    """
+    Convert results between pyperf JSON and the compact binary format.
+
+    The source can be any result file (pyperf JSON, a results stream, or a compact file).
+    The destination is written in the compact format if its name ends with .bbr and as
+    pyperf JSON otherwise.
+    """
+    try:
+        suite = load_results(source)
+    except ValueError as e:
+        err(f"Couldn't load results from `{source}`: {e}")
+        ctx.exit(1)
+
+    confirm_overwrite(destination)
+    if destination.suffix == ".bbr":
+        try:
+            dump_compact(suite, destination, compression)
+        except RuntimeError as e:
+            err(str(e))
+            ctx.exit(2)
+    else:
+        if compression != "none":
+            warn("Ignoring `--compression` since pyperf JSON is written uncompressed.")
+        suite.dump(str(destination), replace=True)
+    before, after = source.stat().st_size, destination.stat().st_size
+    log(f"Converted {len(suite)} benchmarks: {before:,} bytes -> {after:,} bytes.")
+
+
+@main.command("history")
+@click.argument("benchmark")
+@click.option(
+    "--store",
+    default="results.db",
+    show_default=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="The history database to query.",
+)
+@click.option("--black-version", help="Only show results collected with this version of Black.")
+@click.pass_context
+def cmd_history(
+    ctx: click.Context, benchmark: str, store: Path, black_version: Optional[str]
+) -> None:
+    """Show the recorded results of a benchmark over time."""
+    with ResultsStore(store) as results_store:
+        entries = results_store.history(benchmark, black_version=black_version)
+        if not entries:
+            err(f"No results for '{benchmark}' are recorded in `{store}`.")
+            known = results_store.benchmark_names()
+            if known:
+                click.echo(f"    Known benchmarks: {', '.join(known)}")
+            ctx.exit(1)
+
+    click.secho(benchmark, bold=True)
+    previous: Optional[float] = None
+    for entry in entries:
+        mean = format_value(entry.mean, entry.unit)
+        stdev = format_value(entry.stdev, entry.unit)
+        delta = ""
+        if previous:
+            change = (entry.mean - previous) / previous
+            delta = click.style(f" ({change:+.1%})", fg="red" if change > 0 else "green")
+        prepped_version = click.style(f"black {entry.black_version}", fg="cyan")
+        details = click.style(f"[{len(entry.values)} values, {entry.host}]", dim=True)
+        click.echo(f"  {entry.timestamp[:19]} {prepped_version} {mean} +- {stdev}{delta} {details}")
+        previous = entry.mean
+
+
+@main.command("report")
+@click.argument("store", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--html",
+    "output_dir",
+    required=True,
+    type=click.Path(file_okay=False, writable=True, path_type=Path),
+    help="Directory to write the report (index.html) to. It's created if necessary.",
+)
+@click.pass_context
+def cmd_report(ctx: click.Context, store: Path, output_dir: Path) -> None:
+    """
+    Render a static HTML trend report from a history database.
+
+    Every benchmark gets a chart of its results over time with 95% confidence bands.
+    Step changes in the means are detected automatically (with PELT) and labelled with
+    the versions of Black before and after the change.
+    """
+    with ResultsStore(store) as results_store:
+        if not results_store.benchmark_names():
+            err(f"No results are recorded in `{store}`.")
+            ctx.exit(1)
+        path, change_points = write_report(results_store, output_dir)
+    log(f"Report written to `{path}` ({change_points} change points detected).", fg="green")
+
+
+@main.command("check")
+@click.argument("baseline", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.argument("candidate", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option(
+    "--max-slowdown",
+    default="0%",
+    show_default=True,
+    type=PercentageType(),
+    help="Slowdowns equal to or smaller than this are tolerated even if significant.",
+)
+@click.option(
+    "--alpha",
+    default=0.05,
+    show_default=True,
+    type=click.FloatRange(0, 1, min_open=True, max_open=True),
+    help="The significance level (applied after correcting for multiple comparisons).",
+)
+@click.pass_context
+def cmd_check(
+    ctx: click.Context, baseline: Path, candidate: Path, max_slowdown: float, alpha: float
+) -> None:
+    """
+    Check two result files for statistically significant regressions.
+
+    Every benchmark present in both files is tested with a one-sided Mann-Whitney U test
+    on the raw values, and the p-values are corrected with the Holm-Bonferroni method.
+    Exits with code 1 only if at least one benchmark is both significantly slower and
+    slower by more than the maximum allowed slowdown.
+    """
+    suites = []
+    for path in (baseline, candidate):
+        try:
+            suites.append(load_results(path))
+        except ValueError as e:
+            err(f"Couldn't load results from `{path}`: {e}")
+            ctx.exit(2)
+    base_suite, cand_suite = suites
+    missing = set(base_suite.get_benchmark_names()) ^ set(cand_suite.get_benchmark_names())
+    if missing:
+        warn(f"Ignoring benchmarks not present in both files: {', '.join(sorted(missing))}")
+
+    comparisons = compare_suites(base_suite, cand_suite)
+    if not comparisons:
+        err("The two result files have no benchmarks in common.")
+        ctx.exit(2)
+
+    regressions = [c for c in comparisons if c.is_regression(max_slowdown, alpha)]
+    if not regressions:
+        log(
+            f"No significant regressions over {max_slowdown:.1%} found"
+            f" ({len(comparisons)} benchmarks compared).",
+            fg="green",
+        )
+        ctx.exit(0)
+
+    rows = [("Benchmark", "Baseline", "Candidate", "Change", "p-value")]
+    for c in regressions:
+        # fmt: off
+        rows.append((
+            c.name, format_value(c.baseline, c.unit), format_value(c.candidate, c.unit),
+            f"{c.change:+.1%}", f"{c.adjusted_p_value:.2g}",
+        ))
+        # fmt: on
+    print_table(rows)
+    click.echo()
+    err(
+        f"{len(regressions)} of {len(comparisons)} benchmarks regressed by more than"
+        f" {max_slowdown:.1%} (alpha: {alpha})."
+    )
+    ctx.exit(1)
+
+
+@main.command("info")
+@click.pass_context
+def cmd_info(ctx: click.Context) -> None:
+    """Show available targets and tasks."""
+
+    def print_item(index: int, name: str, desc: str, lines: Optional[int] = None) -> None:
+        assert desc, "tasks / targets should have a non-empty description"
+        lines_str = click.style(f"[{lines} lines] ", fg="cyan") if lines else ""
+        prepped_desc = click.style(desc, dim=True)
+        click.echo(f"  {i}. {name} {lines_str}- {prepped_desc}")
 
     click.secho("Tasks:", bold=True)
     for i, task in enumerate(resources.tasks.values(), start=1):
@@ -396,6 +2411,19 @@ def print_item(index: int, name: str, desc: str, lines: Optional[int] = None) ->
     for i, target in enumerate(resources.micro_targets, start=1):
         line_count = len(target.path.read_text("utf8").splitlines())
         print_item(i, target.name, target.description, line_count)
+    click.echo()
+
+    click.secho("Stress targets (not included in all):", bold=True)
+    for i, target in enumerate(resources.stress_targets, start=1):
+        line_count = len(target.path.read_text("utf8").splitlines())
+        print_item(i, target.name, target.description, line_count)
+
+    if resources.ungrouped_targets:
+        click.echo()
+        click.secho("Other targets (only run when selected by name or directory):", bold=True)
+        for i, target in enumerate(resources.ungrouped_targets, start=1):
+            line_count = len(target.path.read_text("utf8").splitlines())
+            print_item(i, target.name, target.description, line_count)
 
 
 @main.command("dump")
@@ -0,0 +1,95 @@
+"""
+Deterministic benchmarking: counting the instructions a benchmark executes instead of
+timing it, for machines too noisy for timings to be useful.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+from blackbench.utils import err
+
+if TYPE_CHECKING:
+    from blackbench import Benchmark
+
+THIS_DIR = Path(__file__).parent
+HARNESS = THIS_DIR / "misc" / "count-harness.py"
+BACKENDS = ("perf", "cachegrind")
+
+
+def _harness_env() -> Dict[str, str]:
+    # A fixed hash seed avoids set / dict ordering differences between processes.
+    return {**os.environ, "PYTHONHASHSEED": "0"}
+
+
+def probe_perf(python: str = sys.executable) -> Optional[str]:
+    """Return why instructions can't be counted with perf_event_open, None if they can."""
+    cmd = [python, str(HARNESS), "--probe"]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf8")
+    if proc.returncode:
+        return proc.stdout.strip() or "unknown error"
+    return None
+
+
+def detect_backend(python: str = sys.executable) -> Optional[str]:
+    if probe_perf(python) is None:
+        return "perf"
+    if shutil.which("valgrind"):
+        return "cachegrind"
+    return None
+
+
+def parse_cachegrind_total(path: Path) -> int:
+    """Return the total of the first event (Ir, instructions) in a cachegrind output file."""
+    match = re.search(r"^summary:\s+(\d+)", path.read_text("utf8"), flags=re.MULTILINE)
+    if not match:
+        raise ValueError(f"no summary line in cachegrind output {path}")
+    return int(match.group(1))
+
+
+def count_instructions(
+    bm: "Benchmark",
+    script: Path,
+    *,
+    loops: int,
+    backend: str,
+    python: str = sys.executable,
+) -> Optional[float]:
+    """
+    Count the instructions of one call of the benchmarked function (averaged over
+    `loops` calls). Returns None if the benchmark failed.
+
+    The perf backend only counts the loops. cachegrind can only count the whole process,
+    so the benchmark is also run with zero loops and the difference is used (this cancels
+    out interpreter startup, imports, and warming up).
+    """
+    script.write_text(bm.code, encoding="utf8")
+    output = script.with_suffix(".count.json")
+    harness = [str(HARNESS), str(script), "--output", str(output)]
+    try:
+        if backend == "perf":
+            cmd = [python, *harness, "--loops", str(loops), "--backend", "perf"]
+            subprocess.run(cmd, check=True, env=_harness_env())
+            return float(json.loads(output.read_text("utf8"))["instructions"])
+
+        totals = []
+        for n in (0, loops):
+            cg_output = script.with_suffix(f".{n}.cachegrind")
+            # fmt: off
+            cmd = [
+                "valgrind", "--tool=cachegrind", "--cache-sim=no", "--quiet",
+                f"--cachegrind-out-file={cg_output}",
+                python, *harness, "--loops", str(n), "--backend", "none",
+            ]
+            # fmt: on
+            subprocess.run(cmd, check=True, env=_harness_env())
+            totals.append(parse_cachegrind_total(cg_output))
+        return (totals[1] - totals[0]) / loops
+    except subprocess.CalledProcessError:
+        err("Failed to count instructions for benchmark ^^^")
+        return None
@@ -0,0 +1,267 @@
+"""
+Result file formats beyond a plain pyperf JSON dump.
+"""
+
+import gzip
+import importlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import pyperf
+
+from blackbench.utils import warn
+
+
+def stream_path(dump_path: Path) -> Path:
+    """Where `blackbench run` streams results to while running (for `dump_path`)."""
+    return dump_path.with_name(dump_path.name + ".jsonl")
+
+
+def append_to_stream(stream: Path, result: pyperf.Benchmark) -> None:
+    """
+    Append a benchmark to a results stream. Streams are JSON Lines files where every
+    line is a complete (compact) pyperf JSON document holding a single benchmark, so
+    they can be followed while benchmarks are still running.
+    """
+    with open(stream, "a", encoding="utf8") as f:
+        pyperf.BenchmarkSuite([result]).dump(f, compact=True)
+
+
+def read_stream(stream: Path) -> Optional[pyperf.BenchmarkSuite]:
+    """Consolidate a results stream into a regular suite (None if it's empty)."""
+    suite: Optional[pyperf.BenchmarkSuite] = None
+    lines = stream.read_text("utf8").splitlines()
+    for lineno, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            part = pyperf.BenchmarkSuite.loads(line)
+        except json.JSONDecodeError:
+            if lineno == len(lines):
+                # The writer was interrupted mid-line, everything before it is fine.
+                warn(f"Ignoring truncated last line of results stream `{stream}`.")
+                continue
+            raise
+        if suite is None:
+            suite = part
+        else:
+            for bm in part.get_benchmarks():
+                suite.add_benchmark(bm)
+    return suite
+
+
+# ===================== #
+# Compact binary format #
+# ===================== #
+
+# Layout: an 8 byte prefix (magic, format version, compression, 3 reserved bytes) and a
+# payload which is compressed as a whole if requested. The payload consists of the
+# header length (u64), a JSON header, padding to a multiple of 8 bytes, and finally all
+# values as little endian float64s. Per benchmark, the values of all runs are stored
+# contiguously (so they can be used straight from a memory map), followed by the values
+# of all warmups.
+#
+# The header holds the deduplicated metadata dictionaries and per benchmark: the index
+# of the metadata common to all runs, the position of the values, the keys of the
+# run-specific metadata, and per run: the number of values, the loops of each warmup,
+# and the run-specific metadata values (in key order, null if missing).
+MAGIC = b"BBR"
+FORMAT_VERSION = 1
+COMPRESSIONS = ("none", "gzip", "zstd")
+_PREFIX = struct.Struct("<3sBB3x")
+_HEADER_LENGTH = struct.Struct("<Q")
+
+Metadata = Dict[str, Any]
+
+
+def _zstd() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    try:
+        # Python 3.14+
+        zstd: Any = importlib.import_module("compression.zstd")
+        return zstd.compress, zstd.decompress
+    except ImportError:
+        pass
+    try:
+        zstandard: Any = importlib.import_module("zstandard")
+    except ImportError:
+        raise RuntimeError("zstd compression requires the zstandard package") from None
+    return zstandard.ZstdCompressor().compress, zstandard.ZstdDecompressor().decompress
+
+
+def is_compact_results(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def dump_compact(suite: pyperf.BenchmarkSuite, path: Path, compression: str = "none") -> None:
+    """Write a suite in the compact binary format."""
+    # Many benchmarks share their metadata (except for the name and description).
+    metadata_table: List[Metadata] = []
+    metadata_index: Dict[str, int] = {}
+
+    def intern(metadata: Metadata) -> int:
+        key = json.dumps(metadata, sort_keys=True, default=str)
+        if key not in metadata_index:
+            metadata_index[key] = len(metadata_table)
+            metadata_table.append(json.loads(key))
+        return metadata_index[key]
+
+    values = array("d")
+    benchmarks = []
+    for bm in suite.get_benchmarks():
+        common = bm.get_metadata()
+        runs = bm.get_runs()
+        specific = [
+            {k: v for k, v in run.get_metadata().items() if k not in common or common[k] != v}
+            for run in runs
+        ]
+        run_keys = sorted({key for metadata in specific for key in metadata})
+        start = len(values)
+        for run in runs:
+            values.extend(run.values)
+        count = len(values) - start
+        for run in runs:
+            values.extend(value for _, value in run.warmups)
+        # fmt: off
+        benchmarks.append({
+            "metadata": intern(common),
+            "values": [start, count],
+            "run_keys": run_keys,
+            "runs": [
+                [len(run.values), [loops for loops, _ in run.warmups],
+                 [metadata.get(key) for key in run_keys]]
+                for run, metadata in zip(runs, specific)
+            ],
+        })
+        # fmt: on
+
+    header = json.dumps(
+        {"metadata": metadata_table, "benchmarks": benchmarks}, separators=(",", ":")
+    ).encode("utf8")
+    header += b" " * (-(_HEADER_LENGTH.size + len(header)) % 8)
+    if sys.byteorder != "little":
+        values.byteswap()
+    payload = _HEADER_LENGTH.pack(len(header)) + header + values.tobytes()
+
+    if compression == "gzip":
+        payload = gzip.compress(payload)
+    elif compression == "zstd":
+        payload = _zstd()[0](payload)
+    prefix = _PREFIX.pack(MAGIC, FORMAT_VERSION, COMPRESSIONS.index(compression))
+    path.write_bytes(prefix + payload)
+
+
+class CompactResults:
+    """
+    A result file in the compact binary format. Uncompressed files are memory-mapped
+    and the values are never copied (or parsed) until used, which makes it cheap to
+    compute summaries over many files. Can be used as a context manager.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap: Optional[mmap.mmap] = None
+        magic, version, compression = _PREFIX.unpack(self._file.read(_PREFIX.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} isn't a compact result file")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{path} uses an unsupported format version ({version})")
+
+        data: Union[bytes, mmap.mmap]
+        if COMPRESSIONS[compression] == "none":
+            self._mmap = data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            offset = _PREFIX.size
+        else:
+            raw = self._file.read()
+            data = gzip.decompress(raw) if COMPRESSIONS[compression] == "gzip" else _zstd()[1](raw)
+            offset = 0
+        (header_length,) = _HEADER_LENGTH.unpack_from(data, offset)
+        header_start = offset + _HEADER_LENGTH.size
+        header = json.loads(bytes(data[header_start : header_start + header_length]))
+        self._metadata: List[Metadata] = header["metadata"]
+        self._benchmarks: List[Dict[str, Any]] = header["benchmarks"]
+        self._index = {self._metadata[b["metadata"]]["name"]: b for b in self._benchmarks}
+
+        raw_values = memoryview(data)[header_start + header_length :]
+        if sys.byteorder == "little":
+            self._values: Sequence[float] = raw_values.cast("d")
+        else:
+            swapped = array("d", raw_values.tobytes())
+            swapped.byteswap()
+            self._values = swapped
+
+    def __enter__(self) -> "CompactResults":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._values, memoryview):
+            self._values.release()
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def get_benchmark_names(self) -> List[str]:
+        return list(self._index)
+
+    def get_metadata(self, name: str) -> Metadata:
+        return dict(self._metadata[self._index[name]["metadata"]])
+
+    def get_unit(self, name: str) -> str:
+        return str(self.get_metadata(name).get("unit", "second"))
+
+    def get_values(self, name: str) -> Sequence[float]:
+        """
+        All values of a benchmark (no warmups), without copying them. For uncompressed
+        files they're a view of the memory map, only valid until the file is closed.
+        """
+        start, count = self._index[name]["values"]
+        return self._values[start : start + count]
+
+    def to_suite(self) -> pyperf.BenchmarkSuite:
+        benchmarks = []
+        for entry in self._benchmarks:
+            common = self._metadata[entry["metadata"]]
+            position, count = entry["values"]
+            warmup_position = position + count
+            runs = []
+            for value_count, warmup_loops, run_values in entry["runs"]:
+                metadata = {**common}
+                for key, value in zip(entry["run_keys"], run_values):
+                    if value is not None:
+                        metadata[key] = value
+                values = list(self._values[position : position + value_count])
+                position += value_count
+                end = warmup_position + len(warmup_loops)
+                warmups = list(zip(warmup_loops, self._values[warmup_position:end])) or None
+                warmup_position = end
+                runs.append(pyperf.Run(values, warmups, metadata, collect_metadata=False))
+            benchmarks.append(pyperf.Benchmark(runs))
+        return pyperf.BenchmarkSuite(benchmarks)
+
+
+def load_results(path: Path) -> pyperf.BenchmarkSuite:
+    """Load a result file in any of the supported formats (pyperf JSON, stream, compact)."""
+    if is_compact_results(path):
+        with CompactResults(path) as results:
+            return results.to_suite()
+    if path.suffix == ".jsonl":
+        suite = read_stream(path)
+        if suite is None:
+            raise ValueError(f"{path} contains no results")
+        return suite
+    return pyperf.BenchmarkSuite.load(str(path))
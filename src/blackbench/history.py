@@ -0,0 +1,166 @@
+"""
+A local SQLite-backed store for keeping the results of many blackbench runs around.
+"""
+
+import json
+import sqlite3
+import statistics
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+import pyperf
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS benchmarks (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    name TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    black_version TEXT,
+    blackbench_version TEXT,
+    description TEXT,
+    host TEXT,
+    cpu TEXT,
+    python TEXT,
+    unit TEXT NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bm_values (
+    benchmark_id INTEGER NOT NULL REFERENCES benchmarks (id),
+    run_index INTEGER NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS benchmarks_by_name
+    ON benchmarks (name, black_version, timestamp);
+CREATE INDEX IF NOT EXISTS values_by_benchmark ON bm_values (benchmark_id);
+"""
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    name: str
+    timestamp: str
+    black_version: Optional[str]
+    blackbench_version: Optional[str]
+    host: Optional[str]
+    python: Optional[str]
+    unit: str
+    values: List[float]
+
+    @property
+    def mean(self) -> float:
+        return statistics.fmean(self.values)
+
+    @property
+    def stdev(self) -> float:
+        return statistics.stdev(self.values) if len(self.values) > 1 else 0.0
+
+
+class ResultsStore:
+    """A results history database. Can be used as a context manager."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> "ResultsStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def record_suite(self, suite: pyperf.BenchmarkSuite, config: Dict[str, Any]) -> int:
+        """Record every benchmark of `suite` as one run, returning the run's ID."""
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (timestamp, config) VALUES (?, ?)",
+                (datetime.now().isoformat(sep=" "), json.dumps(config, sort_keys=True)),
+            )
+            run_id = cursor.lastrowid
+            assert run_id is not None
+            for bm in suite.get_benchmarks():
+                self._record_benchmark(run_id, bm)
+        return run_id
+
+    def _record_benchmark(self, run_id: int, bm: pyperf.Benchmark) -> None:
+        metadata = bm.get_metadata()
+        dates = bm.get_dates()
+        timestamp = dates[0] if dates else datetime.now()
+        python = metadata.get("python_version")
+        if python and "python_implementation" in metadata:
+            python = f"{metadata['python_implementation']} {python}"
+        # fmt: off
+        cursor = self.conn.execute(
+            "INSERT INTO benchmarks (run_id, name, timestamp, black_version, blackbench_version,"
+            " description, host, cpu, python, unit, metadata)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id, bm.get_name(), timestamp.isoformat(sep=" "),
+                metadata.get("black-version"), metadata.get("blackbench-version"),
+                metadata.get("description"), metadata.get("hostname"),
+                metadata.get("cpu_model_name"), python, bm.get_unit(),
+                json.dumps(metadata, sort_keys=True, default=str),
+            ),
+        )
+        # fmt: on
+        values = [
+            (cursor.lastrowid, index, value)
+            for index, run in enumerate(bm.get_runs())
+            for value in run.values
+        ]
+        self.conn.executemany(
+            "INSERT INTO bm_values (benchmark_id, run_index, value) VALUES (?, ?, ?)", values
+        )
+
+    def benchmark_names(self) -> List[str]:
+        rows = self.conn.execute("SELECT DISTINCT name FROM benchmarks ORDER BY name")
+        return [name for (name,) in rows]
+
+    def history(self, benchmark: str, *, black_version: Optional[str] = None) -> List[HistoryEntry]:
+        """Return all recorded results for a benchmark, oldest first."""
+        query = (
+            "SELECT id, timestamp, black_version, blackbench_version, host, python, unit"
+            " FROM benchmarks WHERE name = ?"
+        )
+        params: List[str] = [benchmark]
+        if black_version is not None:
+            query += " AND black_version = ?"
+            params.append(black_version)
+        query += " ORDER BY timestamp"
+
+        entries = []
+        rows = self.conn.execute(query, params).fetchall()
+        for bm_id, timestamp, black, blackbench, host, python, unit in rows:
+            values = self.conn.execute(
+                "SELECT value FROM bm_values WHERE benchmark_id = ? ORDER BY rowid", (bm_id,)
+            )
+            entries.append(
+                HistoryEntry(
+                    benchmark,
+                    timestamp,
+                    black,
+                    blackbench,
+                    host,
+                    python,
+                    unit,
+                    values=[v for (v,) in values],
+                )
+            )
+        return entries
@@ -0,0 +1,157 @@
+"""
+Worker hooks: code injected into the generated benchmark scripts to instrument (or tweak)
+the benchmarked function inside the pyperf worker processes.
+
+The hook sources live in `worker-hooks/`. They can't import blackbench since the scripts
+may run under a different interpreter, so any configuration is passed as module-level
+constants appended to the hook source (overriding its defaults, so hooks must only read
+them once the benchmark runs). Data flows back through sidecar files written next to the
+script, which `WorkerHook.collect` turns into benchmark metadata.
+
+Hooks that change what's measured (rather than just observing it) have a tag which is
+added to the benchmark name, e.g. `fmt[gc=disabled]-black/lines`.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Union
+
+from blackbench.utils import format_value
+
+THIS_DIR = Path(__file__).parent
+HOOK_DIR = THIS_DIR / "worker-hooks"
+
+MetadataValue = Union[int, float, str]
+
+
+class WorkerHook:
+    source: Path
+
+    @property
+    def tag(self) -> Optional[str]:
+        return None
+
+    def settings(self) -> Dict[str, object]:
+        return {}
+
+    def render(self) -> str:
+        constants = "".join(f"{name} = {value!r}\n" for name, value in self.settings().items())
+        return self.source.read_text("utf8") + constants
+
+    def collect(self, script: Path) -> Dict[str, MetadataValue]:
+        """Turn whatever the hook wrote next to `script` into benchmark metadata."""
+        return {}
+
+    def summarize(self, metadata: Dict[str, MetadataValue]) -> Optional[str]:
+        return None
+
+
+GC_MODES = ("default", "disabled", "frozen", "threshold=N")
+
+
+class GCModeHook(WorkerHook):
+    """Garbage collector configuration while the benchmarked function runs."""
+
+    source = HOOK_DIR / "gc-mode.py"
+
+    def __init__(self, mode: str) -> None:
+        self.mode = mode
+
+    @property
+    def tag(self) -> Optional[str]:
+        return None if self.mode == "default" else f"gc={self.mode}"
+
+    def settings(self) -> Dict[str, object]:
+        return {"GC_MODE": self.mode}
+
+    def collect(self, script: Path) -> Dict[str, MetadataValue]:
+        return {"gc-mode": self.mode}
+
+
+class GCMetricsHook(WorkerHook):
+    """Allocated blocks, GC collections (per generation) and GC time per call."""
+
+    source = HOOK_DIR / "gc-metrics.py"
+    averaged = (
+        "alloc-blocks-delta",
+        "gc-collections-gen0",
+        "gc-collections-gen1",
+        "gc-collections-gen2",
+        "gc-collected",
+        "gc-time",
+    )
+
+    def collect(self, script: Path) -> Dict[str, MetadataValue]:
+        path = script.with_suffix(".gc-metrics.jsonl")
+        if not path.exists():
+            return {}
+
+        # Every worker process appends its totals, average them over all calls.
+        processes = [json.loads(line) for line in path.read_text("utf8").splitlines() if line]
+        calls = sum(p["calls"] for p in processes)
+        if not calls:
+            return {}
+        metadata: Dict[str, MetadataValue] = {
+            key: sum(p[key] for p in processes) / calls for key in self.averaged
+        }
+        metadata["alloc-blocks-peak"] = max(p["alloc-blocks-peak"] for p in processes)
+        return metadata
+
+    def summarize(self, metadata: Dict[str, MetadataValue]) -> Optional[str]:
+        if not metadata:
+            return None
+        collections = " / ".join(f"{metadata[f'gc-collections-gen{gen}']:.3g}" for gen in range(3))
+        gc_time = format_value(float(metadata["gc-time"]))
+        return (
+            f"GC (per call): {collections} collections (gen 0 / 1 / 2), {gc_time} in GC,"
+            f" {metadata['alloc-blocks-delta']:+.0f} blocks retained"
+            f" (peak +{metadata['alloc-blocks-peak']})"
+        )
+
+
+PERF_EVENTS = (
+    "cycles",
+    "instructions",
+    "cache-references",
+    "cache-misses",
+    "branches",
+    "branch-misses",
+    "task-clock",
+    "page-faults",
+    "context-switches",
+    "cpu-migrations",
+)
+
+
+class PerfCountersHook(WorkerHook):
+    """Linux perf event counts (eg. instructions, cache misses) per call."""
+
+    source = HOOK_DIR / "perf-counters.py"
+
+    def __init__(self, events: Sequence[str]) -> None:
+        self.events = tuple(events)
+
+    def settings(self) -> Dict[str, object]:
+        return {"PERF_EVENTS": self.events}
+
+    def collect(self, script: Path) -> Dict[str, MetadataValue]:
+        path = script.with_suffix(".perf-counters.jsonl")
+        if not path.exists():
+            return {}
+
+        processes = [json.loads(line) for line in path.read_text("utf8").splitlines() if line]
+        calls = sum(p["calls"] for p in processes)
+        if not calls:
+            return {}
+        return {f"perf-{e}": sum(p.get(e, 0.0) for p in processes) / calls for e in self.events}
+
+    def summarize(self, metadata: Dict[str, MetadataValue]) -> Optional[str]:
+        if not metadata:
+            return None
+        counts = ", ".join(
+            f"{format_value(float(metadata[f'perf-{e}']), 'integer')} {e}" for e in self.events
+        )
+        cycles = float(metadata.get("perf-cycles", 0))
+        if cycles and "perf-instructions" in metadata:
+            counts += f" (IPC: {float(metadata['perf-instructions']) / cycles:.2f})"
+        return f"Perf counters (per call): {counts}"
@@ -0,0 +1,98 @@
+"""
+Pre-flight checks: fingerprinting the host and estimating how noisy it is.
+
+Timings are only comparable (and meaningful) if the host was quiet and configured the
+same way, so this is recorded alongside the results as `host-*` metadata.
+"""
+
+import os
+import platform
+import re
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+CPU_DIR = Path("/sys/devices/system/cpu")
+
+# Locking the frequency with the userspace governor is fine too, these aren't.
+SCALING_GOVERNORS = ("powersave", "ondemand", "conservative", "schedutil")
+
+HostInfo = Dict[str, Union[int, float, str]]
+
+
+def _read(path: Path) -> Optional[str]:
+    try:
+        return path.read_text("utf8").strip()
+    except OSError:
+        return None
+
+
+def _cpu_model() -> str:
+    cpuinfo = _read(Path("/proc/cpuinfo")) or ""
+    match = re.search(r"^model name\s*:\s*(.+)$", cpuinfo, flags=re.MULTILINE)
+    return match.group(1) if match else platform.processor() or "unknown"
+
+
+def _cpu_mhz() -> Optional[float]:
+    khz = _read(CPU_DIR / "cpu0" / "cpufreq" / "scaling_cur_freq")
+    if khz and khz.isdigit():
+        return int(khz) / 1000
+    match = re.search(
+        r"^cpu MHz\s*:\s*([\d.]+)$", _read(Path("/proc/cpuinfo")) or "", flags=re.MULTILINE
+    )
+    return float(match.group(1)) if match else None
+
+
+def fingerprint() -> HostInfo:
+    """Collect the host details that matter for benchmark stability."""
+    info: HostInfo = {"host-cpu-model": _cpu_model(), "host-cpu-count": os.cpu_count() or 0}
+    governor = _read(CPU_DIR / "cpu0" / "cpufreq" / "scaling_governor")
+    if governor:
+        info["host-cpu-governor"] = governor
+    mhz = _cpu_mhz()
+    if mhz:
+        info["host-cpu-mhz"] = round(mhz)
+    isolated = _read(CPU_DIR / "isolated")
+    if isolated is not None:
+        info["host-isolated-cpus"] = isolated or "none"
+    if hasattr(os, "getloadavg"):
+        info["host-load-avg"] = round(os.getloadavg()[0], 2)
+    return info
+
+
+def _calibration_workload() -> int:
+    # Pure Python work (like formatting code is), without allocating much so the GC
+    # doesn't get involved.
+    total = 0
+    for i in range(20_000):
+        total += i * i % 7
+    return total
+
+
+def measure_noise(samples: int = 40, warmups: int = 5) -> float:
+    """
+    Estimate the host noise as the coefficient of variation (stdev / mean) of the
+    timings of a short microbenchmark. A quiet, tuned host is usually below 1-2%.
+    """
+    timings: List[float] = []
+    for i in range(warmups + samples):
+        t0 = time.perf_counter()
+        _calibration_workload()
+        if i >= warmups:
+            timings.append(time.perf_counter() - t0)
+    return statistics.stdev(timings) / statistics.fmean(timings)
+
+
+def stability_hints(info: HostInfo) -> List[str]:
+    """Suggestions on what might make the host noisy, based on its fingerprint."""
+    hints = []
+    governor = info.get("host-cpu-governor")
+    if governor in SCALING_GOVERNORS:
+        hints.append(f"the CPU frequency governor '{governor}' changes the frequency on the fly")
+    if info.get("host-isolated-cpus", "none") == "none":
+        hints.append("no CPUs are isolated (isolcpus)")
+    load = float(info.get("host-load-avg", 0))
+    if load > 0.5:
+        hints.append(f"the load average is {load}")
+    return hints
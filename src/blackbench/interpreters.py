@@ -0,0 +1,139 @@
+"""
+Benchmarking under other Python interpreters (eg. other versions or virtual environments).
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+from collections import Counter
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional, Sequence
+
+PROBE = """\
+import json, platform, sys
+import black, pyperf
+print(json.dumps({
+    "implementation": sys.implementation.name,
+    "version": platform.python_version(),
+    "black-version": black.__version__,
+    "black-compiled": black.__file__.endswith((".so", ".pyd")),
+}))
+"""
+
+
+def is_compiled(module: ModuleType) -> bool:
+    """Whether a module is compiled (eg. Black's mypyc wheels) rather than pure Python."""
+    return Path(module.__file__ or "").suffix in (".so", ".pyd")
+
+
+def black_build(compiled: bool) -> str:
+    return "compiled" if compiled else "pure"
+
+
+@dataclass(frozen=True)
+class Interpreter:
+    path: str
+    implementation: str
+    version: str
+    black_version: str
+    black_compiled: bool = False
+    # Added to the names of the benchmarks run under this interpreter, if set.
+    tag: Optional[str] = None
+
+    @property
+    def short_version(self) -> str:
+        prefix = "" if self.implementation == "cpython" else self.implementation
+        return prefix + ".".join(self.version.split(".")[:2])
+
+    @property
+    def description(self) -> str:
+        black = f"{black_build(self.black_compiled)} black {self.black_version}"
+        return f"{self.path} ({self.implementation} {self.version}, {black})"
+
+
+def probe_interpreter(python: str) -> Interpreter:
+    """Query an interpreter's version and version of Black (which must be importable)."""
+    proc = subprocess.run(
+        [python, "-c", PROBE], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf8"
+    )
+    if proc.returncode:
+        raise RuntimeError(proc.stdout.strip())
+    info = json.loads(proc.stdout)
+    # fmt: off
+    return Interpreter(
+        python, info["implementation"], info["version"], info["black-version"],
+        info["black-compiled"],
+    )
+    # fmt: on
+
+
+def tag_interpreters(interpreters: Sequence[Interpreter]) -> List[Interpreter]:
+    """
+    Give every interpreter a unique `py=...` tag, the short Python version if possible.
+    Otherwise (eg. environments with different versions of Black) the Black version or,
+    failing that, the position is added.
+    """
+    tags = [i.short_version for i in interpreters]
+    if len(set(tags)) != len(tags):
+        tags = [f"{i.short_version}-black{i.black_version}" for i in interpreters]
+    if len(set(tags)) != len(tags):
+        counts = Counter(tags)
+        tags = [f"{t}-{n}" if counts[t] > 1 else t for n, t in enumerate(tags, start=1)]
+    return [replace(i, tag=f"py={tag}") for i, tag in zip(interpreters, tags)]
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "blackbench"
+
+
+def venv_python(venv: Path) -> Path:
+    if sys.platform.startswith("win"):
+        return venv / "Scripts" / "python.exe"
+    return venv / "bin" / "python"
+
+
+def black_venv(
+    cache_dir: Path, black_version: str, *, compiled: bool, python: str = sys.executable
+) -> Interpreter:
+    """
+    Set up a virtual environment with a compiled or pure Python build of Black (and
+    pyperf), reusing a previously set up one from the cache directory if possible.
+    """
+    cmd = [python, "-c", "import sys; print(sys.implementation.name, *sys.version_info[:2])"]
+    implementation, major, minor = subprocess.check_output(cmd, encoding="utf8").split()
+    name = f"black-{black_version}-{black_build(compiled)}-{implementation}{major}.{minor}"
+    venv = cache_dir / "venvs" / name
+    if venv_python(venv).exists():
+        try:
+            interpreter = probe_interpreter(str(venv_python(venv)))
+        except RuntimeError:
+            pass
+        else:
+            if interpreter.black_version == black_version:
+                return interpreter
+        shutil.rmtree(venv)
+
+    # Black's sdist builds a pure Python wheel, the compiled wheels are binary only.
+    build = ["--only-binary", "black"] if compiled else ["--no-binary", "black"]
+    try:
+        subprocess.run([python, "-m", "venv", str(venv)], check=True)
+        # fmt: off
+        subprocess.run(
+            [str(venv_python(venv)), "-m", "pip", "install", "--quiet",
+             "--disable-pip-version-check", f"black=={black_version}", "pyperf", *build],
+            check=True,
+        )
+        # fmt: on
+    except subprocess.CalledProcessError as e:
+        shutil.rmtree(venv, ignore_errors=True)
+        raise RuntimeError(f"setting up the environment failed ({e})") from None
+
+    interpreter = probe_interpreter(str(venv_python(venv)))
+    if interpreter.black_compiled != compiled:
+        shutil.rmtree(venv)
+        raise RuntimeError(f"there's no compiled wheel of Black {black_version} for this platform")
+    return interpreter
@@ -0,0 +1,214 @@
+"""
+Input received string file not changed string cache input default.
+
+    file server line configuration timeout directory option support error not token request
+  input connection input version changed cache length version value   
+"""
+
+
+class Thing1:
+    """   Deprecated be while mode could loaded invalid retry.   
+
+        not length module package module error line configuration function string missing
+    during retry mode output version invalid server changed directory default version be package parser  
+        """
+
+    def method_1(self, value):
+        """Connection support not be string option version support function option version line target loaded be the token missing target string."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Loaded value be server invalid missing output output while.
+        warning loaded configuration be mode output be module module line version the parser
+        '''
+        return value
+
+    def method_3(self, value):
+        """Warning version be output connection input "quoted" processing request changed version  """
+        return value
+
+
+class Thing2:
+    """Value string token string during option not request invalid string warning token received not target format connection function during module package client. \\ expected loaded value token the."""
+
+    def method_1(self, value):
+        """Length package version length missing length invalid argument module value token line module deprecated."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Client received line server error line parser deprecated function.
+        during input connection line version string error target because input client directory cache
+        '''
+        return value
+
+    def method_3(self, value):
+        """Server changed output configuration expected support "quoted" timeout missing parser deprecated  """
+        return value
+
+
+class Thing3:
+    r"""Not warning changed during value function token connection format: \d+ default option support invalid version not.
+
+    Args:
+        value: missing module received directory error cache while deprecated warning cache
+        name: file target deprecated cache module function be loaded
+    """
+
+    def method_1(self, value):
+        """Connection default default mode request argument package file input argument changed argument error length invalid loaded the loaded format retry."""
+        return value
+
+    def method_2(self, value):
+        '''
+		While processing output directory deprecated input retry missing target.
+        error expected changed directory deprecated while option mode configuration received loaded parser warning
+        '''
+        return value
+
+    def method_3(self, value):
+        """Be because option mode token length "quoted" expected timeout processing received  """
+        return value
+
+
+class Thing4:
+    """Mode received loaded missing deprecated missing line"""
+
+    def method_1(self, value):
+        """Token file support because configuration length argument loaded changed."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Request connection processing server output request length output invalid.
+        expected retry error function server server function default invalid error configuration package client
+        '''
+        return value
+
+    def method_3(self, value):
+        """Missing directory invalid version the support "quoted" timeout timeout string support  """
+        return value
+
+
+class Thing5:
+    '''Input loaded cache server target line client expected because format default during processing.'''
+
+    def method_1(self, value):
+        """Line module version package error directory because mode mode expected package server changed support token package directory be."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Changed value line because connection token because server target.
+        deprecated option while version warning module value input version invalid server during function
+        '''
+        return value
+
+    def method_3(self, value):
+        """Cache deprecated argument server output request "quoted" during parser value server  """
+        return value
+
+
+class Thing6:
+    """   Line missing package could mode the during value.   
+
+        client version output while argument during warning changed during warning support
+    missing during request be input configuration retry parser file string retry cache parser request  
+        """
+
+    def method_1(self, value):
+        """Expected input during output while because input because string cache target cache file missing cache timeout invalid loaded argument connection."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Token file missing format mode be missing because connection.
+        timeout directory deprecated mode support package function invalid request package value timeout timeout
+        '''
+        return value
+
+    def method_3(self, value):
+        """Could input mode cache string module "quoted" cache request line support  """
+        return value
+
+
+class Thing7:
+    """Parser input string while changed loaded value warning could string argument value deprecated value connection option support line connection changed error during option input. \\ function string function warning version."""
+
+    def method_1(self, value):
+        """Not function be error while string deprecated target expected during line directory the be expected."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Function default deprecated mode not cache error timeout invalid.
+        timeout during string line parser length output input value input during length changed
+        '''
+        return value
+
+    def method_3(self, value):
+        """Could file loaded function expected configuration "quoted" because request missing expected  """
+        return value
+
+
+class Thing8:
+    r"""The invalid client deprecated value argument token request string: \d+ be argument target format be target.
+
+    Args:
+        value: default argument request could error function token deprecated retry invalid
+        name: argument be support loaded the timeout received not
+    """
+
+    def method_1(self, value):
+        """Directory retry processing changed missing the the deprecated length because."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Invalid deprecated value received not retry version be loaded.
+        loaded line target token value version value argument changed option not processing input
+        '''
+        return value
+
+    def method_3(self, value):
+        """The package argument request missing mode "quoted" timeout function option warning  """
+        return value
+
+
+class Thing9:
+    """Package changed missing timeout be loaded value"""
+
+    def method_1(self, value):
+        """Because directory version mode invalid line value connection string argument be connection output module module module parser deprecated configuration default."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Token timeout processing module while client error parser argument.
+        could connection during version because connection during function module not processing the target
+        '''
+        return value
+
+    def method_3(self, value):
+        """Line value version input warning target "quoted" cache changed server received  """
+        return value
+
+
+class Thing10:
+    '''Configuration directory not the format timeout file could error while parser function support.'''
+
+    def method_1(self, value):
+        """Warning invalid deprecated error be function cache cache package option string be token be while timeout."""
+        return value
+
+    def method_2(self, value):
+        '''
+		Option cache line error directory function argument changed argument.
+        not token deprecated invalid connection could connection be invalid because expected package module
+        '''
+        return value
+
+    def method_3(self, value):
+        """Could token default default server because "quoted" the support value deprecated  """
+        return value
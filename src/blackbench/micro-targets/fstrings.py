@@ -0,0 +1,116 @@
+"""f-strings of all shapes and sizes."""
+
+
+def report_1(items, elapsed, path, user):
+    header = f"Client deprecated connection input version retry {len(items)} warning file line received support {elapsed:.2f} version version default argument option during {path!r}"
+    details = f"{user.name} ({user.email}) file value while directory length loaded missing: {', '.join(str(item) for item in items)} loaded processing expected the"
+    summary = f"option warning argument option not {items[0] if items else None!s:>20} received format length package deprecated error {elapsed * 1000:,.0f} ms" + f" argument be length changed cache version {path}"
+    print(f"Line function support during cache file package not connection {header}", f"function changed parser retry be invalid loaded {details} function support loaded missing request", sep="\n")
+    return header, details, summary
+
+
+def report_2(items, elapsed, path, user):
+    header = f"Deprecated token configuration file line could {len(items)} parser mode target invalid option {elapsed:.2f} connection processing warning input changed server {path!r}"
+    details = f"{user.name} ({user.email}) request server be package version package changed: {', '.join(str(item) for item in items)} connection during directory option"
+    summary = f"retry expected function format expected {items[0] if items else None!s:>20} format default the expected parser changed {elapsed * 1000:,.0f} ms" + f" cache request not missing mode directory {path}"
+    print(f"Token function invalid deprecated format expected token client version {header}", f"received loaded connection version input mode input {details} parser deprecated parser configuration default", sep="\n")
+    return header, details, summary
+
+
+def report_3(items, elapsed, path, user):
+    header = f"Error string the input changed could {len(items)} module during parser retry module {elapsed:.2f} mode retry function client package format {path!r}"
+    details = f"{user.name} ({user.email}) changed default changed value function loaded function: {', '.join(str(item) for item in items)} argument file token missing"
+    summary = f"file directory target value be {items[0] if items else None!s:>20} parser line warning server client value {elapsed * 1000:,.0f} ms" + f" cache target processing while string request {path}"
+    print(f"Format received parser length because expected not option retry {header}", f"changed changed error output target be error {details} the format cache because expected", sep="\n")
+    return header, details, summary
+
+
+def report_4(items, elapsed, path, user):
+    header = f"Target changed changed format directory version {len(items)} function target loaded changed retry {elapsed:.2f} received configuration package output line package {path!r}"
+    details = f"{user.name} ({user.email}) retry argument not function expected deprecated token: {', '.join(str(item) for item in items)} argument warning because value"
+    summary = f"file file token during because {items[0] if items else None!s:>20} loaded connection cache value version expected {elapsed * 1000:,.0f} ms" + f" target default deprecated cache warning directory {path}"
+    print(f"Option warning argument loaded during package warning string file {header}", f"deprecated target timeout missing missing connection target {details} loaded changed target cache argument", sep="\n")
+    return header, details, summary
+
+
+def report_5(items, elapsed, path, user):
+    header = f"Mode could error string client because {len(items)} expected be default timeout argument {elapsed:.2f} function module configuration could length connection {path!r}"
+    details = f"{user.name} ({user.email}) value input timeout not output timeout directory: {', '.join(str(item) for item in items)} timeout retry length option"
+    summary = f"module the string option value {items[0] if items else None!s:>20} cache format server because default configuration {elapsed * 1000:,.0f} ms" + f" value the mode connection directory line {path}"
+    print(f"Configuration server format could value warning processing because not {header}", f"received missing target while directory loaded missing {details} while retry package file default", sep="\n")
+    return header, details, summary
+
+
+def report_6(items, elapsed, path, user):
+    header = f"Processing token expected argument configuration could {len(items)} received error invalid changed loaded {elapsed:.2f} during support missing not be line {path!r}"
+    details = f"{user.name} ({user.email}) module option not value string package function: {', '.join(str(item) for item in items)} directory output support line"
+    summary = f"version module processing parser expected {items[0] if items else None!s:>20} while module invalid loaded deprecated because {elapsed * 1000:,.0f} ms" + f" argument argument output timeout invalid missing {path}"
+    print(f"Retry warning length expected error warning loaded line invalid {header}", f"line default format target option changed received {details} not be be be invalid", sep="\n")
+    return header, details, summary
+
+
+def report_7(items, elapsed, path, user):
+    header = f"Loaded target value output could directory {len(items)} output output length default because {elapsed:.2f} warning mode default invalid could parser {path!r}"
+    details = f"{user.name} ({user.email}) module token mode loaded input while timeout: {', '.join(str(item) for item in items)} option default received retry"
+    summary = f"loaded mode output target because {items[0] if items else None!s:>20} string input retry invalid output package {elapsed * 1000:,.0f} ms" + f" package changed argument output configuration module {path}"
+    print(f"Default deprecated string configuration server string deprecated token length {header}", f"mode the server option input default error {details} not option function configuration be", sep="\n")
+    return header, details, summary
+
+
+def report_8(items, elapsed, path, user):
+    header = f"Processing timeout version warning expected length {len(items)} request target token line input {elapsed:.2f} module be could option request package {path!r}"
+    details = f"{user.name} ({user.email}) could changed be string missing default invalid: {', '.join(str(item) for item in items)} during module missing warning"
+    summary = f"string timeout while because mode {items[0] if items else None!s:>20} invalid because parser changed changed directory {elapsed * 1000:,.0f} ms" + f" during processing default token file retry {path}"
+    print(f"Error module could the timeout token timeout value format {header}", f"parser line because the during invalid server {details} value version cache support retry", sep="\n")
+    return header, details, summary
+
+
+def report_9(items, elapsed, path, user):
+    header = f"While output default mode not error {len(items)} file invalid configuration expected not {elapsed:.2f} line input invalid input error support {path!r}"
+    details = f"{user.name} ({user.email}) function warning parser because error configuration line: {', '.join(str(item) for item in items)} request package expected deprecated"
+    summary = f"target be invalid loaded connection {items[0] if items else None!s:>20} invalid directory error processing be error {elapsed * 1000:,.0f} ms" + f" token length retry length request not {path}"
+    print(f"While function because processing while client mode mode argument {header}", f"option connection loaded option format client server {details} module option argument not server", sep="\n")
+    return header, details, summary
+
+
+def report_10(items, elapsed, path, user):
+    header = f"Function during expected input directory missing {len(items)} changed input argument function package {elapsed:.2f} line function line option missing not {path!r}"
+    details = f"{user.name} ({user.email}) received missing function token string directory could: {', '.join(str(item) for item in items)} mode while not token"
+    summary = f"expected missing file could target {items[0] if items else None!s:>20} parser not argument be package module {elapsed * 1000:,.0f} ms" + f" while version expected directory output file {path}"
+    print(f"Missing input argument client line module received while option {header}", f"could missing loaded length support be while {details} argument server file connection support", sep="\n")
+    return header, details, summary
+
+
+def report_11(items, elapsed, path, user):
+    header = f"Missing missing processing processing package request {len(items)} target target parser version warning {elapsed:.2f} length changed module could function argument {path!r}"
+    details = f"{user.name} ({user.email}) length not length loaded output changed version: {', '.join(str(item) for item in items)} parser format default module"
+    summary = f"option length be directory default {items[0] if items else None!s:>20} option mode token argument deprecated default {elapsed * 1000:,.0f} ms" + f" error value module support be token {path}"
+    print(f"Output version argument length value default deprecated changed processing {header}", f"be argument default invalid while target configuration {details} target token server timeout length", sep="\n")
+    return header, details, summary
+
+
+def report_12(items, elapsed, path, user):
+    header = f"During client retry value option not {len(items)} parser loaded while cache processing {elapsed:.2f} file default length package value module {path!r}"
+    details = f"{user.name} ({user.email}) version option request server deprecated package request: {', '.join(str(item) for item in items)} missing file warning target"
+    summary = f"changed connection missing package parser {items[0] if items else None!s:>20} missing retry cache connection token received {elapsed * 1000:,.0f} ms" + f" client target changed input missing expected {path}"
+    print(f"Parser version while processing warning request client module value {header}", f"format could argument received target output loaded {details} support processing because parser be", sep="\n")
+    return header, details, summary
+
+
+TEMPLATES = [
+    f"string missing while option invalid be retry missing {__name__} configuration warning could error while target connection version be target retry {1 * 2}",
+    f"line loaded support argument length option {__name__} file parser received deprecated value support received missing {2 * 2}",
+    f"be configuration format timeout option output {__name__} invalid because parser connection token because could connection warning function package expected not because {3 * 2}",
+    f"module cache configuration function while input connection support option parser invalid the package {__name__} connection input warning server default default be processing target not processing {4 * 2}",
+    f"while while output configuration version received file function version target format configuration mode not {__name__} connection default function loaded directory length value file mode cache length {5 * 2}",
+    f"changed expected deprecated received function server value not {__name__} file parser client file client file line token while error cache received format {6 * 2}",
+    f"argument client parser mode could argument {__name__} string because target invalid error missing version length server during deprecated {7 * 2}",
+    f"target processing string be invalid be invalid module server cache parser line loaded {__name__} line default parser token missing module support {8 * 2}",
+    f"request deprecated missing mode missing file mode package invalid string function could {__name__} default function error target while changed request {9 * 2}",
+    f"option module changed missing file value {__name__} connection argument target target version input file {10 * 2}",
+    f"changed missing target target missing not input value {__name__} target error line argument string connection because configuration server during processing version output because {11 * 2}",
+    f"format support missing timeout package parser deprecated during client because {__name__} not missing server support missing be changed line {12 * 2}",
+    f"support not output cache parser token request support support deprecated function {__name__} target while retry because client value connection during {13 * 2}",
+    f"target output input target expected output {__name__} package be not token error support received processing {14 * 2}",
+    f"warning input not value line argument not missing expected changed processing mode {__name__} output function directory server value invalid while could {15 * 2}",
+]
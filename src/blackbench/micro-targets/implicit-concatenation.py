@@ -0,0 +1,88 @@
+"""Implicitly concatenated strings, mostly as call arguments."""
+
+import argparse
+
+parser = argparse.ArgumentParser(
+    description="Because processing option token request request line support retry mode "
+    "processing parser be format client function output string value function token package "
+    "cache be while argument request directory directory option.",
+)
+parser.add_argument(
+    "--request-1", help="module length input file configuration be file argument input " "argument timeout input warning package function configuration " "function cache parser argument token received", default="connection" "changed"
+)
+parser.add_argument(
+    "--error-2", help="expected not deprecated could request missing warning " "expected timeout length module option line support line " "mode error value target while output loaded line", default="connection" "expected"
+)
+parser.add_argument(
+    "--because-3", help="missing connection option loaded could parser version " "warning connection request line input line client request during " "expected during token during configuration be error", default="while" "expected"
+)
+parser.add_argument(
+    "--connection-4", help="directory mode could could parser during " "argument changed received parser cache the loaded invalid value " "target error target file error", default="could" "input"
+)
+parser.add_argument(
+    "--output-5", help="target output parser not version while " "output string package changed package because value loaded " "target length output target option client", default="module" "while"
+)
+parser.add_argument(
+    "--error-6", help="file file file value support length received processing expected " "module while value line package line " "error package token directory", default="length" "while"
+)
+parser.add_argument(
+    "--while-7", help="during support input token received configuration target length changed " "warning directory token deprecated function " "module received format", default="argument" "directory"
+)
+parser.add_argument(
+    "--input-8", help="could directory received request processing function " "version option changed connection file input deprecated because client " "missing line warning", default="option" "warning"
+)
+parser.add_argument(
+    "--deprecated-9", help="warning while package received could support " "processing timeout output line default received " "version line server expected cache length cache", default="mode" "changed"
+)
+parser.add_argument(
+    "--changed-10", help="package received client connection string output token " "token parser support timeout deprecated support " "line received mode output string parser", default="because" "input"
+)
+parser.add_argument(
+    "--changed-11", help="version error mode option parser file parser support be " "missing argument format received timeout client cache " "output deprecated string value loaded", default="package" "directory"
+)
+parser.add_argument(
+    "--connection-12", help="could default processing retry function retry " "loaded warning length support received " "changed value the", default="output" "request"
+)
+parser.add_argument(
+    "--warning-13", help="received argument client parser line parser argument could " "argument input retry cache file " "warning server file error", default="during" "server"
+)
+parser.add_argument(
+    "--parser-14", help="the token input module loaded " "parser expected argument cache processing during value " "expected string client because length request expected", default="argument" "format"
+)
+parser.add_argument(
+    "--support-15", help="the length parser input changed client " "package function error invalid while line " "error default loaded", default="server" "value"
+)
+parser.add_argument(
+    "--received-16", help="connection the format version connection missing string " "token directory input the format argument target " "connection could default because expected token request error", default="changed" "while"
+)
+parser.add_argument(
+    "--support-17", help="deprecated because function parser target package retry " "value received option expected module target " "deprecated output received cache default timeout", default="connection" "changed"
+)
+parser.add_argument(
+    "--module-18", help="processing missing processing support target " "input because could output while " "input cache option request", default="line" "processing"
+)
+parser.add_argument(
+    "--missing-19", help="changed timeout support directory during " "while missing could expected value " "warning expected input could output expected changed", default="token" "configuration"
+)
+parser.add_argument(
+    "--error-20", help="the timeout directory not file invalid mode " "cache could not received file " "warning server value argument argument", default="warning" "target"
+)
+
+
+def explain(reason, hint):
+    print("version missing version version be changed default " "cache value argument mode because server " + reason, "cache error processing value retry the " "configuration token expected changed cache", hint, "invalid cache version retry " f"{reason!r} " "connection expected mode option string")
+    print("client because file default warning package configuration " "connection timeout not loaded module file " + reason, "missing module changed support could connection " "file error missing retry cache", hint, "timeout could value while " f"{reason!r} " "parser retry input line input")
+    print("module changed line connection token option default " "processing retry warning token string could " + reason, "output directory server function changed invalid " "output during could mode argument", hint, "default version processing line " f"{reason!r} " "deprecated warning warning option token")
+    print("version server cache received connection retry token " "support option expected could output warning " + reason, "warning output processing value version connection " "format timeout length argument be", hint, "missing target be cache " f"{reason!r} " "client could string version changed")
+    print("module module file not client directory default " "output timeout received timeout length token " + reason, "the timeout client because received connection " "deprecated module support timeout error", hint, "connection output line parser " f"{reason!r} " "version expected cache argument mode")
+    print("token format target while during expected loaded " "received line timeout target line warning " + reason, "file input retry option configuration format " "output directory directory warning parser", hint, "option client length retry " f"{reason!r} " "version input connection during output")
+    print("argument changed length format during argument during " "expected request mode request value cache " + reason, "during server cache argument could processing " "file not default could the", hint, "warning value function retry " f"{reason!r} " "not support option the timeout")
+    print("while expected target could package function default " "package received default during configuration the " + reason, "cache output warning the configuration processing " "string cache parser configuration while", hint, "deprecated changed invalid server " f"{reason!r} " "loaded loaded processing option connection")
+    return (
+        "package processing format mode string error be "
+        "error expected input connection deprecated retry token changed "
+        "argument argument file be error version "
+        "output received could function the deprecated request be during "
+        "argument length input loaded processing file retry timeout deprecated "
+        "end"
+    )
@@ -0,0 +1,104 @@
+"""Long string literals and explicit concatenation, split by the string transformers."""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_1 = "Because configuration string connection retry value loaded changed cache be directory invalid file configuration be timeout retry while module configuration output client support argument deprecated cache warning retry."
+MESSAGE_2 = "Directory string the request deprecated invalid length string option timeout length loaded be version loaded mode mode module format file expected cache because version be."
+MESSAGE_3 = "Parser function package target input client support not file default retry parser be retry loaded version string expected function target request target mode timeout default string."
+MESSAGE_4 = "Changed argument not module function request cache connection request expected version string function deprecated output retry changed line could retry file line error string not timeout input support line."
+MESSAGE_5 = "Argument during error argument expected option format value connection output cache format directory invalid directory error target retry value while during."
+MESSAGE_6 = "Could because option function request changed invalid module not version version module expected processing format output the changed because."
+MESSAGE_7 = "Cache string argument length because parser invalid request expected the format while server while loaded function token function while module client option target request cache processing the module."
+MESSAGE_8 = "During configuration because target token connection could connection input be be during not cache value value default received output request format processing module."
+MESSAGE_9 = "Timeout cache deprecated client support token error default argument target missing processing missing because connection retry not length configuration directory output retry directory retry."
+MESSAGE_10 = "Not support function could retry not file length not while connection string default during timeout cache value input."
+MESSAGE_11 = "Received connection received warning client loaded loaded default invalid mode invalid warning expected could changed argument argument loaded could error length loaded connection client client cache missing."
+MESSAGE_12 = "Invalid server string expected connection not missing output loaded could argument cache the be connection request warning during received timeout."
+MESSAGE_13 = "Could request version the version format expected parser invalid deprecated output default support during option client parser timeout could directory cache could line could."
+MESSAGE_14 = "Directory received while processing request could while be server not module not changed connection error because input connection."
+MESSAGE_15 = "Module file package be warning default directory input processing line format timeout default support line connection format error value default argument token expected line not the expected."
+
+
+def check_1(value, name, limit):
+    if value > limit:
+        raise ValueError("Package input loaded not cache timeout while format value mode not connection " + name + " target parser request missing cache support token package argument processing: " + str(value) + " > " + str(limit))
+    logger.warning("Default output token default loaded value format because loaded output option string parser module timeout %s (%d)", name, value)
+    return "support length timeout changed function format while during" + " " + "format could be function invalid string file the length" + name
+
+
+def check_2(value, name, limit):
+    if value > limit:
+        raise ValueError("Value function format request missing output support invalid output the because not " + name + " deprecated option cache file target directory output option invalid value: " + str(value) + " > " + str(limit))
+    logger.warning("Token target file mode timeout changed connection default loaded mode output warning package option connection %s (%d)", name, value)
+    return "request server warning configuration server length warning default" + " " + "connection string request deprecated loaded version file received retry" + name
+
+
+def check_3(value, name, limit):
+    if value > limit:
+        raise ValueError("Client expected mode token retry retry configuration default client error length string " + name + " not string mode argument while error changed cache length configuration: " + str(value) + " > " + str(limit))
+    logger.warning("Format server directory format file loaded module invalid mode line invalid module while because version input %s (%d)", name, value)
+    return "client format file support invalid the processing cache" + " " + "changed default client target invalid not default length package" + name
+
+
+def check_4(value, name, limit):
+    if value > limit:
+        raise ValueError("Line default because token while token default warning line error deprecated parser " + name + " output value client warning default version changed server package input: " + str(value) + " > " + str(limit))
+    logger.warning("Error output the token parser timeout invalid directory module argument line expected missing missing changed timeout while received request %s (%d)", name, value)
+    return "default be parser while default function package length" + " " + "be connection changed token retry client option configuration file" + name
+
+
+def check_5(value, name, limit):
+    if value > limit:
+        raise ValueError("Connection received package not expected warning function input client support deprecated version " + name + " during error connection option argument deprecated the loaded invalid retry: " + str(value) + " > " + str(limit))
+    logger.warning("Deprecated processing expected could output connection because expected value expected default processing output module line missing package %s (%d)", name, value)
+    return "while invalid output missing request received missing format" + " " + "connection function string processing during function connection string missing" + name
+
+
+def check_6(value, name, limit):
+    if value > limit:
+        raise ValueError("Not support parser connection string length line cache be value option retry " + name + " version deprecated option support timeout not warning warning length cache: " + str(value) + " > " + str(limit))
+    logger.warning("Warning could timeout warning version directory deprecated configuration input version received the mode token version warning cache cache module retry during retry %s (%d)", name, value)
+    return "string invalid during configuration version length default changed" + " " + "error request expected value package cache configuration error directory" + name
+
+
+def check_7(value, name, limit):
+    if value > limit:
+        raise ValueError("Input default configuration be argument invalid value expected server could format version " + name + " line timeout expected line length version string warning format be: " + str(value) + " > " + str(limit))
+    logger.warning("Configuration cache could mode retry argument not argument file configuration connection client configuration package option connection value received default because input timeout %s (%d)", name, value)
+    return "expected deprecated format target request module module support" + " " + "because request token loaded directory configuration token input changed" + name
+
+
+def check_8(value, name, limit):
+    if value > limit:
+        raise ValueError("Version error support client not directory deprecated function connection loaded deprecated token " + name + " changed module because input file mode cache invalid default target: " + str(value) + " > " + str(limit))
+    logger.warning("While argument length the warning during loaded invalid target function expected support option invalid server processing %s (%d)", name, value)
+    return "argument string package cache received expected invalid directory" + " " + "string line connection be string missing connection expected input" + name
+
+
+def check_9(value, name, limit):
+    if value > limit:
+        raise ValueError("Package default version length configuration during line server during timeout mode format " + name + " length string module deprecated string output the processing client be: " + str(value) + " > " + str(limit))
+    logger.warning("Warning during output connection deprecated received argument support during missing configuration be parser retry error deprecated connection token %s (%d)", name, value)
+    return "default directory target received output processing mode invalid" + " " + "output length mode deprecated expected string token format retry" + name
+
+
+def check_10(value, name, limit):
+    if value > limit:
+        raise ValueError("Because client line because cache deprecated server client timeout received string directory " + name + " processing module parser loaded client parser retry target server token: " + str(value) + " > " + str(limit))
+    logger.warning("Support cache value string file could output parser deprecated value function during loaded the input %s (%d)", name, value)
+    return "parser received received missing length server could format" + " " + "received because not error during not input function changed" + name
+
+
+class Messages:
+    text_1 = "Option option input token be connection because output warning module module package retry processing version missing" % {"name": "missing"}
+    text_2 = "Directory invalid token input package could package loaded timeout function timeout format default be request connection server output not request" % {"name": "the"}
+    text_3 = "Missing deprecated module received parser file retry parser support parser deprecated expected not changed retry format function directory default client invalid because" % {"name": "cache"}
+    text_4 = "Argument option string option not could request token module input parser missing because expected deprecated token deprecated error string" % {"name": "while"}
+    text_5 = "During missing be module file invalid line module format configuration be retry changed input directory configuration changed string input file server received processing argument" % {"name": "missing"}
+    text_6 = "Server directory invalid function during be received mode warning length line default loaded request length warning deprecated during parser default" % {"name": "error"}
+    text_7 = "File expected be line format line because error while the default cache expected warning could client processing target package during function missing could timeout" % {"name": "string"}
+    text_8 = "Value parser missing deprecated during because configuration function module connection support request token output the output warning be retry because expected because argument option" % {"name": "during"}
+    text_9 = "While support string warning received received connection expected output option version client module while value not string warning length while" % {"name": "string"}
+    text_10 = "Parser token directory directory default during option missing cache received mode length output cache version expected" % {"name": "line"}
@@ -0,0 +1,235 @@
+"""
+Target mining: mutating existing targets into inputs Black is unusually slow on (per
+token), so pathological shapes can be kept around as regression benchmarks.
+"""
+
+import ast
+import hashlib
+import io
+import random
+import textwrap
+import time
+import tokenize
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, Dict, List, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import black
+
+Mutation = Callable[[str, random.Random], str]
+
+
+@dataclass(frozen=True)
+class Candidate:
+    code: str
+    # The seed target and the mutations applied, eg. black/linegen+nest+deepen
+    origin: str
+
+    @property
+    def lines(self) -> int:
+        return len(self.code.splitlines())
+
+    @property
+    def tokens(self) -> int:
+        return count_tokens(self.code)
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha1(self.code.encode("utf8")).hexdigest()[:10]
+
+
+def count_tokens(source: str) -> int:
+    """
+    Count the tokens, except for the ones that are only layout (newlines, indentation).
+    Unlike lines, this doesn't reward cramming lots of code onto one line.
+    """
+    layout = {tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT, tokenize.ENDMARKER}
+    tokens = tokenize.generate_tokens(io.StringIO(source).readline)
+    return sum(1 for t in tokens if t.type not in layout)
+
+
+def statement_spans(source: str) -> List[Tuple[int, int]]:
+    """Return the line spans (0-based, end exclusive) of the top-level statements."""
+    spans = []
+    for node in ast.parse(source).body:
+        decorators = getattr(node, "decorator_list", [])
+        start = min([node.lineno, *(d.lineno for d in decorators)]) - 1
+        end = getattr(node, "end_lineno", None) or start + 1
+        spans.append((start, end))
+    return spans
+
+
+def _replace_nodes(source: str, nodes: Sequence[ast.AST], rewrite: Callable[[str], str]) -> str:
+    # AST column offsets are in UTF-8 bytes, so all of the slicing is done on bytes.
+    data = source.encode("utf8")
+    line_starts = [0]
+    for line in data.splitlines(keepends=True):
+        line_starts.append(line_starts[-1] + len(line))
+    spans = []
+    for node in nodes:
+        start = line_starts[node.lineno - 1] + node.col_offset  # type: ignore[attr-defined]
+        end = line_starts[node.end_lineno - 1] + node.end_col_offset  # type: ignore[attr-defined]
+        spans.append((start, end))
+
+    # Nested nodes can't both be rewritten, the outermost one wins.
+    chosen: List[Tuple[int, int]] = []
+    for start, end in sorted(spans, key=lambda span: (span[0], -span[1])):
+        if not chosen or start >= chosen[-1][1]:
+            chosen.append((start, end))
+    for start, end in reversed(chosen):
+        segment = data[start:end].decode("utf8")
+        data = data[:start] + rewrite(segment).encode("utf8") + data[end:]
+    return data.decode("utf8")
+
+
+def _sample_nodes(
+    source: str, kinds: Tuple[type, ...], rng: random.Random, count: int = 4
+) -> List[ast.AST]:
+    nodes = [n for n in ast.walk(ast.parse(source)) if isinstance(n, kinds)]
+    # Assignment targets can't be rewritten into just any expression.
+    nodes = [n for n in nodes if isinstance(getattr(n, "ctx", ast.Load()), ast.Load)]
+    return rng.sample(nodes, min(count, len(nodes)))
+
+
+def nest(source: str, rng: random.Random) -> str:
+    """Wrap the code in a few levels of blocks."""
+    headers = ["if condition:", "for item in items:", "with context:", "def inner():"]
+    depth = rng.randint(2, 8)
+    for _ in range(depth):
+        source = f"{rng.choice(headers)}\n" + textwrap.indent(source, "    ")
+    return source
+
+
+def deepen(source: str, rng: random.Random) -> str:
+    """Bury expressions under several levels of brackets."""
+    wrappers = ["call({})", "[{}]", "{{'key': {}}}", "({},)", "obj.method(arg, {})"]
+    statements = [n for n in ast.walk(ast.parse(source)) if isinstance(n, (ast.Assign, ast.Return))]
+    values: List[ast.AST] = [n.value for n in statements if n.value is not None]
+    depth = rng.randint(3, 12)
+
+    def rewrite(segment: str) -> str:
+        for _ in range(depth):
+            segment = rng.choice(wrappers).format(segment)
+        return segment
+
+    return _replace_nodes(source, rng.sample(values, min(4, len(values))), rewrite)
+
+
+def widen(source: str, rng: random.Random) -> str:
+    """Turn expressions into long collections of themselves."""
+    kinds = (ast.Call, ast.List, ast.Dict, ast.Name, ast.Constant)
+    count = rng.randint(5, 40)
+    return _replace_nodes(
+        source,
+        _sample_nodes(source, kinds, rng),
+        lambda segment: "[" + ", ".join([segment] * count) + "]",
+    )
+
+
+def chain(source: str, rng: random.Random) -> str:
+    """Turn expressions into long boolean / arithmetic chains."""
+    operator = rng.choice([" and ", " or ", " + ", " * ", " == "])
+    count = rng.randint(5, 40)
+    kinds = (ast.BoolOp, ast.BinOp, ast.Compare, ast.Call, ast.Name)
+    return _replace_nodes(
+        source,
+        _sample_nodes(source, kinds, rng),
+        lambda segment: "(" + operator.join([f"({segment})"] * count) + ")",
+    )
+
+
+def explode(source: str, rng: random.Random) -> str:
+    """Add magic trailing commas to calls and collections."""
+
+    def rewrite(segment: str) -> str:
+        body = segment[:-1].rstrip()
+        # A comma after a trailing comment would end up commented out.
+        if body.endswith((",", "(", "[", "{")) or "#" in body.splitlines()[-1]:
+            return segment
+        return f"{body},{segment[-1]}"
+
+    kinds = (ast.Call, ast.List, ast.Dict, ast.Set)
+    nodes = [
+        n
+        for n in _sample_nodes(source, kinds, rng, count=20)
+        if not isinstance(n, ast.Call) or n.args or n.keywords
+    ]
+    return _replace_nodes(source, nodes, rewrite)
+
+
+def comment(source: str, rng: random.Random) -> str:
+    """Add comments to the end of lines within brackets."""
+    tokens = list(tokenize.generate_tokens(io.StringIO(source).readline))
+    commented = {t.start[0] for t in tokens if t.type == tokenize.COMMENT}
+    targets = set()
+    for previous, token in zip(tokens, tokens[1:]):
+        # NL tokens also end blank and comment-only lines, those are left alone.
+        if token.type == tokenize.NL and previous.start[0] == token.start[0]:
+            if token.start[0] not in commented:
+                targets.add(token.start[0])
+    lines = source.splitlines(keepends=True)
+    for lineno in targets:
+        if rng.random() < 0.7:
+            line = lines[lineno - 1]
+            lines[lineno - 1] = line.rstrip("\r\n") + "  # mined\n"
+    return "".join(lines)
+
+
+MUTATIONS: Dict[str, Mutation] = {
+    "nest": nest,
+    "deepen": deepen,
+    "widen": widen,
+    "chain": chain,
+    "explode": explode,
+    "comment": comment,
+}
+
+
+def generate_candidates(
+    seeds: Dict[str, str], count: int, rng: random.Random, *, max_lines: int
+) -> List[Candidate]:
+    """
+    Generate (parseable) candidates by applying one to three random mutations to a random
+    window of top-level statements (up to max_lines long) from one of the seed sources.
+    """
+    spans = {name: statement_spans(source) for name, source in seeds.items()}
+    names = [name for name in seeds if spans[name]]
+    candidates: List[Candidate] = []
+    attempts = 0
+    while len(candidates) < count and attempts < count * 20:
+        attempts += 1
+        name = rng.choice(names)
+        lines = seeds[name].splitlines(keepends=True)
+        first = rng.randrange(len(spans[name]))
+        start, end = spans[name][first]
+        if end - start > max_lines:
+            continue
+        for _, next_end in spans[name][first + 1 :]:
+            if next_end - start > max_lines:
+                break
+            end = next_end
+        code = "".join(lines[start:end])
+        applied = rng.sample(list(MUTATIONS), rng.randint(1, 3))
+        try:
+            for mutation in applied:
+                code = MUTATIONS[mutation](code, rng)
+            ast.parse(code)
+        except (SyntaxError, ValueError, tokenize.TokenError):
+            continue
+        candidates.append(Candidate(code, "+".join([name, *applied])))
+    return candidates
+
+
+def time_formatting(code: str, mode: "black.Mode", *, repeat: int = 3) -> float:
+    """Return the best of a few formatting (with --fast) timings, in seconds."""
+    import black
+
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        try:
+            black.format_file_contents(code, fast=True, mode=mode)
+        except black.NothingChanged:
+            pass
+        best = min(best, time.perf_counter() - t0)
+    return best
@@ -0,0 +1,106 @@
+"""
+Runs a generated benchmark script once, counting instructions instead of timing.
+
+Like the profile harness, pyperf.Runner is replaced so the benchmark script can be
+executed as is. The benchmarked function is called once to warm up and then `--loops`
+times. With the perf backend the instructions retired (in user space) during those
+loops are counted with perf_event_open. With the none backend the loops are only run,
+the caller is expected to count the whole process (e.g. under cachegrind). This file
+must not depend on blackbench since it's run with the benchmarking interpreter.
+
+usage: count-harness.py SCRIPT --loops N --backend {perf,none} --output PATH
+       count-harness.py --probe
+"""
+
+import argparse
+import ctypes
+import fcntl
+import json
+import os
+import runpy
+import struct
+import sys
+from typing import Any, Callable, Optional, Sequence
+
+import pyperf
+
+parser = argparse.ArgumentParser()
+parser.add_argument("script", nargs="?")
+parser.add_argument("--loops", type=int, default=1)
+parser.add_argument("--backend", choices=["perf", "none"], default="perf")
+parser.add_argument("--output")
+parser.add_argument("--probe", action="store_true", help="check the perf backend works")
+args = parser.parse_args()
+
+PERF_SYSCALLS = {"x86_64": 298, "aarch64": 241, "i386": 336, "i686": 336, "ppc64le": 319}
+PERF_IOC_ENABLE = 0x2400
+PERF_IOC_DISABLE = 0x2401
+PERF_IOC_RESET = 0x2403
+
+
+def open_instructions_counter() -> int:
+    # PERF_TYPE_HARDWARE / PERF_COUNT_HW_INSTRUCTIONS, disabled until enabled, user space
+    # only. The original (version 0) 64 byte perf_event_attr is understood by every kernel.
+    attr = ctypes.create_string_buffer(64)
+    struct.pack_into("IIQQQQQ", attr, 0, 0, 64, 1, 0, 0, 0, 1 << 0 | 1 << 5 | 1 << 6)
+    number = PERF_SYSCALLS.get(os.uname().machine)
+    if number is None:
+        raise OSError(f"perf_event_open isn't supported on {os.uname().machine}")
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.syscall(number, attr, 0, -1, -1, 0)
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"can't count instructions: {os.strerror(errno)}")
+    return int(fd)
+
+
+def call_func(func: Callable, args: Sequence[Any], loops: int) -> None:
+    for _ in range(loops):
+        func(*args)
+
+
+def call_time_func(time_func: Callable, args: Sequence[Any], loops: int) -> None:
+    if loops:
+        time_func(loops, *args)
+
+
+class CountingRunner:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def bench_func(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> None:
+        self._count(name, call_func, func, args)
+
+    def bench_time_func(self, name: str, time_func: Callable, *args: Any, **kwargs: Any) -> None:
+        self._count(name, call_time_func, time_func, args)
+
+    def _count(self, name: str, caller: Callable, func: Callable, func_args: Sequence[Any]) -> None:
+        # Warm up first so one-off costs (imports, caches, ...) aren't counted.
+        caller(func, func_args, 1)
+
+        instructions: Optional[float] = None
+        if args.backend == "perf":
+            fd = open_instructions_counter()
+            fcntl.ioctl(fd, PERF_IOC_RESET, 0)
+            fcntl.ioctl(fd, PERF_IOC_ENABLE, 0)
+            caller(func, func_args, args.loops)
+            fcntl.ioctl(fd, PERF_IOC_DISABLE, 0)
+            (count,) = struct.unpack("Q", os.read(fd, 8))
+            instructions = count / args.loops
+        else:
+            caller(func, func_args, args.loops)
+
+        with open(args.output, "w", encoding="utf8") as f:
+            json.dump({"name": name, "loops": args.loops, "instructions": instructions}, f)
+
+
+if args.probe:
+    try:
+        os.close(open_instructions_counter())
+    except OSError as e:
+        print(e)
+        sys.exit(1)
+    sys.exit(0)
+
+pyperf.Runner = CountingRunner
+runpy.run_path(args.script, run_name="__main__")
@@ -0,0 +1,128 @@
+"""
+Runs a generated benchmark script under a profiler instead of pyperf.
+
+The benchmark script is executed as is, except pyperf.Runner is replaced with a
+runner that calls the benchmarked function under cProfile (and optionally under a
+simple sampling profiler) instead of timing it. This file must not depend on
+blackbench since it's run with the benchmarking interpreter.
+
+usage: profile-harness.py SCRIPT --loops N --pstats PATH [--collapsed PATH --interval SECONDS]
+"""
+
+import argparse
+import cProfile
+import re
+import runpy
+import sys
+import threading
+from collections import Counter
+from types import CodeType, TracebackType
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+import pyperf
+
+parser = argparse.ArgumentParser()
+parser.add_argument("script")
+parser.add_argument("--loops", type=int, required=True)
+parser.add_argument("--pstats", required=True)
+parser.add_argument("--collapsed")
+parser.add_argument("--interval", type=float, default=0.001)
+args = parser.parse_args()
+
+
+def short_filename(filename: str) -> str:
+    normalized = filename.replace("\\", "/")
+    if "/site-packages/" in normalized:
+        return normalized.rsplit("/site-packages/", maxsplit=1)[1]
+    match = re.search(r"/lib/python[\d.]*/(.+)$", normalized)
+    if match:
+        return match.group(1)
+    return normalized.rsplit("/", maxsplit=1)[-1]
+
+
+def call_func(func: Callable, args: Sequence[Any], loops: int) -> None:
+    for _ in range(loops):
+        func(*args)
+
+
+def call_time_func(time_func: Callable, args: Sequence[Any], loops: int) -> None:
+    time_func(loops, *args)
+
+
+ROOT_CODES: Sequence[CodeType] = (call_func.__code__, call_time_func.__code__)
+
+
+class SamplingProfiler:
+    """Periodically samples the main thread's stack and collapses them (Brendan Gregg style)."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.stacks: "Counter[str]" = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop, daemon=True)
+        self._ident = threading.get_ident()
+
+    def __enter__(self) -> "SamplingProfiler":
+        self._old_switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(min(self._old_switch_interval, self.interval / 2))
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self._stop.set()
+        self._thread.join()
+        sys.setswitchinterval(self._old_switch_interval)
+
+    def _sample_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._ident)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{short_filename(code.co_filename)}:{code.co_name}")
+                if code in ROOT_CODES:
+                    self.stacks[";".join(reversed(stack))] += 1
+                    break
+                frame = frame.f_back
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf8") as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+
+class ProfilingRunner:
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def bench_func(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> None:
+        self._profile(name, call_func, func, args)
+
+    def bench_time_func(self, name: str, time_func: Callable, *args: Any, **kwargs: Any) -> None:
+        self._profile(name, call_time_func, time_func, args)
+
+    def _profile(
+        self, name: str, caller: Callable, func: Callable, func_args: Sequence[Any]
+    ) -> None:
+        # Warm up first so one-off costs (imports, caches, ...) don't end up in the profile.
+        caller(func, func_args, 1)
+
+        profiler = cProfile.Profile()
+        profiler.runcall(caller, func, func_args, args.loops)
+        profiler.dump_stats(args.pstats)
+
+        if args.collapsed:
+            with SamplingProfiler(args.interval) as sampler:
+                caller(func, func_args, args.loops)
+            sampler.write(args.collapsed)
+            print(f"{name}: collected {sum(sampler.stacks.values())} samples")
+        print(f"{name}: profiled {args.loops} loops")
+
+
+pyperf.Runner = ProfilingRunner
+runpy.run_path(args.script, run_name="__main__")
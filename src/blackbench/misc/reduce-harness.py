@@ -0,0 +1,46 @@
+"""
+Times formatting (with safety checks disabled, like the fmt-fast task) on request.
+
+Code is read from stdin, one JSON encoded string per line, and for each the best of
+`--repeat` formatting times (in seconds) is written to stdout as a JSON object, or the
+error if Black failed. The process is kept running so Black is only imported once.
+This file must not depend on blackbench since it's run with the benchmarking interpreter.
+
+usage: reduce-harness.py --mode MODE-ARGS --repeat N
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict
+
+import black
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--mode", default="")
+parser.add_argument("--repeat", type=int, default=3)
+args = parser.parse_args()
+
+mode = eval(f"black.FileMode({args.mode})")
+
+
+def time_formatting(code: str) -> float:
+    best = float("inf")
+    for _ in range(args.repeat):
+        t0 = time.perf_counter()
+        try:
+            black.format_file_contents(code, fast=True, mode=mode)
+        except black.NothingChanged:
+            pass
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+for line in sys.stdin:
+    result: Dict[str, Any]
+    try:
+        result = {"time": time_formatting(json.loads(line))}
+    except Exception as e:
+        result = {"error": f"{type(e).__name__}: {e}"}
+    print(json.dumps(result), flush=True)
@@ -0,0 +1,111 @@
+"""
+Mode matrices: sweeping over black.Mode configurations in a single run.
+
+A matrix is written like `--format-config` (black.Mode keyword arguments) except that a
+list or tuple of values makes that argument an axis of the grid, e.g.
+`line_length=[79, 88, 120], magic_trailing_comma=[True, False]` expands into six mode
+configurations. None of black.Mode's own arguments take a list or tuple (the collection
+ones take sets) so this is unambiguous.
+"""
+
+import ast
+import itertools
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+# Short names for the benchmark tags, e.g. fmt[ll=120]-black/lines. Other arguments are
+# used as is.
+# fmt: off
+MODE_ABBREVIATIONS = {
+    "line_length": "ll", "target_versions": "tv", "magic_trailing_comma": "mtc",
+    "string_normalization": "sn", "is_pyi": "pyi", "experimental_string_processing": "esp",
+    "skip_source_first_line": "ssfl",
+}
+# fmt: on
+
+ModeCell = Dict[str, str]
+
+
+@dataclass(frozen=True)
+class ModeConfig:
+    config: str  # black.Mode arguments, like --format-config
+    tag: str
+
+
+def expand_mode_matrix(matrix: str) -> List[ModeCell]:
+    """
+    Expand a mode matrix into the argument name -> source code of every configuration
+    it describes. Raises ValueError if it isn't a valid matrix.
+    """
+    source = f"Mode({matrix})"
+    try:
+        call = ast.parse(source, mode="eval").body
+    except SyntaxError as e:
+        raise ValueError(f"invalid syntax ({e.msg})") from None
+    assert isinstance(call, ast.Call)
+    if call.args or any(keyword.arg is None for keyword in call.keywords):
+        raise ValueError("only keyword arguments are supported")
+
+    axes: Dict[str, List[str]] = {}
+    for keyword in call.keywords:
+        assert keyword.arg is not None
+        if isinstance(keyword.value, (ast.List, ast.Tuple)):
+            values = [ast.get_source_segment(source, v) or "" for v in keyword.value.elts]
+        else:
+            values = [ast.get_source_segment(source, keyword.value) or ""]
+        if not values:
+            raise ValueError(f"{keyword.arg} has no values")
+        axes[keyword.arg] = list(dict.fromkeys(values))
+    if not axes:
+        raise ValueError("the matrix is empty")
+    return [dict(zip(axes, values)) for values in itertools.product(*axes.values())]
+
+
+def _tag_value(value: str) -> str:
+    # {black.TargetVersion.PY38, black.TargetVersion.PY39} -> PY38+PY39
+    value = re.sub(r"\b[A-Za-z_]\w*\.", "", value)
+    value = re.sub(r"[\s{}\[\]()'\"]", "", value)
+    return value.replace(",", "+")
+
+
+def mode_configs(matrices: Sequence[str], base: str = "") -> List[ModeConfig]:
+    """
+    Expand the mode matrices into a list of mode configurations, each extended with the
+    base configuration (i.e. --format-config) and tagged with the arguments that vary.
+    """
+    cells: List[ModeCell] = []
+    for matrix in matrices:
+        cells.extend(c for c in expand_mode_matrix(matrix) if c not in cells)
+
+    names = list(dict.fromkeys(name for cell in cells for name in cell))
+    varying = [name for name in names if len({cell.get(name) for cell in cells}) > 1]
+    tags = []
+    for cell in cells:
+        shown = [name for name in varying if name in cell] or list(cell)
+        tags.append(
+            ",".join(f"{MODE_ABBREVIATIONS.get(n, n)}={_tag_value(cell[n])}" for n in shown)
+        )
+    if len(set(tags)) != len(tags):
+        counts = Counter(tags)
+        tags = [f"{t}-{n}" if counts[t] > 1 else t for n, t in enumerate(tags, start=1)]
+
+    configs = []
+    for cell, tag in zip(cells, tags):
+        arguments = [f"{name}={value}" for name, value in cell.items()]
+        configs.append(ModeConfig(", ".join(filter(None, [base, *arguments])), tag))
+    return configs
+
+
+def with_default_argument(config: str, name: str, value: str) -> str:
+    """Add a black.Mode argument to the configuration unless it's already set there."""
+    try:
+        call = ast.parse(f"Mode({config})", mode="eval").body
+    except SyntaxError:
+        # Broken configurations are reported by the pre-run checks, leave them be.
+        return config
+    assert isinstance(call, ast.Call)
+    if any(keyword.arg == name for keyword in call.keywords):
+        return config
+    return ", ".join(filter(None, [config, f"{name}={value}"]))
@@ -0,0 +1,4499 @@
+"""Character properties, generated from the Unicode database. DO NOT EDIT."""
+
+# (code point, name, category, combining, bidirectional, decimal, mirrored, lowercase)
+_PROPERTIES = (
+    (0x0020, 'SPACE', 'Zs', 0, 'WS', None, False, None),
+    (0x0021, 'EXCLAMATION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x0022, 'QUOTATION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x0023, 'NUMBER SIGN', 'Po', 0, 'ET', None, False, None),
+    (0x0024, 'DOLLAR SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x0025, 'PERCENT SIGN', 'Po', 0, 'ET', None, False, None),
+    (0x0026, 'AMPERSAND', 'Po', 0, 'ON', None, False, None),
+    (0x0027, 'APOSTROPHE', 'Po', 0, 'ON', None, False, None),
+    (0x0028, 'LEFT PARENTHESIS', 'Ps', 0, 'ON', None, True, None),
+    (0x0029, 'RIGHT PARENTHESIS', 'Pe', 0, 'ON', None, True, None),
+    (0x002A, 'ASTERISK', 'Po', 0, 'ON', None, False, None),
+    (0x002B, 'PLUS SIGN', 'Sm', 0, 'ES', None, False, None),
+    (0x002C, 'COMMA', 'Po', 0, 'CS', None, False, None),
+    (0x002D, 'HYPHEN-MINUS', 'Pd', 0, 'ES', None, False, None),
+    (0x002E, 'FULL STOP', 'Po', 0, 'CS', None, False, None),
+    (0x002F, 'SOLIDUS', 'Po', 0, 'CS', None, False, None),
+    (0x0030, 'DIGIT ZERO', 'Nd', 0, 'EN', 0, False, None),
+    (0x0031, 'DIGIT ONE', 'Nd', 0, 'EN', 1, False, None),
+    (0x0032, 'DIGIT TWO', 'Nd', 0, 'EN', 2, False, None),
+    (0x0033, 'DIGIT THREE', 'Nd', 0, 'EN', 3, False, None),
+    (0x0034, 'DIGIT FOUR', 'Nd', 0, 'EN', 4, False, None),
+    (0x0035, 'DIGIT FIVE', 'Nd', 0, 'EN', 5, False, None),
+    (0x0036, 'DIGIT SIX', 'Nd', 0, 'EN', 6, False, None),
+    (0x0037, 'DIGIT SEVEN', 'Nd', 0, 'EN', 7, False, None),
+    (0x0038, 'DIGIT EIGHT', 'Nd', 0, 'EN', 8, False, None),
+    (0x0039, 'DIGIT NINE', 'Nd', 0, 'EN', 9, False, None),
+    (0x003A, 'COLON', 'Po', 0, 'CS', None, False, None),
+    (0x003B, 'SEMICOLON', 'Po', 0, 'ON', None, False, None),
+    (0x003C, 'LESS-THAN SIGN', 'Sm', 0, 'ON', None, True, None),
+    (0x003D, 'EQUALS SIGN', 'Sm', 0, 'ON', None, False, None),
+    (0x003E, 'GREATER-THAN SIGN', 'Sm', 0, 'ON', None, True, None),
+    (0x003F, 'QUESTION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x0040, 'COMMERCIAL AT', 'Po', 0, 'ON', None, False, None),
+    (0x0041, 'LATIN CAPITAL LETTER A', 'Lu', 0, 'L', None, False, 0x0061),
+    (0x0042, 'LATIN CAPITAL LETTER B', 'Lu', 0, 'L', None, False, 0x0062),
+    (0x0043, 'LATIN CAPITAL LETTER C', 'Lu', 0, 'L', None, False, 0x0063),
+    (0x0044, 'LATIN CAPITAL LETTER D', 'Lu', 0, 'L', None, False, 0x0064),
+    (0x0045, 'LATIN CAPITAL LETTER E', 'Lu', 0, 'L', None, False, 0x0065),
+    (0x0046, 'LATIN CAPITAL LETTER F', 'Lu', 0, 'L', None, False, 0x0066),
+    (0x0047, 'LATIN CAPITAL LETTER G', 'Lu', 0, 'L', None, False, 0x0067),
+    (0x0048, 'LATIN CAPITAL LETTER H', 'Lu', 0, 'L', None, False, 0x0068),
+    (0x0049, 'LATIN CAPITAL LETTER I', 'Lu', 0, 'L', None, False, 0x0069),
+    (0x004A, 'LATIN CAPITAL LETTER J', 'Lu', 0, 'L', None, False, 0x006A),
+    (0x004B, 'LATIN CAPITAL LETTER K', 'Lu', 0, 'L', None, False, 0x006B),
+    (0x004C, 'LATIN CAPITAL LETTER L', 'Lu', 0, 'L', None, False, 0x006C),
+    (0x004D, 'LATIN CAPITAL LETTER M', 'Lu', 0, 'L', None, False, 0x006D),
+    (0x004E, 'LATIN CAPITAL LETTER N', 'Lu', 0, 'L', None, False, 0x006E),
+    (0x004F, 'LATIN CAPITAL LETTER O', 'Lu', 0, 'L', None, False, 0x006F),
+    (0x0050, 'LATIN CAPITAL LETTER P', 'Lu', 0, 'L', None, False, 0x0070),
+    (0x0051, 'LATIN CAPITAL LETTER Q', 'Lu', 0, 'L', None, False, 0x0071),
+    (0x0052, 'LATIN CAPITAL LETTER R', 'Lu', 0, 'L', None, False, 0x0072),
+    (0x0053, 'LATIN CAPITAL LETTER S', 'Lu', 0, 'L', None, False, 0x0073),
+    (0x0054, 'LATIN CAPITAL LETTER T', 'Lu', 0, 'L', None, False, 0x0074),
+    (0x0055, 'LATIN CAPITAL LETTER U', 'Lu', 0, 'L', None, False, 0x0075),
+    (0x0056, 'LATIN CAPITAL LETTER V', 'Lu', 0, 'L', None, False, 0x0076),
+    (0x0057, 'LATIN CAPITAL LETTER W', 'Lu', 0, 'L', None, False, 0x0077),
+    (0x0058, 'LATIN CAPITAL LETTER X', 'Lu', 0, 'L', None, False, 0x0078),
+    (0x0059, 'LATIN CAPITAL LETTER Y', 'Lu', 0, 'L', None, False, 0x0079),
+    (0x005A, 'LATIN CAPITAL LETTER Z', 'Lu', 0, 'L', None, False, 0x007A),
+    (0x005B, 'LEFT SQUARE BRACKET', 'Ps', 0, 'ON', None, True, None),
+    (0x005C, 'REVERSE SOLIDUS', 'Po', 0, 'ON', None, False, None),
+    (0x005D, 'RIGHT SQUARE BRACKET', 'Pe', 0, 'ON', None, True, None),
+    (0x005E, 'CIRCUMFLEX ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x005F, 'LOW LINE', 'Pc', 0, 'ON', None, False, None),
+    (0x0060, 'GRAVE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x0061, 'LATIN SMALL LETTER A', 'Ll', 0, 'L', None, False, None),
+    (0x0062, 'LATIN SMALL LETTER B', 'Ll', 0, 'L', None, False, None),
+    (0x0063, 'LATIN SMALL LETTER C', 'Ll', 0, 'L', None, False, None),
+    (0x0064, 'LATIN SMALL LETTER D', 'Ll', 0, 'L', None, False, None),
+    (0x0065, 'LATIN SMALL LETTER E', 'Ll', 0, 'L', None, False, None),
+    (0x0066, 'LATIN SMALL LETTER F', 'Ll', 0, 'L', None, False, None),
+    (0x0067, 'LATIN SMALL LETTER G', 'Ll', 0, 'L', None, False, None),
+    (0x0068, 'LATIN SMALL LETTER H', 'Ll', 0, 'L', None, False, None),
+    (0x0069, 'LATIN SMALL LETTER I', 'Ll', 0, 'L', None, False, None),
+    (0x006A, 'LATIN SMALL LETTER J', 'Ll', 0, 'L', None, False, None),
+    (0x006B, 'LATIN SMALL LETTER K', 'Ll', 0, 'L', None, False, None),
+    (0x006C, 'LATIN SMALL LETTER L', 'Ll', 0, 'L', None, False, None),
+    (0x006D, 'LATIN SMALL LETTER M', 'Ll', 0, 'L', None, False, None),
+    (0x006E, 'LATIN SMALL LETTER N', 'Ll', 0, 'L', None, False, None),
+    (0x006F, 'LATIN SMALL LETTER O', 'Ll', 0, 'L', None, False, None),
+    (0x0070, 'LATIN SMALL LETTER P', 'Ll', 0, 'L', None, False, None),
+    (0x0071, 'LATIN SMALL LETTER Q', 'Ll', 0, 'L', None, False, None),
+    (0x0072, 'LATIN SMALL LETTER R', 'Ll', 0, 'L', None, False, None),
+    (0x0073, 'LATIN SMALL LETTER S', 'Ll', 0, 'L', None, False, None),
+    (0x0074, 'LATIN SMALL LETTER T', 'Ll', 0, 'L', None, False, None),
+    (0x0075, 'LATIN SMALL LETTER U', 'Ll', 0, 'L', None, False, None),
+    (0x0076, 'LATIN SMALL LETTER V', 'Ll', 0, 'L', None, False, None),
+    (0x0077, 'LATIN SMALL LETTER W', 'Ll', 0, 'L', None, False, None),
+    (0x0078, 'LATIN SMALL LETTER X', 'Ll', 0, 'L', None, False, None),
+    (0x0079, 'LATIN SMALL LETTER Y', 'Ll', 0, 'L', None, False, None),
+    (0x007A, 'LATIN SMALL LETTER Z', 'Ll', 0, 'L', None, False, None),
+    (0x007B, 'LEFT CURLY BRACKET', 'Ps', 0, 'ON', None, True, None),
+    (0x007C, 'VERTICAL LINE', 'Sm', 0, 'ON', None, False, None),
+    (0x007D, 'RIGHT CURLY BRACKET', 'Pe', 0, 'ON', None, True, None),
+    (0x007E, 'TILDE', 'Sm', 0, 'ON', None, False, None),
+    (0x00A0, 'NO-BREAK SPACE', 'Zs', 0, 'CS', None, False, None),
+    (0x00A1, 'INVERTED EXCLAMATION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x00A2, 'CENT SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x00A3, 'POUND SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x00A4, 'CURRENCY SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x00A5, 'YEN SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x00A6, 'BROKEN BAR', 'So', 0, 'ON', None, False, None),
+    (0x00A7, 'SECTION SIGN', 'Po', 0, 'ON', None, False, None),
+    (0x00A8, 'DIAERESIS', 'Sk', 0, 'ON', None, False, None),
+    (0x00A9, 'COPYRIGHT SIGN', 'So', 0, 'ON', None, False, None),
+    (0x00AA, 'FEMININE ORDINAL INDICATOR', 'Lo', 0, 'L', None, False, None),
+    (0x00AB, 'LEFT-POINTING DOUBLE ANGLE QUOTATION MARK', 'Pi', 0, 'ON', None, True, None),
+    (0x00AC, 'NOT SIGN', 'Sm', 0, 'ON', None, False, None),
+    (0x00AD, 'SOFT HYPHEN', 'Cf', 0, 'BN', None, False, None),
+    (0x00AE, 'REGISTERED SIGN', 'So', 0, 'ON', None, False, None),
+    (0x00AF, 'MACRON', 'Sk', 0, 'ON', None, False, None),
+    (0x00B0, 'DEGREE SIGN', 'So', 0, 'ET', None, False, None),
+    (0x00B1, 'PLUS-MINUS SIGN', 'Sm', 0, 'ET', None, False, None),
+    (0x00B2, 'SUPERSCRIPT TWO', 'No', 0, 'EN', None, False, None),
+    (0x00B3, 'SUPERSCRIPT THREE', 'No', 0, 'EN', None, False, None),
+    (0x00B4, 'ACUTE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x00B5, 'MICRO SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x00B6, 'PILCROW SIGN', 'Po', 0, 'ON', None, False, None),
+    (0x00B7, 'MIDDLE DOT', 'Po', 0, 'ON', None, False, None),
+    (0x00B8, 'CEDILLA', 'Sk', 0, 'ON', None, False, None),
+    (0x00B9, 'SUPERSCRIPT ONE', 'No', 0, 'EN', None, False, None),
+    (0x00BA, 'MASCULINE ORDINAL INDICATOR', 'Lo', 0, 'L', None, False, None),
+    (0x00BB, 'RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK', 'Pf', 0, 'ON', None, True, None),
+    (0x00BC, 'VULGAR FRACTION ONE QUARTER', 'No', 0, 'ON', None, False, None),
+    (0x00BD, 'VULGAR FRACTION ONE HALF', 'No', 0, 'ON', None, False, None),
+    (0x00BE, 'VULGAR FRACTION THREE QUARTERS', 'No', 0, 'ON', None, False, None),
+    (0x00BF, 'INVERTED QUESTION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x00C0, 'LATIN CAPITAL LETTER A WITH GRAVE', 'Lu', 0, 'L', None, False, 0x00E0),
+    (0x00C1, 'LATIN CAPITAL LETTER A WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00E1),
+    (0x00C2, 'LATIN CAPITAL LETTER A WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x00E2),
+    (0x00C3, 'LATIN CAPITAL LETTER A WITH TILDE', 'Lu', 0, 'L', None, False, 0x00E3),
+    (0x00C4, 'LATIN CAPITAL LETTER A WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00E4),
+    (0x00C5, 'LATIN CAPITAL LETTER A WITH RING ABOVE', 'Lu', 0, 'L', None, False, 0x00E5),
+    (0x00C6, 'LATIN CAPITAL LETTER AE', 'Lu', 0, 'L', None, False, 0x00E6),
+    (0x00C7, 'LATIN CAPITAL LETTER C WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x00E7),
+    (0x00C8, 'LATIN CAPITAL LETTER E WITH GRAVE', 'Lu', 0, 'L', None, False, 0x00E8),
+    (0x00C9, 'LATIN CAPITAL LETTER E WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00E9),
+    (0x00CA, 'LATIN CAPITAL LETTER E WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x00EA),
+    (0x00CB, 'LATIN CAPITAL LETTER E WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00EB),
+    (0x00CC, 'LATIN CAPITAL LETTER I WITH GRAVE', 'Lu', 0, 'L', None, False, 0x00EC),
+    (0x00CD, 'LATIN CAPITAL LETTER I WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00ED),
+    (0x00CE, 'LATIN CAPITAL LETTER I WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x00EE),
+    (0x00CF, 'LATIN CAPITAL LETTER I WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00EF),
+    (0x00D0, 'LATIN CAPITAL LETTER ETH', 'Lu', 0, 'L', None, False, 0x00F0),
+    (0x00D1, 'LATIN CAPITAL LETTER N WITH TILDE', 'Lu', 0, 'L', None, False, 0x00F1),
+    (0x00D2, 'LATIN CAPITAL LETTER O WITH GRAVE', 'Lu', 0, 'L', None, False, 0x00F2),
+    (0x00D3, 'LATIN CAPITAL LETTER O WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00F3),
+    (0x00D4, 'LATIN CAPITAL LETTER O WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x00F4),
+    (0x00D5, 'LATIN CAPITAL LETTER O WITH TILDE', 'Lu', 0, 'L', None, False, 0x00F5),
+    (0x00D6, 'LATIN CAPITAL LETTER O WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00F6),
+    (0x00D7, 'MULTIPLICATION SIGN', 'Sm', 0, 'ON', None, False, None),
+    (0x00D8, 'LATIN CAPITAL LETTER O WITH STROKE', 'Lu', 0, 'L', None, False, 0x00F8),
+    (0x00D9, 'LATIN CAPITAL LETTER U WITH GRAVE', 'Lu', 0, 'L', None, False, 0x00F9),
+    (0x00DA, 'LATIN CAPITAL LETTER U WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00FA),
+    (0x00DB, 'LATIN CAPITAL LETTER U WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x00FB),
+    (0x00DC, 'LATIN CAPITAL LETTER U WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00FC),
+    (0x00DD, 'LATIN CAPITAL LETTER Y WITH ACUTE', 'Lu', 0, 'L', None, False, 0x00FD),
+    (0x00DE, 'LATIN CAPITAL LETTER THORN', 'Lu', 0, 'L', None, False, 0x00FE),
+    (0x00DF, 'LATIN SMALL LETTER SHARP S', 'Ll', 0, 'L', None, False, None),
+    (0x00E0, 'LATIN SMALL LETTER A WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x00E1, 'LATIN SMALL LETTER A WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00E2, 'LATIN SMALL LETTER A WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x00E3, 'LATIN SMALL LETTER A WITH TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x00E4, 'LATIN SMALL LETTER A WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x00E5, 'LATIN SMALL LETTER A WITH RING ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x00E6, 'LATIN SMALL LETTER AE', 'Ll', 0, 'L', None, False, None),
+    (0x00E7, 'LATIN SMALL LETTER C WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x00E8, 'LATIN SMALL LETTER E WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x00E9, 'LATIN SMALL LETTER E WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00EA, 'LATIN SMALL LETTER E WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x00EB, 'LATIN SMALL LETTER E WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x00EC, 'LATIN SMALL LETTER I WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x00ED, 'LATIN SMALL LETTER I WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00EE, 'LATIN SMALL LETTER I WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x00EF, 'LATIN SMALL LETTER I WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x00F0, 'LATIN SMALL LETTER ETH', 'Ll', 0, 'L', None, False, None),
+    (0x00F1, 'LATIN SMALL LETTER N WITH TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x00F2, 'LATIN SMALL LETTER O WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x00F3, 'LATIN SMALL LETTER O WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00F4, 'LATIN SMALL LETTER O WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x00F5, 'LATIN SMALL LETTER O WITH TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x00F6, 'LATIN SMALL LETTER O WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x00F7, 'DIVISION SIGN', 'Sm', 0, 'ON', None, False, None),
+    (0x00F8, 'LATIN SMALL LETTER O WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x00F9, 'LATIN SMALL LETTER U WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x00FA, 'LATIN SMALL LETTER U WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00FB, 'LATIN SMALL LETTER U WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x00FC, 'LATIN SMALL LETTER U WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x00FD, 'LATIN SMALL LETTER Y WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x00FE, 'LATIN SMALL LETTER THORN', 'Ll', 0, 'L', None, False, None),
+    (0x00FF, 'LATIN SMALL LETTER Y WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x0100, 'LATIN CAPITAL LETTER A WITH MACRON', 'Lu', 0, 'L', None, False, 0x0101),
+    (0x0101, 'LATIN SMALL LETTER A WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x0102, 'LATIN CAPITAL LETTER A WITH BREVE', 'Lu', 0, 'L', None, False, 0x0103),
+    (0x0103, 'LATIN SMALL LETTER A WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0104, 'LATIN CAPITAL LETTER A WITH OGONEK', 'Lu', 0, 'L', None, False, 0x0105),
+    (0x0105, 'LATIN SMALL LETTER A WITH OGONEK', 'Ll', 0, 'L', None, False, None),
+    (0x0106, 'LATIN CAPITAL LETTER C WITH ACUTE', 'Lu', 0, 'L', None, False, 0x0107),
+    (0x0107, 'LATIN SMALL LETTER C WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0108, 'LATIN CAPITAL LETTER C WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x0109),
+    (0x0109, 'LATIN SMALL LETTER C WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x010A, 'LATIN CAPITAL LETTER C WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x010B),
+    (0x010B, 'LATIN SMALL LETTER C WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x010C, 'LATIN CAPITAL LETTER C WITH CARON', 'Lu', 0, 'L', None, False, 0x010D),
+    (0x010D, 'LATIN SMALL LETTER C WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x010E, 'LATIN CAPITAL LETTER D WITH CARON', 'Lu', 0, 'L', None, False, 0x010F),
+    (0x010F, 'LATIN SMALL LETTER D WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x0110, 'LATIN CAPITAL LETTER D WITH STROKE', 'Lu', 0, 'L', None, False, 0x0111),
+    (0x0111, 'LATIN SMALL LETTER D WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0112, 'LATIN CAPITAL LETTER E WITH MACRON', 'Lu', 0, 'L', None, False, 0x0113),
+    (0x0113, 'LATIN SMALL LETTER E WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x0114, 'LATIN CAPITAL LETTER E WITH BREVE', 'Lu', 0, 'L', None, False, 0x0115),
+    (0x0115, 'LATIN SMALL LETTER E WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0116, 'LATIN CAPITAL LETTER E WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x0117),
+    (0x0117, 'LATIN SMALL LETTER E WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x0118, 'LATIN CAPITAL LETTER E WITH OGONEK', 'Lu', 0, 'L', None, False, 0x0119),
+    (0x0119, 'LATIN SMALL LETTER E WITH OGONEK', 'Ll', 0, 'L', None, False, None),
+    (0x011A, 'LATIN CAPITAL LETTER E WITH CARON', 'Lu', 0, 'L', None, False, 0x011B),
+    (0x011B, 'LATIN SMALL LETTER E WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x011C, 'LATIN CAPITAL LETTER G WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x011D),
+    (0x011D, 'LATIN SMALL LETTER G WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x011E, 'LATIN CAPITAL LETTER G WITH BREVE', 'Lu', 0, 'L', None, False, 0x011F),
+    (0x011F, 'LATIN SMALL LETTER G WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0120, 'LATIN CAPITAL LETTER G WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x0121),
+    (0x0121, 'LATIN SMALL LETTER G WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x0122, 'LATIN CAPITAL LETTER G WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0123),
+    (0x0123, 'LATIN SMALL LETTER G WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0124, 'LATIN CAPITAL LETTER H WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x0125),
+    (0x0125, 'LATIN SMALL LETTER H WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x0126, 'LATIN CAPITAL LETTER H WITH STROKE', 'Lu', 0, 'L', None, False, 0x0127),
+    (0x0127, 'LATIN SMALL LETTER H WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0128, 'LATIN CAPITAL LETTER I WITH TILDE', 'Lu', 0, 'L', None, False, 0x0129),
+    (0x0129, 'LATIN SMALL LETTER I WITH TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x012A, 'LATIN CAPITAL LETTER I WITH MACRON', 'Lu', 0, 'L', None, False, 0x012B),
+    (0x012B, 'LATIN SMALL LETTER I WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x012C, 'LATIN CAPITAL LETTER I WITH BREVE', 'Lu', 0, 'L', None, False, 0x012D),
+    (0x012D, 'LATIN SMALL LETTER I WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x012E, 'LATIN CAPITAL LETTER I WITH OGONEK', 'Lu', 0, 'L', None, False, 0x012F),
+    (0x012F, 'LATIN SMALL LETTER I WITH OGONEK', 'Ll', 0, 'L', None, False, None),
+    (0x0130, 'LATIN CAPITAL LETTER I WITH DOT ABOVE', 'Lu', 0, 'L', None, False, None),
+    (0x0131, 'LATIN SMALL LETTER DOTLESS I', 'Ll', 0, 'L', None, False, None),
+    (0x0132, 'LATIN CAPITAL LIGATURE IJ', 'Lu', 0, 'L', None, False, 0x0133),
+    (0x0133, 'LATIN SMALL LIGATURE IJ', 'Ll', 0, 'L', None, False, None),
+    (0x0134, 'LATIN CAPITAL LETTER J WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x0135),
+    (0x0135, 'LATIN SMALL LETTER J WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x0136, 'LATIN CAPITAL LETTER K WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0137),
+    (0x0137, 'LATIN SMALL LETTER K WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0138, 'LATIN SMALL LETTER KRA', 'Ll', 0, 'L', None, False, None),
+    (0x0139, 'LATIN CAPITAL LETTER L WITH ACUTE', 'Lu', 0, 'L', None, False, 0x013A),
+    (0x013A, 'LATIN SMALL LETTER L WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x013B, 'LATIN CAPITAL LETTER L WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x013C),
+    (0x013C, 'LATIN SMALL LETTER L WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x013D, 'LATIN CAPITAL LETTER L WITH CARON', 'Lu', 0, 'L', None, False, 0x013E),
+    (0x013E, 'LATIN SMALL LETTER L WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x013F, 'LATIN CAPITAL LETTER L WITH MIDDLE DOT', 'Lu', 0, 'L', None, False, 0x0140),
+    (0x0140, 'LATIN SMALL LETTER L WITH MIDDLE DOT', 'Ll', 0, 'L', None, False, None),
+    (0x0141, 'LATIN CAPITAL LETTER L WITH STROKE', 'Lu', 0, 'L', None, False, 0x0142),
+    (0x0142, 'LATIN SMALL LETTER L WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0143, 'LATIN CAPITAL LETTER N WITH ACUTE', 'Lu', 0, 'L', None, False, 0x0144),
+    (0x0144, 'LATIN SMALL LETTER N WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0145, 'LATIN CAPITAL LETTER N WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0146),
+    (0x0146, 'LATIN SMALL LETTER N WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0147, 'LATIN CAPITAL LETTER N WITH CARON', 'Lu', 0, 'L', None, False, 0x0148),
+    (0x0148, 'LATIN SMALL LETTER N WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x0149, 'LATIN SMALL LETTER N PRECEDED BY APOSTROPHE', 'Ll', 0, 'L', None, False, None),
+    (0x014A, 'LATIN CAPITAL LETTER ENG', 'Lu', 0, 'L', None, False, 0x014B),
+    (0x014B, 'LATIN SMALL LETTER ENG', 'Ll', 0, 'L', None, False, None),
+    (0x014C, 'LATIN CAPITAL LETTER O WITH MACRON', 'Lu', 0, 'L', None, False, 0x014D),
+    (0x014D, 'LATIN SMALL LETTER O WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x014E, 'LATIN CAPITAL LETTER O WITH BREVE', 'Lu', 0, 'L', None, False, 0x014F),
+    (0x014F, 'LATIN SMALL LETTER O WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0150, 'LATIN CAPITAL LETTER O WITH DOUBLE ACUTE', 'Lu', 0, 'L', None, False, 0x0151),
+    (0x0151, 'LATIN SMALL LETTER O WITH DOUBLE ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0152, 'LATIN CAPITAL LIGATURE OE', 'Lu', 0, 'L', None, False, 0x0153),
+    (0x0153, 'LATIN SMALL LIGATURE OE', 'Ll', 0, 'L', None, False, None),
+    (0x0154, 'LATIN CAPITAL LETTER R WITH ACUTE', 'Lu', 0, 'L', None, False, 0x0155),
+    (0x0155, 'LATIN SMALL LETTER R WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0156, 'LATIN CAPITAL LETTER R WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0157),
+    (0x0157, 'LATIN SMALL LETTER R WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0158, 'LATIN CAPITAL LETTER R WITH CARON', 'Lu', 0, 'L', None, False, 0x0159),
+    (0x0159, 'LATIN SMALL LETTER R WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x015A, 'LATIN CAPITAL LETTER S WITH ACUTE', 'Lu', 0, 'L', None, False, 0x015B),
+    (0x015B, 'LATIN SMALL LETTER S WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x015C, 'LATIN CAPITAL LETTER S WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x015D),
+    (0x015D, 'LATIN SMALL LETTER S WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x015E, 'LATIN CAPITAL LETTER S WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x015F),
+    (0x015F, 'LATIN SMALL LETTER S WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0160, 'LATIN CAPITAL LETTER S WITH CARON', 'Lu', 0, 'L', None, False, 0x0161),
+    (0x0161, 'LATIN SMALL LETTER S WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x0162, 'LATIN CAPITAL LETTER T WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0163),
+    (0x0163, 'LATIN SMALL LETTER T WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x0164, 'LATIN CAPITAL LETTER T WITH CARON', 'Lu', 0, 'L', None, False, 0x0165),
+    (0x0165, 'LATIN SMALL LETTER T WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x0166, 'LATIN CAPITAL LETTER T WITH STROKE', 'Lu', 0, 'L', None, False, 0x0167),
+    (0x0167, 'LATIN SMALL LETTER T WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0168, 'LATIN CAPITAL LETTER U WITH TILDE', 'Lu', 0, 'L', None, False, 0x0169),
+    (0x0169, 'LATIN SMALL LETTER U WITH TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x016A, 'LATIN CAPITAL LETTER U WITH MACRON', 'Lu', 0, 'L', None, False, 0x016B),
+    (0x016B, 'LATIN SMALL LETTER U WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x016C, 'LATIN CAPITAL LETTER U WITH BREVE', 'Lu', 0, 'L', None, False, 0x016D),
+    (0x016D, 'LATIN SMALL LETTER U WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x016E, 'LATIN CAPITAL LETTER U WITH RING ABOVE', 'Lu', 0, 'L', None, False, 0x016F),
+    (0x016F, 'LATIN SMALL LETTER U WITH RING ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x0170, 'LATIN CAPITAL LETTER U WITH DOUBLE ACUTE', 'Lu', 0, 'L', None, False, 0x0171),
+    (0x0171, 'LATIN SMALL LETTER U WITH DOUBLE ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0172, 'LATIN CAPITAL LETTER U WITH OGONEK', 'Lu', 0, 'L', None, False, 0x0173),
+    (0x0173, 'LATIN SMALL LETTER U WITH OGONEK', 'Ll', 0, 'L', None, False, None),
+    (0x0174, 'LATIN CAPITAL LETTER W WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x0175),
+    (0x0175, 'LATIN SMALL LETTER W WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x0176, 'LATIN CAPITAL LETTER Y WITH CIRCUMFLEX', 'Lu', 0, 'L', None, False, 0x0177),
+    (0x0177, 'LATIN SMALL LETTER Y WITH CIRCUMFLEX', 'Ll', 0, 'L', None, False, None),
+    (0x0178, 'LATIN CAPITAL LETTER Y WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x00FF),
+    (0x0179, 'LATIN CAPITAL LETTER Z WITH ACUTE', 'Lu', 0, 'L', None, False, 0x017A),
+    (0x017A, 'LATIN SMALL LETTER Z WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x017B, 'LATIN CAPITAL LETTER Z WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x017C),
+    (0x017C, 'LATIN SMALL LETTER Z WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x017D, 'LATIN CAPITAL LETTER Z WITH CARON', 'Lu', 0, 'L', None, False, 0x017E),
+    (0x017E, 'LATIN SMALL LETTER Z WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x017F, 'LATIN SMALL LETTER LONG S', 'Ll', 0, 'L', None, False, None),
+    (0x0180, 'LATIN SMALL LETTER B WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0181, 'LATIN CAPITAL LETTER B WITH HOOK', 'Lu', 0, 'L', None, False, 0x0253),
+    (0x0182, 'LATIN CAPITAL LETTER B WITH TOPBAR', 'Lu', 0, 'L', None, False, 0x0183),
+    (0x0183, 'LATIN SMALL LETTER B WITH TOPBAR', 'Ll', 0, 'L', None, False, None),
+    (0x0184, 'LATIN CAPITAL LETTER TONE SIX', 'Lu', 0, 'L', None, False, 0x0185),
+    (0x0185, 'LATIN SMALL LETTER TONE SIX', 'Ll', 0, 'L', None, False, None),
+    (0x0186, 'LATIN CAPITAL LETTER OPEN O', 'Lu', 0, 'L', None, False, 0x0254),
+    (0x0187, 'LATIN CAPITAL LETTER C WITH HOOK', 'Lu', 0, 'L', None, False, 0x0188),
+    (0x0188, 'LATIN SMALL LETTER C WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0189, 'LATIN CAPITAL LETTER AFRICAN D', 'Lu', 0, 'L', None, False, 0x0256),
+    (0x018A, 'LATIN CAPITAL LETTER D WITH HOOK', 'Lu', 0, 'L', None, False, 0x0257),
+    (0x018B, 'LATIN CAPITAL LETTER D WITH TOPBAR', 'Lu', 0, 'L', None, False, 0x018C),
+    (0x018C, 'LATIN SMALL LETTER D WITH TOPBAR', 'Ll', 0, 'L', None, False, None),
+    (0x018D, 'LATIN SMALL LETTER TURNED DELTA', 'Ll', 0, 'L', None, False, None),
+    (0x018E, 'LATIN CAPITAL LETTER REVERSED E', 'Lu', 0, 'L', None, False, 0x01DD),
+    (0x018F, 'LATIN CAPITAL LETTER SCHWA', 'Lu', 0, 'L', None, False, 0x0259),
+    (0x0190, 'LATIN CAPITAL LETTER OPEN E', 'Lu', 0, 'L', None, False, 0x025B),
+    (0x0191, 'LATIN CAPITAL LETTER F WITH HOOK', 'Lu', 0, 'L', None, False, 0x0192),
+    (0x0192, 'LATIN SMALL LETTER F WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0193, 'LATIN CAPITAL LETTER G WITH HOOK', 'Lu', 0, 'L', None, False, 0x0260),
+    (0x0194, 'LATIN CAPITAL LETTER GAMMA', 'Lu', 0, 'L', None, False, 0x0263),
+    (0x0195, 'LATIN SMALL LETTER HV', 'Ll', 0, 'L', None, False, None),
+    (0x0196, 'LATIN CAPITAL LETTER IOTA', 'Lu', 0, 'L', None, False, 0x0269),
+    (0x0197, 'LATIN CAPITAL LETTER I WITH STROKE', 'Lu', 0, 'L', None, False, 0x0268),
+    (0x0198, 'LATIN CAPITAL LETTER K WITH HOOK', 'Lu', 0, 'L', None, False, 0x0199),
+    (0x0199, 'LATIN SMALL LETTER K WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x019A, 'LATIN SMALL LETTER L WITH BAR', 'Ll', 0, 'L', None, False, None),
+    (0x019B, 'LATIN SMALL LETTER LAMBDA WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x019C, 'LATIN CAPITAL LETTER TURNED M', 'Lu', 0, 'L', None, False, 0x026F),
+    (0x019D, 'LATIN CAPITAL LETTER N WITH LEFT HOOK', 'Lu', 0, 'L', None, False, 0x0272),
+    (0x019E, 'LATIN SMALL LETTER N WITH LONG RIGHT LEG', 'Ll', 0, 'L', None, False, None),
+    (0x019F, 'LATIN CAPITAL LETTER O WITH MIDDLE TILDE', 'Lu', 0, 'L', None, False, 0x0275),
+    (0x01A0, 'LATIN CAPITAL LETTER O WITH HORN', 'Lu', 0, 'L', None, False, 0x01A1),
+    (0x01A1, 'LATIN SMALL LETTER O WITH HORN', 'Ll', 0, 'L', None, False, None),
+    (0x01A2, 'LATIN CAPITAL LETTER OI', 'Lu', 0, 'L', None, False, 0x01A3),
+    (0x01A3, 'LATIN SMALL LETTER OI', 'Ll', 0, 'L', None, False, None),
+    (0x01A4, 'LATIN CAPITAL LETTER P WITH HOOK', 'Lu', 0, 'L', None, False, 0x01A5),
+    (0x01A5, 'LATIN SMALL LETTER P WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x01A6, 'LATIN LETTER YR', 'Lu', 0, 'L', None, False, 0x0280),
+    (0x01A7, 'LATIN CAPITAL LETTER TONE TWO', 'Lu', 0, 'L', None, False, 0x01A8),
+    (0x01A8, 'LATIN SMALL LETTER TONE TWO', 'Ll', 0, 'L', None, False, None),
+    (0x01A9, 'LATIN CAPITAL LETTER ESH', 'Lu', 0, 'L', None, False, 0x0283),
+    (0x01AA, 'LATIN LETTER REVERSED ESH LOOP', 'Ll', 0, 'L', None, False, None),
+    (0x01AB, 'LATIN SMALL LETTER T WITH PALATAL HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x01AC, 'LATIN CAPITAL LETTER T WITH HOOK', 'Lu', 0, 'L', None, False, 0x01AD),
+    (0x01AD, 'LATIN SMALL LETTER T WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x01AE, 'LATIN CAPITAL LETTER T WITH RETROFLEX HOOK', 'Lu', 0, 'L', None, False, 0x0288),
+    (0x01AF, 'LATIN CAPITAL LETTER U WITH HORN', 'Lu', 0, 'L', None, False, 0x01B0),
+    (0x01B0, 'LATIN SMALL LETTER U WITH HORN', 'Ll', 0, 'L', None, False, None),
+    (0x01B1, 'LATIN CAPITAL LETTER UPSILON', 'Lu', 0, 'L', None, False, 0x028A),
+    (0x01B2, 'LATIN CAPITAL LETTER V WITH HOOK', 'Lu', 0, 'L', None, False, 0x028B),
+    (0x01B3, 'LATIN CAPITAL LETTER Y WITH HOOK', 'Lu', 0, 'L', None, False, 0x01B4),
+    (0x01B4, 'LATIN SMALL LETTER Y WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x01B5, 'LATIN CAPITAL LETTER Z WITH STROKE', 'Lu', 0, 'L', None, False, 0x01B6),
+    (0x01B6, 'LATIN SMALL LETTER Z WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x01B7, 'LATIN CAPITAL LETTER EZH', 'Lu', 0, 'L', None, False, 0x0292),
+    (0x01B8, 'LATIN CAPITAL LETTER EZH REVERSED', 'Lu', 0, 'L', None, False, 0x01B9),
+    (0x01B9, 'LATIN SMALL LETTER EZH REVERSED', 'Ll', 0, 'L', None, False, None),
+    (0x01BA, 'LATIN SMALL LETTER EZH WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x01BB, 'LATIN LETTER TWO WITH STROKE', 'Lo', 0, 'L', None, False, None),
+    (0x01BC, 'LATIN CAPITAL LETTER TONE FIVE', 'Lu', 0, 'L', None, False, 0x01BD),
+    (0x01BD, 'LATIN SMALL LETTER TONE FIVE', 'Ll', 0, 'L', None, False, None),
+    (0x01BE, 'LATIN LETTER INVERTED GLOTTAL STOP WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x01BF, 'LATIN LETTER WYNN', 'Ll', 0, 'L', None, False, None),
+    (0x01C0, 'LATIN LETTER DENTAL CLICK', 'Lo', 0, 'L', None, False, None),
+    (0x01C1, 'LATIN LETTER LATERAL CLICK', 'Lo', 0, 'L', None, False, None),
+    (0x01C2, 'LATIN LETTER ALVEOLAR CLICK', 'Lo', 0, 'L', None, False, None),
+    (0x01C3, 'LATIN LETTER RETROFLEX CLICK', 'Lo', 0, 'L', None, False, None),
+    (0x01C4, 'LATIN CAPITAL LETTER DZ WITH CARON', 'Lu', 0, 'L', None, False, 0x01C6),
+    (0x01C5, 'LATIN CAPITAL LETTER D WITH SMALL LETTER Z WITH CARON', 'Lt', 0, 'L', None, False, 0x01C6),
+    (0x01C6, 'LATIN SMALL LETTER DZ WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01C7, 'LATIN CAPITAL LETTER LJ', 'Lu', 0, 'L', None, False, 0x01C9),
+    (0x01C8, 'LATIN CAPITAL LETTER L WITH SMALL LETTER J', 'Lt', 0, 'L', None, False, 0x01C9),
+    (0x01C9, 'LATIN SMALL LETTER LJ', 'Ll', 0, 'L', None, False, None),
+    (0x01CA, 'LATIN CAPITAL LETTER NJ', 'Lu', 0, 'L', None, False, 0x01CC),
+    (0x01CB, 'LATIN CAPITAL LETTER N WITH SMALL LETTER J', 'Lt', 0, 'L', None, False, 0x01CC),
+    (0x01CC, 'LATIN SMALL LETTER NJ', 'Ll', 0, 'L', None, False, None),
+    (0x01CD, 'LATIN CAPITAL LETTER A WITH CARON', 'Lu', 0, 'L', None, False, 0x01CE),
+    (0x01CE, 'LATIN SMALL LETTER A WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01CF, 'LATIN CAPITAL LETTER I WITH CARON', 'Lu', 0, 'L', None, False, 0x01D0),
+    (0x01D0, 'LATIN SMALL LETTER I WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01D1, 'LATIN CAPITAL LETTER O WITH CARON', 'Lu', 0, 'L', None, False, 0x01D2),
+    (0x01D2, 'LATIN SMALL LETTER O WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01D3, 'LATIN CAPITAL LETTER U WITH CARON', 'Lu', 0, 'L', None, False, 0x01D4),
+    (0x01D4, 'LATIN SMALL LETTER U WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01D5, 'LATIN CAPITAL LETTER U WITH DIAERESIS AND MACRON', 'Lu', 0, 'L', None, False, 0x01D6),
+    (0x01D6, 'LATIN SMALL LETTER U WITH DIAERESIS AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x01D7, 'LATIN CAPITAL LETTER U WITH DIAERESIS AND ACUTE', 'Lu', 0, 'L', None, False, 0x01D8),
+    (0x01D8, 'LATIN SMALL LETTER U WITH DIAERESIS AND ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x01D9, 'LATIN CAPITAL LETTER U WITH DIAERESIS AND CARON', 'Lu', 0, 'L', None, False, 0x01DA),
+    (0x01DA, 'LATIN SMALL LETTER U WITH DIAERESIS AND CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01DB, 'LATIN CAPITAL LETTER U WITH DIAERESIS AND GRAVE', 'Lu', 0, 'L', None, False, 0x01DC),
+    (0x01DC, 'LATIN SMALL LETTER U WITH DIAERESIS AND GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x01DD, 'LATIN SMALL LETTER TURNED E', 'Ll', 0, 'L', None, False, None),
+    (0x01DE, 'LATIN CAPITAL LETTER A WITH DIAERESIS AND MACRON', 'Lu', 0, 'L', None, False, 0x01DF),
+    (0x01DF, 'LATIN SMALL LETTER A WITH DIAERESIS AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x01E0, 'LATIN CAPITAL LETTER A WITH DOT ABOVE AND MACRON', 'Lu', 0, 'L', None, False, 0x01E1),
+    (0x01E1, 'LATIN SMALL LETTER A WITH DOT ABOVE AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x01E2, 'LATIN CAPITAL LETTER AE WITH MACRON', 'Lu', 0, 'L', None, False, 0x01E3),
+    (0x01E3, 'LATIN SMALL LETTER AE WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x01E4, 'LATIN CAPITAL LETTER G WITH STROKE', 'Lu', 0, 'L', None, False, 0x01E5),
+    (0x01E5, 'LATIN SMALL LETTER G WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x01E6, 'LATIN CAPITAL LETTER G WITH CARON', 'Lu', 0, 'L', None, False, 0x01E7),
+    (0x01E7, 'LATIN SMALL LETTER G WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01E8, 'LATIN CAPITAL LETTER K WITH CARON', 'Lu', 0, 'L', None, False, 0x01E9),
+    (0x01E9, 'LATIN SMALL LETTER K WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01EA, 'LATIN CAPITAL LETTER O WITH OGONEK', 'Lu', 0, 'L', None, False, 0x01EB),
+    (0x01EB, 'LATIN SMALL LETTER O WITH OGONEK', 'Ll', 0, 'L', None, False, None),
+    (0x01EC, 'LATIN CAPITAL LETTER O WITH OGONEK AND MACRON', 'Lu', 0, 'L', None, False, 0x01ED),
+    (0x01ED, 'LATIN SMALL LETTER O WITH OGONEK AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x01EE, 'LATIN CAPITAL LETTER EZH WITH CARON', 'Lu', 0, 'L', None, False, 0x01EF),
+    (0x01EF, 'LATIN SMALL LETTER EZH WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01F0, 'LATIN SMALL LETTER J WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x01F1, 'LATIN CAPITAL LETTER DZ', 'Lu', 0, 'L', None, False, 0x01F3),
+    (0x01F2, 'LATIN CAPITAL LETTER D WITH SMALL LETTER Z', 'Lt', 0, 'L', None, False, 0x01F3),
+    (0x01F3, 'LATIN SMALL LETTER DZ', 'Ll', 0, 'L', None, False, None),
+    (0x01F4, 'LATIN CAPITAL LETTER G WITH ACUTE', 'Lu', 0, 'L', None, False, 0x01F5),
+    (0x01F5, 'LATIN SMALL LETTER G WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x01F6, 'LATIN CAPITAL LETTER HWAIR', 'Lu', 0, 'L', None, False, 0x0195),
+    (0x01F7, 'LATIN CAPITAL LETTER WYNN', 'Lu', 0, 'L', None, False, 0x01BF),
+    (0x01F8, 'LATIN CAPITAL LETTER N WITH GRAVE', 'Lu', 0, 'L', None, False, 0x01F9),
+    (0x01F9, 'LATIN SMALL LETTER N WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x01FA, 'LATIN CAPITAL LETTER A WITH RING ABOVE AND ACUTE', 'Lu', 0, 'L', None, False, 0x01FB),
+    (0x01FB, 'LATIN SMALL LETTER A WITH RING ABOVE AND ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x01FC, 'LATIN CAPITAL LETTER AE WITH ACUTE', 'Lu', 0, 'L', None, False, 0x01FD),
+    (0x01FD, 'LATIN SMALL LETTER AE WITH ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x01FE, 'LATIN CAPITAL LETTER O WITH STROKE AND ACUTE', 'Lu', 0, 'L', None, False, 0x01FF),
+    (0x01FF, 'LATIN SMALL LETTER O WITH STROKE AND ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x0200, 'LATIN CAPITAL LETTER A WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x0201),
+    (0x0201, 'LATIN SMALL LETTER A WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x0202, 'LATIN CAPITAL LETTER A WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x0203),
+    (0x0203, 'LATIN SMALL LETTER A WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0204, 'LATIN CAPITAL LETTER E WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x0205),
+    (0x0205, 'LATIN SMALL LETTER E WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x0206, 'LATIN CAPITAL LETTER E WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x0207),
+    (0x0207, 'LATIN SMALL LETTER E WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0208, 'LATIN CAPITAL LETTER I WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x0209),
+    (0x0209, 'LATIN SMALL LETTER I WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x020A, 'LATIN CAPITAL LETTER I WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x020B),
+    (0x020B, 'LATIN SMALL LETTER I WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x020C, 'LATIN CAPITAL LETTER O WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x020D),
+    (0x020D, 'LATIN SMALL LETTER O WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x020E, 'LATIN CAPITAL LETTER O WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x020F),
+    (0x020F, 'LATIN SMALL LETTER O WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0210, 'LATIN CAPITAL LETTER R WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x0211),
+    (0x0211, 'LATIN SMALL LETTER R WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x0212, 'LATIN CAPITAL LETTER R WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x0213),
+    (0x0213, 'LATIN SMALL LETTER R WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0214, 'LATIN CAPITAL LETTER U WITH DOUBLE GRAVE', 'Lu', 0, 'L', None, False, 0x0215),
+    (0x0215, 'LATIN SMALL LETTER U WITH DOUBLE GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x0216, 'LATIN CAPITAL LETTER U WITH INVERTED BREVE', 'Lu', 0, 'L', None, False, 0x0217),
+    (0x0217, 'LATIN SMALL LETTER U WITH INVERTED BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x0218, 'LATIN CAPITAL LETTER S WITH COMMA BELOW', 'Lu', 0, 'L', None, False, 0x0219),
+    (0x0219, 'LATIN SMALL LETTER S WITH COMMA BELOW', 'Ll', 0, 'L', None, False, None),
+    (0x021A, 'LATIN CAPITAL LETTER T WITH COMMA BELOW', 'Lu', 0, 'L', None, False, 0x021B),
+    (0x021B, 'LATIN SMALL LETTER T WITH COMMA BELOW', 'Ll', 0, 'L', None, False, None),
+    (0x021C, 'LATIN CAPITAL LETTER YOGH', 'Lu', 0, 'L', None, False, 0x021D),
+    (0x021D, 'LATIN SMALL LETTER YOGH', 'Ll', 0, 'L', None, False, None),
+    (0x021E, 'LATIN CAPITAL LETTER H WITH CARON', 'Lu', 0, 'L', None, False, 0x021F),
+    (0x021F, 'LATIN SMALL LETTER H WITH CARON', 'Ll', 0, 'L', None, False, None),
+    (0x0220, 'LATIN CAPITAL LETTER N WITH LONG RIGHT LEG', 'Lu', 0, 'L', None, False, 0x019E),
+    (0x0221, 'LATIN SMALL LETTER D WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0222, 'LATIN CAPITAL LETTER OU', 'Lu', 0, 'L', None, False, 0x0223),
+    (0x0223, 'LATIN SMALL LETTER OU', 'Ll', 0, 'L', None, False, None),
+    (0x0224, 'LATIN CAPITAL LETTER Z WITH HOOK', 'Lu', 0, 'L', None, False, 0x0225),
+    (0x0225, 'LATIN SMALL LETTER Z WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0226, 'LATIN CAPITAL LETTER A WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x0227),
+    (0x0227, 'LATIN SMALL LETTER A WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x0228, 'LATIN CAPITAL LETTER E WITH CEDILLA', 'Lu', 0, 'L', None, False, 0x0229),
+    (0x0229, 'LATIN SMALL LETTER E WITH CEDILLA', 'Ll', 0, 'L', None, False, None),
+    (0x022A, 'LATIN CAPITAL LETTER O WITH DIAERESIS AND MACRON', 'Lu', 0, 'L', None, False, 0x022B),
+    (0x022B, 'LATIN SMALL LETTER O WITH DIAERESIS AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x022C, 'LATIN CAPITAL LETTER O WITH TILDE AND MACRON', 'Lu', 0, 'L', None, False, 0x022D),
+    (0x022D, 'LATIN SMALL LETTER O WITH TILDE AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x022E, 'LATIN CAPITAL LETTER O WITH DOT ABOVE', 'Lu', 0, 'L', None, False, 0x022F),
+    (0x022F, 'LATIN SMALL LETTER O WITH DOT ABOVE', 'Ll', 0, 'L', None, False, None),
+    (0x0230, 'LATIN CAPITAL LETTER O WITH DOT ABOVE AND MACRON', 'Lu', 0, 'L', None, False, 0x0231),
+    (0x0231, 'LATIN SMALL LETTER O WITH DOT ABOVE AND MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x0232, 'LATIN CAPITAL LETTER Y WITH MACRON', 'Lu', 0, 'L', None, False, 0x0233),
+    (0x0233, 'LATIN SMALL LETTER Y WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x0234, 'LATIN SMALL LETTER L WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0235, 'LATIN SMALL LETTER N WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0236, 'LATIN SMALL LETTER T WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0237, 'LATIN SMALL LETTER DOTLESS J', 'Ll', 0, 'L', None, False, None),
+    (0x0238, 'LATIN SMALL LETTER DB DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x0239, 'LATIN SMALL LETTER QP DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x023A, 'LATIN CAPITAL LETTER A WITH STROKE', 'Lu', 0, 'L', None, False, 0x2C65),
+    (0x023B, 'LATIN CAPITAL LETTER C WITH STROKE', 'Lu', 0, 'L', None, False, 0x023C),
+    (0x023C, 'LATIN SMALL LETTER C WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x023D, 'LATIN CAPITAL LETTER L WITH BAR', 'Lu', 0, 'L', None, False, 0x019A),
+    (0x023E, 'LATIN CAPITAL LETTER T WITH DIAGONAL STROKE', 'Lu', 0, 'L', None, False, 0x2C66),
+    (0x023F, 'LATIN SMALL LETTER S WITH SWASH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x0240, 'LATIN SMALL LETTER Z WITH SWASH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x0241, 'LATIN CAPITAL LETTER GLOTTAL STOP', 'Lu', 0, 'L', None, False, 0x0242),
+    (0x0242, 'LATIN SMALL LETTER GLOTTAL STOP', 'Ll', 0, 'L', None, False, None),
+    (0x0243, 'LATIN CAPITAL LETTER B WITH STROKE', 'Lu', 0, 'L', None, False, 0x0180),
+    (0x0244, 'LATIN CAPITAL LETTER U BAR', 'Lu', 0, 'L', None, False, 0x0289),
+    (0x0245, 'LATIN CAPITAL LETTER TURNED V', 'Lu', 0, 'L', None, False, 0x028C),
+    (0x0246, 'LATIN CAPITAL LETTER E WITH STROKE', 'Lu', 0, 'L', None, False, 0x0247),
+    (0x0247, 'LATIN SMALL LETTER E WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0248, 'LATIN CAPITAL LETTER J WITH STROKE', 'Lu', 0, 'L', None, False, 0x0249),
+    (0x0249, 'LATIN SMALL LETTER J WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x024A, 'LATIN CAPITAL LETTER SMALL Q WITH HOOK TAIL', 'Lu', 0, 'L', None, False, 0x024B),
+    (0x024B, 'LATIN SMALL LETTER Q WITH HOOK TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x024C, 'LATIN CAPITAL LETTER R WITH STROKE', 'Lu', 0, 'L', None, False, 0x024D),
+    (0x024D, 'LATIN SMALL LETTER R WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x024E, 'LATIN CAPITAL LETTER Y WITH STROKE', 'Lu', 0, 'L', None, False, 0x024F),
+    (0x024F, 'LATIN SMALL LETTER Y WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0250, 'LATIN SMALL LETTER TURNED A', 'Ll', 0, 'L', None, False, None),
+    (0x0251, 'LATIN SMALL LETTER ALPHA', 'Ll', 0, 'L', None, False, None),
+    (0x0252, 'LATIN SMALL LETTER TURNED ALPHA', 'Ll', 0, 'L', None, False, None),
+    (0x0253, 'LATIN SMALL LETTER B WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0254, 'LATIN SMALL LETTER OPEN O', 'Ll', 0, 'L', None, False, None),
+    (0x0255, 'LATIN SMALL LETTER C WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0256, 'LATIN SMALL LETTER D WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x0257, 'LATIN SMALL LETTER D WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0258, 'LATIN SMALL LETTER REVERSED E', 'Ll', 0, 'L', None, False, None),
+    (0x0259, 'LATIN SMALL LETTER SCHWA', 'Ll', 0, 'L', None, False, None),
+    (0x025A, 'LATIN SMALL LETTER SCHWA WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x025B, 'LATIN SMALL LETTER OPEN E', 'Ll', 0, 'L', None, False, None),
+    (0x025C, 'LATIN SMALL LETTER REVERSED OPEN E', 'Ll', 0, 'L', None, False, None),
+    (0x025D, 'LATIN SMALL LETTER REVERSED OPEN E WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x025E, 'LATIN SMALL LETTER CLOSED REVERSED OPEN E', 'Ll', 0, 'L', None, False, None),
+    (0x025F, 'LATIN SMALL LETTER DOTLESS J WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0260, 'LATIN SMALL LETTER G WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0261, 'LATIN SMALL LETTER SCRIPT G', 'Ll', 0, 'L', None, False, None),
+    (0x0262, 'LATIN LETTER SMALL CAPITAL G', 'Ll', 0, 'L', None, False, None),
+    (0x0263, 'LATIN SMALL LETTER GAMMA', 'Ll', 0, 'L', None, False, None),
+    (0x0264, 'LATIN SMALL LETTER RAMS HORN', 'Ll', 0, 'L', None, False, None),
+    (0x0265, 'LATIN SMALL LETTER TURNED H', 'Ll', 0, 'L', None, False, None),
+    (0x0266, 'LATIN SMALL LETTER H WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0267, 'LATIN SMALL LETTER HENG WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0268, 'LATIN SMALL LETTER I WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0269, 'LATIN SMALL LETTER IOTA', 'Ll', 0, 'L', None, False, None),
+    (0x026A, 'LATIN LETTER SMALL CAPITAL I', 'Ll', 0, 'L', None, False, None),
+    (0x026B, 'LATIN SMALL LETTER L WITH MIDDLE TILDE', 'Ll', 0, 'L', None, False, None),
+    (0x026C, 'LATIN SMALL LETTER L WITH BELT', 'Ll', 0, 'L', None, False, None),
+    (0x026D, 'LATIN SMALL LETTER L WITH RETROFLEX HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x026E, 'LATIN SMALL LETTER LEZH', 'Ll', 0, 'L', None, False, None),
+    (0x026F, 'LATIN SMALL LETTER TURNED M', 'Ll', 0, 'L', None, False, None),
+    (0x0270, 'LATIN SMALL LETTER TURNED M WITH LONG LEG', 'Ll', 0, 'L', None, False, None),
+    (0x0271, 'LATIN SMALL LETTER M WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0272, 'LATIN SMALL LETTER N WITH LEFT HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0273, 'LATIN SMALL LETTER N WITH RETROFLEX HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0274, 'LATIN LETTER SMALL CAPITAL N', 'Ll', 0, 'L', None, False, None),
+    (0x0275, 'LATIN SMALL LETTER BARRED O', 'Ll', 0, 'L', None, False, None),
+    (0x0276, 'LATIN LETTER SMALL CAPITAL OE', 'Ll', 0, 'L', None, False, None),
+    (0x0277, 'LATIN SMALL LETTER CLOSED OMEGA', 'Ll', 0, 'L', None, False, None),
+    (0x0278, 'LATIN SMALL LETTER PHI', 'Ll', 0, 'L', None, False, None),
+    (0x0279, 'LATIN SMALL LETTER TURNED R', 'Ll', 0, 'L', None, False, None),
+    (0x027A, 'LATIN SMALL LETTER TURNED R WITH LONG LEG', 'Ll', 0, 'L', None, False, None),
+    (0x027B, 'LATIN SMALL LETTER TURNED R WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x027C, 'LATIN SMALL LETTER R WITH LONG LEG', 'Ll', 0, 'L', None, False, None),
+    (0x027D, 'LATIN SMALL LETTER R WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x027E, 'LATIN SMALL LETTER R WITH FISHHOOK', 'Ll', 0, 'L', None, False, None),
+    (0x027F, 'LATIN SMALL LETTER REVERSED R WITH FISHHOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0280, 'LATIN LETTER SMALL CAPITAL R', 'Ll', 0, 'L', None, False, None),
+    (0x0281, 'LATIN LETTER SMALL CAPITAL INVERTED R', 'Ll', 0, 'L', None, False, None),
+    (0x0282, 'LATIN SMALL LETTER S WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0283, 'LATIN SMALL LETTER ESH', 'Ll', 0, 'L', None, False, None),
+    (0x0284, 'LATIN SMALL LETTER DOTLESS J WITH STROKE AND HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0285, 'LATIN SMALL LETTER SQUAT REVERSED ESH', 'Ll', 0, 'L', None, False, None),
+    (0x0286, 'LATIN SMALL LETTER ESH WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0287, 'LATIN SMALL LETTER TURNED T', 'Ll', 0, 'L', None, False, None),
+    (0x0288, 'LATIN SMALL LETTER T WITH RETROFLEX HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0289, 'LATIN SMALL LETTER U BAR', 'Ll', 0, 'L', None, False, None),
+    (0x028A, 'LATIN SMALL LETTER UPSILON', 'Ll', 0, 'L', None, False, None),
+    (0x028B, 'LATIN SMALL LETTER V WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x028C, 'LATIN SMALL LETTER TURNED V', 'Ll', 0, 'L', None, False, None),
+    (0x028D, 'LATIN SMALL LETTER TURNED W', 'Ll', 0, 'L', None, False, None),
+    (0x028E, 'LATIN SMALL LETTER TURNED Y', 'Ll', 0, 'L', None, False, None),
+    (0x028F, 'LATIN LETTER SMALL CAPITAL Y', 'Ll', 0, 'L', None, False, None),
+    (0x0290, 'LATIN SMALL LETTER Z WITH RETROFLEX HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0291, 'LATIN SMALL LETTER Z WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0292, 'LATIN SMALL LETTER EZH', 'Ll', 0, 'L', None, False, None),
+    (0x0293, 'LATIN SMALL LETTER EZH WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x0294, 'LATIN LETTER GLOTTAL STOP', 'Lo', 0, 'L', None, False, None),
+    (0x0295, 'LATIN LETTER PHARYNGEAL VOICED FRICATIVE', 'Ll', 0, 'L', None, False, None),
+    (0x0296, 'LATIN LETTER INVERTED GLOTTAL STOP', 'Ll', 0, 'L', None, False, None),
+    (0x0297, 'LATIN LETTER STRETCHED C', 'Ll', 0, 'L', None, False, None),
+    (0x0298, 'LATIN LETTER BILABIAL CLICK', 'Ll', 0, 'L', None, False, None),
+    (0x0299, 'LATIN LETTER SMALL CAPITAL B', 'Ll', 0, 'L', None, False, None),
+    (0x029A, 'LATIN SMALL LETTER CLOSED OPEN E', 'Ll', 0, 'L', None, False, None),
+    (0x029B, 'LATIN LETTER SMALL CAPITAL G WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x029C, 'LATIN LETTER SMALL CAPITAL H', 'Ll', 0, 'L', None, False, None),
+    (0x029D, 'LATIN SMALL LETTER J WITH CROSSED-TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x029E, 'LATIN SMALL LETTER TURNED K', 'Ll', 0, 'L', None, False, None),
+    (0x029F, 'LATIN LETTER SMALL CAPITAL L', 'Ll', 0, 'L', None, False, None),
+    (0x02A0, 'LATIN SMALL LETTER Q WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x02A1, 'LATIN LETTER GLOTTAL STOP WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x02A2, 'LATIN LETTER REVERSED GLOTTAL STOP WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x02A3, 'LATIN SMALL LETTER DZ DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02A4, 'LATIN SMALL LETTER DEZH DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02A5, 'LATIN SMALL LETTER DZ DIGRAPH WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x02A6, 'LATIN SMALL LETTER TS DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02A7, 'LATIN SMALL LETTER TESH DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02A8, 'LATIN SMALL LETTER TC DIGRAPH WITH CURL', 'Ll', 0, 'L', None, False, None),
+    (0x02A9, 'LATIN SMALL LETTER FENG DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02AA, 'LATIN SMALL LETTER LS DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02AB, 'LATIN SMALL LETTER LZ DIGRAPH', 'Ll', 0, 'L', None, False, None),
+    (0x02AC, 'LATIN LETTER BILABIAL PERCUSSIVE', 'Ll', 0, 'L', None, False, None),
+    (0x02AD, 'LATIN LETTER BIDENTAL PERCUSSIVE', 'Ll', 0, 'L', None, False, None),
+    (0x02AE, 'LATIN SMALL LETTER TURNED H WITH FISHHOOK', 'Ll', 0, 'L', None, False, None),
+    (0x02AF, 'LATIN SMALL LETTER TURNED H WITH FISHHOOK AND TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x02B0, 'MODIFIER LETTER SMALL H', 'Lm', 0, 'L', None, False, None),
+    (0x02B1, 'MODIFIER LETTER SMALL H WITH HOOK', 'Lm', 0, 'L', None, False, None),
+    (0x02B2, 'MODIFIER LETTER SMALL J', 'Lm', 0, 'L', None, False, None),
+    (0x02B3, 'MODIFIER LETTER SMALL R', 'Lm', 0, 'L', None, False, None),
+    (0x02B4, 'MODIFIER LETTER SMALL TURNED R', 'Lm', 0, 'L', None, False, None),
+    (0x02B5, 'MODIFIER LETTER SMALL TURNED R WITH HOOK', 'Lm', 0, 'L', None, False, None),
+    (0x02B6, 'MODIFIER LETTER SMALL CAPITAL INVERTED R', 'Lm', 0, 'L', None, False, None),
+    (0x02B7, 'MODIFIER LETTER SMALL W', 'Lm', 0, 'L', None, False, None),
+    (0x02B8, 'MODIFIER LETTER SMALL Y', 'Lm', 0, 'L', None, False, None),
+    (0x02B9, 'MODIFIER LETTER PRIME', 'Lm', 0, 'ON', None, False, None),
+    (0x02BA, 'MODIFIER LETTER DOUBLE PRIME', 'Lm', 0, 'ON', None, False, None),
+    (0x02BB, 'MODIFIER LETTER TURNED COMMA', 'Lm', 0, 'L', None, False, None),
+    (0x02BC, 'MODIFIER LETTER APOSTROPHE', 'Lm', 0, 'L', None, False, None),
+    (0x02BD, 'MODIFIER LETTER REVERSED COMMA', 'Lm', 0, 'L', None, False, None),
+    (0x02BE, 'MODIFIER LETTER RIGHT HALF RING', 'Lm', 0, 'L', None, False, None),
+    (0x02BF, 'MODIFIER LETTER LEFT HALF RING', 'Lm', 0, 'L', None, False, None),
+    (0x02C0, 'MODIFIER LETTER GLOTTAL STOP', 'Lm', 0, 'L', None, False, None),
+    (0x02C1, 'MODIFIER LETTER REVERSED GLOTTAL STOP', 'Lm', 0, 'L', None, False, None),
+    (0x02C2, 'MODIFIER LETTER LEFT ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02C3, 'MODIFIER LETTER RIGHT ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02C4, 'MODIFIER LETTER UP ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02C5, 'MODIFIER LETTER DOWN ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02C6, 'MODIFIER LETTER CIRCUMFLEX ACCENT', 'Lm', 0, 'ON', None, False, None),
+    (0x02C7, 'CARON', 'Lm', 0, 'ON', None, False, None),
+    (0x02C8, 'MODIFIER LETTER VERTICAL LINE', 'Lm', 0, 'ON', None, False, None),
+    (0x02C9, 'MODIFIER LETTER MACRON', 'Lm', 0, 'ON', None, False, None),
+    (0x02CA, 'MODIFIER LETTER ACUTE ACCENT', 'Lm', 0, 'ON', None, False, None),
+    (0x02CB, 'MODIFIER LETTER GRAVE ACCENT', 'Lm', 0, 'ON', None, False, None),
+    (0x02CC, 'MODIFIER LETTER LOW VERTICAL LINE', 'Lm', 0, 'ON', None, False, None),
+    (0x02CD, 'MODIFIER LETTER LOW MACRON', 'Lm', 0, 'ON', None, False, None),
+    (0x02CE, 'MODIFIER LETTER LOW GRAVE ACCENT', 'Lm', 0, 'ON', None, False, None),
+    (0x02CF, 'MODIFIER LETTER LOW ACUTE ACCENT', 'Lm', 0, 'ON', None, False, None),
+    (0x02D0, 'MODIFIER LETTER TRIANGULAR COLON', 'Lm', 0, 'L', None, False, None),
+    (0x02D1, 'MODIFIER LETTER HALF TRIANGULAR COLON', 'Lm', 0, 'L', None, False, None),
+    (0x02D2, 'MODIFIER LETTER CENTRED RIGHT HALF RING', 'Sk', 0, 'ON', None, False, None),
+    (0x02D3, 'MODIFIER LETTER CENTRED LEFT HALF RING', 'Sk', 0, 'ON', None, False, None),
+    (0x02D4, 'MODIFIER LETTER UP TACK', 'Sk', 0, 'ON', None, False, None),
+    (0x02D5, 'MODIFIER LETTER DOWN TACK', 'Sk', 0, 'ON', None, False, None),
+    (0x02D6, 'MODIFIER LETTER PLUS SIGN', 'Sk', 0, 'ON', None, False, None),
+    (0x02D7, 'MODIFIER LETTER MINUS SIGN', 'Sk', 0, 'ON', None, False, None),
+    (0x02D8, 'BREVE', 'Sk', 0, 'ON', None, False, None),
+    (0x02D9, 'DOT ABOVE', 'Sk', 0, 'ON', None, False, None),
+    (0x02DA, 'RING ABOVE', 'Sk', 0, 'ON', None, False, None),
+    (0x02DB, 'OGONEK', 'Sk', 0, 'ON', None, False, None),
+    (0x02DC, 'SMALL TILDE', 'Sk', 0, 'ON', None, False, None),
+    (0x02DD, 'DOUBLE ACUTE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x02DE, 'MODIFIER LETTER RHOTIC HOOK', 'Sk', 0, 'ON', None, False, None),
+    (0x02DF, 'MODIFIER LETTER CROSS ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x02E0, 'MODIFIER LETTER SMALL GAMMA', 'Lm', 0, 'L', None, False, None),
+    (0x02E1, 'MODIFIER LETTER SMALL L', 'Lm', 0, 'L', None, False, None),
+    (0x02E2, 'MODIFIER LETTER SMALL S', 'Lm', 0, 'L', None, False, None),
+    (0x02E3, 'MODIFIER LETTER SMALL X', 'Lm', 0, 'L', None, False, None),
+    (0x02E4, 'MODIFIER LETTER SMALL REVERSED GLOTTAL STOP', 'Lm', 0, 'L', None, False, None),
+    (0x02E5, 'MODIFIER LETTER EXTRA-HIGH TONE BAR', 'Sk', 0, 'ON', None, False, None),
+    (0x02E6, 'MODIFIER LETTER HIGH TONE BAR', 'Sk', 0, 'ON', None, False, None),
+    (0x02E7, 'MODIFIER LETTER MID TONE BAR', 'Sk', 0, 'ON', None, False, None),
+    (0x02E8, 'MODIFIER LETTER LOW TONE BAR', 'Sk', 0, 'ON', None, False, None),
+    (0x02E9, 'MODIFIER LETTER EXTRA-LOW TONE BAR', 'Sk', 0, 'ON', None, False, None),
+    (0x02EA, 'MODIFIER LETTER YIN DEPARTING TONE MARK', 'Sk', 0, 'ON', None, False, None),
+    (0x02EB, 'MODIFIER LETTER YANG DEPARTING TONE MARK', 'Sk', 0, 'ON', None, False, None),
+    (0x02EC, 'MODIFIER LETTER VOICING', 'Lm', 0, 'ON', None, False, None),
+    (0x02ED, 'MODIFIER LETTER UNASPIRATED', 'Sk', 0, 'ON', None, False, None),
+    (0x02EE, 'MODIFIER LETTER DOUBLE APOSTROPHE', 'Lm', 0, 'L', None, False, None),
+    (0x02EF, 'MODIFIER LETTER LOW DOWN ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02F0, 'MODIFIER LETTER LOW UP ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02F1, 'MODIFIER LETTER LOW LEFT ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02F2, 'MODIFIER LETTER LOW RIGHT ARROWHEAD', 'Sk', 0, 'ON', None, False, None),
+    (0x02F3, 'MODIFIER LETTER LOW RING', 'Sk', 0, 'ON', None, False, None),
+    (0x02F4, 'MODIFIER LETTER MIDDLE GRAVE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x02F5, 'MODIFIER LETTER MIDDLE DOUBLE GRAVE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x02F6, 'MODIFIER LETTER MIDDLE DOUBLE ACUTE ACCENT', 'Sk', 0, 'ON', None, False, None),
+    (0x02F7, 'MODIFIER LETTER LOW TILDE', 'Sk', 0, 'ON', None, False, None),
+    (0x02F8, 'MODIFIER LETTER RAISED COLON', 'Sk', 0, 'ON', None, False, None),
+    (0x02F9, 'MODIFIER LETTER BEGIN HIGH TONE', 'Sk', 0, 'ON', None, False, None),
+    (0x02FA, 'MODIFIER LETTER END HIGH TONE', 'Sk', 0, 'ON', None, False, None),
+    (0x02FB, 'MODIFIER LETTER BEGIN LOW TONE', 'Sk', 0, 'ON', None, False, None),
+    (0x02FC, 'MODIFIER LETTER END LOW TONE', 'Sk', 0, 'ON', None, False, None),
+    (0x02FD, 'MODIFIER LETTER SHELF', 'Sk', 0, 'ON', None, False, None),
+    (0x02FE, 'MODIFIER LETTER OPEN SHELF', 'Sk', 0, 'ON', None, False, None),
+    (0x02FF, 'MODIFIER LETTER LOW LEFT ARROW', 'Sk', 0, 'ON', None, False, None),
+    (0x0300, 'COMBINING GRAVE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0301, 'COMBINING ACUTE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0302, 'COMBINING CIRCUMFLEX ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0303, 'COMBINING TILDE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0304, 'COMBINING MACRON', 'Mn', 230, 'NSM', None, False, None),
+    (0x0305, 'COMBINING OVERLINE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0306, 'COMBINING BREVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0307, 'COMBINING DOT ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0308, 'COMBINING DIAERESIS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0309, 'COMBINING HOOK ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x030A, 'COMBINING RING ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x030B, 'COMBINING DOUBLE ACUTE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x030C, 'COMBINING CARON', 'Mn', 230, 'NSM', None, False, None),
+    (0x030D, 'COMBINING VERTICAL LINE ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x030E, 'COMBINING DOUBLE VERTICAL LINE ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x030F, 'COMBINING DOUBLE GRAVE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0310, 'COMBINING CANDRABINDU', 'Mn', 230, 'NSM', None, False, None),
+    (0x0311, 'COMBINING INVERTED BREVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0312, 'COMBINING TURNED COMMA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0313, 'COMBINING COMMA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0314, 'COMBINING REVERSED COMMA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0315, 'COMBINING COMMA ABOVE RIGHT', 'Mn', 232, 'NSM', None, False, None),
+    (0x0316, 'COMBINING GRAVE ACCENT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0317, 'COMBINING ACUTE ACCENT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0318, 'COMBINING LEFT TACK BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0319, 'COMBINING RIGHT TACK BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x031A, 'COMBINING LEFT ANGLE ABOVE', 'Mn', 232, 'NSM', None, False, None),
+    (0x031B, 'COMBINING HORN', 'Mn', 216, 'NSM', None, False, None),
+    (0x031C, 'COMBINING LEFT HALF RING BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x031D, 'COMBINING UP TACK BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x031E, 'COMBINING DOWN TACK BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x031F, 'COMBINING PLUS SIGN BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0320, 'COMBINING MINUS SIGN BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0321, 'COMBINING PALATALIZED HOOK BELOW', 'Mn', 202, 'NSM', None, False, None),
+    (0x0322, 'COMBINING RETROFLEX HOOK BELOW', 'Mn', 202, 'NSM', None, False, None),
+    (0x0323, 'COMBINING DOT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0324, 'COMBINING DIAERESIS BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0325, 'COMBINING RING BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0326, 'COMBINING COMMA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0327, 'COMBINING CEDILLA', 'Mn', 202, 'NSM', None, False, None),
+    (0x0328, 'COMBINING OGONEK', 'Mn', 202, 'NSM', None, False, None),
+    (0x0329, 'COMBINING VERTICAL LINE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032A, 'COMBINING BRIDGE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032B, 'COMBINING INVERTED DOUBLE ARCH BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032C, 'COMBINING CARON BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032D, 'COMBINING CIRCUMFLEX ACCENT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032E, 'COMBINING BREVE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x032F, 'COMBINING INVERTED BREVE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0330, 'COMBINING TILDE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0331, 'COMBINING MACRON BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0332, 'COMBINING LOW LINE', 'Mn', 220, 'NSM', None, False, None),
+    (0x0333, 'COMBINING DOUBLE LOW LINE', 'Mn', 220, 'NSM', None, False, None),
+    (0x0334, 'COMBINING TILDE OVERLAY', 'Mn', 1, 'NSM', None, False, None),
+    (0x0335, 'COMBINING SHORT STROKE OVERLAY', 'Mn', 1, 'NSM', None, False, None),
+    (0x0336, 'COMBINING LONG STROKE OVERLAY', 'Mn', 1, 'NSM', None, False, None),
+    (0x0337, 'COMBINING SHORT SOLIDUS OVERLAY', 'Mn', 1, 'NSM', None, False, None),
+    (0x0338, 'COMBINING LONG SOLIDUS OVERLAY', 'Mn', 1, 'NSM', None, False, None),
+    (0x0339, 'COMBINING RIGHT HALF RING BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x033A, 'COMBINING INVERTED BRIDGE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x033B, 'COMBINING SQUARE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x033C, 'COMBINING SEAGULL BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x033D, 'COMBINING X ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x033E, 'COMBINING VERTICAL TILDE', 'Mn', 230, 'NSM', None, False, None),
+    (0x033F, 'COMBINING DOUBLE OVERLINE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0340, 'COMBINING GRAVE TONE MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x0341, 'COMBINING ACUTE TONE MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x0342, 'COMBINING GREEK PERISPOMENI', 'Mn', 230, 'NSM', None, False, None),
+    (0x0343, 'COMBINING GREEK KORONIS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0344, 'COMBINING GREEK DIALYTIKA TONOS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0345, 'COMBINING GREEK YPOGEGRAMMENI', 'Mn', 240, 'NSM', None, False, None),
+    (0x0346, 'COMBINING BRIDGE ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0347, 'COMBINING EQUALS SIGN BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0348, 'COMBINING DOUBLE VERTICAL LINE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0349, 'COMBINING LEFT ANGLE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x034A, 'COMBINING NOT TILDE ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x034B, 'COMBINING HOMOTHETIC ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x034C, 'COMBINING ALMOST EQUAL TO ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x034D, 'COMBINING LEFT RIGHT ARROW BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x034E, 'COMBINING UPWARDS ARROW BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x034F, 'COMBINING GRAPHEME JOINER', 'Mn', 0, 'NSM', None, False, None),
+    (0x0350, 'COMBINING RIGHT ARROWHEAD ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0351, 'COMBINING LEFT HALF RING ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0352, 'COMBINING FERMATA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0353, 'COMBINING X BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0354, 'COMBINING LEFT ARROWHEAD BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0355, 'COMBINING RIGHT ARROWHEAD BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0356, 'COMBINING RIGHT ARROWHEAD AND UP ARROWHEAD BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0357, 'COMBINING RIGHT HALF RING ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0358, 'COMBINING DOT ABOVE RIGHT', 'Mn', 232, 'NSM', None, False, None),
+    (0x0359, 'COMBINING ASTERISK BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x035A, 'COMBINING DOUBLE RING BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x035B, 'COMBINING ZIGZAG ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x035C, 'COMBINING DOUBLE BREVE BELOW', 'Mn', 233, 'NSM', None, False, None),
+    (0x035D, 'COMBINING DOUBLE BREVE', 'Mn', 234, 'NSM', None, False, None),
+    (0x035E, 'COMBINING DOUBLE MACRON', 'Mn', 234, 'NSM', None, False, None),
+    (0x035F, 'COMBINING DOUBLE MACRON BELOW', 'Mn', 233, 'NSM', None, False, None),
+    (0x0360, 'COMBINING DOUBLE TILDE', 'Mn', 234, 'NSM', None, False, None),
+    (0x0361, 'COMBINING DOUBLE INVERTED BREVE', 'Mn', 234, 'NSM', None, False, None),
+    (0x0362, 'COMBINING DOUBLE RIGHTWARDS ARROW BELOW', 'Mn', 233, 'NSM', None, False, None),
+    (0x0363, 'COMBINING LATIN SMALL LETTER A', 'Mn', 230, 'NSM', None, False, None),
+    (0x0364, 'COMBINING LATIN SMALL LETTER E', 'Mn', 230, 'NSM', None, False, None),
+    (0x0365, 'COMBINING LATIN SMALL LETTER I', 'Mn', 230, 'NSM', None, False, None),
+    (0x0366, 'COMBINING LATIN SMALL LETTER O', 'Mn', 230, 'NSM', None, False, None),
+    (0x0367, 'COMBINING LATIN SMALL LETTER U', 'Mn', 230, 'NSM', None, False, None),
+    (0x0368, 'COMBINING LATIN SMALL LETTER C', 'Mn', 230, 'NSM', None, False, None),
+    (0x0369, 'COMBINING LATIN SMALL LETTER D', 'Mn', 230, 'NSM', None, False, None),
+    (0x036A, 'COMBINING LATIN SMALL LETTER H', 'Mn', 230, 'NSM', None, False, None),
+    (0x036B, 'COMBINING LATIN SMALL LETTER M', 'Mn', 230, 'NSM', None, False, None),
+    (0x036C, 'COMBINING LATIN SMALL LETTER R', 'Mn', 230, 'NSM', None, False, None),
+    (0x036D, 'COMBINING LATIN SMALL LETTER T', 'Mn', 230, 'NSM', None, False, None),
+    (0x036E, 'COMBINING LATIN SMALL LETTER V', 'Mn', 230, 'NSM', None, False, None),
+    (0x036F, 'COMBINING LATIN SMALL LETTER X', 'Mn', 230, 'NSM', None, False, None),
+    (0x0370, 'GREEK CAPITAL LETTER HETA', 'Lu', 0, 'L', None, False, 0x0371),
+    (0x0371, 'GREEK SMALL LETTER HETA', 'Ll', 0, 'L', None, False, None),
+    (0x0372, 'GREEK CAPITAL LETTER ARCHAIC SAMPI', 'Lu', 0, 'L', None, False, 0x0373),
+    (0x0373, 'GREEK SMALL LETTER ARCHAIC SAMPI', 'Ll', 0, 'L', None, False, None),
+    (0x0374, 'GREEK NUMERAL SIGN', 'Lm', 0, 'ON', None, False, None),
+    (0x0375, 'GREEK LOWER NUMERAL SIGN', 'Sk', 0, 'ON', None, False, None),
+    (0x0376, 'GREEK CAPITAL LETTER PAMPHYLIAN DIGAMMA', 'Lu', 0, 'L', None, False, 0x0377),
+    (0x0377, 'GREEK SMALL LETTER PAMPHYLIAN DIGAMMA', 'Ll', 0, 'L', None, False, None),
+    (0x037A, 'GREEK YPOGEGRAMMENI', 'Lm', 0, 'L', None, False, None),
+    (0x037B, 'GREEK SMALL REVERSED LUNATE SIGMA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x037C, 'GREEK SMALL DOTTED LUNATE SIGMA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x037D, 'GREEK SMALL REVERSED DOTTED LUNATE SIGMA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x037E, 'GREEK QUESTION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x037F, 'GREEK CAPITAL LETTER YOT', 'Lu', 0, 'L', None, False, 0x03F3),
+    (0x0384, 'GREEK TONOS', 'Sk', 0, 'ON', None, False, None),
+    (0x0385, 'GREEK DIALYTIKA TONOS', 'Sk', 0, 'ON', None, False, None),
+    (0x0386, 'GREEK CAPITAL LETTER ALPHA WITH TONOS', 'Lu', 0, 'L', None, False, 0x03AC),
+    (0x0387, 'GREEK ANO TELEIA', 'Po', 0, 'ON', None, False, None),
+    (0x0388, 'GREEK CAPITAL LETTER EPSILON WITH TONOS', 'Lu', 0, 'L', None, False, 0x03AD),
+    (0x0389, 'GREEK CAPITAL LETTER ETA WITH TONOS', 'Lu', 0, 'L', None, False, 0x03AE),
+    (0x038A, 'GREEK CAPITAL LETTER IOTA WITH TONOS', 'Lu', 0, 'L', None, False, 0x03AF),
+    (0x038C, 'GREEK CAPITAL LETTER OMICRON WITH TONOS', 'Lu', 0, 'L', None, False, 0x03CC),
+    (0x038E, 'GREEK CAPITAL LETTER UPSILON WITH TONOS', 'Lu', 0, 'L', None, False, 0x03CD),
+    (0x038F, 'GREEK CAPITAL LETTER OMEGA WITH TONOS', 'Lu', 0, 'L', None, False, 0x03CE),
+    (0x0390, 'GREEK SMALL LETTER IOTA WITH DIALYTIKA AND TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x0391, 'GREEK CAPITAL LETTER ALPHA', 'Lu', 0, 'L', None, False, 0x03B1),
+    (0x0392, 'GREEK CAPITAL LETTER BETA', 'Lu', 0, 'L', None, False, 0x03B2),
+    (0x0393, 'GREEK CAPITAL LETTER GAMMA', 'Lu', 0, 'L', None, False, 0x03B3),
+    (0x0394, 'GREEK CAPITAL LETTER DELTA', 'Lu', 0, 'L', None, False, 0x03B4),
+    (0x0395, 'GREEK CAPITAL LETTER EPSILON', 'Lu', 0, 'L', None, False, 0x03B5),
+    (0x0396, 'GREEK CAPITAL LETTER ZETA', 'Lu', 0, 'L', None, False, 0x03B6),
+    (0x0397, 'GREEK CAPITAL LETTER ETA', 'Lu', 0, 'L', None, False, 0x03B7),
+    (0x0398, 'GREEK CAPITAL LETTER THETA', 'Lu', 0, 'L', None, False, 0x03B8),
+    (0x0399, 'GREEK CAPITAL LETTER IOTA', 'Lu', 0, 'L', None, False, 0x03B9),
+    (0x039A, 'GREEK CAPITAL LETTER KAPPA', 'Lu', 0, 'L', None, False, 0x03BA),
+    (0x039B, 'GREEK CAPITAL LETTER LAMDA', 'Lu', 0, 'L', None, False, 0x03BB),
+    (0x039C, 'GREEK CAPITAL LETTER MU', 'Lu', 0, 'L', None, False, 0x03BC),
+    (0x039D, 'GREEK CAPITAL LETTER NU', 'Lu', 0, 'L', None, False, 0x03BD),
+    (0x039E, 'GREEK CAPITAL LETTER XI', 'Lu', 0, 'L', None, False, 0x03BE),
+    (0x039F, 'GREEK CAPITAL LETTER OMICRON', 'Lu', 0, 'L', None, False, 0x03BF),
+    (0x03A0, 'GREEK CAPITAL LETTER PI', 'Lu', 0, 'L', None, False, 0x03C0),
+    (0x03A1, 'GREEK CAPITAL LETTER RHO', 'Lu', 0, 'L', None, False, 0x03C1),
+    (0x03A3, 'GREEK CAPITAL LETTER SIGMA', 'Lu', 0, 'L', None, False, 0x03C3),
+    (0x03A4, 'GREEK CAPITAL LETTER TAU', 'Lu', 0, 'L', None, False, 0x03C4),
+    (0x03A5, 'GREEK CAPITAL LETTER UPSILON', 'Lu', 0, 'L', None, False, 0x03C5),
+    (0x03A6, 'GREEK CAPITAL LETTER PHI', 'Lu', 0, 'L', None, False, 0x03C6),
+    (0x03A7, 'GREEK CAPITAL LETTER CHI', 'Lu', 0, 'L', None, False, 0x03C7),
+    (0x03A8, 'GREEK CAPITAL LETTER PSI', 'Lu', 0, 'L', None, False, 0x03C8),
+    (0x03A9, 'GREEK CAPITAL LETTER OMEGA', 'Lu', 0, 'L', None, False, 0x03C9),
+    (0x03AA, 'GREEK CAPITAL LETTER IOTA WITH DIALYTIKA', 'Lu', 0, 'L', None, False, 0x03CA),
+    (0x03AB, 'GREEK CAPITAL LETTER UPSILON WITH DIALYTIKA', 'Lu', 0, 'L', None, False, 0x03CB),
+    (0x03AC, 'GREEK SMALL LETTER ALPHA WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03AD, 'GREEK SMALL LETTER EPSILON WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03AE, 'GREEK SMALL LETTER ETA WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03AF, 'GREEK SMALL LETTER IOTA WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03B0, 'GREEK SMALL LETTER UPSILON WITH DIALYTIKA AND TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03B1, 'GREEK SMALL LETTER ALPHA', 'Ll', 0, 'L', None, False, None),
+    (0x03B2, 'GREEK SMALL LETTER BETA', 'Ll', 0, 'L', None, False, None),
+    (0x03B3, 'GREEK SMALL LETTER GAMMA', 'Ll', 0, 'L', None, False, None),
+    (0x03B4, 'GREEK SMALL LETTER DELTA', 'Ll', 0, 'L', None, False, None),
+    (0x03B5, 'GREEK SMALL LETTER EPSILON', 'Ll', 0, 'L', None, False, None),
+    (0x03B6, 'GREEK SMALL LETTER ZETA', 'Ll', 0, 'L', None, False, None),
+    (0x03B7, 'GREEK SMALL LETTER ETA', 'Ll', 0, 'L', None, False, None),
+    (0x03B8, 'GREEK SMALL LETTER THETA', 'Ll', 0, 'L', None, False, None),
+    (0x03B9, 'GREEK SMALL LETTER IOTA', 'Ll', 0, 'L', None, False, None),
+    (0x03BA, 'GREEK SMALL LETTER KAPPA', 'Ll', 0, 'L', None, False, None),
+    (0x03BB, 'GREEK SMALL LETTER LAMDA', 'Ll', 0, 'L', None, False, None),
+    (0x03BC, 'GREEK SMALL LETTER MU', 'Ll', 0, 'L', None, False, None),
+    (0x03BD, 'GREEK SMALL LETTER NU', 'Ll', 0, 'L', None, False, None),
+    (0x03BE, 'GREEK SMALL LETTER XI', 'Ll', 0, 'L', None, False, None),
+    (0x03BF, 'GREEK SMALL LETTER OMICRON', 'Ll', 0, 'L', None, False, None),
+    (0x03C0, 'GREEK SMALL LETTER PI', 'Ll', 0, 'L', None, False, None),
+    (0x03C1, 'GREEK SMALL LETTER RHO', 'Ll', 0, 'L', None, False, None),
+    (0x03C2, 'GREEK SMALL LETTER FINAL SIGMA', 'Ll', 0, 'L', None, False, None),
+    (0x03C3, 'GREEK SMALL LETTER SIGMA', 'Ll', 0, 'L', None, False, None),
+    (0x03C4, 'GREEK SMALL LETTER TAU', 'Ll', 0, 'L', None, False, None),
+    (0x03C5, 'GREEK SMALL LETTER UPSILON', 'Ll', 0, 'L', None, False, None),
+    (0x03C6, 'GREEK SMALL LETTER PHI', 'Ll', 0, 'L', None, False, None),
+    (0x03C7, 'GREEK SMALL LETTER CHI', 'Ll', 0, 'L', None, False, None),
+    (0x03C8, 'GREEK SMALL LETTER PSI', 'Ll', 0, 'L', None, False, None),
+    (0x03C9, 'GREEK SMALL LETTER OMEGA', 'Ll', 0, 'L', None, False, None),
+    (0x03CA, 'GREEK SMALL LETTER IOTA WITH DIALYTIKA', 'Ll', 0, 'L', None, False, None),
+    (0x03CB, 'GREEK SMALL LETTER UPSILON WITH DIALYTIKA', 'Ll', 0, 'L', None, False, None),
+    (0x03CC, 'GREEK SMALL LETTER OMICRON WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03CD, 'GREEK SMALL LETTER UPSILON WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03CE, 'GREEK SMALL LETTER OMEGA WITH TONOS', 'Ll', 0, 'L', None, False, None),
+    (0x03CF, 'GREEK CAPITAL KAI SYMBOL', 'Lu', 0, 'L', None, False, 0x03D7),
+    (0x03D0, 'GREEK BETA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03D1, 'GREEK THETA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03D2, 'GREEK UPSILON WITH HOOK SYMBOL', 'Lu', 0, 'L', None, False, None),
+    (0x03D3, 'GREEK UPSILON WITH ACUTE AND HOOK SYMBOL', 'Lu', 0, 'L', None, False, None),
+    (0x03D4, 'GREEK UPSILON WITH DIAERESIS AND HOOK SYMBOL', 'Lu', 0, 'L', None, False, None),
+    (0x03D5, 'GREEK PHI SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03D6, 'GREEK PI SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03D7, 'GREEK KAI SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03D8, 'GREEK LETTER ARCHAIC KOPPA', 'Lu', 0, 'L', None, False, 0x03D9),
+    (0x03D9, 'GREEK SMALL LETTER ARCHAIC KOPPA', 'Ll', 0, 'L', None, False, None),
+    (0x03DA, 'GREEK LETTER STIGMA', 'Lu', 0, 'L', None, False, 0x03DB),
+    (0x03DB, 'GREEK SMALL LETTER STIGMA', 'Ll', 0, 'L', None, False, None),
+    (0x03DC, 'GREEK LETTER DIGAMMA', 'Lu', 0, 'L', None, False, 0x03DD),
+    (0x03DD, 'GREEK SMALL LETTER DIGAMMA', 'Ll', 0, 'L', None, False, None),
+    (0x03DE, 'GREEK LETTER KOPPA', 'Lu', 0, 'L', None, False, 0x03DF),
+    (0x03DF, 'GREEK SMALL LETTER KOPPA', 'Ll', 0, 'L', None, False, None),
+    (0x03E0, 'GREEK LETTER SAMPI', 'Lu', 0, 'L', None, False, 0x03E1),
+    (0x03E1, 'GREEK SMALL LETTER SAMPI', 'Ll', 0, 'L', None, False, None),
+    (0x03E2, 'COPTIC CAPITAL LETTER SHEI', 'Lu', 0, 'L', None, False, 0x03E3),
+    (0x03E3, 'COPTIC SMALL LETTER SHEI', 'Ll', 0, 'L', None, False, None),
+    (0x03E4, 'COPTIC CAPITAL LETTER FEI', 'Lu', 0, 'L', None, False, 0x03E5),
+    (0x03E5, 'COPTIC SMALL LETTER FEI', 'Ll', 0, 'L', None, False, None),
+    (0x03E6, 'COPTIC CAPITAL LETTER KHEI', 'Lu', 0, 'L', None, False, 0x03E7),
+    (0x03E7, 'COPTIC SMALL LETTER KHEI', 'Ll', 0, 'L', None, False, None),
+    (0x03E8, 'COPTIC CAPITAL LETTER HORI', 'Lu', 0, 'L', None, False, 0x03E9),
+    (0x03E9, 'COPTIC SMALL LETTER HORI', 'Ll', 0, 'L', None, False, None),
+    (0x03EA, 'COPTIC CAPITAL LETTER GANGIA', 'Lu', 0, 'L', None, False, 0x03EB),
+    (0x03EB, 'COPTIC SMALL LETTER GANGIA', 'Ll', 0, 'L', None, False, None),
+    (0x03EC, 'COPTIC CAPITAL LETTER SHIMA', 'Lu', 0, 'L', None, False, 0x03ED),
+    (0x03ED, 'COPTIC SMALL LETTER SHIMA', 'Ll', 0, 'L', None, False, None),
+    (0x03EE, 'COPTIC CAPITAL LETTER DEI', 'Lu', 0, 'L', None, False, 0x03EF),
+    (0x03EF, 'COPTIC SMALL LETTER DEI', 'Ll', 0, 'L', None, False, None),
+    (0x03F0, 'GREEK KAPPA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03F1, 'GREEK RHO SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03F2, 'GREEK LUNATE SIGMA SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03F3, 'GREEK LETTER YOT', 'Ll', 0, 'L', None, False, None),
+    (0x03F4, 'GREEK CAPITAL THETA SYMBOL', 'Lu', 0, 'L', None, False, 0x03B8),
+    (0x03F5, 'GREEK LUNATE EPSILON SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03F6, 'GREEK REVERSED LUNATE EPSILON SYMBOL', 'Sm', 0, 'ON', None, False, None),
+    (0x03F7, 'GREEK CAPITAL LETTER SHO', 'Lu', 0, 'L', None, False, 0x03F8),
+    (0x03F8, 'GREEK SMALL LETTER SHO', 'Ll', 0, 'L', None, False, None),
+    (0x03F9, 'GREEK CAPITAL LUNATE SIGMA SYMBOL', 'Lu', 0, 'L', None, False, 0x03F2),
+    (0x03FA, 'GREEK CAPITAL LETTER SAN', 'Lu', 0, 'L', None, False, 0x03FB),
+    (0x03FB, 'GREEK SMALL LETTER SAN', 'Ll', 0, 'L', None, False, None),
+    (0x03FC, 'GREEK RHO WITH STROKE SYMBOL', 'Ll', 0, 'L', None, False, None),
+    (0x03FD, 'GREEK CAPITAL REVERSED LUNATE SIGMA SYMBOL', 'Lu', 0, 'L', None, False, 0x037B),
+    (0x03FE, 'GREEK CAPITAL DOTTED LUNATE SIGMA SYMBOL', 'Lu', 0, 'L', None, False, 0x037C),
+    (0x03FF, 'GREEK CAPITAL REVERSED DOTTED LUNATE SIGMA SYMBOL', 'Lu', 0, 'L', None, False, 0x037D),
+    (0x0400, 'CYRILLIC CAPITAL LETTER IE WITH GRAVE', 'Lu', 0, 'L', None, False, 0x0450),
+    (0x0401, 'CYRILLIC CAPITAL LETTER IO', 'Lu', 0, 'L', None, False, 0x0451),
+    (0x0402, 'CYRILLIC CAPITAL LETTER DJE', 'Lu', 0, 'L', None, False, 0x0452),
+    (0x0403, 'CYRILLIC CAPITAL LETTER GJE', 'Lu', 0, 'L', None, False, 0x0453),
+    (0x0404, 'CYRILLIC CAPITAL LETTER UKRAINIAN IE', 'Lu', 0, 'L', None, False, 0x0454),
+    (0x0405, 'CYRILLIC CAPITAL LETTER DZE', 'Lu', 0, 'L', None, False, 0x0455),
+    (0x0406, 'CYRILLIC CAPITAL LETTER BYELORUSSIAN-UKRAINIAN I', 'Lu', 0, 'L', None, False, 0x0456),
+    (0x0407, 'CYRILLIC CAPITAL LETTER YI', 'Lu', 0, 'L', None, False, 0x0457),
+    (0x0408, 'CYRILLIC CAPITAL LETTER JE', 'Lu', 0, 'L', None, False, 0x0458),
+    (0x0409, 'CYRILLIC CAPITAL LETTER LJE', 'Lu', 0, 'L', None, False, 0x0459),
+    (0x040A, 'CYRILLIC CAPITAL LETTER NJE', 'Lu', 0, 'L', None, False, 0x045A),
+    (0x040B, 'CYRILLIC CAPITAL LETTER TSHE', 'Lu', 0, 'L', None, False, 0x045B),
+    (0x040C, 'CYRILLIC CAPITAL LETTER KJE', 'Lu', 0, 'L', None, False, 0x045C),
+    (0x040D, 'CYRILLIC CAPITAL LETTER I WITH GRAVE', 'Lu', 0, 'L', None, False, 0x045D),
+    (0x040E, 'CYRILLIC CAPITAL LETTER SHORT U', 'Lu', 0, 'L', None, False, 0x045E),
+    (0x040F, 'CYRILLIC CAPITAL LETTER DZHE', 'Lu', 0, 'L', None, False, 0x045F),
+    (0x0410, 'CYRILLIC CAPITAL LETTER A', 'Lu', 0, 'L', None, False, 0x0430),
+    (0x0411, 'CYRILLIC CAPITAL LETTER BE', 'Lu', 0, 'L', None, False, 0x0431),
+    (0x0412, 'CYRILLIC CAPITAL LETTER VE', 'Lu', 0, 'L', None, False, 0x0432),
+    (0x0413, 'CYRILLIC CAPITAL LETTER GHE', 'Lu', 0, 'L', None, False, 0x0433),
+    (0x0414, 'CYRILLIC CAPITAL LETTER DE', 'Lu', 0, 'L', None, False, 0x0434),
+    (0x0415, 'CYRILLIC CAPITAL LETTER IE', 'Lu', 0, 'L', None, False, 0x0435),
+    (0x0416, 'CYRILLIC CAPITAL LETTER ZHE', 'Lu', 0, 'L', None, False, 0x0436),
+    (0x0417, 'CYRILLIC CAPITAL LETTER ZE', 'Lu', 0, 'L', None, False, 0x0437),
+    (0x0418, 'CYRILLIC CAPITAL LETTER I', 'Lu', 0, 'L', None, False, 0x0438),
+    (0x0419, 'CYRILLIC CAPITAL LETTER SHORT I', 'Lu', 0, 'L', None, False, 0x0439),
+    (0x041A, 'CYRILLIC CAPITAL LETTER KA', 'Lu', 0, 'L', None, False, 0x043A),
+    (0x041B, 'CYRILLIC CAPITAL LETTER EL', 'Lu', 0, 'L', None, False, 0x043B),
+    (0x041C, 'CYRILLIC CAPITAL LETTER EM', 'Lu', 0, 'L', None, False, 0x043C),
+    (0x041D, 'CYRILLIC CAPITAL LETTER EN', 'Lu', 0, 'L', None, False, 0x043D),
+    (0x041E, 'CYRILLIC CAPITAL LETTER O', 'Lu', 0, 'L', None, False, 0x043E),
+    (0x041F, 'CYRILLIC CAPITAL LETTER PE', 'Lu', 0, 'L', None, False, 0x043F),
+    (0x0420, 'CYRILLIC CAPITAL LETTER ER', 'Lu', 0, 'L', None, False, 0x0440),
+    (0x0421, 'CYRILLIC CAPITAL LETTER ES', 'Lu', 0, 'L', None, False, 0x0441),
+    (0x0422, 'CYRILLIC CAPITAL LETTER TE', 'Lu', 0, 'L', None, False, 0x0442),
+    (0x0423, 'CYRILLIC CAPITAL LETTER U', 'Lu', 0, 'L', None, False, 0x0443),
+    (0x0424, 'CYRILLIC CAPITAL LETTER EF', 'Lu', 0, 'L', None, False, 0x0444),
+    (0x0425, 'CYRILLIC CAPITAL LETTER HA', 'Lu', 0, 'L', None, False, 0x0445),
+    (0x0426, 'CYRILLIC CAPITAL LETTER TSE', 'Lu', 0, 'L', None, False, 0x0446),
+    (0x0427, 'CYRILLIC CAPITAL LETTER CHE', 'Lu', 0, 'L', None, False, 0x0447),
+    (0x0428, 'CYRILLIC CAPITAL LETTER SHA', 'Lu', 0, 'L', None, False, 0x0448),
+    (0x0429, 'CYRILLIC CAPITAL LETTER SHCHA', 'Lu', 0, 'L', None, False, 0x0449),
+    (0x042A, 'CYRILLIC CAPITAL LETTER HARD SIGN', 'Lu', 0, 'L', None, False, 0x044A),
+    (0x042B, 'CYRILLIC CAPITAL LETTER YERU', 'Lu', 0, 'L', None, False, 0x044B),
+    (0x042C, 'CYRILLIC CAPITAL LETTER SOFT SIGN', 'Lu', 0, 'L', None, False, 0x044C),
+    (0x042D, 'CYRILLIC CAPITAL LETTER E', 'Lu', 0, 'L', None, False, 0x044D),
+    (0x042E, 'CYRILLIC CAPITAL LETTER YU', 'Lu', 0, 'L', None, False, 0x044E),
+    (0x042F, 'CYRILLIC CAPITAL LETTER YA', 'Lu', 0, 'L', None, False, 0x044F),
+    (0x0430, 'CYRILLIC SMALL LETTER A', 'Ll', 0, 'L', None, False, None),
+    (0x0431, 'CYRILLIC SMALL LETTER BE', 'Ll', 0, 'L', None, False, None),
+    (0x0432, 'CYRILLIC SMALL LETTER VE', 'Ll', 0, 'L', None, False, None),
+    (0x0433, 'CYRILLIC SMALL LETTER GHE', 'Ll', 0, 'L', None, False, None),
+    (0x0434, 'CYRILLIC SMALL LETTER DE', 'Ll', 0, 'L', None, False, None),
+    (0x0435, 'CYRILLIC SMALL LETTER IE', 'Ll', 0, 'L', None, False, None),
+    (0x0436, 'CYRILLIC SMALL LETTER ZHE', 'Ll', 0, 'L', None, False, None),
+    (0x0437, 'CYRILLIC SMALL LETTER ZE', 'Ll', 0, 'L', None, False, None),
+    (0x0438, 'CYRILLIC SMALL LETTER I', 'Ll', 0, 'L', None, False, None),
+    (0x0439, 'CYRILLIC SMALL LETTER SHORT I', 'Ll', 0, 'L', None, False, None),
+    (0x043A, 'CYRILLIC SMALL LETTER KA', 'Ll', 0, 'L', None, False, None),
+    (0x043B, 'CYRILLIC SMALL LETTER EL', 'Ll', 0, 'L', None, False, None),
+    (0x043C, 'CYRILLIC SMALL LETTER EM', 'Ll', 0, 'L', None, False, None),
+    (0x043D, 'CYRILLIC SMALL LETTER EN', 'Ll', 0, 'L', None, False, None),
+    (0x043E, 'CYRILLIC SMALL LETTER O', 'Ll', 0, 'L', None, False, None),
+    (0x043F, 'CYRILLIC SMALL LETTER PE', 'Ll', 0, 'L', None, False, None),
+    (0x0440, 'CYRILLIC SMALL LETTER ER', 'Ll', 0, 'L', None, False, None),
+    (0x0441, 'CYRILLIC SMALL LETTER ES', 'Ll', 0, 'L', None, False, None),
+    (0x0442, 'CYRILLIC SMALL LETTER TE', 'Ll', 0, 'L', None, False, None),
+    (0x0443, 'CYRILLIC SMALL LETTER U', 'Ll', 0, 'L', None, False, None),
+    (0x0444, 'CYRILLIC SMALL LETTER EF', 'Ll', 0, 'L', None, False, None),
+    (0x0445, 'CYRILLIC SMALL LETTER HA', 'Ll', 0, 'L', None, False, None),
+    (0x0446, 'CYRILLIC SMALL LETTER TSE', 'Ll', 0, 'L', None, False, None),
+    (0x0447, 'CYRILLIC SMALL LETTER CHE', 'Ll', 0, 'L', None, False, None),
+    (0x0448, 'CYRILLIC SMALL LETTER SHA', 'Ll', 0, 'L', None, False, None),
+    (0x0449, 'CYRILLIC SMALL LETTER SHCHA', 'Ll', 0, 'L', None, False, None),
+    (0x044A, 'CYRILLIC SMALL LETTER HARD SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x044B, 'CYRILLIC SMALL LETTER YERU', 'Ll', 0, 'L', None, False, None),
+    (0x044C, 'CYRILLIC SMALL LETTER SOFT SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x044D, 'CYRILLIC SMALL LETTER E', 'Ll', 0, 'L', None, False, None),
+    (0x044E, 'CYRILLIC SMALL LETTER YU', 'Ll', 0, 'L', None, False, None),
+    (0x044F, 'CYRILLIC SMALL LETTER YA', 'Ll', 0, 'L', None, False, None),
+    (0x0450, 'CYRILLIC SMALL LETTER IE WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x0451, 'CYRILLIC SMALL LETTER IO', 'Ll', 0, 'L', None, False, None),
+    (0x0452, 'CYRILLIC SMALL LETTER DJE', 'Ll', 0, 'L', None, False, None),
+    (0x0453, 'CYRILLIC SMALL LETTER GJE', 'Ll', 0, 'L', None, False, None),
+    (0x0454, 'CYRILLIC SMALL LETTER UKRAINIAN IE', 'Ll', 0, 'L', None, False, None),
+    (0x0455, 'CYRILLIC SMALL LETTER DZE', 'Ll', 0, 'L', None, False, None),
+    (0x0456, 'CYRILLIC SMALL LETTER BYELORUSSIAN-UKRAINIAN I', 'Ll', 0, 'L', None, False, None),
+    (0x0457, 'CYRILLIC SMALL LETTER YI', 'Ll', 0, 'L', None, False, None),
+    (0x0458, 'CYRILLIC SMALL LETTER JE', 'Ll', 0, 'L', None, False, None),
+    (0x0459, 'CYRILLIC SMALL LETTER LJE', 'Ll', 0, 'L', None, False, None),
+    (0x045A, 'CYRILLIC SMALL LETTER NJE', 'Ll', 0, 'L', None, False, None),
+    (0x045B, 'CYRILLIC SMALL LETTER TSHE', 'Ll', 0, 'L', None, False, None),
+    (0x045C, 'CYRILLIC SMALL LETTER KJE', 'Ll', 0, 'L', None, False, None),
+    (0x045D, 'CYRILLIC SMALL LETTER I WITH GRAVE', 'Ll', 0, 'L', None, False, None),
+    (0x045E, 'CYRILLIC SMALL LETTER SHORT U', 'Ll', 0, 'L', None, False, None),
+    (0x045F, 'CYRILLIC SMALL LETTER DZHE', 'Ll', 0, 'L', None, False, None),
+    (0x0460, 'CYRILLIC CAPITAL LETTER OMEGA', 'Lu', 0, 'L', None, False, 0x0461),
+    (0x0461, 'CYRILLIC SMALL LETTER OMEGA', 'Ll', 0, 'L', None, False, None),
+    (0x0462, 'CYRILLIC CAPITAL LETTER YAT', 'Lu', 0, 'L', None, False, 0x0463),
+    (0x0463, 'CYRILLIC SMALL LETTER YAT', 'Ll', 0, 'L', None, False, None),
+    (0x0464, 'CYRILLIC CAPITAL LETTER IOTIFIED E', 'Lu', 0, 'L', None, False, 0x0465),
+    (0x0465, 'CYRILLIC SMALL LETTER IOTIFIED E', 'Ll', 0, 'L', None, False, None),
+    (0x0466, 'CYRILLIC CAPITAL LETTER LITTLE YUS', 'Lu', 0, 'L', None, False, 0x0467),
+    (0x0467, 'CYRILLIC SMALL LETTER LITTLE YUS', 'Ll', 0, 'L', None, False, None),
+    (0x0468, 'CYRILLIC CAPITAL LETTER IOTIFIED LITTLE YUS', 'Lu', 0, 'L', None, False, 0x0469),
+    (0x0469, 'CYRILLIC SMALL LETTER IOTIFIED LITTLE YUS', 'Ll', 0, 'L', None, False, None),
+    (0x046A, 'CYRILLIC CAPITAL LETTER BIG YUS', 'Lu', 0, 'L', None, False, 0x046B),
+    (0x046B, 'CYRILLIC SMALL LETTER BIG YUS', 'Ll', 0, 'L', None, False, None),
+    (0x046C, 'CYRILLIC CAPITAL LETTER IOTIFIED BIG YUS', 'Lu', 0, 'L', None, False, 0x046D),
+    (0x046D, 'CYRILLIC SMALL LETTER IOTIFIED BIG YUS', 'Ll', 0, 'L', None, False, None),
+    (0x046E, 'CYRILLIC CAPITAL LETTER KSI', 'Lu', 0, 'L', None, False, 0x046F),
+    (0x046F, 'CYRILLIC SMALL LETTER KSI', 'Ll', 0, 'L', None, False, None),
+    (0x0470, 'CYRILLIC CAPITAL LETTER PSI', 'Lu', 0, 'L', None, False, 0x0471),
+    (0x0471, 'CYRILLIC SMALL LETTER PSI', 'Ll', 0, 'L', None, False, None),
+    (0x0472, 'CYRILLIC CAPITAL LETTER FITA', 'Lu', 0, 'L', None, False, 0x0473),
+    (0x0473, 'CYRILLIC SMALL LETTER FITA', 'Ll', 0, 'L', None, False, None),
+    (0x0474, 'CYRILLIC CAPITAL LETTER IZHITSA', 'Lu', 0, 'L', None, False, 0x0475),
+    (0x0475, 'CYRILLIC SMALL LETTER IZHITSA', 'Ll', 0, 'L', None, False, None),
+    (0x0476, 'CYRILLIC CAPITAL LETTER IZHITSA WITH DOUBLE GRAVE ACCENT', 'Lu', 0, 'L', None, False, 0x0477),
+    (0x0477, 'CYRILLIC SMALL LETTER IZHITSA WITH DOUBLE GRAVE ACCENT', 'Ll', 0, 'L', None, False, None),
+    (0x0478, 'CYRILLIC CAPITAL LETTER UK', 'Lu', 0, 'L', None, False, 0x0479),
+    (0x0479, 'CYRILLIC SMALL LETTER UK', 'Ll', 0, 'L', None, False, None),
+    (0x047A, 'CYRILLIC CAPITAL LETTER ROUND OMEGA', 'Lu', 0, 'L', None, False, 0x047B),
+    (0x047B, 'CYRILLIC SMALL LETTER ROUND OMEGA', 'Ll', 0, 'L', None, False, None),
+    (0x047C, 'CYRILLIC CAPITAL LETTER OMEGA WITH TITLO', 'Lu', 0, 'L', None, False, 0x047D),
+    (0x047D, 'CYRILLIC SMALL LETTER OMEGA WITH TITLO', 'Ll', 0, 'L', None, False, None),
+    (0x047E, 'CYRILLIC CAPITAL LETTER OT', 'Lu', 0, 'L', None, False, 0x047F),
+    (0x047F, 'CYRILLIC SMALL LETTER OT', 'Ll', 0, 'L', None, False, None),
+    (0x0480, 'CYRILLIC CAPITAL LETTER KOPPA', 'Lu', 0, 'L', None, False, 0x0481),
+    (0x0481, 'CYRILLIC SMALL LETTER KOPPA', 'Ll', 0, 'L', None, False, None),
+    (0x0482, 'CYRILLIC THOUSANDS SIGN', 'So', 0, 'L', None, False, None),
+    (0x0483, 'COMBINING CYRILLIC TITLO', 'Mn', 230, 'NSM', None, False, None),
+    (0x0484, 'COMBINING CYRILLIC PALATALIZATION', 'Mn', 230, 'NSM', None, False, None),
+    (0x0485, 'COMBINING CYRILLIC DASIA PNEUMATA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0486, 'COMBINING CYRILLIC PSILI PNEUMATA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0487, 'COMBINING CYRILLIC POKRYTIE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0488, 'COMBINING CYRILLIC HUNDRED THOUSANDS SIGN', 'Me', 0, 'NSM', None, False, None),
+    (0x0489, 'COMBINING CYRILLIC MILLIONS SIGN', 'Me', 0, 'NSM', None, False, None),
+    (0x048A, 'CYRILLIC CAPITAL LETTER SHORT I WITH TAIL', 'Lu', 0, 'L', None, False, 0x048B),
+    (0x048B, 'CYRILLIC SMALL LETTER SHORT I WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x048C, 'CYRILLIC CAPITAL LETTER SEMISOFT SIGN', 'Lu', 0, 'L', None, False, 0x048D),
+    (0x048D, 'CYRILLIC SMALL LETTER SEMISOFT SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x048E, 'CYRILLIC CAPITAL LETTER ER WITH TICK', 'Lu', 0, 'L', None, False, 0x048F),
+    (0x048F, 'CYRILLIC SMALL LETTER ER WITH TICK', 'Ll', 0, 'L', None, False, None),
+    (0x0490, 'CYRILLIC CAPITAL LETTER GHE WITH UPTURN', 'Lu', 0, 'L', None, False, 0x0491),
+    (0x0491, 'CYRILLIC SMALL LETTER GHE WITH UPTURN', 'Ll', 0, 'L', None, False, None),
+    (0x0492, 'CYRILLIC CAPITAL LETTER GHE WITH STROKE', 'Lu', 0, 'L', None, False, 0x0493),
+    (0x0493, 'CYRILLIC SMALL LETTER GHE WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0494, 'CYRILLIC CAPITAL LETTER GHE WITH MIDDLE HOOK', 'Lu', 0, 'L', None, False, 0x0495),
+    (0x0495, 'CYRILLIC SMALL LETTER GHE WITH MIDDLE HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0496, 'CYRILLIC CAPITAL LETTER ZHE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x0497),
+    (0x0497, 'CYRILLIC SMALL LETTER ZHE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x0498, 'CYRILLIC CAPITAL LETTER ZE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x0499),
+    (0x0499, 'CYRILLIC SMALL LETTER ZE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x049A, 'CYRILLIC CAPITAL LETTER KA WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x049B),
+    (0x049B, 'CYRILLIC SMALL LETTER KA WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x049C, 'CYRILLIC CAPITAL LETTER KA WITH VERTICAL STROKE', 'Lu', 0, 'L', None, False, 0x049D),
+    (0x049D, 'CYRILLIC SMALL LETTER KA WITH VERTICAL STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x049E, 'CYRILLIC CAPITAL LETTER KA WITH STROKE', 'Lu', 0, 'L', None, False, 0x049F),
+    (0x049F, 'CYRILLIC SMALL LETTER KA WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x04A0, 'CYRILLIC CAPITAL LETTER BASHKIR KA', 'Lu', 0, 'L', None, False, 0x04A1),
+    (0x04A1, 'CYRILLIC SMALL LETTER BASHKIR KA', 'Ll', 0, 'L', None, False, None),
+    (0x04A2, 'CYRILLIC CAPITAL LETTER EN WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04A3),
+    (0x04A3, 'CYRILLIC SMALL LETTER EN WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04A4, 'CYRILLIC CAPITAL LIGATURE EN GHE', 'Lu', 0, 'L', None, False, 0x04A5),
+    (0x04A5, 'CYRILLIC SMALL LIGATURE EN GHE', 'Ll', 0, 'L', None, False, None),
+    (0x04A6, 'CYRILLIC CAPITAL LETTER PE WITH MIDDLE HOOK', 'Lu', 0, 'L', None, False, 0x04A7),
+    (0x04A7, 'CYRILLIC SMALL LETTER PE WITH MIDDLE HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x04A8, 'CYRILLIC CAPITAL LETTER ABKHASIAN HA', 'Lu', 0, 'L', None, False, 0x04A9),
+    (0x04A9, 'CYRILLIC SMALL LETTER ABKHASIAN HA', 'Ll', 0, 'L', None, False, None),
+    (0x04AA, 'CYRILLIC CAPITAL LETTER ES WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04AB),
+    (0x04AB, 'CYRILLIC SMALL LETTER ES WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04AC, 'CYRILLIC CAPITAL LETTER TE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04AD),
+    (0x04AD, 'CYRILLIC SMALL LETTER TE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04AE, 'CYRILLIC CAPITAL LETTER STRAIGHT U', 'Lu', 0, 'L', None, False, 0x04AF),
+    (0x04AF, 'CYRILLIC SMALL LETTER STRAIGHT U', 'Ll', 0, 'L', None, False, None),
+    (0x04B0, 'CYRILLIC CAPITAL LETTER STRAIGHT U WITH STROKE', 'Lu', 0, 'L', None, False, 0x04B1),
+    (0x04B1, 'CYRILLIC SMALL LETTER STRAIGHT U WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x04B2, 'CYRILLIC CAPITAL LETTER HA WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04B3),
+    (0x04B3, 'CYRILLIC SMALL LETTER HA WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04B4, 'CYRILLIC CAPITAL LIGATURE TE TSE', 'Lu', 0, 'L', None, False, 0x04B5),
+    (0x04B5, 'CYRILLIC SMALL LIGATURE TE TSE', 'Ll', 0, 'L', None, False, None),
+    (0x04B6, 'CYRILLIC CAPITAL LETTER CHE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04B7),
+    (0x04B7, 'CYRILLIC SMALL LETTER CHE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04B8, 'CYRILLIC CAPITAL LETTER CHE WITH VERTICAL STROKE', 'Lu', 0, 'L', None, False, 0x04B9),
+    (0x04B9, 'CYRILLIC SMALL LETTER CHE WITH VERTICAL STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x04BA, 'CYRILLIC CAPITAL LETTER SHHA', 'Lu', 0, 'L', None, False, 0x04BB),
+    (0x04BB, 'CYRILLIC SMALL LETTER SHHA', 'Ll', 0, 'L', None, False, None),
+    (0x04BC, 'CYRILLIC CAPITAL LETTER ABKHASIAN CHE', 'Lu', 0, 'L', None, False, 0x04BD),
+    (0x04BD, 'CYRILLIC SMALL LETTER ABKHASIAN CHE', 'Ll', 0, 'L', None, False, None),
+    (0x04BE, 'CYRILLIC CAPITAL LETTER ABKHASIAN CHE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04BF),
+    (0x04BF, 'CYRILLIC SMALL LETTER ABKHASIAN CHE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04C0, 'CYRILLIC LETTER PALOCHKA', 'Lu', 0, 'L', None, False, 0x04CF),
+    (0x04C1, 'CYRILLIC CAPITAL LETTER ZHE WITH BREVE', 'Lu', 0, 'L', None, False, 0x04C2),
+    (0x04C2, 'CYRILLIC SMALL LETTER ZHE WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x04C3, 'CYRILLIC CAPITAL LETTER KA WITH HOOK', 'Lu', 0, 'L', None, False, 0x04C4),
+    (0x04C4, 'CYRILLIC SMALL LETTER KA WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x04C5, 'CYRILLIC CAPITAL LETTER EL WITH TAIL', 'Lu', 0, 'L', None, False, 0x04C6),
+    (0x04C6, 'CYRILLIC SMALL LETTER EL WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x04C7, 'CYRILLIC CAPITAL LETTER EN WITH HOOK', 'Lu', 0, 'L', None, False, 0x04C8),
+    (0x04C8, 'CYRILLIC SMALL LETTER EN WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x04C9, 'CYRILLIC CAPITAL LETTER EN WITH TAIL', 'Lu', 0, 'L', None, False, 0x04CA),
+    (0x04CA, 'CYRILLIC SMALL LETTER EN WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x04CB, 'CYRILLIC CAPITAL LETTER KHAKASSIAN CHE', 'Lu', 0, 'L', None, False, 0x04CC),
+    (0x04CC, 'CYRILLIC SMALL LETTER KHAKASSIAN CHE', 'Ll', 0, 'L', None, False, None),
+    (0x04CD, 'CYRILLIC CAPITAL LETTER EM WITH TAIL', 'Lu', 0, 'L', None, False, 0x04CE),
+    (0x04CE, 'CYRILLIC SMALL LETTER EM WITH TAIL', 'Ll', 0, 'L', None, False, None),
+    (0x04CF, 'CYRILLIC SMALL LETTER PALOCHKA', 'Ll', 0, 'L', None, False, None),
+    (0x04D0, 'CYRILLIC CAPITAL LETTER A WITH BREVE', 'Lu', 0, 'L', None, False, 0x04D1),
+    (0x04D1, 'CYRILLIC SMALL LETTER A WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x04D2, 'CYRILLIC CAPITAL LETTER A WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04D3),
+    (0x04D3, 'CYRILLIC SMALL LETTER A WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04D4, 'CYRILLIC CAPITAL LIGATURE A IE', 'Lu', 0, 'L', None, False, 0x04D5),
+    (0x04D5, 'CYRILLIC SMALL LIGATURE A IE', 'Ll', 0, 'L', None, False, None),
+    (0x04D6, 'CYRILLIC CAPITAL LETTER IE WITH BREVE', 'Lu', 0, 'L', None, False, 0x04D7),
+    (0x04D7, 'CYRILLIC SMALL LETTER IE WITH BREVE', 'Ll', 0, 'L', None, False, None),
+    (0x04D8, 'CYRILLIC CAPITAL LETTER SCHWA', 'Lu', 0, 'L', None, False, 0x04D9),
+    (0x04D9, 'CYRILLIC SMALL LETTER SCHWA', 'Ll', 0, 'L', None, False, None),
+    (0x04DA, 'CYRILLIC CAPITAL LETTER SCHWA WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04DB),
+    (0x04DB, 'CYRILLIC SMALL LETTER SCHWA WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04DC, 'CYRILLIC CAPITAL LETTER ZHE WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04DD),
+    (0x04DD, 'CYRILLIC SMALL LETTER ZHE WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04DE, 'CYRILLIC CAPITAL LETTER ZE WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04DF),
+    (0x04DF, 'CYRILLIC SMALL LETTER ZE WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04E0, 'CYRILLIC CAPITAL LETTER ABKHASIAN DZE', 'Lu', 0, 'L', None, False, 0x04E1),
+    (0x04E1, 'CYRILLIC SMALL LETTER ABKHASIAN DZE', 'Ll', 0, 'L', None, False, None),
+    (0x04E2, 'CYRILLIC CAPITAL LETTER I WITH MACRON', 'Lu', 0, 'L', None, False, 0x04E3),
+    (0x04E3, 'CYRILLIC SMALL LETTER I WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x04E4, 'CYRILLIC CAPITAL LETTER I WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04E5),
+    (0x04E5, 'CYRILLIC SMALL LETTER I WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04E6, 'CYRILLIC CAPITAL LETTER O WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04E7),
+    (0x04E7, 'CYRILLIC SMALL LETTER O WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04E8, 'CYRILLIC CAPITAL LETTER BARRED O', 'Lu', 0, 'L', None, False, 0x04E9),
+    (0x04E9, 'CYRILLIC SMALL LETTER BARRED O', 'Ll', 0, 'L', None, False, None),
+    (0x04EA, 'CYRILLIC CAPITAL LETTER BARRED O WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04EB),
+    (0x04EB, 'CYRILLIC SMALL LETTER BARRED O WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04EC, 'CYRILLIC CAPITAL LETTER E WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04ED),
+    (0x04ED, 'CYRILLIC SMALL LETTER E WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04EE, 'CYRILLIC CAPITAL LETTER U WITH MACRON', 'Lu', 0, 'L', None, False, 0x04EF),
+    (0x04EF, 'CYRILLIC SMALL LETTER U WITH MACRON', 'Ll', 0, 'L', None, False, None),
+    (0x04F0, 'CYRILLIC CAPITAL LETTER U WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04F1),
+    (0x04F1, 'CYRILLIC SMALL LETTER U WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04F2, 'CYRILLIC CAPITAL LETTER U WITH DOUBLE ACUTE', 'Lu', 0, 'L', None, False, 0x04F3),
+    (0x04F3, 'CYRILLIC SMALL LETTER U WITH DOUBLE ACUTE', 'Ll', 0, 'L', None, False, None),
+    (0x04F4, 'CYRILLIC CAPITAL LETTER CHE WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04F5),
+    (0x04F5, 'CYRILLIC SMALL LETTER CHE WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04F6, 'CYRILLIC CAPITAL LETTER GHE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x04F7),
+    (0x04F7, 'CYRILLIC SMALL LETTER GHE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x04F8, 'CYRILLIC CAPITAL LETTER YERU WITH DIAERESIS', 'Lu', 0, 'L', None, False, 0x04F9),
+    (0x04F9, 'CYRILLIC SMALL LETTER YERU WITH DIAERESIS', 'Ll', 0, 'L', None, False, None),
+    (0x04FA, 'CYRILLIC CAPITAL LETTER GHE WITH STROKE AND HOOK', 'Lu', 0, 'L', None, False, 0x04FB),
+    (0x04FB, 'CYRILLIC SMALL LETTER GHE WITH STROKE AND HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x04FC, 'CYRILLIC CAPITAL LETTER HA WITH HOOK', 'Lu', 0, 'L', None, False, 0x04FD),
+    (0x04FD, 'CYRILLIC SMALL LETTER HA WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x04FE, 'CYRILLIC CAPITAL LETTER HA WITH STROKE', 'Lu', 0, 'L', None, False, 0x04FF),
+    (0x04FF, 'CYRILLIC SMALL LETTER HA WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0500, 'CYRILLIC CAPITAL LETTER KOMI DE', 'Lu', 0, 'L', None, False, 0x0501),
+    (0x0501, 'CYRILLIC SMALL LETTER KOMI DE', 'Ll', 0, 'L', None, False, None),
+    (0x0502, 'CYRILLIC CAPITAL LETTER KOMI DJE', 'Lu', 0, 'L', None, False, 0x0503),
+    (0x0503, 'CYRILLIC SMALL LETTER KOMI DJE', 'Ll', 0, 'L', None, False, None),
+    (0x0504, 'CYRILLIC CAPITAL LETTER KOMI ZJE', 'Lu', 0, 'L', None, False, 0x0505),
+    (0x0505, 'CYRILLIC SMALL LETTER KOMI ZJE', 'Ll', 0, 'L', None, False, None),
+    (0x0506, 'CYRILLIC CAPITAL LETTER KOMI DZJE', 'Lu', 0, 'L', None, False, 0x0507),
+    (0x0507, 'CYRILLIC SMALL LETTER KOMI DZJE', 'Ll', 0, 'L', None, False, None),
+    (0x0508, 'CYRILLIC CAPITAL LETTER KOMI LJE', 'Lu', 0, 'L', None, False, 0x0509),
+    (0x0509, 'CYRILLIC SMALL LETTER KOMI LJE', 'Ll', 0, 'L', None, False, None),
+    (0x050A, 'CYRILLIC CAPITAL LETTER KOMI NJE', 'Lu', 0, 'L', None, False, 0x050B),
+    (0x050B, 'CYRILLIC SMALL LETTER KOMI NJE', 'Ll', 0, 'L', None, False, None),
+    (0x050C, 'CYRILLIC CAPITAL LETTER KOMI SJE', 'Lu', 0, 'L', None, False, 0x050D),
+    (0x050D, 'CYRILLIC SMALL LETTER KOMI SJE', 'Ll', 0, 'L', None, False, None),
+    (0x050E, 'CYRILLIC CAPITAL LETTER KOMI TJE', 'Lu', 0, 'L', None, False, 0x050F),
+    (0x050F, 'CYRILLIC SMALL LETTER KOMI TJE', 'Ll', 0, 'L', None, False, None),
+    (0x0510, 'CYRILLIC CAPITAL LETTER REVERSED ZE', 'Lu', 0, 'L', None, False, 0x0511),
+    (0x0511, 'CYRILLIC SMALL LETTER REVERSED ZE', 'Ll', 0, 'L', None, False, None),
+    (0x0512, 'CYRILLIC CAPITAL LETTER EL WITH HOOK', 'Lu', 0, 'L', None, False, 0x0513),
+    (0x0513, 'CYRILLIC SMALL LETTER EL WITH HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0514, 'CYRILLIC CAPITAL LETTER LHA', 'Lu', 0, 'L', None, False, 0x0515),
+    (0x0515, 'CYRILLIC SMALL LETTER LHA', 'Ll', 0, 'L', None, False, None),
+    (0x0516, 'CYRILLIC CAPITAL LETTER RHA', 'Lu', 0, 'L', None, False, 0x0517),
+    (0x0517, 'CYRILLIC SMALL LETTER RHA', 'Ll', 0, 'L', None, False, None),
+    (0x0518, 'CYRILLIC CAPITAL LETTER YAE', 'Lu', 0, 'L', None, False, 0x0519),
+    (0x0519, 'CYRILLIC SMALL LETTER YAE', 'Ll', 0, 'L', None, False, None),
+    (0x051A, 'CYRILLIC CAPITAL LETTER QA', 'Lu', 0, 'L', None, False, 0x051B),
+    (0x051B, 'CYRILLIC SMALL LETTER QA', 'Ll', 0, 'L', None, False, None),
+    (0x051C, 'CYRILLIC CAPITAL LETTER WE', 'Lu', 0, 'L', None, False, 0x051D),
+    (0x051D, 'CYRILLIC SMALL LETTER WE', 'Ll', 0, 'L', None, False, None),
+    (0x051E, 'CYRILLIC CAPITAL LETTER ALEUT KA', 'Lu', 0, 'L', None, False, 0x051F),
+    (0x051F, 'CYRILLIC SMALL LETTER ALEUT KA', 'Ll', 0, 'L', None, False, None),
+    (0x0520, 'CYRILLIC CAPITAL LETTER EL WITH MIDDLE HOOK', 'Lu', 0, 'L', None, False, 0x0521),
+    (0x0521, 'CYRILLIC SMALL LETTER EL WITH MIDDLE HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0522, 'CYRILLIC CAPITAL LETTER EN WITH MIDDLE HOOK', 'Lu', 0, 'L', None, False, 0x0523),
+    (0x0523, 'CYRILLIC SMALL LETTER EN WITH MIDDLE HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x0524, 'CYRILLIC CAPITAL LETTER PE WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x0525),
+    (0x0525, 'CYRILLIC SMALL LETTER PE WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x0526, 'CYRILLIC CAPITAL LETTER SHHA WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x0527),
+    (0x0527, 'CYRILLIC SMALL LETTER SHHA WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x0528, 'CYRILLIC CAPITAL LETTER EN WITH LEFT HOOK', 'Lu', 0, 'L', None, False, 0x0529),
+    (0x0529, 'CYRILLIC SMALL LETTER EN WITH LEFT HOOK', 'Ll', 0, 'L', None, False, None),
+    (0x052A, 'CYRILLIC CAPITAL LETTER DZZHE', 'Lu', 0, 'L', None, False, 0x052B),
+    (0x052B, 'CYRILLIC SMALL LETTER DZZHE', 'Ll', 0, 'L', None, False, None),
+    (0x052C, 'CYRILLIC CAPITAL LETTER DCHE', 'Lu', 0, 'L', None, False, 0x052D),
+    (0x052D, 'CYRILLIC SMALL LETTER DCHE', 'Ll', 0, 'L', None, False, None),
+    (0x052E, 'CYRILLIC CAPITAL LETTER EL WITH DESCENDER', 'Lu', 0, 'L', None, False, 0x052F),
+    (0x052F, 'CYRILLIC SMALL LETTER EL WITH DESCENDER', 'Ll', 0, 'L', None, False, None),
+    (0x0531, 'ARMENIAN CAPITAL LETTER AYB', 'Lu', 0, 'L', None, False, 0x0561),
+    (0x0532, 'ARMENIAN CAPITAL LETTER BEN', 'Lu', 0, 'L', None, False, 0x0562),
+    (0x0533, 'ARMENIAN CAPITAL LETTER GIM', 'Lu', 0, 'L', None, False, 0x0563),
+    (0x0534, 'ARMENIAN CAPITAL LETTER DA', 'Lu', 0, 'L', None, False, 0x0564),
+    (0x0535, 'ARMENIAN CAPITAL LETTER ECH', 'Lu', 0, 'L', None, False, 0x0565),
+    (0x0536, 'ARMENIAN CAPITAL LETTER ZA', 'Lu', 0, 'L', None, False, 0x0566),
+    (0x0537, 'ARMENIAN CAPITAL LETTER EH', 'Lu', 0, 'L', None, False, 0x0567),
+    (0x0538, 'ARMENIAN CAPITAL LETTER ET', 'Lu', 0, 'L', None, False, 0x0568),
+    (0x0539, 'ARMENIAN CAPITAL LETTER TO', 'Lu', 0, 'L', None, False, 0x0569),
+    (0x053A, 'ARMENIAN CAPITAL LETTER ZHE', 'Lu', 0, 'L', None, False, 0x056A),
+    (0x053B, 'ARMENIAN CAPITAL LETTER INI', 'Lu', 0, 'L', None, False, 0x056B),
+    (0x053C, 'ARMENIAN CAPITAL LETTER LIWN', 'Lu', 0, 'L', None, False, 0x056C),
+    (0x053D, 'ARMENIAN CAPITAL LETTER XEH', 'Lu', 0, 'L', None, False, 0x056D),
+    (0x053E, 'ARMENIAN CAPITAL LETTER CA', 'Lu', 0, 'L', None, False, 0x056E),
+    (0x053F, 'ARMENIAN CAPITAL LETTER KEN', 'Lu', 0, 'L', None, False, 0x056F),
+    (0x0540, 'ARMENIAN CAPITAL LETTER HO', 'Lu', 0, 'L', None, False, 0x0570),
+    (0x0541, 'ARMENIAN CAPITAL LETTER JA', 'Lu', 0, 'L', None, False, 0x0571),
+    (0x0542, 'ARMENIAN CAPITAL LETTER GHAD', 'Lu', 0, 'L', None, False, 0x0572),
+    (0x0543, 'ARMENIAN CAPITAL LETTER CHEH', 'Lu', 0, 'L', None, False, 0x0573),
+    (0x0544, 'ARMENIAN CAPITAL LETTER MEN', 'Lu', 0, 'L', None, False, 0x0574),
+    (0x0545, 'ARMENIAN CAPITAL LETTER YI', 'Lu', 0, 'L', None, False, 0x0575),
+    (0x0546, 'ARMENIAN CAPITAL LETTER NOW', 'Lu', 0, 'L', None, False, 0x0576),
+    (0x0547, 'ARMENIAN CAPITAL LETTER SHA', 'Lu', 0, 'L', None, False, 0x0577),
+    (0x0548, 'ARMENIAN CAPITAL LETTER VO', 'Lu', 0, 'L', None, False, 0x0578),
+    (0x0549, 'ARMENIAN CAPITAL LETTER CHA', 'Lu', 0, 'L', None, False, 0x0579),
+    (0x054A, 'ARMENIAN CAPITAL LETTER PEH', 'Lu', 0, 'L', None, False, 0x057A),
+    (0x054B, 'ARMENIAN CAPITAL LETTER JHEH', 'Lu', 0, 'L', None, False, 0x057B),
+    (0x054C, 'ARMENIAN CAPITAL LETTER RA', 'Lu', 0, 'L', None, False, 0x057C),
+    (0x054D, 'ARMENIAN CAPITAL LETTER SEH', 'Lu', 0, 'L', None, False, 0x057D),
+    (0x054E, 'ARMENIAN CAPITAL LETTER VEW', 'Lu', 0, 'L', None, False, 0x057E),
+    (0x054F, 'ARMENIAN CAPITAL LETTER TIWN', 'Lu', 0, 'L', None, False, 0x057F),
+    (0x0550, 'ARMENIAN CAPITAL LETTER REH', 'Lu', 0, 'L', None, False, 0x0580),
+    (0x0551, 'ARMENIAN CAPITAL LETTER CO', 'Lu', 0, 'L', None, False, 0x0581),
+    (0x0552, 'ARMENIAN CAPITAL LETTER YIWN', 'Lu', 0, 'L', None, False, 0x0582),
+    (0x0553, 'ARMENIAN CAPITAL LETTER PIWR', 'Lu', 0, 'L', None, False, 0x0583),
+    (0x0554, 'ARMENIAN CAPITAL LETTER KEH', 'Lu', 0, 'L', None, False, 0x0584),
+    (0x0555, 'ARMENIAN CAPITAL LETTER OH', 'Lu', 0, 'L', None, False, 0x0585),
+    (0x0556, 'ARMENIAN CAPITAL LETTER FEH', 'Lu', 0, 'L', None, False, 0x0586),
+    (0x0559, 'ARMENIAN MODIFIER LETTER LEFT HALF RING', 'Lm', 0, 'L', None, False, None),
+    (0x055A, 'ARMENIAN APOSTROPHE', 'Po', 0, 'L', None, False, None),
+    (0x055B, 'ARMENIAN EMPHASIS MARK', 'Po', 0, 'L', None, False, None),
+    (0x055C, 'ARMENIAN EXCLAMATION MARK', 'Po', 0, 'L', None, False, None),
+    (0x055D, 'ARMENIAN COMMA', 'Po', 0, 'L', None, False, None),
+    (0x055E, 'ARMENIAN QUESTION MARK', 'Po', 0, 'L', None, False, None),
+    (0x055F, 'ARMENIAN ABBREVIATION MARK', 'Po', 0, 'L', None, False, None),
+    (0x0560, 'ARMENIAN SMALL LETTER TURNED AYB', 'Ll', 0, 'L', None, False, None),
+    (0x0561, 'ARMENIAN SMALL LETTER AYB', 'Ll', 0, 'L', None, False, None),
+    (0x0562, 'ARMENIAN SMALL LETTER BEN', 'Ll', 0, 'L', None, False, None),
+    (0x0563, 'ARMENIAN SMALL LETTER GIM', 'Ll', 0, 'L', None, False, None),
+    (0x0564, 'ARMENIAN SMALL LETTER DA', 'Ll', 0, 'L', None, False, None),
+    (0x0565, 'ARMENIAN SMALL LETTER ECH', 'Ll', 0, 'L', None, False, None),
+    (0x0566, 'ARMENIAN SMALL LETTER ZA', 'Ll', 0, 'L', None, False, None),
+    (0x0567, 'ARMENIAN SMALL LETTER EH', 'Ll', 0, 'L', None, False, None),
+    (0x0568, 'ARMENIAN SMALL LETTER ET', 'Ll', 0, 'L', None, False, None),
+    (0x0569, 'ARMENIAN SMALL LETTER TO', 'Ll', 0, 'L', None, False, None),
+    (0x056A, 'ARMENIAN SMALL LETTER ZHE', 'Ll', 0, 'L', None, False, None),
+    (0x056B, 'ARMENIAN SMALL LETTER INI', 'Ll', 0, 'L', None, False, None),
+    (0x056C, 'ARMENIAN SMALL LETTER LIWN', 'Ll', 0, 'L', None, False, None),
+    (0x056D, 'ARMENIAN SMALL LETTER XEH', 'Ll', 0, 'L', None, False, None),
+    (0x056E, 'ARMENIAN SMALL LETTER CA', 'Ll', 0, 'L', None, False, None),
+    (0x056F, 'ARMENIAN SMALL LETTER KEN', 'Ll', 0, 'L', None, False, None),
+    (0x0570, 'ARMENIAN SMALL LETTER HO', 'Ll', 0, 'L', None, False, None),
+    (0x0571, 'ARMENIAN SMALL LETTER JA', 'Ll', 0, 'L', None, False, None),
+    (0x0572, 'ARMENIAN SMALL LETTER GHAD', 'Ll', 0, 'L', None, False, None),
+    (0x0573, 'ARMENIAN SMALL LETTER CHEH', 'Ll', 0, 'L', None, False, None),
+    (0x0574, 'ARMENIAN SMALL LETTER MEN', 'Ll', 0, 'L', None, False, None),
+    (0x0575, 'ARMENIAN SMALL LETTER YI', 'Ll', 0, 'L', None, False, None),
+    (0x0576, 'ARMENIAN SMALL LETTER NOW', 'Ll', 0, 'L', None, False, None),
+    (0x0577, 'ARMENIAN SMALL LETTER SHA', 'Ll', 0, 'L', None, False, None),
+    (0x0578, 'ARMENIAN SMALL LETTER VO', 'Ll', 0, 'L', None, False, None),
+    (0x0579, 'ARMENIAN SMALL LETTER CHA', 'Ll', 0, 'L', None, False, None),
+    (0x057A, 'ARMENIAN SMALL LETTER PEH', 'Ll', 0, 'L', None, False, None),
+    (0x057B, 'ARMENIAN SMALL LETTER JHEH', 'Ll', 0, 'L', None, False, None),
+    (0x057C, 'ARMENIAN SMALL LETTER RA', 'Ll', 0, 'L', None, False, None),
+    (0x057D, 'ARMENIAN SMALL LETTER SEH', 'Ll', 0, 'L', None, False, None),
+    (0x057E, 'ARMENIAN SMALL LETTER VEW', 'Ll', 0, 'L', None, False, None),
+    (0x057F, 'ARMENIAN SMALL LETTER TIWN', 'Ll', 0, 'L', None, False, None),
+    (0x0580, 'ARMENIAN SMALL LETTER REH', 'Ll', 0, 'L', None, False, None),
+    (0x0581, 'ARMENIAN SMALL LETTER CO', 'Ll', 0, 'L', None, False, None),
+    (0x0582, 'ARMENIAN SMALL LETTER YIWN', 'Ll', 0, 'L', None, False, None),
+    (0x0583, 'ARMENIAN SMALL LETTER PIWR', 'Ll', 0, 'L', None, False, None),
+    (0x0584, 'ARMENIAN SMALL LETTER KEH', 'Ll', 0, 'L', None, False, None),
+    (0x0585, 'ARMENIAN SMALL LETTER OH', 'Ll', 0, 'L', None, False, None),
+    (0x0586, 'ARMENIAN SMALL LETTER FEH', 'Ll', 0, 'L', None, False, None),
+    (0x0587, 'ARMENIAN SMALL LIGATURE ECH YIWN', 'Ll', 0, 'L', None, False, None),
+    (0x0588, 'ARMENIAN SMALL LETTER YI WITH STROKE', 'Ll', 0, 'L', None, False, None),
+    (0x0589, 'ARMENIAN FULL STOP', 'Po', 0, 'L', None, False, None),
+    (0x058A, 'ARMENIAN HYPHEN', 'Pd', 0, 'ON', None, False, None),
+    (0x058D, 'RIGHT-FACING ARMENIAN ETERNITY SIGN', 'So', 0, 'ON', None, False, None),
+    (0x058E, 'LEFT-FACING ARMENIAN ETERNITY SIGN', 'So', 0, 'ON', None, False, None),
+    (0x058F, 'ARMENIAN DRAM SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x0591, 'HEBREW ACCENT ETNAHTA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0592, 'HEBREW ACCENT SEGOL', 'Mn', 230, 'NSM', None, False, None),
+    (0x0593, 'HEBREW ACCENT SHALSHELET', 'Mn', 230, 'NSM', None, False, None),
+    (0x0594, 'HEBREW ACCENT ZAQEF QATAN', 'Mn', 230, 'NSM', None, False, None),
+    (0x0595, 'HEBREW ACCENT ZAQEF GADOL', 'Mn', 230, 'NSM', None, False, None),
+    (0x0596, 'HEBREW ACCENT TIPEHA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0597, 'HEBREW ACCENT REVIA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0598, 'HEBREW ACCENT ZARQA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0599, 'HEBREW ACCENT PASHTA', 'Mn', 230, 'NSM', None, False, None),
+    (0x059A, 'HEBREW ACCENT YETIV', 'Mn', 222, 'NSM', None, False, None),
+    (0x059B, 'HEBREW ACCENT TEVIR', 'Mn', 220, 'NSM', None, False, None),
+    (0x059C, 'HEBREW ACCENT GERESH', 'Mn', 230, 'NSM', None, False, None),
+    (0x059D, 'HEBREW ACCENT GERESH MUQDAM', 'Mn', 230, 'NSM', None, False, None),
+    (0x059E, 'HEBREW ACCENT GERSHAYIM', 'Mn', 230, 'NSM', None, False, None),
+    (0x059F, 'HEBREW ACCENT QARNEY PARA', 'Mn', 230, 'NSM', None, False, None),
+    (0x05A0, 'HEBREW ACCENT TELISHA GEDOLA', 'Mn', 230, 'NSM', None, False, None),
+    (0x05A1, 'HEBREW ACCENT PAZER', 'Mn', 230, 'NSM', None, False, None),
+    (0x05A2, 'HEBREW ACCENT ATNAH HAFUKH', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A3, 'HEBREW ACCENT MUNAH', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A4, 'HEBREW ACCENT MAHAPAKH', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A5, 'HEBREW ACCENT MERKHA', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A6, 'HEBREW ACCENT MERKHA KEFULA', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A7, 'HEBREW ACCENT DARGA', 'Mn', 220, 'NSM', None, False, None),
+    (0x05A8, 'HEBREW ACCENT QADMA', 'Mn', 230, 'NSM', None, False, None),
+    (0x05A9, 'HEBREW ACCENT TELISHA QETANA', 'Mn', 230, 'NSM', None, False, None),
+    (0x05AA, 'HEBREW ACCENT YERAH BEN YOMO', 'Mn', 220, 'NSM', None, False, None),
+    (0x05AB, 'HEBREW ACCENT OLE', 'Mn', 230, 'NSM', None, False, None),
+    (0x05AC, 'HEBREW ACCENT ILUY', 'Mn', 230, 'NSM', None, False, None),
+    (0x05AD, 'HEBREW ACCENT DEHI', 'Mn', 222, 'NSM', None, False, None),
+    (0x05AE, 'HEBREW ACCENT ZINOR', 'Mn', 228, 'NSM', None, False, None),
+    (0x05AF, 'HEBREW MARK MASORA CIRCLE', 'Mn', 230, 'NSM', None, False, None),
+    (0x05B0, 'HEBREW POINT SHEVA', 'Mn', 10, 'NSM', None, False, None),
+    (0x05B1, 'HEBREW POINT HATAF SEGOL', 'Mn', 11, 'NSM', None, False, None),
+    (0x05B2, 'HEBREW POINT HATAF PATAH', 'Mn', 12, 'NSM', None, False, None),
+    (0x05B3, 'HEBREW POINT HATAF QAMATS', 'Mn', 13, 'NSM', None, False, None),
+    (0x05B4, 'HEBREW POINT HIRIQ', 'Mn', 14, 'NSM', None, False, None),
+    (0x05B5, 'HEBREW POINT TSERE', 'Mn', 15, 'NSM', None, False, None),
+    (0x05B6, 'HEBREW POINT SEGOL', 'Mn', 16, 'NSM', None, False, None),
+    (0x05B7, 'HEBREW POINT PATAH', 'Mn', 17, 'NSM', None, False, None),
+    (0x05B8, 'HEBREW POINT QAMATS', 'Mn', 18, 'NSM', None, False, None),
+    (0x05B9, 'HEBREW POINT HOLAM', 'Mn', 19, 'NSM', None, False, None),
+    (0x05BA, 'HEBREW POINT HOLAM HASER FOR VAV', 'Mn', 19, 'NSM', None, False, None),
+    (0x05BB, 'HEBREW POINT QUBUTS', 'Mn', 20, 'NSM', None, False, None),
+    (0x05BC, 'HEBREW POINT DAGESH OR MAPIQ', 'Mn', 21, 'NSM', None, False, None),
+    (0x05BD, 'HEBREW POINT METEG', 'Mn', 22, 'NSM', None, False, None),
+    (0x05BE, 'HEBREW PUNCTUATION MAQAF', 'Pd', 0, 'R', None, False, None),
+    (0x05BF, 'HEBREW POINT RAFE', 'Mn', 23, 'NSM', None, False, None),
+    (0x05C0, 'HEBREW PUNCTUATION PASEQ', 'Po', 0, 'R', None, False, None),
+    (0x05C1, 'HEBREW POINT SHIN DOT', 'Mn', 24, 'NSM', None, False, None),
+    (0x05C2, 'HEBREW POINT SIN DOT', 'Mn', 25, 'NSM', None, False, None),
+    (0x05C3, 'HEBREW PUNCTUATION SOF PASUQ', 'Po', 0, 'R', None, False, None),
+    (0x05C4, 'HEBREW MARK UPPER DOT', 'Mn', 230, 'NSM', None, False, None),
+    (0x05C5, 'HEBREW MARK LOWER DOT', 'Mn', 220, 'NSM', None, False, None),
+    (0x05C6, 'HEBREW PUNCTUATION NUN HAFUKHA', 'Po', 0, 'R', None, False, None),
+    (0x05C7, 'HEBREW POINT QAMATS QATAN', 'Mn', 18, 'NSM', None, False, None),
+    (0x05D0, 'HEBREW LETTER ALEF', 'Lo', 0, 'R', None, False, None),
+    (0x05D1, 'HEBREW LETTER BET', 'Lo', 0, 'R', None, False, None),
+    (0x05D2, 'HEBREW LETTER GIMEL', 'Lo', 0, 'R', None, False, None),
+    (0x05D3, 'HEBREW LETTER DALET', 'Lo', 0, 'R', None, False, None),
+    (0x05D4, 'HEBREW LETTER HE', 'Lo', 0, 'R', None, False, None),
+    (0x05D5, 'HEBREW LETTER VAV', 'Lo', 0, 'R', None, False, None),
+    (0x05D6, 'HEBREW LETTER ZAYIN', 'Lo', 0, 'R', None, False, None),
+    (0x05D7, 'HEBREW LETTER HET', 'Lo', 0, 'R', None, False, None),
+    (0x05D8, 'HEBREW LETTER TET', 'Lo', 0, 'R', None, False, None),
+    (0x05D9, 'HEBREW LETTER YOD', 'Lo', 0, 'R', None, False, None),
+    (0x05DA, 'HEBREW LETTER FINAL KAF', 'Lo', 0, 'R', None, False, None),
+    (0x05DB, 'HEBREW LETTER KAF', 'Lo', 0, 'R', None, False, None),
+    (0x05DC, 'HEBREW LETTER LAMED', 'Lo', 0, 'R', None, False, None),
+    (0x05DD, 'HEBREW LETTER FINAL MEM', 'Lo', 0, 'R', None, False, None),
+    (0x05DE, 'HEBREW LETTER MEM', 'Lo', 0, 'R', None, False, None),
+    (0x05DF, 'HEBREW LETTER FINAL NUN', 'Lo', 0, 'R', None, False, None),
+    (0x05E0, 'HEBREW LETTER NUN', 'Lo', 0, 'R', None, False, None),
+    (0x05E1, 'HEBREW LETTER SAMEKH', 'Lo', 0, 'R', None, False, None),
+    (0x05E2, 'HEBREW LETTER AYIN', 'Lo', 0, 'R', None, False, None),
+    (0x05E3, 'HEBREW LETTER FINAL PE', 'Lo', 0, 'R', None, False, None),
+    (0x05E4, 'HEBREW LETTER PE', 'Lo', 0, 'R', None, False, None),
+    (0x05E5, 'HEBREW LETTER FINAL TSADI', 'Lo', 0, 'R', None, False, None),
+    (0x05E6, 'HEBREW LETTER TSADI', 'Lo', 0, 'R', None, False, None),
+    (0x05E7, 'HEBREW LETTER QOF', 'Lo', 0, 'R', None, False, None),
+    (0x05E8, 'HEBREW LETTER RESH', 'Lo', 0, 'R', None, False, None),
+    (0x05E9, 'HEBREW LETTER SHIN', 'Lo', 0, 'R', None, False, None),
+    (0x05EA, 'HEBREW LETTER TAV', 'Lo', 0, 'R', None, False, None),
+    (0x05EF, 'HEBREW YOD TRIANGLE', 'Lo', 0, 'R', None, False, None),
+    (0x05F0, 'HEBREW LIGATURE YIDDISH DOUBLE VAV', 'Lo', 0, 'R', None, False, None),
+    (0x05F1, 'HEBREW LIGATURE YIDDISH VAV YOD', 'Lo', 0, 'R', None, False, None),
+    (0x05F2, 'HEBREW LIGATURE YIDDISH DOUBLE YOD', 'Lo', 0, 'R', None, False, None),
+    (0x05F3, 'HEBREW PUNCTUATION GERESH', 'Po', 0, 'R', None, False, None),
+    (0x05F4, 'HEBREW PUNCTUATION GERSHAYIM', 'Po', 0, 'R', None, False, None),
+    (0x0600, 'ARABIC NUMBER SIGN', 'Cf', 0, 'AN', None, False, None),
+    (0x0601, 'ARABIC SIGN SANAH', 'Cf', 0, 'AN', None, False, None),
+    (0x0602, 'ARABIC FOOTNOTE MARKER', 'Cf', 0, 'AN', None, False, None),
+    (0x0603, 'ARABIC SIGN SAFHA', 'Cf', 0, 'AN', None, False, None),
+    (0x0604, 'ARABIC SIGN SAMVAT', 'Cf', 0, 'AN', None, False, None),
+    (0x0605, 'ARABIC NUMBER MARK ABOVE', 'Cf', 0, 'AN', None, False, None),
+    (0x0606, 'ARABIC-INDIC CUBE ROOT', 'Sm', 0, 'ON', None, False, None),
+    (0x0607, 'ARABIC-INDIC FOURTH ROOT', 'Sm', 0, 'ON', None, False, None),
+    (0x0608, 'ARABIC RAY', 'Sm', 0, 'AL', None, False, None),
+    (0x0609, 'ARABIC-INDIC PER MILLE SIGN', 'Po', 0, 'ET', None, False, None),
+    (0x060A, 'ARABIC-INDIC PER TEN THOUSAND SIGN', 'Po', 0, 'ET', None, False, None),
+    (0x060B, 'AFGHANI SIGN', 'Sc', 0, 'AL', None, False, None),
+    (0x060C, 'ARABIC COMMA', 'Po', 0, 'CS', None, False, None),
+    (0x060D, 'ARABIC DATE SEPARATOR', 'Po', 0, 'AL', None, False, None),
+    (0x060E, 'ARABIC POETIC VERSE SIGN', 'So', 0, 'ON', None, False, None),
+    (0x060F, 'ARABIC SIGN MISRA', 'So', 0, 'ON', None, False, None),
+    (0x0610, 'ARABIC SIGN SALLALLAHOU ALAYHE WASSALLAM', 'Mn', 230, 'NSM', None, False, None),
+    (0x0611, 'ARABIC SIGN ALAYHE ASSALLAM', 'Mn', 230, 'NSM', None, False, None),
+    (0x0612, 'ARABIC SIGN RAHMATULLAH ALAYHE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0613, 'ARABIC SIGN RADI ALLAHOU ANHU', 'Mn', 230, 'NSM', None, False, None),
+    (0x0614, 'ARABIC SIGN TAKHALLUS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0615, 'ARABIC SMALL HIGH TAH', 'Mn', 230, 'NSM', None, False, None),
+    (0x0616, 'ARABIC SMALL HIGH LIGATURE ALEF WITH LAM WITH YEH', 'Mn', 230, 'NSM', None, False, None),
+    (0x0617, 'ARABIC SMALL HIGH ZAIN', 'Mn', 230, 'NSM', None, False, None),
+    (0x0618, 'ARABIC SMALL FATHA', 'Mn', 30, 'NSM', None, False, None),
+    (0x0619, 'ARABIC SMALL DAMMA', 'Mn', 31, 'NSM', None, False, None),
+    (0x061A, 'ARABIC SMALL KASRA', 'Mn', 32, 'NSM', None, False, None),
+    (0x061B, 'ARABIC SEMICOLON', 'Po', 0, 'AL', None, False, None),
+    (0x061C, 'ARABIC LETTER MARK', 'Cf', 0, 'AL', None, False, None),
+    (0x061D, 'ARABIC END OF TEXT MARK', 'Po', 0, 'AL', None, False, None),
+    (0x061E, 'ARABIC TRIPLE DOT PUNCTUATION MARK', 'Po', 0, 'AL', None, False, None),
+    (0x061F, 'ARABIC QUESTION MARK', 'Po', 0, 'AL', None, False, None),
+    (0x0620, 'ARABIC LETTER KASHMIRI YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0621, 'ARABIC LETTER HAMZA', 'Lo', 0, 'AL', None, False, None),
+    (0x0622, 'ARABIC LETTER ALEF WITH MADDA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0623, 'ARABIC LETTER ALEF WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0624, 'ARABIC LETTER WAW WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0625, 'ARABIC LETTER ALEF WITH HAMZA BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0626, 'ARABIC LETTER YEH WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0627, 'ARABIC LETTER ALEF', 'Lo', 0, 'AL', None, False, None),
+    (0x0628, 'ARABIC LETTER BEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0629, 'ARABIC LETTER TEH MARBUTA', 'Lo', 0, 'AL', None, False, None),
+    (0x062A, 'ARABIC LETTER TEH', 'Lo', 0, 'AL', None, False, None),
+    (0x062B, 'ARABIC LETTER THEH', 'Lo', 0, 'AL', None, False, None),
+    (0x062C, 'ARABIC LETTER JEEM', 'Lo', 0, 'AL', None, False, None),
+    (0x062D, 'ARABIC LETTER HAH', 'Lo', 0, 'AL', None, False, None),
+    (0x062E, 'ARABIC LETTER KHAH', 'Lo', 0, 'AL', None, False, None),
+    (0x062F, 'ARABIC LETTER DAL', 'Lo', 0, 'AL', None, False, None),
+    (0x0630, 'ARABIC LETTER THAL', 'Lo', 0, 'AL', None, False, None),
+    (0x0631, 'ARABIC LETTER REH', 'Lo', 0, 'AL', None, False, None),
+    (0x0632, 'ARABIC LETTER ZAIN', 'Lo', 0, 'AL', None, False, None),
+    (0x0633, 'ARABIC LETTER SEEN', 'Lo', 0, 'AL', None, False, None),
+    (0x0634, 'ARABIC LETTER SHEEN', 'Lo', 0, 'AL', None, False, None),
+    (0x0635, 'ARABIC LETTER SAD', 'Lo', 0, 'AL', None, False, None),
+    (0x0636, 'ARABIC LETTER DAD', 'Lo', 0, 'AL', None, False, None),
+    (0x0637, 'ARABIC LETTER TAH', 'Lo', 0, 'AL', None, False, None),
+    (0x0638, 'ARABIC LETTER ZAH', 'Lo', 0, 'AL', None, False, None),
+    (0x0639, 'ARABIC LETTER AIN', 'Lo', 0, 'AL', None, False, None),
+    (0x063A, 'ARABIC LETTER GHAIN', 'Lo', 0, 'AL', None, False, None),
+    (0x063B, 'ARABIC LETTER KEHEH WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x063C, 'ARABIC LETTER KEHEH WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x063D, 'ARABIC LETTER FARSI YEH WITH INVERTED V', 'Lo', 0, 'AL', None, False, None),
+    (0x063E, 'ARABIC LETTER FARSI YEH WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x063F, 'ARABIC LETTER FARSI YEH WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0640, 'ARABIC TATWEEL', 'Lm', 0, 'AL', None, False, None),
+    (0x0641, 'ARABIC LETTER FEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0642, 'ARABIC LETTER QAF', 'Lo', 0, 'AL', None, False, None),
+    (0x0643, 'ARABIC LETTER KAF', 'Lo', 0, 'AL', None, False, None),
+    (0x0644, 'ARABIC LETTER LAM', 'Lo', 0, 'AL', None, False, None),
+    (0x0645, 'ARABIC LETTER MEEM', 'Lo', 0, 'AL', None, False, None),
+    (0x0646, 'ARABIC LETTER NOON', 'Lo', 0, 'AL', None, False, None),
+    (0x0647, 'ARABIC LETTER HEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0648, 'ARABIC LETTER WAW', 'Lo', 0, 'AL', None, False, None),
+    (0x0649, 'ARABIC LETTER ALEF MAKSURA', 'Lo', 0, 'AL', None, False, None),
+    (0x064A, 'ARABIC LETTER YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x064B, 'ARABIC FATHATAN', 'Mn', 27, 'NSM', None, False, None),
+    (0x064C, 'ARABIC DAMMATAN', 'Mn', 28, 'NSM', None, False, None),
+    (0x064D, 'ARABIC KASRATAN', 'Mn', 29, 'NSM', None, False, None),
+    (0x064E, 'ARABIC FATHA', 'Mn', 30, 'NSM', None, False, None),
+    (0x064F, 'ARABIC DAMMA', 'Mn', 31, 'NSM', None, False, None),
+    (0x0650, 'ARABIC KASRA', 'Mn', 32, 'NSM', None, False, None),
+    (0x0651, 'ARABIC SHADDA', 'Mn', 33, 'NSM', None, False, None),
+    (0x0652, 'ARABIC SUKUN', 'Mn', 34, 'NSM', None, False, None),
+    (0x0653, 'ARABIC MADDAH ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0654, 'ARABIC HAMZA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0655, 'ARABIC HAMZA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0656, 'ARABIC SUBSCRIPT ALEF', 'Mn', 220, 'NSM', None, False, None),
+    (0x0657, 'ARABIC INVERTED DAMMA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0658, 'ARABIC MARK NOON GHUNNA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0659, 'ARABIC ZWARAKAY', 'Mn', 230, 'NSM', None, False, None),
+    (0x065A, 'ARABIC VOWEL SIGN SMALL V ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x065B, 'ARABIC VOWEL SIGN INVERTED SMALL V ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x065C, 'ARABIC VOWEL SIGN DOT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x065D, 'ARABIC REVERSED DAMMA', 'Mn', 230, 'NSM', None, False, None),
+    (0x065E, 'ARABIC FATHA WITH TWO DOTS', 'Mn', 230, 'NSM', None, False, None),
+    (0x065F, 'ARABIC WAVY HAMZA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0660, 'ARABIC-INDIC DIGIT ZERO', 'Nd', 0, 'AN', 0, False, None),
+    (0x0661, 'ARABIC-INDIC DIGIT ONE', 'Nd', 0, 'AN', 1, False, None),
+    (0x0662, 'ARABIC-INDIC DIGIT TWO', 'Nd', 0, 'AN', 2, False, None),
+    (0x0663, 'ARABIC-INDIC DIGIT THREE', 'Nd', 0, 'AN', 3, False, None),
+    (0x0664, 'ARABIC-INDIC DIGIT FOUR', 'Nd', 0, 'AN', 4, False, None),
+    (0x0665, 'ARABIC-INDIC DIGIT FIVE', 'Nd', 0, 'AN', 5, False, None),
+    (0x0666, 'ARABIC-INDIC DIGIT SIX', 'Nd', 0, 'AN', 6, False, None),
+    (0x0667, 'ARABIC-INDIC DIGIT SEVEN', 'Nd', 0, 'AN', 7, False, None),
+    (0x0668, 'ARABIC-INDIC DIGIT EIGHT', 'Nd', 0, 'AN', 8, False, None),
+    (0x0669, 'ARABIC-INDIC DIGIT NINE', 'Nd', 0, 'AN', 9, False, None),
+    (0x066A, 'ARABIC PERCENT SIGN', 'Po', 0, 'ET', None, False, None),
+    (0x066B, 'ARABIC DECIMAL SEPARATOR', 'Po', 0, 'AN', None, False, None),
+    (0x066C, 'ARABIC THOUSANDS SEPARATOR', 'Po', 0, 'AN', None, False, None),
+    (0x066D, 'ARABIC FIVE POINTED STAR', 'Po', 0, 'AL', None, False, None),
+    (0x066E, 'ARABIC LETTER DOTLESS BEH', 'Lo', 0, 'AL', None, False, None),
+    (0x066F, 'ARABIC LETTER DOTLESS QAF', 'Lo', 0, 'AL', None, False, None),
+    (0x0670, 'ARABIC LETTER SUPERSCRIPT ALEF', 'Mn', 35, 'NSM', None, False, None),
+    (0x0671, 'ARABIC LETTER ALEF WASLA', 'Lo', 0, 'AL', None, False, None),
+    (0x0672, 'ARABIC LETTER ALEF WITH WAVY HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0673, 'ARABIC LETTER ALEF WITH WAVY HAMZA BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0674, 'ARABIC LETTER HIGH HAMZA', 'Lo', 0, 'AL', None, False, None),
+    (0x0675, 'ARABIC LETTER HIGH HAMZA ALEF', 'Lo', 0, 'AL', None, False, None),
+    (0x0676, 'ARABIC LETTER HIGH HAMZA WAW', 'Lo', 0, 'AL', None, False, None),
+    (0x0677, 'ARABIC LETTER U WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0678, 'ARABIC LETTER HIGH HAMZA YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0679, 'ARABIC LETTER TTEH', 'Lo', 0, 'AL', None, False, None),
+    (0x067A, 'ARABIC LETTER TTEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x067B, 'ARABIC LETTER BEEH', 'Lo', 0, 'AL', None, False, None),
+    (0x067C, 'ARABIC LETTER TEH WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x067D, 'ARABIC LETTER TEH WITH THREE DOTS ABOVE DOWNWARDS', 'Lo', 0, 'AL', None, False, None),
+    (0x067E, 'ARABIC LETTER PEH', 'Lo', 0, 'AL', None, False, None),
+    (0x067F, 'ARABIC LETTER TEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0680, 'ARABIC LETTER BEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0681, 'ARABIC LETTER HAH WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0682, 'ARABIC LETTER HAH WITH TWO DOTS VERTICAL ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0683, 'ARABIC LETTER NYEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0684, 'ARABIC LETTER DYEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0685, 'ARABIC LETTER HAH WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0686, 'ARABIC LETTER TCHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0687, 'ARABIC LETTER TCHEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0688, 'ARABIC LETTER DDAL', 'Lo', 0, 'AL', None, False, None),
+    (0x0689, 'ARABIC LETTER DAL WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x068A, 'ARABIC LETTER DAL WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x068B, 'ARABIC LETTER DAL WITH DOT BELOW AND SMALL TAH', 'Lo', 0, 'AL', None, False, None),
+    (0x068C, 'ARABIC LETTER DAHAL', 'Lo', 0, 'AL', None, False, None),
+    (0x068D, 'ARABIC LETTER DDAHAL', 'Lo', 0, 'AL', None, False, None),
+    (0x068E, 'ARABIC LETTER DUL', 'Lo', 0, 'AL', None, False, None),
+    (0x068F, 'ARABIC LETTER DAL WITH THREE DOTS ABOVE DOWNWARDS', 'Lo', 0, 'AL', None, False, None),
+    (0x0690, 'ARABIC LETTER DAL WITH FOUR DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0691, 'ARABIC LETTER RREH', 'Lo', 0, 'AL', None, False, None),
+    (0x0692, 'ARABIC LETTER REH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x0693, 'ARABIC LETTER REH WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x0694, 'ARABIC LETTER REH WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0695, 'ARABIC LETTER REH WITH SMALL V BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0696, 'ARABIC LETTER REH WITH DOT BELOW AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0697, 'ARABIC LETTER REH WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0698, 'ARABIC LETTER JEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0699, 'ARABIC LETTER REH WITH FOUR DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x069A, 'ARABIC LETTER SEEN WITH DOT BELOW AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x069B, 'ARABIC LETTER SEEN WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x069C, 'ARABIC LETTER SEEN WITH THREE DOTS BELOW AND THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x069D, 'ARABIC LETTER SAD WITH TWO DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x069E, 'ARABIC LETTER SAD WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x069F, 'ARABIC LETTER TAH WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06A0, 'ARABIC LETTER AIN WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06A1, 'ARABIC LETTER DOTLESS FEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06A2, 'ARABIC LETTER FEH WITH DOT MOVED BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06A3, 'ARABIC LETTER FEH WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06A4, 'ARABIC LETTER VEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06A5, 'ARABIC LETTER FEH WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06A6, 'ARABIC LETTER PEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06A7, 'ARABIC LETTER QAF WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06A8, 'ARABIC LETTER QAF WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06A9, 'ARABIC LETTER KEHEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06AA, 'ARABIC LETTER SWASH KAF', 'Lo', 0, 'AL', None, False, None),
+    (0x06AB, 'ARABIC LETTER KAF WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x06AC, 'ARABIC LETTER KAF WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06AD, 'ARABIC LETTER NG', 'Lo', 0, 'AL', None, False, None),
+    (0x06AE, 'ARABIC LETTER KAF WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06AF, 'ARABIC LETTER GAF', 'Lo', 0, 'AL', None, False, None),
+    (0x06B0, 'ARABIC LETTER GAF WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x06B1, 'ARABIC LETTER NGOEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06B2, 'ARABIC LETTER GAF WITH TWO DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06B3, 'ARABIC LETTER GUEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06B4, 'ARABIC LETTER GAF WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06B5, 'ARABIC LETTER LAM WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x06B6, 'ARABIC LETTER LAM WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06B7, 'ARABIC LETTER LAM WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06B8, 'ARABIC LETTER LAM WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06B9, 'ARABIC LETTER NOON WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06BA, 'ARABIC LETTER NOON GHUNNA', 'Lo', 0, 'AL', None, False, None),
+    (0x06BB, 'ARABIC LETTER RNOON', 'Lo', 0, 'AL', None, False, None),
+    (0x06BC, 'ARABIC LETTER NOON WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x06BD, 'ARABIC LETTER NOON WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06BE, 'ARABIC LETTER HEH DOACHASHMEE', 'Lo', 0, 'AL', None, False, None),
+    (0x06BF, 'ARABIC LETTER TCHEH WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06C0, 'ARABIC LETTER HEH WITH YEH ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06C1, 'ARABIC LETTER HEH GOAL', 'Lo', 0, 'AL', None, False, None),
+    (0x06C2, 'ARABIC LETTER HEH GOAL WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06C3, 'ARABIC LETTER TEH MARBUTA GOAL', 'Lo', 0, 'AL', None, False, None),
+    (0x06C4, 'ARABIC LETTER WAW WITH RING', 'Lo', 0, 'AL', None, False, None),
+    (0x06C5, 'ARABIC LETTER KIRGHIZ OE', 'Lo', 0, 'AL', None, False, None),
+    (0x06C6, 'ARABIC LETTER OE', 'Lo', 0, 'AL', None, False, None),
+    (0x06C7, 'ARABIC LETTER U', 'Lo', 0, 'AL', None, False, None),
+    (0x06C8, 'ARABIC LETTER YU', 'Lo', 0, 'AL', None, False, None),
+    (0x06C9, 'ARABIC LETTER KIRGHIZ YU', 'Lo', 0, 'AL', None, False, None),
+    (0x06CA, 'ARABIC LETTER WAW WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06CB, 'ARABIC LETTER VE', 'Lo', 0, 'AL', None, False, None),
+    (0x06CC, 'ARABIC LETTER FARSI YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x06CD, 'ARABIC LETTER YEH WITH TAIL', 'Lo', 0, 'AL', None, False, None),
+    (0x06CE, 'ARABIC LETTER YEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x06CF, 'ARABIC LETTER WAW WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06D0, 'ARABIC LETTER E', 'Lo', 0, 'AL', None, False, None),
+    (0x06D1, 'ARABIC LETTER YEH WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06D2, 'ARABIC LETTER YEH BARREE', 'Lo', 0, 'AL', None, False, None),
+    (0x06D3, 'ARABIC LETTER YEH BARREE WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x06D4, 'ARABIC FULL STOP', 'Po', 0, 'AL', None, False, None),
+    (0x06D5, 'ARABIC LETTER AE', 'Lo', 0, 'AL', None, False, None),
+    (0x06D6, 'ARABIC SMALL HIGH LIGATURE SAD WITH LAM WITH ALEF MAKSURA', 'Mn', 230, 'NSM', None, False, None),
+    (0x06D7, 'ARABIC SMALL HIGH LIGATURE QAF WITH LAM WITH ALEF MAKSURA', 'Mn', 230, 'NSM', None, False, None),
+    (0x06D8, 'ARABIC SMALL HIGH MEEM INITIAL FORM', 'Mn', 230, 'NSM', None, False, None),
+    (0x06D9, 'ARABIC SMALL HIGH LAM ALEF', 'Mn', 230, 'NSM', None, False, None),
+    (0x06DA, 'ARABIC SMALL HIGH JEEM', 'Mn', 230, 'NSM', None, False, None),
+    (0x06DB, 'ARABIC SMALL HIGH THREE DOTS', 'Mn', 230, 'NSM', None, False, None),
+    (0x06DC, 'ARABIC SMALL HIGH SEEN', 'Mn', 230, 'NSM', None, False, None),
+    (0x06DD, 'ARABIC END OF AYAH', 'Cf', 0, 'AN', None, False, None),
+    (0x06DE, 'ARABIC START OF RUB EL HIZB', 'So', 0, 'ON', None, False, None),
+    (0x06DF, 'ARABIC SMALL HIGH ROUNDED ZERO', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E0, 'ARABIC SMALL HIGH UPRIGHT RECTANGULAR ZERO', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E1, 'ARABIC SMALL HIGH DOTLESS HEAD OF KHAH', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E2, 'ARABIC SMALL HIGH MEEM ISOLATED FORM', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E3, 'ARABIC SMALL LOW SEEN', 'Mn', 220, 'NSM', None, False, None),
+    (0x06E4, 'ARABIC SMALL HIGH MADDA', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E5, 'ARABIC SMALL WAW', 'Lm', 0, 'AL', None, False, None),
+    (0x06E6, 'ARABIC SMALL YEH', 'Lm', 0, 'AL', None, False, None),
+    (0x06E7, 'ARABIC SMALL HIGH YEH', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E8, 'ARABIC SMALL HIGH NOON', 'Mn', 230, 'NSM', None, False, None),
+    (0x06E9, 'ARABIC PLACE OF SAJDAH', 'So', 0, 'ON', None, False, None),
+    (0x06EA, 'ARABIC EMPTY CENTRE LOW STOP', 'Mn', 220, 'NSM', None, False, None),
+    (0x06EB, 'ARABIC EMPTY CENTRE HIGH STOP', 'Mn', 230, 'NSM', None, False, None),
+    (0x06EC, 'ARABIC ROUNDED HIGH STOP WITH FILLED CENTRE', 'Mn', 230, 'NSM', None, False, None),
+    (0x06ED, 'ARABIC SMALL LOW MEEM', 'Mn', 220, 'NSM', None, False, None),
+    (0x06EE, 'ARABIC LETTER DAL WITH INVERTED V', 'Lo', 0, 'AL', None, False, None),
+    (0x06EF, 'ARABIC LETTER REH WITH INVERTED V', 'Lo', 0, 'AL', None, False, None),
+    (0x06F0, 'EXTENDED ARABIC-INDIC DIGIT ZERO', 'Nd', 0, 'EN', 0, False, None),
+    (0x06F1, 'EXTENDED ARABIC-INDIC DIGIT ONE', 'Nd', 0, 'EN', 1, False, None),
+    (0x06F2, 'EXTENDED ARABIC-INDIC DIGIT TWO', 'Nd', 0, 'EN', 2, False, None),
+    (0x06F3, 'EXTENDED ARABIC-INDIC DIGIT THREE', 'Nd', 0, 'EN', 3, False, None),
+    (0x06F4, 'EXTENDED ARABIC-INDIC DIGIT FOUR', 'Nd', 0, 'EN', 4, False, None),
+    (0x06F5, 'EXTENDED ARABIC-INDIC DIGIT FIVE', 'Nd', 0, 'EN', 5, False, None),
+    (0x06F6, 'EXTENDED ARABIC-INDIC DIGIT SIX', 'Nd', 0, 'EN', 6, False, None),
+    (0x06F7, 'EXTENDED ARABIC-INDIC DIGIT SEVEN', 'Nd', 0, 'EN', 7, False, None),
+    (0x06F8, 'EXTENDED ARABIC-INDIC DIGIT EIGHT', 'Nd', 0, 'EN', 8, False, None),
+    (0x06F9, 'EXTENDED ARABIC-INDIC DIGIT NINE', 'Nd', 0, 'EN', 9, False, None),
+    (0x06FA, 'ARABIC LETTER SHEEN WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06FB, 'ARABIC LETTER DAD WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06FC, 'ARABIC LETTER GHAIN WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x06FD, 'ARABIC SIGN SINDHI AMPERSAND', 'So', 0, 'AL', None, False, None),
+    (0x06FE, 'ARABIC SIGN SINDHI POSTPOSITION MEN', 'So', 0, 'AL', None, False, None),
+    (0x06FF, 'ARABIC LETTER HEH WITH INVERTED V', 'Lo', 0, 'AL', None, False, None),
+    (0x0700, 'SYRIAC END OF PARAGRAPH', 'Po', 0, 'AL', None, False, None),
+    (0x0701, 'SYRIAC SUPRALINEAR FULL STOP', 'Po', 0, 'AL', None, False, None),
+    (0x0702, 'SYRIAC SUBLINEAR FULL STOP', 'Po', 0, 'AL', None, False, None),
+    (0x0703, 'SYRIAC SUPRALINEAR COLON', 'Po', 0, 'AL', None, False, None),
+    (0x0704, 'SYRIAC SUBLINEAR COLON', 'Po', 0, 'AL', None, False, None),
+    (0x0705, 'SYRIAC HORIZONTAL COLON', 'Po', 0, 'AL', None, False, None),
+    (0x0706, 'SYRIAC COLON SKEWED LEFT', 'Po', 0, 'AL', None, False, None),
+    (0x0707, 'SYRIAC COLON SKEWED RIGHT', 'Po', 0, 'AL', None, False, None),
+    (0x0708, 'SYRIAC SUPRALINEAR COLON SKEWED LEFT', 'Po', 0, 'AL', None, False, None),
+    (0x0709, 'SYRIAC SUBLINEAR COLON SKEWED RIGHT', 'Po', 0, 'AL', None, False, None),
+    (0x070A, 'SYRIAC CONTRACTION', 'Po', 0, 'AL', None, False, None),
+    (0x070B, 'SYRIAC HARKLEAN OBELUS', 'Po', 0, 'AL', None, False, None),
+    (0x070C, 'SYRIAC HARKLEAN METOBELUS', 'Po', 0, 'AL', None, False, None),
+    (0x070D, 'SYRIAC HARKLEAN ASTERISCUS', 'Po', 0, 'AL', None, False, None),
+    (0x070F, 'SYRIAC ABBREVIATION MARK', 'Cf', 0, 'AL', None, False, None),
+    (0x0710, 'SYRIAC LETTER ALAPH', 'Lo', 0, 'AL', None, False, None),
+    (0x0711, 'SYRIAC LETTER SUPERSCRIPT ALAPH', 'Mn', 36, 'NSM', None, False, None),
+    (0x0712, 'SYRIAC LETTER BETH', 'Lo', 0, 'AL', None, False, None),
+    (0x0713, 'SYRIAC LETTER GAMAL', 'Lo', 0, 'AL', None, False, None),
+    (0x0714, 'SYRIAC LETTER GAMAL GARSHUNI', 'Lo', 0, 'AL', None, False, None),
+    (0x0715, 'SYRIAC LETTER DALATH', 'Lo', 0, 'AL', None, False, None),
+    (0x0716, 'SYRIAC LETTER DOTLESS DALATH RISH', 'Lo', 0, 'AL', None, False, None),
+    (0x0717, 'SYRIAC LETTER HE', 'Lo', 0, 'AL', None, False, None),
+    (0x0718, 'SYRIAC LETTER WAW', 'Lo', 0, 'AL', None, False, None),
+    (0x0719, 'SYRIAC LETTER ZAIN', 'Lo', 0, 'AL', None, False, None),
+    (0x071A, 'SYRIAC LETTER HETH', 'Lo', 0, 'AL', None, False, None),
+    (0x071B, 'SYRIAC LETTER TETH', 'Lo', 0, 'AL', None, False, None),
+    (0x071C, 'SYRIAC LETTER TETH GARSHUNI', 'Lo', 0, 'AL', None, False, None),
+    (0x071D, 'SYRIAC LETTER YUDH', 'Lo', 0, 'AL', None, False, None),
+    (0x071E, 'SYRIAC LETTER YUDH HE', 'Lo', 0, 'AL', None, False, None),
+    (0x071F, 'SYRIAC LETTER KAPH', 'Lo', 0, 'AL', None, False, None),
+    (0x0720, 'SYRIAC LETTER LAMADH', 'Lo', 0, 'AL', None, False, None),
+    (0x0721, 'SYRIAC LETTER MIM', 'Lo', 0, 'AL', None, False, None),
+    (0x0722, 'SYRIAC LETTER NUN', 'Lo', 0, 'AL', None, False, None),
+    (0x0723, 'SYRIAC LETTER SEMKATH', 'Lo', 0, 'AL', None, False, None),
+    (0x0724, 'SYRIAC LETTER FINAL SEMKATH', 'Lo', 0, 'AL', None, False, None),
+    (0x0725, 'SYRIAC LETTER E', 'Lo', 0, 'AL', None, False, None),
+    (0x0726, 'SYRIAC LETTER PE', 'Lo', 0, 'AL', None, False, None),
+    (0x0727, 'SYRIAC LETTER REVERSED PE', 'Lo', 0, 'AL', None, False, None),
+    (0x0728, 'SYRIAC LETTER SADHE', 'Lo', 0, 'AL', None, False, None),
+    (0x0729, 'SYRIAC LETTER QAPH', 'Lo', 0, 'AL', None, False, None),
+    (0x072A, 'SYRIAC LETTER RISH', 'Lo', 0, 'AL', None, False, None),
+    (0x072B, 'SYRIAC LETTER SHIN', 'Lo', 0, 'AL', None, False, None),
+    (0x072C, 'SYRIAC LETTER TAW', 'Lo', 0, 'AL', None, False, None),
+    (0x072D, 'SYRIAC LETTER PERSIAN BHETH', 'Lo', 0, 'AL', None, False, None),
+    (0x072E, 'SYRIAC LETTER PERSIAN GHAMAL', 'Lo', 0, 'AL', None, False, None),
+    (0x072F, 'SYRIAC LETTER PERSIAN DHALATH', 'Lo', 0, 'AL', None, False, None),
+    (0x0730, 'SYRIAC PTHAHA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0731, 'SYRIAC PTHAHA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0732, 'SYRIAC PTHAHA DOTTED', 'Mn', 230, 'NSM', None, False, None),
+    (0x0733, 'SYRIAC ZQAPHA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0734, 'SYRIAC ZQAPHA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0735, 'SYRIAC ZQAPHA DOTTED', 'Mn', 230, 'NSM', None, False, None),
+    (0x0736, 'SYRIAC RBASA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0737, 'SYRIAC RBASA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0738, 'SYRIAC DOTTED ZLAMA HORIZONTAL', 'Mn', 220, 'NSM', None, False, None),
+    (0x0739, 'SYRIAC DOTTED ZLAMA ANGULAR', 'Mn', 220, 'NSM', None, False, None),
+    (0x073A, 'SYRIAC HBASA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x073B, 'SYRIAC HBASA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x073C, 'SYRIAC HBASA-ESASA DOTTED', 'Mn', 220, 'NSM', None, False, None),
+    (0x073D, 'SYRIAC ESASA ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x073E, 'SYRIAC ESASA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x073F, 'SYRIAC RWAHA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0740, 'SYRIAC FEMININE DOT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0741, 'SYRIAC QUSHSHAYA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0742, 'SYRIAC RUKKAKHA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0743, 'SYRIAC TWO VERTICAL DOTS ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0744, 'SYRIAC TWO VERTICAL DOTS BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0745, 'SYRIAC THREE DOTS ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0746, 'SYRIAC THREE DOTS BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0747, 'SYRIAC OBLIQUE LINE ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x0748, 'SYRIAC OBLIQUE LINE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x0749, 'SYRIAC MUSIC', 'Mn', 230, 'NSM', None, False, None),
+    (0x074A, 'SYRIAC BARREKH', 'Mn', 230, 'NSM', None, False, None),
+    (0x074D, 'SYRIAC LETTER SOGDIAN ZHAIN', 'Lo', 0, 'AL', None, False, None),
+    (0x074E, 'SYRIAC LETTER SOGDIAN KHAPH', 'Lo', 0, 'AL', None, False, None),
+    (0x074F, 'SYRIAC LETTER SOGDIAN FE', 'Lo', 0, 'AL', None, False, None),
+    (0x0750, 'ARABIC LETTER BEH WITH THREE DOTS HORIZONTALLY BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0751, 'ARABIC LETTER BEH WITH DOT BELOW AND THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0752, 'ARABIC LETTER BEH WITH THREE DOTS POINTING UPWARDS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0753, 'ARABIC LETTER BEH WITH THREE DOTS POINTING UPWARDS BELOW AND TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0754, 'ARABIC LETTER BEH WITH TWO DOTS BELOW AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0755, 'ARABIC LETTER BEH WITH INVERTED SMALL V BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0756, 'ARABIC LETTER BEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x0757, 'ARABIC LETTER HAH WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0758, 'ARABIC LETTER HAH WITH THREE DOTS POINTING UPWARDS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0759, 'ARABIC LETTER DAL WITH TWO DOTS VERTICALLY BELOW AND SMALL TAH', 'Lo', 0, 'AL', None, False, None),
+    (0x075A, 'ARABIC LETTER DAL WITH INVERTED SMALL V BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x075B, 'ARABIC LETTER REH WITH STROKE', 'Lo', 0, 'AL', None, False, None),
+    (0x075C, 'ARABIC LETTER SEEN WITH FOUR DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x075D, 'ARABIC LETTER AIN WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x075E, 'ARABIC LETTER AIN WITH THREE DOTS POINTING DOWNWARDS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x075F, 'ARABIC LETTER AIN WITH TWO DOTS VERTICALLY ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0760, 'ARABIC LETTER FEH WITH TWO DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0761, 'ARABIC LETTER FEH WITH THREE DOTS POINTING UPWARDS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0762, 'ARABIC LETTER KEHEH WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0763, 'ARABIC LETTER KEHEH WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0764, 'ARABIC LETTER KEHEH WITH THREE DOTS POINTING UPWARDS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0765, 'ARABIC LETTER MEEM WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0766, 'ARABIC LETTER MEEM WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0767, 'ARABIC LETTER NOON WITH TWO DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0768, 'ARABIC LETTER NOON WITH SMALL TAH', 'Lo', 0, 'AL', None, False, None),
+    (0x0769, 'ARABIC LETTER NOON WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x076A, 'ARABIC LETTER LAM WITH BAR', 'Lo', 0, 'AL', None, False, None),
+    (0x076B, 'ARABIC LETTER REH WITH TWO DOTS VERTICALLY ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x076C, 'ARABIC LETTER REH WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x076D, 'ARABIC LETTER SEEN WITH TWO DOTS VERTICALLY ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x076E, 'ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x076F, 'ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH AND TWO DOTS', 'Lo', 0, 'AL', None, False, None),
+    (0x0770, 'ARABIC LETTER SEEN WITH SMALL ARABIC LETTER TAH AND TWO DOTS', 'Lo', 0, 'AL', None, False, None),
+    (0x0771, 'ARABIC LETTER REH WITH SMALL ARABIC LETTER TAH AND TWO DOTS', 'Lo', 0, 'AL', None, False, None),
+    (0x0772, 'ARABIC LETTER HAH WITH SMALL ARABIC LETTER TAH ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0773, 'ARABIC LETTER ALEF WITH EXTENDED ARABIC-INDIC DIGIT TWO ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0774, 'ARABIC LETTER ALEF WITH EXTENDED ARABIC-INDIC DIGIT THREE ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0775, 'ARABIC LETTER FARSI YEH WITH EXTENDED ARABIC-INDIC DIGIT TWO ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0776, 'ARABIC LETTER FARSI YEH WITH EXTENDED ARABIC-INDIC DIGIT THREE ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0777, 'ARABIC LETTER FARSI YEH WITH EXTENDED ARABIC-INDIC DIGIT FOUR BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0778, 'ARABIC LETTER WAW WITH EXTENDED ARABIC-INDIC DIGIT TWO ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0779, 'ARABIC LETTER WAW WITH EXTENDED ARABIC-INDIC DIGIT THREE ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x077A, 'ARABIC LETTER YEH BARREE WITH EXTENDED ARABIC-INDIC DIGIT TWO ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x077B, 'ARABIC LETTER YEH BARREE WITH EXTENDED ARABIC-INDIC DIGIT THREE ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x077C, 'ARABIC LETTER HAH WITH EXTENDED ARABIC-INDIC DIGIT FOUR BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x077D, 'ARABIC LETTER SEEN WITH EXTENDED ARABIC-INDIC DIGIT FOUR ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x077E, 'ARABIC LETTER SEEN WITH INVERTED V', 'Lo', 0, 'AL', None, False, None),
+    (0x077F, 'ARABIC LETTER KAF WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0780, 'THAANA LETTER HAA', 'Lo', 0, 'AL', None, False, None),
+    (0x0781, 'THAANA LETTER SHAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0782, 'THAANA LETTER NOONU', 'Lo', 0, 'AL', None, False, None),
+    (0x0783, 'THAANA LETTER RAA', 'Lo', 0, 'AL', None, False, None),
+    (0x0784, 'THAANA LETTER BAA', 'Lo', 0, 'AL', None, False, None),
+    (0x0785, 'THAANA LETTER LHAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0786, 'THAANA LETTER KAAFU', 'Lo', 0, 'AL', None, False, None),
+    (0x0787, 'THAANA LETTER ALIFU', 'Lo', 0, 'AL', None, False, None),
+    (0x0788, 'THAANA LETTER VAAVU', 'Lo', 0, 'AL', None, False, None),
+    (0x0789, 'THAANA LETTER MEEMU', 'Lo', 0, 'AL', None, False, None),
+    (0x078A, 'THAANA LETTER FAAFU', 'Lo', 0, 'AL', None, False, None),
+    (0x078B, 'THAANA LETTER DHAALU', 'Lo', 0, 'AL', None, False, None),
+    (0x078C, 'THAANA LETTER THAA', 'Lo', 0, 'AL', None, False, None),
+    (0x078D, 'THAANA LETTER LAAMU', 'Lo', 0, 'AL', None, False, None),
+    (0x078E, 'THAANA LETTER GAAFU', 'Lo', 0, 'AL', None, False, None),
+    (0x078F, 'THAANA LETTER GNAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0790, 'THAANA LETTER SEENU', 'Lo', 0, 'AL', None, False, None),
+    (0x0791, 'THAANA LETTER DAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0792, 'THAANA LETTER ZAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0793, 'THAANA LETTER TAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0794, 'THAANA LETTER YAA', 'Lo', 0, 'AL', None, False, None),
+    (0x0795, 'THAANA LETTER PAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0796, 'THAANA LETTER JAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0797, 'THAANA LETTER CHAVIYANI', 'Lo', 0, 'AL', None, False, None),
+    (0x0798, 'THAANA LETTER TTAA', 'Lo', 0, 'AL', None, False, None),
+    (0x0799, 'THAANA LETTER HHAA', 'Lo', 0, 'AL', None, False, None),
+    (0x079A, 'THAANA LETTER KHAA', 'Lo', 0, 'AL', None, False, None),
+    (0x079B, 'THAANA LETTER THAALU', 'Lo', 0, 'AL', None, False, None),
+    (0x079C, 'THAANA LETTER ZAA', 'Lo', 0, 'AL', None, False, None),
+    (0x079D, 'THAANA LETTER SHEENU', 'Lo', 0, 'AL', None, False, None),
+    (0x079E, 'THAANA LETTER SAADHU', 'Lo', 0, 'AL', None, False, None),
+    (0x079F, 'THAANA LETTER DAADHU', 'Lo', 0, 'AL', None, False, None),
+    (0x07A0, 'THAANA LETTER TO', 'Lo', 0, 'AL', None, False, None),
+    (0x07A1, 'THAANA LETTER ZO', 'Lo', 0, 'AL', None, False, None),
+    (0x07A2, 'THAANA LETTER AINU', 'Lo', 0, 'AL', None, False, None),
+    (0x07A3, 'THAANA LETTER GHAINU', 'Lo', 0, 'AL', None, False, None),
+    (0x07A4, 'THAANA LETTER QAAFU', 'Lo', 0, 'AL', None, False, None),
+    (0x07A5, 'THAANA LETTER WAAVU', 'Lo', 0, 'AL', None, False, None),
+    (0x07A6, 'THAANA ABAFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07A7, 'THAANA AABAAFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07A8, 'THAANA IBIFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07A9, 'THAANA EEBEEFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AA, 'THAANA UBUFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AB, 'THAANA OOBOOFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AC, 'THAANA EBEFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AD, 'THAANA EYBEYFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AE, 'THAANA OBOFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07AF, 'THAANA OABOAFILI', 'Mn', 0, 'NSM', None, False, None),
+    (0x07B0, 'THAANA SUKUN', 'Mn', 0, 'NSM', None, False, None),
+    (0x07B1, 'THAANA LETTER NAA', 'Lo', 0, 'AL', None, False, None),
+    (0x07C0, 'NKO DIGIT ZERO', 'Nd', 0, 'R', 0, False, None),
+    (0x07C1, 'NKO DIGIT ONE', 'Nd', 0, 'R', 1, False, None),
+    (0x07C2, 'NKO DIGIT TWO', 'Nd', 0, 'R', 2, False, None),
+    (0x07C3, 'NKO DIGIT THREE', 'Nd', 0, 'R', 3, False, None),
+    (0x07C4, 'NKO DIGIT FOUR', 'Nd', 0, 'R', 4, False, None),
+    (0x07C5, 'NKO DIGIT FIVE', 'Nd', 0, 'R', 5, False, None),
+    (0x07C6, 'NKO DIGIT SIX', 'Nd', 0, 'R', 6, False, None),
+    (0x07C7, 'NKO DIGIT SEVEN', 'Nd', 0, 'R', 7, False, None),
+    (0x07C8, 'NKO DIGIT EIGHT', 'Nd', 0, 'R', 8, False, None),
+    (0x07C9, 'NKO DIGIT NINE', 'Nd', 0, 'R', 9, False, None),
+    (0x07CA, 'NKO LETTER A', 'Lo', 0, 'R', None, False, None),
+    (0x07CB, 'NKO LETTER EE', 'Lo', 0, 'R', None, False, None),
+    (0x07CC, 'NKO LETTER I', 'Lo', 0, 'R', None, False, None),
+    (0x07CD, 'NKO LETTER E', 'Lo', 0, 'R', None, False, None),
+    (0x07CE, 'NKO LETTER U', 'Lo', 0, 'R', None, False, None),
+    (0x07CF, 'NKO LETTER OO', 'Lo', 0, 'R', None, False, None),
+    (0x07D0, 'NKO LETTER O', 'Lo', 0, 'R', None, False, None),
+    (0x07D1, 'NKO LETTER DAGBASINNA', 'Lo', 0, 'R', None, False, None),
+    (0x07D2, 'NKO LETTER N', 'Lo', 0, 'R', None, False, None),
+    (0x07D3, 'NKO LETTER BA', 'Lo', 0, 'R', None, False, None),
+    (0x07D4, 'NKO LETTER PA', 'Lo', 0, 'R', None, False, None),
+    (0x07D5, 'NKO LETTER TA', 'Lo', 0, 'R', None, False, None),
+    (0x07D6, 'NKO LETTER JA', 'Lo', 0, 'R', None, False, None),
+    (0x07D7, 'NKO LETTER CHA', 'Lo', 0, 'R', None, False, None),
+    (0x07D8, 'NKO LETTER DA', 'Lo', 0, 'R', None, False, None),
+    (0x07D9, 'NKO LETTER RA', 'Lo', 0, 'R', None, False, None),
+    (0x07DA, 'NKO LETTER RRA', 'Lo', 0, 'R', None, False, None),
+    (0x07DB, 'NKO LETTER SA', 'Lo', 0, 'R', None, False, None),
+    (0x07DC, 'NKO LETTER GBA', 'Lo', 0, 'R', None, False, None),
+    (0x07DD, 'NKO LETTER FA', 'Lo', 0, 'R', None, False, None),
+    (0x07DE, 'NKO LETTER KA', 'Lo', 0, 'R', None, False, None),
+    (0x07DF, 'NKO LETTER LA', 'Lo', 0, 'R', None, False, None),
+    (0x07E0, 'NKO LETTER NA WOLOSO', 'Lo', 0, 'R', None, False, None),
+    (0x07E1, 'NKO LETTER MA', 'Lo', 0, 'R', None, False, None),
+    (0x07E2, 'NKO LETTER NYA', 'Lo', 0, 'R', None, False, None),
+    (0x07E3, 'NKO LETTER NA', 'Lo', 0, 'R', None, False, None),
+    (0x07E4, 'NKO LETTER HA', 'Lo', 0, 'R', None, False, None),
+    (0x07E5, 'NKO LETTER WA', 'Lo', 0, 'R', None, False, None),
+    (0x07E6, 'NKO LETTER YA', 'Lo', 0, 'R', None, False, None),
+    (0x07E7, 'NKO LETTER NYA WOLOSO', 'Lo', 0, 'R', None, False, None),
+    (0x07E8, 'NKO LETTER JONA JA', 'Lo', 0, 'R', None, False, None),
+    (0x07E9, 'NKO LETTER JONA CHA', 'Lo', 0, 'R', None, False, None),
+    (0x07EA, 'NKO LETTER JONA RA', 'Lo', 0, 'R', None, False, None),
+    (0x07EB, 'NKO COMBINING SHORT HIGH TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07EC, 'NKO COMBINING SHORT LOW TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07ED, 'NKO COMBINING SHORT RISING TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07EE, 'NKO COMBINING LONG DESCENDING TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07EF, 'NKO COMBINING LONG HIGH TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07F0, 'NKO COMBINING LONG LOW TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07F1, 'NKO COMBINING LONG RISING TONE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07F2, 'NKO COMBINING NASALIZATION MARK', 'Mn', 220, 'NSM', None, False, None),
+    (0x07F3, 'NKO COMBINING DOUBLE DOT ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x07F4, 'NKO HIGH TONE APOSTROPHE', 'Lm', 0, 'R', None, False, None),
+    (0x07F5, 'NKO LOW TONE APOSTROPHE', 'Lm', 0, 'R', None, False, None),
+    (0x07F6, 'NKO SYMBOL OO DENNEN', 'So', 0, 'ON', None, False, None),
+    (0x07F7, 'NKO SYMBOL GBAKURUNEN', 'Po', 0, 'ON', None, False, None),
+    (0x07F8, 'NKO COMMA', 'Po', 0, 'ON', None, False, None),
+    (0x07F9, 'NKO EXCLAMATION MARK', 'Po', 0, 'ON', None, False, None),
+    (0x07FA, 'NKO LAJANYALAN', 'Lm', 0, 'R', None, False, None),
+    (0x07FD, 'NKO DANTAYALAN', 'Mn', 220, 'NSM', None, False, None),
+    (0x07FE, 'NKO DOROME SIGN', 'Sc', 0, 'R', None, False, None),
+    (0x07FF, 'NKO TAMAN SIGN', 'Sc', 0, 'R', None, False, None),
+    (0x0800, 'SAMARITAN LETTER ALAF', 'Lo', 0, 'R', None, False, None),
+    (0x0801, 'SAMARITAN LETTER BIT', 'Lo', 0, 'R', None, False, None),
+    (0x0802, 'SAMARITAN LETTER GAMAN', 'Lo', 0, 'R', None, False, None),
+    (0x0803, 'SAMARITAN LETTER DALAT', 'Lo', 0, 'R', None, False, None),
+    (0x0804, 'SAMARITAN LETTER IY', 'Lo', 0, 'R', None, False, None),
+    (0x0805, 'SAMARITAN LETTER BAA', 'Lo', 0, 'R', None, False, None),
+    (0x0806, 'SAMARITAN LETTER ZEN', 'Lo', 0, 'R', None, False, None),
+    (0x0807, 'SAMARITAN LETTER IT', 'Lo', 0, 'R', None, False, None),
+    (0x0808, 'SAMARITAN LETTER TIT', 'Lo', 0, 'R', None, False, None),
+    (0x0809, 'SAMARITAN LETTER YUT', 'Lo', 0, 'R', None, False, None),
+    (0x080A, 'SAMARITAN LETTER KAAF', 'Lo', 0, 'R', None, False, None),
+    (0x080B, 'SAMARITAN LETTER LABAT', 'Lo', 0, 'R', None, False, None),
+    (0x080C, 'SAMARITAN LETTER MIM', 'Lo', 0, 'R', None, False, None),
+    (0x080D, 'SAMARITAN LETTER NUN', 'Lo', 0, 'R', None, False, None),
+    (0x080E, 'SAMARITAN LETTER SINGAAT', 'Lo', 0, 'R', None, False, None),
+    (0x080F, 'SAMARITAN LETTER IN', 'Lo', 0, 'R', None, False, None),
+    (0x0810, 'SAMARITAN LETTER FI', 'Lo', 0, 'R', None, False, None),
+    (0x0811, 'SAMARITAN LETTER TSAADIY', 'Lo', 0, 'R', None, False, None),
+    (0x0812, 'SAMARITAN LETTER QUF', 'Lo', 0, 'R', None, False, None),
+    (0x0813, 'SAMARITAN LETTER RISH', 'Lo', 0, 'R', None, False, None),
+    (0x0814, 'SAMARITAN LETTER SHAN', 'Lo', 0, 'R', None, False, None),
+    (0x0815, 'SAMARITAN LETTER TAAF', 'Lo', 0, 'R', None, False, None),
+    (0x0816, 'SAMARITAN MARK IN', 'Mn', 230, 'NSM', None, False, None),
+    (0x0817, 'SAMARITAN MARK IN-ALAF', 'Mn', 230, 'NSM', None, False, None),
+    (0x0818, 'SAMARITAN MARK OCCLUSION', 'Mn', 230, 'NSM', None, False, None),
+    (0x0819, 'SAMARITAN MARK DAGESH', 'Mn', 230, 'NSM', None, False, None),
+    (0x081A, 'SAMARITAN MODIFIER LETTER EPENTHETIC YUT', 'Lm', 0, 'R', None, False, None),
+    (0x081B, 'SAMARITAN MARK EPENTHETIC YUT', 'Mn', 230, 'NSM', None, False, None),
+    (0x081C, 'SAMARITAN VOWEL SIGN LONG E', 'Mn', 230, 'NSM', None, False, None),
+    (0x081D, 'SAMARITAN VOWEL SIGN E', 'Mn', 230, 'NSM', None, False, None),
+    (0x081E, 'SAMARITAN VOWEL SIGN OVERLONG AA', 'Mn', 230, 'NSM', None, False, None),
+    (0x081F, 'SAMARITAN VOWEL SIGN LONG AA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0820, 'SAMARITAN VOWEL SIGN AA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0821, 'SAMARITAN VOWEL SIGN OVERLONG A', 'Mn', 230, 'NSM', None, False, None),
+    (0x0822, 'SAMARITAN VOWEL SIGN LONG A', 'Mn', 230, 'NSM', None, False, None),
+    (0x0823, 'SAMARITAN VOWEL SIGN A', 'Mn', 230, 'NSM', None, False, None),
+    (0x0824, 'SAMARITAN MODIFIER LETTER SHORT A', 'Lm', 0, 'R', None, False, None),
+    (0x0825, 'SAMARITAN VOWEL SIGN SHORT A', 'Mn', 230, 'NSM', None, False, None),
+    (0x0826, 'SAMARITAN VOWEL SIGN LONG U', 'Mn', 230, 'NSM', None, False, None),
+    (0x0827, 'SAMARITAN VOWEL SIGN U', 'Mn', 230, 'NSM', None, False, None),
+    (0x0828, 'SAMARITAN MODIFIER LETTER I', 'Lm', 0, 'R', None, False, None),
+    (0x0829, 'SAMARITAN VOWEL SIGN LONG I', 'Mn', 230, 'NSM', None, False, None),
+    (0x082A, 'SAMARITAN VOWEL SIGN I', 'Mn', 230, 'NSM', None, False, None),
+    (0x082B, 'SAMARITAN VOWEL SIGN O', 'Mn', 230, 'NSM', None, False, None),
+    (0x082C, 'SAMARITAN VOWEL SIGN SUKUN', 'Mn', 230, 'NSM', None, False, None),
+    (0x082D, 'SAMARITAN MARK NEQUDAA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0830, 'SAMARITAN PUNCTUATION NEQUDAA', 'Po', 0, 'R', None, False, None),
+    (0x0831, 'SAMARITAN PUNCTUATION AFSAAQ', 'Po', 0, 'R', None, False, None),
+    (0x0832, 'SAMARITAN PUNCTUATION ANGED', 'Po', 0, 'R', None, False, None),
+    (0x0833, 'SAMARITAN PUNCTUATION BAU', 'Po', 0, 'R', None, False, None),
+    (0x0834, 'SAMARITAN PUNCTUATION ATMAAU', 'Po', 0, 'R', None, False, None),
+    (0x0835, 'SAMARITAN PUNCTUATION SHIYYAALAA', 'Po', 0, 'R', None, False, None),
+    (0x0836, 'SAMARITAN ABBREVIATION MARK', 'Po', 0, 'R', None, False, None),
+    (0x0837, 'SAMARITAN PUNCTUATION MELODIC QITSA', 'Po', 0, 'R', None, False, None),
+    (0x0838, 'SAMARITAN PUNCTUATION ZIQAA', 'Po', 0, 'R', None, False, None),
+    (0x0839, 'SAMARITAN PUNCTUATION QITSA', 'Po', 0, 'R', None, False, None),
+    (0x083A, 'SAMARITAN PUNCTUATION ZAEF', 'Po', 0, 'R', None, False, None),
+    (0x083B, 'SAMARITAN PUNCTUATION TURU', 'Po', 0, 'R', None, False, None),
+    (0x083C, 'SAMARITAN PUNCTUATION ARKAANU', 'Po', 0, 'R', None, False, None),
+    (0x083D, 'SAMARITAN PUNCTUATION SOF MASHFAAT', 'Po', 0, 'R', None, False, None),
+    (0x083E, 'SAMARITAN PUNCTUATION ANNAAU', 'Po', 0, 'R', None, False, None),
+    (0x0840, 'MANDAIC LETTER HALQA', 'Lo', 0, 'R', None, False, None),
+    (0x0841, 'MANDAIC LETTER AB', 'Lo', 0, 'R', None, False, None),
+    (0x0842, 'MANDAIC LETTER AG', 'Lo', 0, 'R', None, False, None),
+    (0x0843, 'MANDAIC LETTER AD', 'Lo', 0, 'R', None, False, None),
+    (0x0844, 'MANDAIC LETTER AH', 'Lo', 0, 'R', None, False, None),
+    (0x0845, 'MANDAIC LETTER USHENNA', 'Lo', 0, 'R', None, False, None),
+    (0x0846, 'MANDAIC LETTER AZ', 'Lo', 0, 'R', None, False, None),
+    (0x0847, 'MANDAIC LETTER IT', 'Lo', 0, 'R', None, False, None),
+    (0x0848, 'MANDAIC LETTER ATT', 'Lo', 0, 'R', None, False, None),
+    (0x0849, 'MANDAIC LETTER AKSA', 'Lo', 0, 'R', None, False, None),
+    (0x084A, 'MANDAIC LETTER AK', 'Lo', 0, 'R', None, False, None),
+    (0x084B, 'MANDAIC LETTER AL', 'Lo', 0, 'R', None, False, None),
+    (0x084C, 'MANDAIC LETTER AM', 'Lo', 0, 'R', None, False, None),
+    (0x084D, 'MANDAIC LETTER AN', 'Lo', 0, 'R', None, False, None),
+    (0x084E, 'MANDAIC LETTER AS', 'Lo', 0, 'R', None, False, None),
+    (0x084F, 'MANDAIC LETTER IN', 'Lo', 0, 'R', None, False, None),
+    (0x0850, 'MANDAIC LETTER AP', 'Lo', 0, 'R', None, False, None),
+    (0x0851, 'MANDAIC LETTER ASZ', 'Lo', 0, 'R', None, False, None),
+    (0x0852, 'MANDAIC LETTER AQ', 'Lo', 0, 'R', None, False, None),
+    (0x0853, 'MANDAIC LETTER AR', 'Lo', 0, 'R', None, False, None),
+    (0x0854, 'MANDAIC LETTER ASH', 'Lo', 0, 'R', None, False, None),
+    (0x0855, 'MANDAIC LETTER AT', 'Lo', 0, 'R', None, False, None),
+    (0x0856, 'MANDAIC LETTER DUSHENNA', 'Lo', 0, 'R', None, False, None),
+    (0x0857, 'MANDAIC LETTER KAD', 'Lo', 0, 'R', None, False, None),
+    (0x0858, 'MANDAIC LETTER AIN', 'Lo', 0, 'R', None, False, None),
+    (0x0859, 'MANDAIC AFFRICATION MARK', 'Mn', 220, 'NSM', None, False, None),
+    (0x085A, 'MANDAIC VOCALIZATION MARK', 'Mn', 220, 'NSM', None, False, None),
+    (0x085B, 'MANDAIC GEMINATION MARK', 'Mn', 220, 'NSM', None, False, None),
+    (0x085E, 'MANDAIC PUNCTUATION', 'Po', 0, 'R', None, False, None),
+    (0x0860, 'SYRIAC LETTER MALAYALAM NGA', 'Lo', 0, 'AL', None, False, None),
+    (0x0861, 'SYRIAC LETTER MALAYALAM JA', 'Lo', 0, 'AL', None, False, None),
+    (0x0862, 'SYRIAC LETTER MALAYALAM NYA', 'Lo', 0, 'AL', None, False, None),
+    (0x0863, 'SYRIAC LETTER MALAYALAM TTA', 'Lo', 0, 'AL', None, False, None),
+    (0x0864, 'SYRIAC LETTER MALAYALAM NNA', 'Lo', 0, 'AL', None, False, None),
+    (0x0865, 'SYRIAC LETTER MALAYALAM NNNA', 'Lo', 0, 'AL', None, False, None),
+    (0x0866, 'SYRIAC LETTER MALAYALAM BHA', 'Lo', 0, 'AL', None, False, None),
+    (0x0867, 'SYRIAC LETTER MALAYALAM RA', 'Lo', 0, 'AL', None, False, None),
+    (0x0868, 'SYRIAC LETTER MALAYALAM LLA', 'Lo', 0, 'AL', None, False, None),
+    (0x0869, 'SYRIAC LETTER MALAYALAM LLLA', 'Lo', 0, 'AL', None, False, None),
+    (0x086A, 'SYRIAC LETTER MALAYALAM SSA', 'Lo', 0, 'AL', None, False, None),
+    (0x0870, 'ARABIC LETTER ALEF WITH ATTACHED FATHA', 'Lo', 0, 'AL', None, False, None),
+    (0x0871, 'ARABIC LETTER ALEF WITH ATTACHED TOP RIGHT FATHA', 'Lo', 0, 'AL', None, False, None),
+    (0x0872, 'ARABIC LETTER ALEF WITH RIGHT MIDDLE STROKE', 'Lo', 0, 'AL', None, False, None),
+    (0x0873, 'ARABIC LETTER ALEF WITH LEFT MIDDLE STROKE', 'Lo', 0, 'AL', None, False, None),
+    (0x0874, 'ARABIC LETTER ALEF WITH ATTACHED KASRA', 'Lo', 0, 'AL', None, False, None),
+    (0x0875, 'ARABIC LETTER ALEF WITH ATTACHED BOTTOM RIGHT KASRA', 'Lo', 0, 'AL', None, False, None),
+    (0x0876, 'ARABIC LETTER ALEF WITH ATTACHED ROUND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x0877, 'ARABIC LETTER ALEF WITH ATTACHED RIGHT ROUND DOT', 'Lo', 0, 'AL', None, False, None),
+    (0x0878, 'ARABIC LETTER ALEF WITH ATTACHED LEFT ROUND DOT', 'Lo', 0, 'AL', None, False, None),
+    (0x0879, 'ARABIC LETTER ALEF WITH ATTACHED ROUND DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x087A, 'ARABIC LETTER ALEF WITH DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x087B, 'ARABIC LETTER ALEF WITH ATTACHED TOP RIGHT FATHA AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x087C, 'ARABIC LETTER ALEF WITH RIGHT MIDDLE STROKE AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x087D, 'ARABIC LETTER ALEF WITH ATTACHED BOTTOM RIGHT KASRA AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x087E, 'ARABIC LETTER ALEF WITH ATTACHED TOP RIGHT FATHA AND LEFT RING', 'Lo', 0, 'AL', None, False, None),
+    (0x087F, 'ARABIC LETTER ALEF WITH RIGHT MIDDLE STROKE AND LEFT RING', 'Lo', 0, 'AL', None, False, None),
+    (0x0880, 'ARABIC LETTER ALEF WITH ATTACHED BOTTOM RIGHT KASRA AND LEFT RING', 'Lo', 0, 'AL', None, False, None),
+    (0x0881, 'ARABIC LETTER ALEF WITH ATTACHED RIGHT HAMZA', 'Lo', 0, 'AL', None, False, None),
+    (0x0882, 'ARABIC LETTER ALEF WITH ATTACHED LEFT HAMZA', 'Lo', 0, 'AL', None, False, None),
+    (0x0883, 'ARABIC TATWEEL WITH OVERSTRUCK HAMZA', 'Lo', 0, 'AL', None, False, None),
+    (0x0884, 'ARABIC TATWEEL WITH OVERSTRUCK WAW', 'Lo', 0, 'AL', None, False, None),
+    (0x0885, 'ARABIC TATWEEL WITH TWO DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x0886, 'ARABIC LETTER THIN YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x0887, 'ARABIC BASELINE ROUND DOT', 'Lo', 0, 'AL', None, False, None),
+    (0x0888, 'ARABIC RAISED ROUND DOT', 'Sk', 0, 'AL', None, False, None),
+    (0x0889, 'ARABIC LETTER NOON WITH INVERTED SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x088A, 'ARABIC LETTER HAH WITH INVERTED SMALL V BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x088B, 'ARABIC LETTER TAH WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x088C, 'ARABIC LETTER TAH WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x088D, 'ARABIC LETTER KEHEH WITH TWO DOTS VERTICALLY BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x088E, 'ARABIC VERTICAL TAIL', 'Lo', 0, 'AL', None, False, None),
+    (0x0890, 'ARABIC POUND MARK ABOVE', 'Cf', 0, 'AN', None, False, None),
+    (0x0891, 'ARABIC PIASTRE MARK ABOVE', 'Cf', 0, 'AN', None, False, None),
+    (0x0898, 'ARABIC SMALL HIGH WORD AL-JUZ', 'Mn', 230, 'NSM', None, False, None),
+    (0x0899, 'ARABIC SMALL LOW WORD ISHMAAM', 'Mn', 220, 'NSM', None, False, None),
+    (0x089A, 'ARABIC SMALL LOW WORD IMAALA', 'Mn', 220, 'NSM', None, False, None),
+    (0x089B, 'ARABIC SMALL LOW WORD TASHEEL', 'Mn', 220, 'NSM', None, False, None),
+    (0x089C, 'ARABIC MADDA WAAJIB', 'Mn', 230, 'NSM', None, False, None),
+    (0x089D, 'ARABIC SUPERSCRIPT ALEF MOKHASSAS', 'Mn', 230, 'NSM', None, False, None),
+    (0x089E, 'ARABIC DOUBLED MADDA', 'Mn', 230, 'NSM', None, False, None),
+    (0x089F, 'ARABIC HALF MADDA OVER MADDA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08A0, 'ARABIC LETTER BEH WITH SMALL V BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08A1, 'ARABIC LETTER BEH WITH HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A2, 'ARABIC LETTER JEEM WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A3, 'ARABIC LETTER TAH WITH TWO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A4, 'ARABIC LETTER FEH WITH DOT BELOW AND THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A5, 'ARABIC LETTER QAF WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08A6, 'ARABIC LETTER LAM WITH DOUBLE BAR', 'Lo', 0, 'AL', None, False, None),
+    (0x08A7, 'ARABIC LETTER MEEM WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A8, 'ARABIC LETTER YEH WITH TWO DOTS BELOW AND HAMZA ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08A9, 'ARABIC LETTER YEH WITH TWO DOTS BELOW AND DOT ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08AA, 'ARABIC LETTER REH WITH LOOP', 'Lo', 0, 'AL', None, False, None),
+    (0x08AB, 'ARABIC LETTER WAW WITH DOT WITHIN', 'Lo', 0, 'AL', None, False, None),
+    (0x08AC, 'ARABIC LETTER ROHINGYA YEH', 'Lo', 0, 'AL', None, False, None),
+    (0x08AD, 'ARABIC LETTER LOW ALEF', 'Lo', 0, 'AL', None, False, None),
+    (0x08AE, 'ARABIC LETTER DAL WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08AF, 'ARABIC LETTER SAD WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08B0, 'ARABIC LETTER GAF WITH INVERTED STROKE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B1, 'ARABIC LETTER STRAIGHT WAW', 'Lo', 0, 'AL', None, False, None),
+    (0x08B2, 'ARABIC LETTER ZAIN WITH INVERTED V ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B3, 'ARABIC LETTER AIN WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08B4, 'ARABIC LETTER KAF WITH DOT BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08B5, 'ARABIC LETTER QAF WITH DOT BELOW AND NO DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B6, 'ARABIC LETTER BEH WITH SMALL MEEM ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B7, 'ARABIC LETTER PEH WITH SMALL MEEM ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B8, 'ARABIC LETTER TEH WITH SMALL TEH ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08B9, 'ARABIC LETTER REH WITH SMALL NOON ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08BA, 'ARABIC LETTER YEH WITH TWO DOTS BELOW AND SMALL NOON ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08BB, 'ARABIC LETTER AFRICAN FEH', 'Lo', 0, 'AL', None, False, None),
+    (0x08BC, 'ARABIC LETTER AFRICAN QAF', 'Lo', 0, 'AL', None, False, None),
+    (0x08BD, 'ARABIC LETTER AFRICAN NOON', 'Lo', 0, 'AL', None, False, None),
+    (0x08BE, 'ARABIC LETTER PEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x08BF, 'ARABIC LETTER TEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x08C0, 'ARABIC LETTER TTEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x08C1, 'ARABIC LETTER TCHEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x08C2, 'ARABIC LETTER KEHEH WITH SMALL V', 'Lo', 0, 'AL', None, False, None),
+    (0x08C3, 'ARABIC LETTER GHAIN WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08C4, 'ARABIC LETTER AFRICAN QAF WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08C5, 'ARABIC LETTER JEEM WITH THREE DOTS ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08C6, 'ARABIC LETTER JEEM WITH THREE DOTS BELOW', 'Lo', 0, 'AL', None, False, None),
+    (0x08C7, 'ARABIC LETTER LAM WITH SMALL ARABIC LETTER TAH ABOVE', 'Lo', 0, 'AL', None, False, None),
+    (0x08C8, 'ARABIC LETTER GRAF', 'Lo', 0, 'AL', None, False, None),
+    (0x08C9, 'ARABIC SMALL FARSI YEH', 'Lm', 0, 'AL', None, False, None),
+    (0x08CA, 'ARABIC SMALL HIGH FARSI YEH', 'Mn', 230, 'NSM', None, False, None),
+    (0x08CB, 'ARABIC SMALL HIGH YEH BARREE WITH TWO DOTS BELOW', 'Mn', 230, 'NSM', None, False, None),
+    (0x08CC, 'ARABIC SMALL HIGH WORD SAH', 'Mn', 230, 'NSM', None, False, None),
+    (0x08CD, 'ARABIC SMALL HIGH ZAH', 'Mn', 230, 'NSM', None, False, None),
+    (0x08CE, 'ARABIC LARGE ROUND DOT ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08CF, 'ARABIC LARGE ROUND DOT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08D0, 'ARABIC SUKUN BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08D1, 'ARABIC LARGE CIRCLE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08D2, 'ARABIC LARGE ROUND DOT INSIDE CIRCLE BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08D3, 'ARABIC SMALL LOW WAW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08D4, 'ARABIC SMALL HIGH WORD AR-RUB', 'Mn', 230, 'NSM', None, False, None),
+    (0x08D5, 'ARABIC SMALL HIGH SAD', 'Mn', 230, 'NSM', None, False, None),
+    (0x08D6, 'ARABIC SMALL HIGH AIN', 'Mn', 230, 'NSM', None, False, None),
+    (0x08D7, 'ARABIC SMALL HIGH QAF', 'Mn', 230, 'NSM', None, False, None),
+    (0x08D8, 'ARABIC SMALL HIGH NOON WITH KASRA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08D9, 'ARABIC SMALL LOW NOON WITH KASRA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DA, 'ARABIC SMALL HIGH WORD ATH-THALATHA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DB, 'ARABIC SMALL HIGH WORD AS-SAJDA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DC, 'ARABIC SMALL HIGH WORD AN-NISF', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DD, 'ARABIC SMALL HIGH WORD SAKTA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DE, 'ARABIC SMALL HIGH WORD QIF', 'Mn', 230, 'NSM', None, False, None),
+    (0x08DF, 'ARABIC SMALL HIGH WORD WAQFA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E0, 'ARABIC SMALL HIGH FOOTNOTE MARKER', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E1, 'ARABIC SMALL HIGH SIGN SAFHA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E2, 'ARABIC DISPUTED END OF AYAH', 'Cf', 0, 'AN', None, False, None),
+    (0x08E3, 'ARABIC TURNED DAMMA BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08E4, 'ARABIC CURLY FATHA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E5, 'ARABIC CURLY DAMMA', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E6, 'ARABIC CURLY KASRA', 'Mn', 220, 'NSM', None, False, None),
+    (0x08E7, 'ARABIC CURLY FATHATAN', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E8, 'ARABIC CURLY DAMMATAN', 'Mn', 230, 'NSM', None, False, None),
+    (0x08E9, 'ARABIC CURLY KASRATAN', 'Mn', 220, 'NSM', None, False, None),
+    (0x08EA, 'ARABIC TONE ONE DOT ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08EB, 'ARABIC TONE TWO DOTS ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08EC, 'ARABIC TONE LOOP ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08ED, 'ARABIC TONE ONE DOT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08EE, 'ARABIC TONE TWO DOTS BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08EF, 'ARABIC TONE LOOP BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08F0, 'ARABIC OPEN FATHATAN', 'Mn', 27, 'NSM', None, False, None),
+    (0x08F1, 'ARABIC OPEN DAMMATAN', 'Mn', 28, 'NSM', None, False, None),
+    (0x08F2, 'ARABIC OPEN KASRATAN', 'Mn', 29, 'NSM', None, False, None),
+    (0x08F3, 'ARABIC SMALL HIGH WAW', 'Mn', 230, 'NSM', None, False, None),
+    (0x08F4, 'ARABIC FATHA WITH RING', 'Mn', 230, 'NSM', None, False, None),
+    (0x08F5, 'ARABIC FATHA WITH DOT ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08F6, 'ARABIC KASRA WITH DOT BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08F7, 'ARABIC LEFT ARROWHEAD ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08F8, 'ARABIC RIGHT ARROWHEAD ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08F9, 'ARABIC LEFT ARROWHEAD BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08FA, 'ARABIC RIGHT ARROWHEAD BELOW', 'Mn', 220, 'NSM', None, False, None),
+    (0x08FB, 'ARABIC DOUBLE RIGHT ARROWHEAD ABOVE', 'Mn', 230, 'NSM', None, False, None),
+    (0x08FC, 'ARABIC DOUBLE RIGHT ARROWHEAD ABOVE WITH DOT', 'Mn', 230, 'NSM', None, False, None),
+    (0x08FD, 'ARABIC RIGHT ARROWHEAD ABOVE WITH DOT', 'Mn', 230, 'NSM', None, False, None),
+    (0x08FE, 'ARABIC DAMMA WITH DOT', 'Mn', 230, 'NSM', None, False, None),
+    (0x08FF, 'ARABIC MARK SIDEWAYS NOON GHUNNA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0900, 'DEVANAGARI SIGN INVERTED CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0901, 'DEVANAGARI SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0902, 'DEVANAGARI SIGN ANUSVARA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0903, 'DEVANAGARI SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0904, 'DEVANAGARI LETTER SHORT A', 'Lo', 0, 'L', None, False, None),
+    (0x0905, 'DEVANAGARI LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0906, 'DEVANAGARI LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0907, 'DEVANAGARI LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0908, 'DEVANAGARI LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0909, 'DEVANAGARI LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x090A, 'DEVANAGARI LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x090B, 'DEVANAGARI LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x090C, 'DEVANAGARI LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x090D, 'DEVANAGARI LETTER CANDRA E', 'Lo', 0, 'L', None, False, None),
+    (0x090E, 'DEVANAGARI LETTER SHORT E', 'Lo', 0, 'L', None, False, None),
+    (0x090F, 'DEVANAGARI LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0910, 'DEVANAGARI LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0911, 'DEVANAGARI LETTER CANDRA O', 'Lo', 0, 'L', None, False, None),
+    (0x0912, 'DEVANAGARI LETTER SHORT O', 'Lo', 0, 'L', None, False, None),
+    (0x0913, 'DEVANAGARI LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0914, 'DEVANAGARI LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0915, 'DEVANAGARI LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0916, 'DEVANAGARI LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0917, 'DEVANAGARI LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0918, 'DEVANAGARI LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0919, 'DEVANAGARI LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x091A, 'DEVANAGARI LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x091B, 'DEVANAGARI LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x091C, 'DEVANAGARI LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x091D, 'DEVANAGARI LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x091E, 'DEVANAGARI LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x091F, 'DEVANAGARI LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0920, 'DEVANAGARI LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0921, 'DEVANAGARI LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0922, 'DEVANAGARI LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0923, 'DEVANAGARI LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0924, 'DEVANAGARI LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0925, 'DEVANAGARI LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0926, 'DEVANAGARI LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0927, 'DEVANAGARI LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0928, 'DEVANAGARI LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0929, 'DEVANAGARI LETTER NNNA', 'Lo', 0, 'L', None, False, None),
+    (0x092A, 'DEVANAGARI LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x092B, 'DEVANAGARI LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x092C, 'DEVANAGARI LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x092D, 'DEVANAGARI LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x092E, 'DEVANAGARI LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x092F, 'DEVANAGARI LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0930, 'DEVANAGARI LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0931, 'DEVANAGARI LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0932, 'DEVANAGARI LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0933, 'DEVANAGARI LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0934, 'DEVANAGARI LETTER LLLA', 'Lo', 0, 'L', None, False, None),
+    (0x0935, 'DEVANAGARI LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0936, 'DEVANAGARI LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0937, 'DEVANAGARI LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0938, 'DEVANAGARI LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0939, 'DEVANAGARI LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x093A, 'DEVANAGARI VOWEL SIGN OE', 'Mn', 0, 'NSM', None, False, None),
+    (0x093B, 'DEVANAGARI VOWEL SIGN OOE', 'Mc', 0, 'L', None, False, None),
+    (0x093C, 'DEVANAGARI SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x093D, 'DEVANAGARI SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x093E, 'DEVANAGARI VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x093F, 'DEVANAGARI VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x0940, 'DEVANAGARI VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0941, 'DEVANAGARI VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x0942, 'DEVANAGARI VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0943, 'DEVANAGARI VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x0944, 'DEVANAGARI VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x0945, 'DEVANAGARI VOWEL SIGN CANDRA E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0946, 'DEVANAGARI VOWEL SIGN SHORT E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0947, 'DEVANAGARI VOWEL SIGN E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0948, 'DEVANAGARI VOWEL SIGN AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0949, 'DEVANAGARI VOWEL SIGN CANDRA O', 'Mc', 0, 'L', None, False, None),
+    (0x094A, 'DEVANAGARI VOWEL SIGN SHORT O', 'Mc', 0, 'L', None, False, None),
+    (0x094B, 'DEVANAGARI VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x094C, 'DEVANAGARI VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x094D, 'DEVANAGARI SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x094E, 'DEVANAGARI VOWEL SIGN PRISHTHAMATRA E', 'Mc', 0, 'L', None, False, None),
+    (0x094F, 'DEVANAGARI VOWEL SIGN AW', 'Mc', 0, 'L', None, False, None),
+    (0x0950, 'DEVANAGARI OM', 'Lo', 0, 'L', None, False, None),
+    (0x0951, 'DEVANAGARI STRESS SIGN UDATTA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0952, 'DEVANAGARI STRESS SIGN ANUDATTA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0953, 'DEVANAGARI GRAVE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0954, 'DEVANAGARI ACUTE ACCENT', 'Mn', 230, 'NSM', None, False, None),
+    (0x0955, 'DEVANAGARI VOWEL SIGN CANDRA LONG E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0956, 'DEVANAGARI VOWEL SIGN UE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0957, 'DEVANAGARI VOWEL SIGN UUE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0958, 'DEVANAGARI LETTER QA', 'Lo', 0, 'L', None, False, None),
+    (0x0959, 'DEVANAGARI LETTER KHHA', 'Lo', 0, 'L', None, False, None),
+    (0x095A, 'DEVANAGARI LETTER GHHA', 'Lo', 0, 'L', None, False, None),
+    (0x095B, 'DEVANAGARI LETTER ZA', 'Lo', 0, 'L', None, False, None),
+    (0x095C, 'DEVANAGARI LETTER DDDHA', 'Lo', 0, 'L', None, False, None),
+    (0x095D, 'DEVANAGARI LETTER RHA', 'Lo', 0, 'L', None, False, None),
+    (0x095E, 'DEVANAGARI LETTER FA', 'Lo', 0, 'L', None, False, None),
+    (0x095F, 'DEVANAGARI LETTER YYA', 'Lo', 0, 'L', None, False, None),
+    (0x0960, 'DEVANAGARI LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0961, 'DEVANAGARI LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0962, 'DEVANAGARI VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0963, 'DEVANAGARI VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0964, 'DEVANAGARI DANDA', 'Po', 0, 'L', None, False, None),
+    (0x0965, 'DEVANAGARI DOUBLE DANDA', 'Po', 0, 'L', None, False, None),
+    (0x0966, 'DEVANAGARI DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0967, 'DEVANAGARI DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0968, 'DEVANAGARI DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0969, 'DEVANAGARI DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x096A, 'DEVANAGARI DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x096B, 'DEVANAGARI DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x096C, 'DEVANAGARI DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x096D, 'DEVANAGARI DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x096E, 'DEVANAGARI DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x096F, 'DEVANAGARI DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0970, 'DEVANAGARI ABBREVIATION SIGN', 'Po', 0, 'L', None, False, None),
+    (0x0971, 'DEVANAGARI SIGN HIGH SPACING DOT', 'Lm', 0, 'L', None, False, None),
+    (0x0972, 'DEVANAGARI LETTER CANDRA A', 'Lo', 0, 'L', None, False, None),
+    (0x0973, 'DEVANAGARI LETTER OE', 'Lo', 0, 'L', None, False, None),
+    (0x0974, 'DEVANAGARI LETTER OOE', 'Lo', 0, 'L', None, False, None),
+    (0x0975, 'DEVANAGARI LETTER AW', 'Lo', 0, 'L', None, False, None),
+    (0x0976, 'DEVANAGARI LETTER UE', 'Lo', 0, 'L', None, False, None),
+    (0x0977, 'DEVANAGARI LETTER UUE', 'Lo', 0, 'L', None, False, None),
+    (0x0978, 'DEVANAGARI LETTER MARWARI DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0979, 'DEVANAGARI LETTER ZHA', 'Lo', 0, 'L', None, False, None),
+    (0x097A, 'DEVANAGARI LETTER HEAVY YA', 'Lo', 0, 'L', None, False, None),
+    (0x097B, 'DEVANAGARI LETTER GGA', 'Lo', 0, 'L', None, False, None),
+    (0x097C, 'DEVANAGARI LETTER JJA', 'Lo', 0, 'L', None, False, None),
+    (0x097D, 'DEVANAGARI LETTER GLOTTAL STOP', 'Lo', 0, 'L', None, False, None),
+    (0x097E, 'DEVANAGARI LETTER DDDA', 'Lo', 0, 'L', None, False, None),
+    (0x097F, 'DEVANAGARI LETTER BBA', 'Lo', 0, 'L', None, False, None),
+    (0x0980, 'BENGALI ANJI', 'Lo', 0, 'L', None, False, None),
+    (0x0981, 'BENGALI SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0982, 'BENGALI SIGN ANUSVARA', 'Mc', 0, 'L', None, False, None),
+    (0x0983, 'BENGALI SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0985, 'BENGALI LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0986, 'BENGALI LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0987, 'BENGALI LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0988, 'BENGALI LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0989, 'BENGALI LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x098A, 'BENGALI LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x098B, 'BENGALI LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x098C, 'BENGALI LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x098F, 'BENGALI LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0990, 'BENGALI LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0993, 'BENGALI LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0994, 'BENGALI LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0995, 'BENGALI LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0996, 'BENGALI LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0997, 'BENGALI LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0998, 'BENGALI LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0999, 'BENGALI LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x099A, 'BENGALI LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x099B, 'BENGALI LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x099C, 'BENGALI LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x099D, 'BENGALI LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x099E, 'BENGALI LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x099F, 'BENGALI LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x09A0, 'BENGALI LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x09A1, 'BENGALI LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x09A2, 'BENGALI LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x09A3, 'BENGALI LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x09A4, 'BENGALI LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x09A5, 'BENGALI LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x09A6, 'BENGALI LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x09A7, 'BENGALI LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x09A8, 'BENGALI LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x09AA, 'BENGALI LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x09AB, 'BENGALI LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x09AC, 'BENGALI LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x09AD, 'BENGALI LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x09AE, 'BENGALI LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x09AF, 'BENGALI LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x09B0, 'BENGALI LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x09B2, 'BENGALI LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x09B6, 'BENGALI LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x09B7, 'BENGALI LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x09B8, 'BENGALI LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x09B9, 'BENGALI LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x09BC, 'BENGALI SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x09BD, 'BENGALI SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x09BE, 'BENGALI VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x09BF, 'BENGALI VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x09C0, 'BENGALI VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x09C1, 'BENGALI VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x09C2, 'BENGALI VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x09C3, 'BENGALI VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x09C4, 'BENGALI VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x09C7, 'BENGALI VOWEL SIGN E', 'Mc', 0, 'L', None, False, None),
+    (0x09C8, 'BENGALI VOWEL SIGN AI', 'Mc', 0, 'L', None, False, None),
+    (0x09CB, 'BENGALI VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x09CC, 'BENGALI VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x09CD, 'BENGALI SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x09CE, 'BENGALI LETTER KHANDA TA', 'Lo', 0, 'L', None, False, None),
+    (0x09D7, 'BENGALI AU LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x09DC, 'BENGALI LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x09DD, 'BENGALI LETTER RHA', 'Lo', 0, 'L', None, False, None),
+    (0x09DF, 'BENGALI LETTER YYA', 'Lo', 0, 'L', None, False, None),
+    (0x09E0, 'BENGALI LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x09E1, 'BENGALI LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x09E2, 'BENGALI VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x09E3, 'BENGALI VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x09E6, 'BENGALI DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x09E7, 'BENGALI DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x09E8, 'BENGALI DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x09E9, 'BENGALI DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x09EA, 'BENGALI DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x09EB, 'BENGALI DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x09EC, 'BENGALI DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x09ED, 'BENGALI DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x09EE, 'BENGALI DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x09EF, 'BENGALI DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x09F0, 'BENGALI LETTER RA WITH MIDDLE DIAGONAL', 'Lo', 0, 'L', None, False, None),
+    (0x09F1, 'BENGALI LETTER RA WITH LOWER DIAGONAL', 'Lo', 0, 'L', None, False, None),
+    (0x09F2, 'BENGALI RUPEE MARK', 'Sc', 0, 'ET', None, False, None),
+    (0x09F3, 'BENGALI RUPEE SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x09F4, 'BENGALI CURRENCY NUMERATOR ONE', 'No', 0, 'L', None, False, None),
+    (0x09F5, 'BENGALI CURRENCY NUMERATOR TWO', 'No', 0, 'L', None, False, None),
+    (0x09F6, 'BENGALI CURRENCY NUMERATOR THREE', 'No', 0, 'L', None, False, None),
+    (0x09F7, 'BENGALI CURRENCY NUMERATOR FOUR', 'No', 0, 'L', None, False, None),
+    (0x09F8, 'BENGALI CURRENCY NUMERATOR ONE LESS THAN THE DENOMINATOR', 'No', 0, 'L', None, False, None),
+    (0x09F9, 'BENGALI CURRENCY DENOMINATOR SIXTEEN', 'No', 0, 'L', None, False, None),
+    (0x09FA, 'BENGALI ISSHAR', 'So', 0, 'L', None, False, None),
+    (0x09FB, 'BENGALI GANDA MARK', 'Sc', 0, 'ET', None, False, None),
+    (0x09FC, 'BENGALI LETTER VEDIC ANUSVARA', 'Lo', 0, 'L', None, False, None),
+    (0x09FD, 'BENGALI ABBREVIATION SIGN', 'Po', 0, 'L', None, False, None),
+    (0x09FE, 'BENGALI SANDHI MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x0A01, 'GURMUKHI SIGN ADAK BINDI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A02, 'GURMUKHI SIGN BINDI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A03, 'GURMUKHI SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0A05, 'GURMUKHI LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0A06, 'GURMUKHI LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0A07, 'GURMUKHI LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0A08, 'GURMUKHI LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0A09, 'GURMUKHI LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0A0A, 'GURMUKHI LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0A0F, 'GURMUKHI LETTER EE', 'Lo', 0, 'L', None, False, None),
+    (0x0A10, 'GURMUKHI LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0A13, 'GURMUKHI LETTER OO', 'Lo', 0, 'L', None, False, None),
+    (0x0A14, 'GURMUKHI LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0A15, 'GURMUKHI LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0A16, 'GURMUKHI LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A17, 'GURMUKHI LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0A18, 'GURMUKHI LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A19, 'GURMUKHI LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1A, 'GURMUKHI LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1B, 'GURMUKHI LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1C, 'GURMUKHI LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1D, 'GURMUKHI LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1E, 'GURMUKHI LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0A1F, 'GURMUKHI LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0A20, 'GURMUKHI LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A21, 'GURMUKHI LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0A22, 'GURMUKHI LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A23, 'GURMUKHI LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0A24, 'GURMUKHI LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0A25, 'GURMUKHI LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0A26, 'GURMUKHI LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0A27, 'GURMUKHI LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A28, 'GURMUKHI LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2A, 'GURMUKHI LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2B, 'GURMUKHI LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2C, 'GURMUKHI LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2D, 'GURMUKHI LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2E, 'GURMUKHI LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0A2F, 'GURMUKHI LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0A30, 'GURMUKHI LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0A32, 'GURMUKHI LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0A33, 'GURMUKHI LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0A35, 'GURMUKHI LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0A36, 'GURMUKHI LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A38, 'GURMUKHI LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0A39, 'GURMUKHI LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0A3C, 'GURMUKHI SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x0A3E, 'GURMUKHI VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0A3F, 'GURMUKHI VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x0A40, 'GURMUKHI VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0A41, 'GURMUKHI VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A42, 'GURMUKHI VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A47, 'GURMUKHI VOWEL SIGN EE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A48, 'GURMUKHI VOWEL SIGN AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A4B, 'GURMUKHI VOWEL SIGN OO', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A4C, 'GURMUKHI VOWEL SIGN AU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A4D, 'GURMUKHI SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0A51, 'GURMUKHI SIGN UDAAT', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A59, 'GURMUKHI LETTER KHHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A5A, 'GURMUKHI LETTER GHHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A5B, 'GURMUKHI LETTER ZA', 'Lo', 0, 'L', None, False, None),
+    (0x0A5C, 'GURMUKHI LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0A5E, 'GURMUKHI LETTER FA', 'Lo', 0, 'L', None, False, None),
+    (0x0A66, 'GURMUKHI DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0A67, 'GURMUKHI DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0A68, 'GURMUKHI DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0A69, 'GURMUKHI DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0A6A, 'GURMUKHI DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0A6B, 'GURMUKHI DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0A6C, 'GURMUKHI DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0A6D, 'GURMUKHI DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0A6E, 'GURMUKHI DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0A6F, 'GURMUKHI DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0A70, 'GURMUKHI TIPPI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A71, 'GURMUKHI ADDAK', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A72, 'GURMUKHI IRI', 'Lo', 0, 'L', None, False, None),
+    (0x0A73, 'GURMUKHI URA', 'Lo', 0, 'L', None, False, None),
+    (0x0A74, 'GURMUKHI EK ONKAR', 'Lo', 0, 'L', None, False, None),
+    (0x0A75, 'GURMUKHI SIGN YAKASH', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A76, 'GURMUKHI ABBREVIATION SIGN', 'Po', 0, 'L', None, False, None),
+    (0x0A81, 'GUJARATI SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A82, 'GUJARATI SIGN ANUSVARA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0A83, 'GUJARATI SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0A85, 'GUJARATI LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0A86, 'GUJARATI LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0A87, 'GUJARATI LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0A88, 'GUJARATI LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0A89, 'GUJARATI LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0A8A, 'GUJARATI LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0A8B, 'GUJARATI LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x0A8C, 'GUJARATI LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x0A8D, 'GUJARATI VOWEL CANDRA E', 'Lo', 0, 'L', None, False, None),
+    (0x0A8F, 'GUJARATI LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0A90, 'GUJARATI LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0A91, 'GUJARATI VOWEL CANDRA O', 'Lo', 0, 'L', None, False, None),
+    (0x0A93, 'GUJARATI LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0A94, 'GUJARATI LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0A95, 'GUJARATI LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0A96, 'GUJARATI LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A97, 'GUJARATI LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0A98, 'GUJARATI LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A99, 'GUJARATI LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9A, 'GUJARATI LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9B, 'GUJARATI LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9C, 'GUJARATI LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9D, 'GUJARATI LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9E, 'GUJARATI LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0A9F, 'GUJARATI LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA0, 'GUJARATI LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA1, 'GUJARATI LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA2, 'GUJARATI LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA3, 'GUJARATI LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA4, 'GUJARATI LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA5, 'GUJARATI LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA6, 'GUJARATI LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA7, 'GUJARATI LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AA8, 'GUJARATI LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAA, 'GUJARATI LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAB, 'GUJARATI LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAC, 'GUJARATI LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAD, 'GUJARATI LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAE, 'GUJARATI LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0AAF, 'GUJARATI LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB0, 'GUJARATI LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB2, 'GUJARATI LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB3, 'GUJARATI LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB5, 'GUJARATI LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB6, 'GUJARATI LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB7, 'GUJARATI LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB8, 'GUJARATI LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0AB9, 'GUJARATI LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0ABC, 'GUJARATI SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x0ABD, 'GUJARATI SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x0ABE, 'GUJARATI VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0ABF, 'GUJARATI VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x0AC0, 'GUJARATI VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0AC1, 'GUJARATI VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC2, 'GUJARATI VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC3, 'GUJARATI VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC4, 'GUJARATI VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC5, 'GUJARATI VOWEL SIGN CANDRA E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC7, 'GUJARATI VOWEL SIGN E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC8, 'GUJARATI VOWEL SIGN AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AC9, 'GUJARATI VOWEL SIGN CANDRA O', 'Mc', 0, 'L', None, False, None),
+    (0x0ACB, 'GUJARATI VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x0ACC, 'GUJARATI VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x0ACD, 'GUJARATI SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0AD0, 'GUJARATI OM', 'Lo', 0, 'L', None, False, None),
+    (0x0AE0, 'GUJARATI LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0AE1, 'GUJARATI LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0AE2, 'GUJARATI VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AE3, 'GUJARATI VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AE6, 'GUJARATI DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0AE7, 'GUJARATI DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0AE8, 'GUJARATI DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0AE9, 'GUJARATI DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0AEA, 'GUJARATI DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0AEB, 'GUJARATI DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0AEC, 'GUJARATI DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0AED, 'GUJARATI DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0AEE, 'GUJARATI DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0AEF, 'GUJARATI DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0AF0, 'GUJARATI ABBREVIATION SIGN', 'Po', 0, 'L', None, False, None),
+    (0x0AF1, 'GUJARATI RUPEE SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x0AF9, 'GUJARATI LETTER ZHA', 'Lo', 0, 'L', None, False, None),
+    (0x0AFA, 'GUJARATI SIGN SUKUN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AFB, 'GUJARATI SIGN SHADDA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AFC, 'GUJARATI SIGN MADDAH', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AFD, 'GUJARATI SIGN THREE-DOT NUKTA ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AFE, 'GUJARATI SIGN CIRCLE NUKTA ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0AFF, 'GUJARATI SIGN TWO-CIRCLE NUKTA ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B01, 'ORIYA SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B02, 'ORIYA SIGN ANUSVARA', 'Mc', 0, 'L', None, False, None),
+    (0x0B03, 'ORIYA SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0B05, 'ORIYA LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0B06, 'ORIYA LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0B07, 'ORIYA LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0B08, 'ORIYA LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0B09, 'ORIYA LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0B0A, 'ORIYA LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0B0B, 'ORIYA LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x0B0C, 'ORIYA LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x0B0F, 'ORIYA LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0B10, 'ORIYA LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0B13, 'ORIYA LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0B14, 'ORIYA LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0B15, 'ORIYA LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0B16, 'ORIYA LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B17, 'ORIYA LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0B18, 'ORIYA LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B19, 'ORIYA LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1A, 'ORIYA LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1B, 'ORIYA LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1C, 'ORIYA LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1D, 'ORIYA LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1E, 'ORIYA LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0B1F, 'ORIYA LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0B20, 'ORIYA LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B21, 'ORIYA LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0B22, 'ORIYA LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B23, 'ORIYA LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0B24, 'ORIYA LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0B25, 'ORIYA LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0B26, 'ORIYA LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0B27, 'ORIYA LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B28, 'ORIYA LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2A, 'ORIYA LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2B, 'ORIYA LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2C, 'ORIYA LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2D, 'ORIYA LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2E, 'ORIYA LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0B2F, 'ORIYA LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0B30, 'ORIYA LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0B32, 'ORIYA LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0B33, 'ORIYA LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0B35, 'ORIYA LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0B36, 'ORIYA LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B37, 'ORIYA LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0B38, 'ORIYA LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0B39, 'ORIYA LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0B3C, 'ORIYA SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x0B3D, 'ORIYA SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B3E, 'ORIYA VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0B3F, 'ORIYA VOWEL SIGN I', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B40, 'ORIYA VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0B41, 'ORIYA VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B42, 'ORIYA VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B43, 'ORIYA VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B44, 'ORIYA VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B47, 'ORIYA VOWEL SIGN E', 'Mc', 0, 'L', None, False, None),
+    (0x0B48, 'ORIYA VOWEL SIGN AI', 'Mc', 0, 'L', None, False, None),
+    (0x0B4B, 'ORIYA VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x0B4C, 'ORIYA VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x0B4D, 'ORIYA SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0B55, 'ORIYA SIGN OVERLINE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B56, 'ORIYA AI LENGTH MARK', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B57, 'ORIYA AU LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x0B5C, 'ORIYA LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0B5D, 'ORIYA LETTER RHA', 'Lo', 0, 'L', None, False, None),
+    (0x0B5F, 'ORIYA LETTER YYA', 'Lo', 0, 'L', None, False, None),
+    (0x0B60, 'ORIYA LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0B61, 'ORIYA LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0B62, 'ORIYA VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B63, 'ORIYA VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B66, 'ORIYA DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0B67, 'ORIYA DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0B68, 'ORIYA DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0B69, 'ORIYA DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0B6A, 'ORIYA DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0B6B, 'ORIYA DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0B6C, 'ORIYA DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0B6D, 'ORIYA DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0B6E, 'ORIYA DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0B6F, 'ORIYA DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0B70, 'ORIYA ISSHAR', 'So', 0, 'L', None, False, None),
+    (0x0B71, 'ORIYA LETTER WA', 'Lo', 0, 'L', None, False, None),
+    (0x0B72, 'ORIYA FRACTION ONE QUARTER', 'No', 0, 'L', None, False, None),
+    (0x0B73, 'ORIYA FRACTION ONE HALF', 'No', 0, 'L', None, False, None),
+    (0x0B74, 'ORIYA FRACTION THREE QUARTERS', 'No', 0, 'L', None, False, None),
+    (0x0B75, 'ORIYA FRACTION ONE SIXTEENTH', 'No', 0, 'L', None, False, None),
+    (0x0B76, 'ORIYA FRACTION ONE EIGHTH', 'No', 0, 'L', None, False, None),
+    (0x0B77, 'ORIYA FRACTION THREE SIXTEENTHS', 'No', 0, 'L', None, False, None),
+    (0x0B82, 'TAMIL SIGN ANUSVARA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0B83, 'TAMIL SIGN VISARGA', 'Lo', 0, 'L', None, False, None),
+    (0x0B85, 'TAMIL LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0B86, 'TAMIL LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0B87, 'TAMIL LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0B88, 'TAMIL LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0B89, 'TAMIL LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0B8A, 'TAMIL LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0B8E, 'TAMIL LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0B8F, 'TAMIL LETTER EE', 'Lo', 0, 'L', None, False, None),
+    (0x0B90, 'TAMIL LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0B92, 'TAMIL LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0B93, 'TAMIL LETTER OO', 'Lo', 0, 'L', None, False, None),
+    (0x0B94, 'TAMIL LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0B95, 'TAMIL LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0B99, 'TAMIL LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0B9A, 'TAMIL LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0B9C, 'TAMIL LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0B9E, 'TAMIL LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0B9F, 'TAMIL LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0BA3, 'TAMIL LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0BA4, 'TAMIL LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0BA8, 'TAMIL LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0BA9, 'TAMIL LETTER NNNA', 'Lo', 0, 'L', None, False, None),
+    (0x0BAA, 'TAMIL LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0BAE, 'TAMIL LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0BAF, 'TAMIL LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB0, 'TAMIL LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB1, 'TAMIL LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB2, 'TAMIL LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB3, 'TAMIL LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB4, 'TAMIL LETTER LLLA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB5, 'TAMIL LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB6, 'TAMIL LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB7, 'TAMIL LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB8, 'TAMIL LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0BB9, 'TAMIL LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0BBE, 'TAMIL VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0BBF, 'TAMIL VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x0BC0, 'TAMIL VOWEL SIGN II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0BC1, 'TAMIL VOWEL SIGN U', 'Mc', 0, 'L', None, False, None),
+    (0x0BC2, 'TAMIL VOWEL SIGN UU', 'Mc', 0, 'L', None, False, None),
+    (0x0BC6, 'TAMIL VOWEL SIGN E', 'Mc', 0, 'L', None, False, None),
+    (0x0BC7, 'TAMIL VOWEL SIGN EE', 'Mc', 0, 'L', None, False, None),
+    (0x0BC8, 'TAMIL VOWEL SIGN AI', 'Mc', 0, 'L', None, False, None),
+    (0x0BCA, 'TAMIL VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x0BCB, 'TAMIL VOWEL SIGN OO', 'Mc', 0, 'L', None, False, None),
+    (0x0BCC, 'TAMIL VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x0BCD, 'TAMIL SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0BD0, 'TAMIL OM', 'Lo', 0, 'L', None, False, None),
+    (0x0BD7, 'TAMIL AU LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x0BE6, 'TAMIL DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0BE7, 'TAMIL DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0BE8, 'TAMIL DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0BE9, 'TAMIL DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0BEA, 'TAMIL DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0BEB, 'TAMIL DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0BEC, 'TAMIL DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0BED, 'TAMIL DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0BEE, 'TAMIL DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0BEF, 'TAMIL DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0BF0, 'TAMIL NUMBER TEN', 'No', 0, 'L', None, False, None),
+    (0x0BF1, 'TAMIL NUMBER ONE HUNDRED', 'No', 0, 'L', None, False, None),
+    (0x0BF2, 'TAMIL NUMBER ONE THOUSAND', 'No', 0, 'L', None, False, None),
+    (0x0BF3, 'TAMIL DAY SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF4, 'TAMIL MONTH SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF5, 'TAMIL YEAR SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF6, 'TAMIL DEBIT SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF7, 'TAMIL CREDIT SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF8, 'TAMIL AS ABOVE SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0BF9, 'TAMIL RUPEE SIGN', 'Sc', 0, 'ET', None, False, None),
+    (0x0BFA, 'TAMIL NUMBER SIGN', 'So', 0, 'ON', None, False, None),
+    (0x0C00, 'TELUGU SIGN COMBINING CANDRABINDU ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C01, 'TELUGU SIGN CANDRABINDU', 'Mc', 0, 'L', None, False, None),
+    (0x0C02, 'TELUGU SIGN ANUSVARA', 'Mc', 0, 'L', None, False, None),
+    (0x0C03, 'TELUGU SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0C04, 'TELUGU SIGN COMBINING ANUSVARA ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C05, 'TELUGU LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0C06, 'TELUGU LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0C07, 'TELUGU LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0C08, 'TELUGU LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0C09, 'TELUGU LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0C0A, 'TELUGU LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0C0B, 'TELUGU LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x0C0C, 'TELUGU LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x0C0E, 'TELUGU LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0C0F, 'TELUGU LETTER EE', 'Lo', 0, 'L', None, False, None),
+    (0x0C10, 'TELUGU LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0C12, 'TELUGU LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0C13, 'TELUGU LETTER OO', 'Lo', 0, 'L', None, False, None),
+    (0x0C14, 'TELUGU LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0C15, 'TELUGU LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0C16, 'TELUGU LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C17, 'TELUGU LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0C18, 'TELUGU LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C19, 'TELUGU LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1A, 'TELUGU LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1B, 'TELUGU LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1C, 'TELUGU LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1D, 'TELUGU LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1E, 'TELUGU LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0C1F, 'TELUGU LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0C20, 'TELUGU LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C21, 'TELUGU LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0C22, 'TELUGU LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C23, 'TELUGU LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0C24, 'TELUGU LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0C25, 'TELUGU LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0C26, 'TELUGU LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0C27, 'TELUGU LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C28, 'TELUGU LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2A, 'TELUGU LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2B, 'TELUGU LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2C, 'TELUGU LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2D, 'TELUGU LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2E, 'TELUGU LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0C2F, 'TELUGU LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0C30, 'TELUGU LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0C31, 'TELUGU LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0C32, 'TELUGU LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0C33, 'TELUGU LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0C34, 'TELUGU LETTER LLLA', 'Lo', 0, 'L', None, False, None),
+    (0x0C35, 'TELUGU LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0C36, 'TELUGU LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C37, 'TELUGU LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0C38, 'TELUGU LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0C39, 'TELUGU LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0C3C, 'TELUGU SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x0C3D, 'TELUGU SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C3E, 'TELUGU VOWEL SIGN AA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C3F, 'TELUGU VOWEL SIGN I', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C40, 'TELUGU VOWEL SIGN II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C41, 'TELUGU VOWEL SIGN U', 'Mc', 0, 'L', None, False, None),
+    (0x0C42, 'TELUGU VOWEL SIGN UU', 'Mc', 0, 'L', None, False, None),
+    (0x0C43, 'TELUGU VOWEL SIGN VOCALIC R', 'Mc', 0, 'L', None, False, None),
+    (0x0C44, 'TELUGU VOWEL SIGN VOCALIC RR', 'Mc', 0, 'L', None, False, None),
+    (0x0C46, 'TELUGU VOWEL SIGN E', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C47, 'TELUGU VOWEL SIGN EE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C48, 'TELUGU VOWEL SIGN AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C4A, 'TELUGU VOWEL SIGN O', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C4B, 'TELUGU VOWEL SIGN OO', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C4C, 'TELUGU VOWEL SIGN AU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C4D, 'TELUGU SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0C55, 'TELUGU LENGTH MARK', 'Mn', 84, 'NSM', None, False, None),
+    (0x0C56, 'TELUGU AI LENGTH MARK', 'Mn', 91, 'NSM', None, False, None),
+    (0x0C58, 'TELUGU LETTER TSA', 'Lo', 0, 'L', None, False, None),
+    (0x0C59, 'TELUGU LETTER DZA', 'Lo', 0, 'L', None, False, None),
+    (0x0C5A, 'TELUGU LETTER RRRA', 'Lo', 0, 'L', None, False, None),
+    (0x0C5D, 'TELUGU LETTER NAKAARA POLLU', 'Lo', 0, 'L', None, False, None),
+    (0x0C60, 'TELUGU LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0C61, 'TELUGU LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0C62, 'TELUGU VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C63, 'TELUGU VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C66, 'TELUGU DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0C67, 'TELUGU DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0C68, 'TELUGU DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0C69, 'TELUGU DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0C6A, 'TELUGU DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0C6B, 'TELUGU DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0C6C, 'TELUGU DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0C6D, 'TELUGU DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0C6E, 'TELUGU DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0C6F, 'TELUGU DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0C77, 'TELUGU SIGN SIDDHAM', 'Po', 0, 'L', None, False, None),
+    (0x0C78, 'TELUGU FRACTION DIGIT ZERO FOR ODD POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C79, 'TELUGU FRACTION DIGIT ONE FOR ODD POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7A, 'TELUGU FRACTION DIGIT TWO FOR ODD POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7B, 'TELUGU FRACTION DIGIT THREE FOR ODD POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7C, 'TELUGU FRACTION DIGIT ONE FOR EVEN POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7D, 'TELUGU FRACTION DIGIT TWO FOR EVEN POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7E, 'TELUGU FRACTION DIGIT THREE FOR EVEN POWERS OF FOUR', 'No', 0, 'ON', None, False, None),
+    (0x0C7F, 'TELUGU SIGN TUUMU', 'So', 0, 'L', None, False, None),
+    (0x0C80, 'KANNADA SIGN SPACING CANDRABINDU', 'Lo', 0, 'L', None, False, None),
+    (0x0C81, 'KANNADA SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0C82, 'KANNADA SIGN ANUSVARA', 'Mc', 0, 'L', None, False, None),
+    (0x0C83, 'KANNADA SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0C84, 'KANNADA SIGN SIDDHAM', 'Po', 0, 'L', None, False, None),
+    (0x0C85, 'KANNADA LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0C86, 'KANNADA LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0C87, 'KANNADA LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0C88, 'KANNADA LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0C89, 'KANNADA LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0C8A, 'KANNADA LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0C8B, 'KANNADA LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x0C8C, 'KANNADA LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x0C8E, 'KANNADA LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0C8F, 'KANNADA LETTER EE', 'Lo', 0, 'L', None, False, None),
+    (0x0C90, 'KANNADA LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0C92, 'KANNADA LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0C93, 'KANNADA LETTER OO', 'Lo', 0, 'L', None, False, None),
+    (0x0C94, 'KANNADA LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0C95, 'KANNADA LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0C96, 'KANNADA LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C97, 'KANNADA LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0C98, 'KANNADA LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C99, 'KANNADA LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9A, 'KANNADA LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9B, 'KANNADA LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9C, 'KANNADA LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9D, 'KANNADA LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9E, 'KANNADA LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0C9F, 'KANNADA LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA0, 'KANNADA LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA1, 'KANNADA LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA2, 'KANNADA LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA3, 'KANNADA LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA4, 'KANNADA LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA5, 'KANNADA LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA6, 'KANNADA LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA7, 'KANNADA LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CA8, 'KANNADA LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAA, 'KANNADA LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAB, 'KANNADA LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAC, 'KANNADA LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAD, 'KANNADA LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAE, 'KANNADA LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0CAF, 'KANNADA LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB0, 'KANNADA LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB1, 'KANNADA LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB2, 'KANNADA LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB3, 'KANNADA LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB5, 'KANNADA LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB6, 'KANNADA LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB7, 'KANNADA LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB8, 'KANNADA LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0CB9, 'KANNADA LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0CBC, 'KANNADA SIGN NUKTA', 'Mn', 7, 'NSM', None, False, None),
+    (0x0CBD, 'KANNADA SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x0CBE, 'KANNADA VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0CBF, 'KANNADA VOWEL SIGN I', 'Mn', 0, 'L', None, False, None),
+    (0x0CC0, 'KANNADA VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0CC1, 'KANNADA VOWEL SIGN U', 'Mc', 0, 'L', None, False, None),
+    (0x0CC2, 'KANNADA VOWEL SIGN UU', 'Mc', 0, 'L', None, False, None),
+    (0x0CC3, 'KANNADA VOWEL SIGN VOCALIC R', 'Mc', 0, 'L', None, False, None),
+    (0x0CC4, 'KANNADA VOWEL SIGN VOCALIC RR', 'Mc', 0, 'L', None, False, None),
+    (0x0CC6, 'KANNADA VOWEL SIGN E', 'Mn', 0, 'L', None, False, None),
+    (0x0CC7, 'KANNADA VOWEL SIGN EE', 'Mc', 0, 'L', None, False, None),
+    (0x0CC8, 'KANNADA VOWEL SIGN AI', 'Mc', 0, 'L', None, False, None),
+    (0x0CCA, 'KANNADA VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x0CCB, 'KANNADA VOWEL SIGN OO', 'Mc', 0, 'L', None, False, None),
+    (0x0CCC, 'KANNADA VOWEL SIGN AU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0CCD, 'KANNADA SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0CD5, 'KANNADA LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x0CD6, 'KANNADA AI LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x0CDD, 'KANNADA LETTER NAKAARA POLLU', 'Lo', 0, 'L', None, False, None),
+    (0x0CDE, 'KANNADA LETTER FA', 'Lo', 0, 'L', None, False, None),
+    (0x0CE0, 'KANNADA LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0CE1, 'KANNADA LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0CE2, 'KANNADA VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0CE3, 'KANNADA VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0CE6, 'KANNADA DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0CE7, 'KANNADA DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0CE8, 'KANNADA DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0CE9, 'KANNADA DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0CEA, 'KANNADA DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0CEB, 'KANNADA DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0CEC, 'KANNADA DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0CED, 'KANNADA DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0CEE, 'KANNADA DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0CEF, 'KANNADA DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0CF1, 'KANNADA SIGN JIHVAMULIYA', 'Lo', 0, 'L', None, False, None),
+    (0x0CF2, 'KANNADA SIGN UPADHMANIYA', 'Lo', 0, 'L', None, False, None),
+    (0x0D00, 'MALAYALAM SIGN COMBINING ANUSVARA ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D01, 'MALAYALAM SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D02, 'MALAYALAM SIGN ANUSVARA', 'Mc', 0, 'L', None, False, None),
+    (0x0D03, 'MALAYALAM SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x0D04, 'MALAYALAM LETTER VEDIC ANUSVARA', 'Lo', 0, 'L', None, False, None),
+    (0x0D05, 'MALAYALAM LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0D06, 'MALAYALAM LETTER AA', 'Lo', 0, 'L', None, False, None),
+    (0x0D07, 'MALAYALAM LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x0D08, 'MALAYALAM LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x0D09, 'MALAYALAM LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x0D0A, 'MALAYALAM LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x0D0B, 'MALAYALAM LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x0D0C, 'MALAYALAM LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x0D0E, 'MALAYALAM LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x0D0F, 'MALAYALAM LETTER EE', 'Lo', 0, 'L', None, False, None),
+    (0x0D10, 'MALAYALAM LETTER AI', 'Lo', 0, 'L', None, False, None),
+    (0x0D12, 'MALAYALAM LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0D13, 'MALAYALAM LETTER OO', 'Lo', 0, 'L', None, False, None),
+    (0x0D14, 'MALAYALAM LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x0D15, 'MALAYALAM LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0D16, 'MALAYALAM LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D17, 'MALAYALAM LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0D18, 'MALAYALAM LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D19, 'MALAYALAM LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1A, 'MALAYALAM LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1B, 'MALAYALAM LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1C, 'MALAYALAM LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1D, 'MALAYALAM LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1E, 'MALAYALAM LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0D1F, 'MALAYALAM LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0D20, 'MALAYALAM LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D21, 'MALAYALAM LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0D22, 'MALAYALAM LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D23, 'MALAYALAM LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D24, 'MALAYALAM LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0D25, 'MALAYALAM LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0D26, 'MALAYALAM LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0D27, 'MALAYALAM LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D28, 'MALAYALAM LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0D29, 'MALAYALAM LETTER NNNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2A, 'MALAYALAM LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2B, 'MALAYALAM LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2C, 'MALAYALAM LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2D, 'MALAYALAM LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2E, 'MALAYALAM LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0D2F, 'MALAYALAM LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0D30, 'MALAYALAM LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0D31, 'MALAYALAM LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0D32, 'MALAYALAM LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0D33, 'MALAYALAM LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0D34, 'MALAYALAM LETTER LLLA', 'Lo', 0, 'L', None, False, None),
+    (0x0D35, 'MALAYALAM LETTER VA', 'Lo', 0, 'L', None, False, None),
+    (0x0D36, 'MALAYALAM LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D37, 'MALAYALAM LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0D38, 'MALAYALAM LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0D39, 'MALAYALAM LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0D3A, 'MALAYALAM LETTER TTTA', 'Lo', 0, 'L', None, False, None),
+    (0x0D3B, 'MALAYALAM SIGN VERTICAL BAR VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0D3C, 'MALAYALAM SIGN CIRCULAR VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0D3D, 'MALAYALAM SIGN AVAGRAHA', 'Lo', 0, 'L', None, False, None),
+    (0x0D3E, 'MALAYALAM VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x0D3F, 'MALAYALAM VOWEL SIGN I', 'Mc', 0, 'L', None, False, None),
+    (0x0D40, 'MALAYALAM VOWEL SIGN II', 'Mc', 0, 'L', None, False, None),
+    (0x0D41, 'MALAYALAM VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D42, 'MALAYALAM VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D43, 'MALAYALAM VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D44, 'MALAYALAM VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D46, 'MALAYALAM VOWEL SIGN E', 'Mc', 0, 'L', None, False, None),
+    (0x0D47, 'MALAYALAM VOWEL SIGN EE', 'Mc', 0, 'L', None, False, None),
+    (0x0D48, 'MALAYALAM VOWEL SIGN AI', 'Mc', 0, 'L', None, False, None),
+    (0x0D4A, 'MALAYALAM VOWEL SIGN O', 'Mc', 0, 'L', None, False, None),
+    (0x0D4B, 'MALAYALAM VOWEL SIGN OO', 'Mc', 0, 'L', None, False, None),
+    (0x0D4C, 'MALAYALAM VOWEL SIGN AU', 'Mc', 0, 'L', None, False, None),
+    (0x0D4D, 'MALAYALAM SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0D4E, 'MALAYALAM LETTER DOT REPH', 'Lo', 0, 'L', None, False, None),
+    (0x0D4F, 'MALAYALAM SIGN PARA', 'So', 0, 'L', None, False, None),
+    (0x0D54, 'MALAYALAM LETTER CHILLU M', 'Lo', 0, 'L', None, False, None),
+    (0x0D55, 'MALAYALAM LETTER CHILLU Y', 'Lo', 0, 'L', None, False, None),
+    (0x0D56, 'MALAYALAM LETTER CHILLU LLL', 'Lo', 0, 'L', None, False, None),
+    (0x0D57, 'MALAYALAM AU LENGTH MARK', 'Mc', 0, 'L', None, False, None),
+    (0x0D58, 'MALAYALAM FRACTION ONE ONE-HUNDRED-AND-SIXTIETH', 'No', 0, 'L', None, False, None),
+    (0x0D59, 'MALAYALAM FRACTION ONE FORTIETH', 'No', 0, 'L', None, False, None),
+    (0x0D5A, 'MALAYALAM FRACTION THREE EIGHTIETHS', 'No', 0, 'L', None, False, None),
+    (0x0D5B, 'MALAYALAM FRACTION ONE TWENTIETH', 'No', 0, 'L', None, False, None),
+    (0x0D5C, 'MALAYALAM FRACTION ONE TENTH', 'No', 0, 'L', None, False, None),
+    (0x0D5D, 'MALAYALAM FRACTION THREE TWENTIETHS', 'No', 0, 'L', None, False, None),
+    (0x0D5E, 'MALAYALAM FRACTION ONE FIFTH', 'No', 0, 'L', None, False, None),
+    (0x0D5F, 'MALAYALAM LETTER ARCHAIC II', 'Lo', 0, 'L', None, False, None),
+    (0x0D60, 'MALAYALAM LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x0D61, 'MALAYALAM LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x0D62, 'MALAYALAM VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D63, 'MALAYALAM VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D66, 'MALAYALAM DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0D67, 'MALAYALAM DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0D68, 'MALAYALAM DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0D69, 'MALAYALAM DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0D6A, 'MALAYALAM DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0D6B, 'MALAYALAM DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0D6C, 'MALAYALAM DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0D6D, 'MALAYALAM DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0D6E, 'MALAYALAM DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0D6F, 'MALAYALAM DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0D70, 'MALAYALAM NUMBER TEN', 'No', 0, 'L', None, False, None),
+    (0x0D71, 'MALAYALAM NUMBER ONE HUNDRED', 'No', 0, 'L', None, False, None),
+    (0x0D72, 'MALAYALAM NUMBER ONE THOUSAND', 'No', 0, 'L', None, False, None),
+    (0x0D73, 'MALAYALAM FRACTION ONE QUARTER', 'No', 0, 'L', None, False, None),
+    (0x0D74, 'MALAYALAM FRACTION ONE HALF', 'No', 0, 'L', None, False, None),
+    (0x0D75, 'MALAYALAM FRACTION THREE QUARTERS', 'No', 0, 'L', None, False, None),
+    (0x0D76, 'MALAYALAM FRACTION ONE SIXTEENTH', 'No', 0, 'L', None, False, None),
+    (0x0D77, 'MALAYALAM FRACTION ONE EIGHTH', 'No', 0, 'L', None, False, None),
+    (0x0D78, 'MALAYALAM FRACTION THREE SIXTEENTHS', 'No', 0, 'L', None, False, None),
+    (0x0D79, 'MALAYALAM DATE MARK', 'So', 0, 'L', None, False, None),
+    (0x0D7A, 'MALAYALAM LETTER CHILLU NN', 'Lo', 0, 'L', None, False, None),
+    (0x0D7B, 'MALAYALAM LETTER CHILLU N', 'Lo', 0, 'L', None, False, None),
+    (0x0D7C, 'MALAYALAM LETTER CHILLU RR', 'Lo', 0, 'L', None, False, None),
+    (0x0D7D, 'MALAYALAM LETTER CHILLU L', 'Lo', 0, 'L', None, False, None),
+    (0x0D7E, 'MALAYALAM LETTER CHILLU LL', 'Lo', 0, 'L', None, False, None),
+    (0x0D7F, 'MALAYALAM LETTER CHILLU K', 'Lo', 0, 'L', None, False, None),
+    (0x0D81, 'SINHALA SIGN CANDRABINDU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0D82, 'SINHALA SIGN ANUSVARAYA', 'Mc', 0, 'L', None, False, None),
+    (0x0D83, 'SINHALA SIGN VISARGAYA', 'Mc', 0, 'L', None, False, None),
+    (0x0D85, 'SINHALA LETTER AYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D86, 'SINHALA LETTER AAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D87, 'SINHALA LETTER AEYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D88, 'SINHALA LETTER AEEYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D89, 'SINHALA LETTER IYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8A, 'SINHALA LETTER IIYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8B, 'SINHALA LETTER UYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8C, 'SINHALA LETTER UUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8D, 'SINHALA LETTER IRUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8E, 'SINHALA LETTER IRUUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D8F, 'SINHALA LETTER ILUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D90, 'SINHALA LETTER ILUUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D91, 'SINHALA LETTER EYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D92, 'SINHALA LETTER EEYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D93, 'SINHALA LETTER AIYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D94, 'SINHALA LETTER OYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D95, 'SINHALA LETTER OOYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D96, 'SINHALA LETTER AUYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9A, 'SINHALA LETTER ALPAPRAANA KAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9B, 'SINHALA LETTER MAHAAPRAANA KAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9C, 'SINHALA LETTER ALPAPRAANA GAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9D, 'SINHALA LETTER MAHAAPRAANA GAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9E, 'SINHALA LETTER KANTAJA NAASIKYAYA', 'Lo', 0, 'L', None, False, None),
+    (0x0D9F, 'SINHALA LETTER SANYAKA GAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA0, 'SINHALA LETTER ALPAPRAANA CAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA1, 'SINHALA LETTER MAHAAPRAANA CAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA2, 'SINHALA LETTER ALPAPRAANA JAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA3, 'SINHALA LETTER MAHAAPRAANA JAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA4, 'SINHALA LETTER TAALUJA NAASIKYAYA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA5, 'SINHALA LETTER TAALUJA SANYOOGA NAAKSIKYAYA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA6, 'SINHALA LETTER SANYAKA JAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA7, 'SINHALA LETTER ALPAPRAANA TTAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA8, 'SINHALA LETTER MAHAAPRAANA TTAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DA9, 'SINHALA LETTER ALPAPRAANA DDAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAA, 'SINHALA LETTER MAHAAPRAANA DDAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAB, 'SINHALA LETTER MUURDHAJA NAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAC, 'SINHALA LETTER SANYAKA DDAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAD, 'SINHALA LETTER ALPAPRAANA TAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAE, 'SINHALA LETTER MAHAAPRAANA TAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DAF, 'SINHALA LETTER ALPAPRAANA DAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB0, 'SINHALA LETTER MAHAAPRAANA DAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB1, 'SINHALA LETTER DANTAJA NAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB3, 'SINHALA LETTER SANYAKA DAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB4, 'SINHALA LETTER ALPAPRAANA PAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB5, 'SINHALA LETTER MAHAAPRAANA PAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB6, 'SINHALA LETTER ALPAPRAANA BAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB7, 'SINHALA LETTER MAHAAPRAANA BAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB8, 'SINHALA LETTER MAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DB9, 'SINHALA LETTER AMBA BAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DBA, 'SINHALA LETTER YAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DBB, 'SINHALA LETTER RAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DBD, 'SINHALA LETTER DANTAJA LAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC0, 'SINHALA LETTER VAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC1, 'SINHALA LETTER TAALUJA SAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC2, 'SINHALA LETTER MUURDHAJA SAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC3, 'SINHALA LETTER DANTAJA SAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC4, 'SINHALA LETTER HAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC5, 'SINHALA LETTER MUURDHAJA LAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DC6, 'SINHALA LETTER FAYANNA', 'Lo', 0, 'L', None, False, None),
+    (0x0DCA, 'SINHALA SIGN AL-LAKUNA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0DCF, 'SINHALA VOWEL SIGN AELA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DD0, 'SINHALA VOWEL SIGN KETTI AEDA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DD1, 'SINHALA VOWEL SIGN DIGA AEDA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DD2, 'SINHALA VOWEL SIGN KETTI IS-PILLA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0DD3, 'SINHALA VOWEL SIGN DIGA IS-PILLA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0DD4, 'SINHALA VOWEL SIGN KETTI PAA-PILLA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0DD6, 'SINHALA VOWEL SIGN DIGA PAA-PILLA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0DD8, 'SINHALA VOWEL SIGN GAETTA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DD9, 'SINHALA VOWEL SIGN KOMBUVA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDA, 'SINHALA VOWEL SIGN DIGA KOMBUVA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDB, 'SINHALA VOWEL SIGN KOMBU DEKA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDC, 'SINHALA VOWEL SIGN KOMBUVA HAA AELA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDD, 'SINHALA VOWEL SIGN KOMBUVA HAA DIGA AELA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDE, 'SINHALA VOWEL SIGN KOMBUVA HAA GAYANUKITTA', 'Mc', 0, 'L', None, False, None),
+    (0x0DDF, 'SINHALA VOWEL SIGN GAYANUKITTA', 'Mc', 0, 'L', None, False, None),
+    (0x0DE6, 'SINHALA LITH DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0DE7, 'SINHALA LITH DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0DE8, 'SINHALA LITH DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0DE9, 'SINHALA LITH DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0DEA, 'SINHALA LITH DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0DEB, 'SINHALA LITH DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0DEC, 'SINHALA LITH DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0DED, 'SINHALA LITH DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0DEE, 'SINHALA LITH DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0DEF, 'SINHALA LITH DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0DF2, 'SINHALA VOWEL SIGN DIGA GAETTA-PILLA', 'Mc', 0, 'L', None, False, None),
+    (0x0DF3, 'SINHALA VOWEL SIGN DIGA GAYANUKITTA', 'Mc', 0, 'L', None, False, None),
+    (0x0DF4, 'SINHALA PUNCTUATION KUNDDALIYA', 'Po', 0, 'L', None, False, None),
+    (0x0E01, 'THAI CHARACTER KO KAI', 'Lo', 0, 'L', None, False, None),
+    (0x0E02, 'THAI CHARACTER KHO KHAI', 'Lo', 0, 'L', None, False, None),
+    (0x0E03, 'THAI CHARACTER KHO KHUAT', 'Lo', 0, 'L', None, False, None),
+    (0x0E04, 'THAI CHARACTER KHO KHWAI', 'Lo', 0, 'L', None, False, None),
+    (0x0E05, 'THAI CHARACTER KHO KHON', 'Lo', 0, 'L', None, False, None),
+    (0x0E06, 'THAI CHARACTER KHO RAKHANG', 'Lo', 0, 'L', None, False, None),
+    (0x0E07, 'THAI CHARACTER NGO NGU', 'Lo', 0, 'L', None, False, None),
+    (0x0E08, 'THAI CHARACTER CHO CHAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E09, 'THAI CHARACTER CHO CHING', 'Lo', 0, 'L', None, False, None),
+    (0x0E0A, 'THAI CHARACTER CHO CHANG', 'Lo', 0, 'L', None, False, None),
+    (0x0E0B, 'THAI CHARACTER SO SO', 'Lo', 0, 'L', None, False, None),
+    (0x0E0C, 'THAI CHARACTER CHO CHOE', 'Lo', 0, 'L', None, False, None),
+    (0x0E0D, 'THAI CHARACTER YO YING', 'Lo', 0, 'L', None, False, None),
+    (0x0E0E, 'THAI CHARACTER DO CHADA', 'Lo', 0, 'L', None, False, None),
+    (0x0E0F, 'THAI CHARACTER TO PATAK', 'Lo', 0, 'L', None, False, None),
+    (0x0E10, 'THAI CHARACTER THO THAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E11, 'THAI CHARACTER THO NANGMONTHO', 'Lo', 0, 'L', None, False, None),
+    (0x0E12, 'THAI CHARACTER THO PHUTHAO', 'Lo', 0, 'L', None, False, None),
+    (0x0E13, 'THAI CHARACTER NO NEN', 'Lo', 0, 'L', None, False, None),
+    (0x0E14, 'THAI CHARACTER DO DEK', 'Lo', 0, 'L', None, False, None),
+    (0x0E15, 'THAI CHARACTER TO TAO', 'Lo', 0, 'L', None, False, None),
+    (0x0E16, 'THAI CHARACTER THO THUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0E17, 'THAI CHARACTER THO THAHAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E18, 'THAI CHARACTER THO THONG', 'Lo', 0, 'L', None, False, None),
+    (0x0E19, 'THAI CHARACTER NO NU', 'Lo', 0, 'L', None, False, None),
+    (0x0E1A, 'THAI CHARACTER BO BAIMAI', 'Lo', 0, 'L', None, False, None),
+    (0x0E1B, 'THAI CHARACTER PO PLA', 'Lo', 0, 'L', None, False, None),
+    (0x0E1C, 'THAI CHARACTER PHO PHUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0E1D, 'THAI CHARACTER FO FA', 'Lo', 0, 'L', None, False, None),
+    (0x0E1E, 'THAI CHARACTER PHO PHAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E1F, 'THAI CHARACTER FO FAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E20, 'THAI CHARACTER PHO SAMPHAO', 'Lo', 0, 'L', None, False, None),
+    (0x0E21, 'THAI CHARACTER MO MA', 'Lo', 0, 'L', None, False, None),
+    (0x0E22, 'THAI CHARACTER YO YAK', 'Lo', 0, 'L', None, False, None),
+    (0x0E23, 'THAI CHARACTER RO RUA', 'Lo', 0, 'L', None, False, None),
+    (0x0E24, 'THAI CHARACTER RU', 'Lo', 0, 'L', None, False, None),
+    (0x0E25, 'THAI CHARACTER LO LING', 'Lo', 0, 'L', None, False, None),
+    (0x0E26, 'THAI CHARACTER LU', 'Lo', 0, 'L', None, False, None),
+    (0x0E27, 'THAI CHARACTER WO WAEN', 'Lo', 0, 'L', None, False, None),
+    (0x0E28, 'THAI CHARACTER SO SALA', 'Lo', 0, 'L', None, False, None),
+    (0x0E29, 'THAI CHARACTER SO RUSI', 'Lo', 0, 'L', None, False, None),
+    (0x0E2A, 'THAI CHARACTER SO SUA', 'Lo', 0, 'L', None, False, None),
+    (0x0E2B, 'THAI CHARACTER HO HIP', 'Lo', 0, 'L', None, False, None),
+    (0x0E2C, 'THAI CHARACTER LO CHULA', 'Lo', 0, 'L', None, False, None),
+    (0x0E2D, 'THAI CHARACTER O ANG', 'Lo', 0, 'L', None, False, None),
+    (0x0E2E, 'THAI CHARACTER HO NOKHUK', 'Lo', 0, 'L', None, False, None),
+    (0x0E2F, 'THAI CHARACTER PAIYANNOI', 'Lo', 0, 'L', None, False, None),
+    (0x0E30, 'THAI CHARACTER SARA A', 'Lo', 0, 'L', None, False, None),
+    (0x0E31, 'THAI CHARACTER MAI HAN-AKAT', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E32, 'THAI CHARACTER SARA AA', 'Lo', 0, 'L', None, False, None),
+    (0x0E33, 'THAI CHARACTER SARA AM', 'Lo', 0, 'L', None, False, None),
+    (0x0E34, 'THAI CHARACTER SARA I', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E35, 'THAI CHARACTER SARA II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E36, 'THAI CHARACTER SARA UE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E37, 'THAI CHARACTER SARA UEE', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E38, 'THAI CHARACTER SARA U', 'Mn', 103, 'NSM', None, False, None),
+    (0x0E39, 'THAI CHARACTER SARA UU', 'Mn', 103, 'NSM', None, False, None),
+    (0x0E3A, 'THAI CHARACTER PHINTHU', 'Mn', 9, 'NSM', None, False, None),
+    (0x0E3F, 'THAI CURRENCY SYMBOL BAHT', 'Sc', 0, 'ET', None, False, None),
+    (0x0E40, 'THAI CHARACTER SARA E', 'Lo', 0, 'L', None, False, None),
+    (0x0E41, 'THAI CHARACTER SARA AE', 'Lo', 0, 'L', None, False, None),
+    (0x0E42, 'THAI CHARACTER SARA O', 'Lo', 0, 'L', None, False, None),
+    (0x0E43, 'THAI CHARACTER SARA AI MAIMUAN', 'Lo', 0, 'L', None, False, None),
+    (0x0E44, 'THAI CHARACTER SARA AI MAIMALAI', 'Lo', 0, 'L', None, False, None),
+    (0x0E45, 'THAI CHARACTER LAKKHANGYAO', 'Lo', 0, 'L', None, False, None),
+    (0x0E46, 'THAI CHARACTER MAIYAMOK', 'Lm', 0, 'L', None, False, None),
+    (0x0E47, 'THAI CHARACTER MAITAIKHU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E48, 'THAI CHARACTER MAI EK', 'Mn', 107, 'NSM', None, False, None),
+    (0x0E49, 'THAI CHARACTER MAI THO', 'Mn', 107, 'NSM', None, False, None),
+    (0x0E4A, 'THAI CHARACTER MAI TRI', 'Mn', 107, 'NSM', None, False, None),
+    (0x0E4B, 'THAI CHARACTER MAI CHATTAWA', 'Mn', 107, 'NSM', None, False, None),
+    (0x0E4C, 'THAI CHARACTER THANTHAKHAT', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E4D, 'THAI CHARACTER NIKHAHIT', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E4E, 'THAI CHARACTER YAMAKKAN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0E4F, 'THAI CHARACTER FONGMAN', 'Po', 0, 'L', None, False, None),
+    (0x0E50, 'THAI DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0E51, 'THAI DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0E52, 'THAI DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0E53, 'THAI DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0E54, 'THAI DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0E55, 'THAI DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0E56, 'THAI DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0E57, 'THAI DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0E58, 'THAI DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0E59, 'THAI DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0E5A, 'THAI CHARACTER ANGKHANKHU', 'Po', 0, 'L', None, False, None),
+    (0x0E5B, 'THAI CHARACTER KHOMUT', 'Po', 0, 'L', None, False, None),
+    (0x0E81, 'LAO LETTER KO', 'Lo', 0, 'L', None, False, None),
+    (0x0E82, 'LAO LETTER KHO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0E84, 'LAO LETTER KHO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0E86, 'LAO LETTER PALI GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E87, 'LAO LETTER NGO', 'Lo', 0, 'L', None, False, None),
+    (0x0E88, 'LAO LETTER CO', 'Lo', 0, 'L', None, False, None),
+    (0x0E89, 'LAO LETTER PALI CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E8A, 'LAO LETTER SO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0E8C, 'LAO LETTER PALI JHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E8D, 'LAO LETTER NYO', 'Lo', 0, 'L', None, False, None),
+    (0x0E8E, 'LAO LETTER PALI NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0E8F, 'LAO LETTER PALI TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0E90, 'LAO LETTER PALI TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E91, 'LAO LETTER PALI DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0E92, 'LAO LETTER PALI DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E93, 'LAO LETTER PALI NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0E94, 'LAO LETTER DO', 'Lo', 0, 'L', None, False, None),
+    (0x0E95, 'LAO LETTER TO', 'Lo', 0, 'L', None, False, None),
+    (0x0E96, 'LAO LETTER THO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0E97, 'LAO LETTER THO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0E98, 'LAO LETTER PALI DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0E99, 'LAO LETTER NO', 'Lo', 0, 'L', None, False, None),
+    (0x0E9A, 'LAO LETTER BO', 'Lo', 0, 'L', None, False, None),
+    (0x0E9B, 'LAO LETTER PO', 'Lo', 0, 'L', None, False, None),
+    (0x0E9C, 'LAO LETTER PHO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0E9D, 'LAO LETTER FO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0E9E, 'LAO LETTER PHO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0E9F, 'LAO LETTER FO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0EA0, 'LAO LETTER PALI BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0EA1, 'LAO LETTER MO', 'Lo', 0, 'L', None, False, None),
+    (0x0EA2, 'LAO LETTER YO', 'Lo', 0, 'L', None, False, None),
+    (0x0EA3, 'LAO LETTER LO LING', 'Lo', 0, 'L', None, False, None),
+    (0x0EA5, 'LAO LETTER LO LOOT', 'Lo', 0, 'L', None, False, None),
+    (0x0EA7, 'LAO LETTER WO', 'Lo', 0, 'L', None, False, None),
+    (0x0EA8, 'LAO LETTER SANSKRIT SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0EA9, 'LAO LETTER SANSKRIT SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0EAA, 'LAO LETTER SO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0EAB, 'LAO LETTER HO SUNG', 'Lo', 0, 'L', None, False, None),
+    (0x0EAC, 'LAO LETTER PALI LLA', 'Lo', 0, 'L', None, False, None),
+    (0x0EAD, 'LAO LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x0EAE, 'LAO LETTER HO TAM', 'Lo', 0, 'L', None, False, None),
+    (0x0EAF, 'LAO ELLIPSIS', 'Lo', 0, 'L', None, False, None),
+    (0x0EB0, 'LAO VOWEL SIGN A', 'Lo', 0, 'L', None, False, None),
+    (0x0EB1, 'LAO VOWEL SIGN MAI KAN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EB2, 'LAO VOWEL SIGN AA', 'Lo', 0, 'L', None, False, None),
+    (0x0EB3, 'LAO VOWEL SIGN AM', 'Lo', 0, 'L', None, False, None),
+    (0x0EB4, 'LAO VOWEL SIGN I', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EB5, 'LAO VOWEL SIGN II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EB6, 'LAO VOWEL SIGN Y', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EB7, 'LAO VOWEL SIGN YY', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EB8, 'LAO VOWEL SIGN U', 'Mn', 118, 'NSM', None, False, None),
+    (0x0EB9, 'LAO VOWEL SIGN UU', 'Mn', 118, 'NSM', None, False, None),
+    (0x0EBA, 'LAO SIGN PALI VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0EBB, 'LAO VOWEL SIGN MAI KON', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EBC, 'LAO SEMIVOWEL SIGN LO', 'Mn', 0, 'NSM', None, False, None),
+    (0x0EBD, 'LAO SEMIVOWEL SIGN NYO', 'Lo', 0, 'L', None, False, None),
+    (0x0EC0, 'LAO VOWEL SIGN E', 'Lo', 0, 'L', None, False, None),
+    (0x0EC1, 'LAO VOWEL SIGN EI', 'Lo', 0, 'L', None, False, None),
+    (0x0EC2, 'LAO VOWEL SIGN O', 'Lo', 0, 'L', None, False, None),
+    (0x0EC3, 'LAO VOWEL SIGN AY', 'Lo', 0, 'L', None, False, None),
+    (0x0EC4, 'LAO VOWEL SIGN AI', 'Lo', 0, 'L', None, False, None),
+    (0x0EC6, 'LAO KO LA', 'Lm', 0, 'L', None, False, None),
+    (0x0EC8, 'LAO TONE MAI EK', 'Mn', 122, 'NSM', None, False, None),
+    (0x0EC9, 'LAO TONE MAI THO', 'Mn', 122, 'NSM', None, False, None),
+    (0x0ECA, 'LAO TONE MAI TI', 'Mn', 122, 'NSM', None, False, None),
+    (0x0ECB, 'LAO TONE MAI CATAWA', 'Mn', 122, 'NSM', None, False, None),
+    (0x0ECC, 'LAO CANCELLATION MARK', 'Mn', 0, 'NSM', None, False, None),
+    (0x0ECD, 'LAO NIGGAHITA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0ED0, 'LAO DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0ED1, 'LAO DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0ED2, 'LAO DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0ED3, 'LAO DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0ED4, 'LAO DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0ED5, 'LAO DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0ED6, 'LAO DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0ED7, 'LAO DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0ED8, 'LAO DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0ED9, 'LAO DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0EDC, 'LAO HO NO', 'Lo', 0, 'L', None, False, None),
+    (0x0EDD, 'LAO HO MO', 'Lo', 0, 'L', None, False, None),
+    (0x0EDE, 'LAO LETTER KHMU GO', 'Lo', 0, 'L', None, False, None),
+    (0x0EDF, 'LAO LETTER KHMU NYO', 'Lo', 0, 'L', None, False, None),
+    (0x0F00, 'TIBETAN SYLLABLE OM', 'Lo', 0, 'L', None, False, None),
+    (0x0F01, 'TIBETAN MARK GTER YIG MGO TRUNCATED A', 'So', 0, 'L', None, False, None),
+    (0x0F02, 'TIBETAN MARK GTER YIG MGO -UM RNAM BCAD MA', 'So', 0, 'L', None, False, None),
+    (0x0F03, 'TIBETAN MARK GTER YIG MGO -UM GTER TSHEG MA', 'So', 0, 'L', None, False, None),
+    (0x0F04, 'TIBETAN MARK INITIAL YIG MGO MDUN MA', 'Po', 0, 'L', None, False, None),
+    (0x0F05, 'TIBETAN MARK CLOSING YIG MGO SGAB MA', 'Po', 0, 'L', None, False, None),
+    (0x0F06, 'TIBETAN MARK CARET YIG MGO PHUR SHAD MA', 'Po', 0, 'L', None, False, None),
+    (0x0F07, 'TIBETAN MARK YIG MGO TSHEG SHAD MA', 'Po', 0, 'L', None, False, None),
+    (0x0F08, 'TIBETAN MARK SBRUL SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F09, 'TIBETAN MARK BSKUR YIG MGO', 'Po', 0, 'L', None, False, None),
+    (0x0F0A, 'TIBETAN MARK BKA- SHOG YIG MGO', 'Po', 0, 'L', None, False, None),
+    (0x0F0B, 'TIBETAN MARK INTERSYLLABIC TSHEG', 'Po', 0, 'L', None, False, None),
+    (0x0F0C, 'TIBETAN MARK DELIMITER TSHEG BSTAR', 'Po', 0, 'L', None, False, None),
+    (0x0F0D, 'TIBETAN MARK SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F0E, 'TIBETAN MARK NYIS SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F0F, 'TIBETAN MARK TSHEG SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F10, 'TIBETAN MARK NYIS TSHEG SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F11, 'TIBETAN MARK RIN CHEN SPUNGS SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F12, 'TIBETAN MARK RGYA GRAM SHAD', 'Po', 0, 'L', None, False, None),
+    (0x0F13, 'TIBETAN MARK CARET -DZUD RTAGS ME LONG CAN', 'So', 0, 'L', None, False, None),
+    (0x0F14, 'TIBETAN MARK GTER TSHEG', 'Po', 0, 'L', None, False, None),
+    (0x0F15, 'TIBETAN LOGOTYPE SIGN CHAD RTAGS', 'So', 0, 'L', None, False, None),
+    (0x0F16, 'TIBETAN LOGOTYPE SIGN LHAG RTAGS', 'So', 0, 'L', None, False, None),
+    (0x0F17, 'TIBETAN ASTROLOGICAL SIGN SGRA GCAN -CHAR RTAGS', 'So', 0, 'L', None, False, None),
+    (0x0F18, 'TIBETAN ASTROLOGICAL SIGN -KHYUD PA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0F19, 'TIBETAN ASTROLOGICAL SIGN SDONG TSHUGS', 'Mn', 220, 'NSM', None, False, None),
+    (0x0F1A, 'TIBETAN SIGN RDEL DKAR GCIG', 'So', 0, 'L', None, False, None),
+    (0x0F1B, 'TIBETAN SIGN RDEL DKAR GNYIS', 'So', 0, 'L', None, False, None),
+    (0x0F1C, 'TIBETAN SIGN RDEL DKAR GSUM', 'So', 0, 'L', None, False, None),
+    (0x0F1D, 'TIBETAN SIGN RDEL NAG GCIG', 'So', 0, 'L', None, False, None),
+    (0x0F1E, 'TIBETAN SIGN RDEL NAG GNYIS', 'So', 0, 'L', None, False, None),
+    (0x0F1F, 'TIBETAN SIGN RDEL DKAR RDEL NAG', 'So', 0, 'L', None, False, None),
+    (0x0F20, 'TIBETAN DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x0F21, 'TIBETAN DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x0F22, 'TIBETAN DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x0F23, 'TIBETAN DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x0F24, 'TIBETAN DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x0F25, 'TIBETAN DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x0F26, 'TIBETAN DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x0F27, 'TIBETAN DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x0F28, 'TIBETAN DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x0F29, 'TIBETAN DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x0F2A, 'TIBETAN DIGIT HALF ONE', 'No', 0, 'L', None, False, None),
+    (0x0F2B, 'TIBETAN DIGIT HALF TWO', 'No', 0, 'L', None, False, None),
+    (0x0F2C, 'TIBETAN DIGIT HALF THREE', 'No', 0, 'L', None, False, None),
+    (0x0F2D, 'TIBETAN DIGIT HALF FOUR', 'No', 0, 'L', None, False, None),
+    (0x0F2E, 'TIBETAN DIGIT HALF FIVE', 'No', 0, 'L', None, False, None),
+    (0x0F2F, 'TIBETAN DIGIT HALF SIX', 'No', 0, 'L', None, False, None),
+    (0x0F30, 'TIBETAN DIGIT HALF SEVEN', 'No', 0, 'L', None, False, None),
+    (0x0F31, 'TIBETAN DIGIT HALF EIGHT', 'No', 0, 'L', None, False, None),
+    (0x0F32, 'TIBETAN DIGIT HALF NINE', 'No', 0, 'L', None, False, None),
+    (0x0F33, 'TIBETAN DIGIT HALF ZERO', 'No', 0, 'L', None, False, None),
+    (0x0F34, 'TIBETAN MARK BSDUS RTAGS', 'So', 0, 'L', None, False, None),
+    (0x0F35, 'TIBETAN MARK NGAS BZUNG NYI ZLA', 'Mn', 220, 'NSM', None, False, None),
+    (0x0F36, 'TIBETAN MARK CARET -DZUD RTAGS BZHI MIG CAN', 'So', 0, 'L', None, False, None),
+    (0x0F37, 'TIBETAN MARK NGAS BZUNG SGOR RTAGS', 'Mn', 220, 'NSM', None, False, None),
+    (0x0F38, 'TIBETAN MARK CHE MGO', 'So', 0, 'L', None, False, None),
+    (0x0F39, 'TIBETAN MARK TSA -PHRU', 'Mn', 216, 'NSM', None, False, None),
+    (0x0F3A, 'TIBETAN MARK GUG RTAGS GYON', 'Ps', 0, 'ON', None, True, None),
+    (0x0F3B, 'TIBETAN MARK GUG RTAGS GYAS', 'Pe', 0, 'ON', None, True, None),
+    (0x0F3C, 'TIBETAN MARK ANG KHANG GYON', 'Ps', 0, 'ON', None, True, None),
+    (0x0F3D, 'TIBETAN MARK ANG KHANG GYAS', 'Pe', 0, 'ON', None, True, None),
+    (0x0F3E, 'TIBETAN SIGN YAR TSHES', 'Mc', 0, 'L', None, False, None),
+    (0x0F3F, 'TIBETAN SIGN MAR TSHES', 'Mc', 0, 'L', None, False, None),
+    (0x0F40, 'TIBETAN LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x0F41, 'TIBETAN LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F42, 'TIBETAN LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x0F43, 'TIBETAN LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F44, 'TIBETAN LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x0F45, 'TIBETAN LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x0F46, 'TIBETAN LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F47, 'TIBETAN LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x0F49, 'TIBETAN LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4A, 'TIBETAN LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4B, 'TIBETAN LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4C, 'TIBETAN LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4D, 'TIBETAN LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4E, 'TIBETAN LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x0F4F, 'TIBETAN LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x0F50, 'TIBETAN LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x0F51, 'TIBETAN LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x0F52, 'TIBETAN LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F53, 'TIBETAN LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x0F54, 'TIBETAN LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x0F55, 'TIBETAN LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F56, 'TIBETAN LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x0F57, 'TIBETAN LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F58, 'TIBETAN LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x0F59, 'TIBETAN LETTER TSA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5A, 'TIBETAN LETTER TSHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5B, 'TIBETAN LETTER DZA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5C, 'TIBETAN LETTER DZHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5D, 'TIBETAN LETTER WA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5E, 'TIBETAN LETTER ZHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F5F, 'TIBETAN LETTER ZA', 'Lo', 0, 'L', None, False, None),
+    (0x0F60, 'TIBETAN LETTER -A', 'Lo', 0, 'L', None, False, None),
+    (0x0F61, 'TIBETAN LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x0F62, 'TIBETAN LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x0F63, 'TIBETAN LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x0F64, 'TIBETAN LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x0F65, 'TIBETAN LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x0F66, 'TIBETAN LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x0F67, 'TIBETAN LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x0F68, 'TIBETAN LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x0F69, 'TIBETAN LETTER KSSA', 'Lo', 0, 'L', None, False, None),
+    (0x0F6A, 'TIBETAN LETTER FIXED-FORM RA', 'Lo', 0, 'L', None, False, None),
+    (0x0F6B, 'TIBETAN LETTER KKA', 'Lo', 0, 'L', None, False, None),
+    (0x0F6C, 'TIBETAN LETTER RRA', 'Lo', 0, 'L', None, False, None),
+    (0x0F71, 'TIBETAN VOWEL SIGN AA', 'Mn', 129, 'NSM', None, False, None),
+    (0x0F72, 'TIBETAN VOWEL SIGN I', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F73, 'TIBETAN VOWEL SIGN II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F74, 'TIBETAN VOWEL SIGN U', 'Mn', 132, 'NSM', None, False, None),
+    (0x0F75, 'TIBETAN VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F76, 'TIBETAN VOWEL SIGN VOCALIC R', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F77, 'TIBETAN VOWEL SIGN VOCALIC RR', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F78, 'TIBETAN VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F79, 'TIBETAN VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F7A, 'TIBETAN VOWEL SIGN E', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F7B, 'TIBETAN VOWEL SIGN EE', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F7C, 'TIBETAN VOWEL SIGN O', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F7D, 'TIBETAN VOWEL SIGN OO', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F7E, 'TIBETAN SIGN RJES SU NGA RO', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F7F, 'TIBETAN SIGN RNAM BCAD', 'Mc', 0, 'L', None, False, None),
+    (0x0F80, 'TIBETAN VOWEL SIGN REVERSED I', 'Mn', 130, 'NSM', None, False, None),
+    (0x0F81, 'TIBETAN VOWEL SIGN REVERSED II', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F82, 'TIBETAN SIGN NYI ZLA NAA DA', 'Mn', 230, 'NSM', None, False, None),
+    (0x0F83, 'TIBETAN SIGN SNA LDAN', 'Mn', 230, 'NSM', None, False, None),
+    (0x0F84, 'TIBETAN MARK HALANTA', 'Mn', 9, 'NSM', None, False, None),
+    (0x0F85, 'TIBETAN MARK PALUTA', 'Po', 0, 'L', None, False, None),
+    (0x0F86, 'TIBETAN SIGN LCI RTAGS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0F87, 'TIBETAN SIGN YANG RTAGS', 'Mn', 230, 'NSM', None, False, None),
+    (0x0F88, 'TIBETAN SIGN LCE TSA CAN', 'Lo', 0, 'L', None, False, None),
+    (0x0F89, 'TIBETAN SIGN MCHU CAN', 'Lo', 0, 'L', None, False, None),
+    (0x0F8A, 'TIBETAN SIGN GRU CAN RGYINGS', 'Lo', 0, 'L', None, False, None),
+    (0x0F8B, 'TIBETAN SIGN GRU MED RGYINGS', 'Lo', 0, 'L', None, False, None),
+    (0x0F8C, 'TIBETAN SIGN INVERTED MCHU CAN', 'Lo', 0, 'L', None, False, None),
+    (0x0F8D, 'TIBETAN SUBJOINED SIGN LCE TSA CAN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F8E, 'TIBETAN SUBJOINED SIGN MCHU CAN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F8F, 'TIBETAN SUBJOINED SIGN INVERTED MCHU CAN', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F90, 'TIBETAN SUBJOINED LETTER KA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F91, 'TIBETAN SUBJOINED LETTER KHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F92, 'TIBETAN SUBJOINED LETTER GA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F93, 'TIBETAN SUBJOINED LETTER GHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F94, 'TIBETAN SUBJOINED LETTER NGA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F95, 'TIBETAN SUBJOINED LETTER CA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F96, 'TIBETAN SUBJOINED LETTER CHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F97, 'TIBETAN SUBJOINED LETTER JA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F99, 'TIBETAN SUBJOINED LETTER NYA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9A, 'TIBETAN SUBJOINED LETTER TTA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9B, 'TIBETAN SUBJOINED LETTER TTHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9C, 'TIBETAN SUBJOINED LETTER DDA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9D, 'TIBETAN SUBJOINED LETTER DDHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9E, 'TIBETAN SUBJOINED LETTER NNA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0F9F, 'TIBETAN SUBJOINED LETTER TA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA0, 'TIBETAN SUBJOINED LETTER THA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA1, 'TIBETAN SUBJOINED LETTER DA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA2, 'TIBETAN SUBJOINED LETTER DHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA3, 'TIBETAN SUBJOINED LETTER NA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA4, 'TIBETAN SUBJOINED LETTER PA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA5, 'TIBETAN SUBJOINED LETTER PHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA6, 'TIBETAN SUBJOINED LETTER BA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA7, 'TIBETAN SUBJOINED LETTER BHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA8, 'TIBETAN SUBJOINED LETTER MA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FA9, 'TIBETAN SUBJOINED LETTER TSA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAA, 'TIBETAN SUBJOINED LETTER TSHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAB, 'TIBETAN SUBJOINED LETTER DZA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAC, 'TIBETAN SUBJOINED LETTER DZHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAD, 'TIBETAN SUBJOINED LETTER WA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAE, 'TIBETAN SUBJOINED LETTER ZHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FAF, 'TIBETAN SUBJOINED LETTER ZA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB0, 'TIBETAN SUBJOINED LETTER -A', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB1, 'TIBETAN SUBJOINED LETTER YA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB2, 'TIBETAN SUBJOINED LETTER RA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB3, 'TIBETAN SUBJOINED LETTER LA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB4, 'TIBETAN SUBJOINED LETTER SHA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB5, 'TIBETAN SUBJOINED LETTER SSA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB6, 'TIBETAN SUBJOINED LETTER SA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB7, 'TIBETAN SUBJOINED LETTER HA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB8, 'TIBETAN SUBJOINED LETTER A', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FB9, 'TIBETAN SUBJOINED LETTER KSSA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FBA, 'TIBETAN SUBJOINED LETTER FIXED-FORM WA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FBB, 'TIBETAN SUBJOINED LETTER FIXED-FORM YA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FBC, 'TIBETAN SUBJOINED LETTER FIXED-FORM RA', 'Mn', 0, 'NSM', None, False, None),
+    (0x0FBE, 'TIBETAN KU RU KHA', 'So', 0, 'L', None, False, None),
+    (0x0FBF, 'TIBETAN KU RU KHA BZHI MIG CAN', 'So', 0, 'L', None, False, None),
+    (0x0FC0, 'TIBETAN CANTILLATION SIGN HEAVY BEAT', 'So', 0, 'L', None, False, None),
+    (0x0FC1, 'TIBETAN CANTILLATION SIGN LIGHT BEAT', 'So', 0, 'L', None, False, None),
+    (0x0FC2, 'TIBETAN CANTILLATION SIGN CANG TE-U', 'So', 0, 'L', None, False, None),
+    (0x0FC3, 'TIBETAN CANTILLATION SIGN SBUB -CHAL', 'So', 0, 'L', None, False, None),
+    (0x0FC4, 'TIBETAN SYMBOL DRIL BU', 'So', 0, 'L', None, False, None),
+    (0x0FC5, 'TIBETAN SYMBOL RDO RJE', 'So', 0, 'L', None, False, None),
+    (0x0FC6, 'TIBETAN SYMBOL PADMA GDAN', 'Mn', 220, 'NSM', None, False, None),
+    (0x0FC7, 'TIBETAN SYMBOL RDO RJE RGYA GRAM', 'So', 0, 'L', None, False, None),
+    (0x0FC8, 'TIBETAN SYMBOL PHUR PA', 'So', 0, 'L', None, False, None),
+    (0x0FC9, 'TIBETAN SYMBOL NOR BU', 'So', 0, 'L', None, False, None),
+    (0x0FCA, 'TIBETAN SYMBOL NOR BU NYIS -KHYIL', 'So', 0, 'L', None, False, None),
+    (0x0FCB, 'TIBETAN SYMBOL NOR BU GSUM -KHYIL', 'So', 0, 'L', None, False, None),
+    (0x0FCC, 'TIBETAN SYMBOL NOR BU BZHI -KHYIL', 'So', 0, 'L', None, False, None),
+    (0x0FCE, 'TIBETAN SIGN RDEL NAG RDEL DKAR', 'So', 0, 'L', None, False, None),
+    (0x0FCF, 'TIBETAN SIGN RDEL NAG GSUM', 'So', 0, 'L', None, False, None),
+    (0x0FD0, 'TIBETAN MARK BSKA- SHOG GI MGO RGYAN', 'Po', 0, 'L', None, False, None),
+    (0x0FD1, 'TIBETAN MARK MNYAM YIG GI MGO RGYAN', 'Po', 0, 'L', None, False, None),
+    (0x0FD2, 'TIBETAN MARK NYIS TSHEG', 'Po', 0, 'L', None, False, None),
+    (0x0FD3, 'TIBETAN MARK INITIAL BRDA RNYING YIG MGO MDUN MA', 'Po', 0, 'L', None, False, None),
+    (0x0FD4, 'TIBETAN MARK CLOSING BRDA RNYING YIG MGO SGAB MA', 'Po', 0, 'L', None, False, None),
+    (0x0FD5, 'RIGHT-FACING SVASTI SIGN', 'So', 0, 'L', None, False, None),
+    (0x0FD6, 'LEFT-FACING SVASTI SIGN', 'So', 0, 'L', None, False, None),
+    (0x0FD7, 'RIGHT-FACING SVASTI SIGN WITH DOTS', 'So', 0, 'L', None, False, None),
+    (0x0FD8, 'LEFT-FACING SVASTI SIGN WITH DOTS', 'So', 0, 'L', None, False, None),
+    (0x0FD9, 'TIBETAN MARK LEADING MCHAN RTAGS', 'Po', 0, 'L', None, False, None),
+    (0x0FDA, 'TIBETAN MARK TRAILING MCHAN RTAGS', 'Po', 0, 'L', None, False, None),
+    (0x1000, 'MYANMAR LETTER KA', 'Lo', 0, 'L', None, False, None),
+    (0x1001, 'MYANMAR LETTER KHA', 'Lo', 0, 'L', None, False, None),
+    (0x1002, 'MYANMAR LETTER GA', 'Lo', 0, 'L', None, False, None),
+    (0x1003, 'MYANMAR LETTER GHA', 'Lo', 0, 'L', None, False, None),
+    (0x1004, 'MYANMAR LETTER NGA', 'Lo', 0, 'L', None, False, None),
+    (0x1005, 'MYANMAR LETTER CA', 'Lo', 0, 'L', None, False, None),
+    (0x1006, 'MYANMAR LETTER CHA', 'Lo', 0, 'L', None, False, None),
+    (0x1007, 'MYANMAR LETTER JA', 'Lo', 0, 'L', None, False, None),
+    (0x1008, 'MYANMAR LETTER JHA', 'Lo', 0, 'L', None, False, None),
+    (0x1009, 'MYANMAR LETTER NYA', 'Lo', 0, 'L', None, False, None),
+    (0x100A, 'MYANMAR LETTER NNYA', 'Lo', 0, 'L', None, False, None),
+    (0x100B, 'MYANMAR LETTER TTA', 'Lo', 0, 'L', None, False, None),
+    (0x100C, 'MYANMAR LETTER TTHA', 'Lo', 0, 'L', None, False, None),
+    (0x100D, 'MYANMAR LETTER DDA', 'Lo', 0, 'L', None, False, None),
+    (0x100E, 'MYANMAR LETTER DDHA', 'Lo', 0, 'L', None, False, None),
+    (0x100F, 'MYANMAR LETTER NNA', 'Lo', 0, 'L', None, False, None),
+    (0x1010, 'MYANMAR LETTER TA', 'Lo', 0, 'L', None, False, None),
+    (0x1011, 'MYANMAR LETTER THA', 'Lo', 0, 'L', None, False, None),
+    (0x1012, 'MYANMAR LETTER DA', 'Lo', 0, 'L', None, False, None),
+    (0x1013, 'MYANMAR LETTER DHA', 'Lo', 0, 'L', None, False, None),
+    (0x1014, 'MYANMAR LETTER NA', 'Lo', 0, 'L', None, False, None),
+    (0x1015, 'MYANMAR LETTER PA', 'Lo', 0, 'L', None, False, None),
+    (0x1016, 'MYANMAR LETTER PHA', 'Lo', 0, 'L', None, False, None),
+    (0x1017, 'MYANMAR LETTER BA', 'Lo', 0, 'L', None, False, None),
+    (0x1018, 'MYANMAR LETTER BHA', 'Lo', 0, 'L', None, False, None),
+    (0x1019, 'MYANMAR LETTER MA', 'Lo', 0, 'L', None, False, None),
+    (0x101A, 'MYANMAR LETTER YA', 'Lo', 0, 'L', None, False, None),
+    (0x101B, 'MYANMAR LETTER RA', 'Lo', 0, 'L', None, False, None),
+    (0x101C, 'MYANMAR LETTER LA', 'Lo', 0, 'L', None, False, None),
+    (0x101D, 'MYANMAR LETTER WA', 'Lo', 0, 'L', None, False, None),
+    (0x101E, 'MYANMAR LETTER SA', 'Lo', 0, 'L', None, False, None),
+    (0x101F, 'MYANMAR LETTER HA', 'Lo', 0, 'L', None, False, None),
+    (0x1020, 'MYANMAR LETTER LLA', 'Lo', 0, 'L', None, False, None),
+    (0x1021, 'MYANMAR LETTER A', 'Lo', 0, 'L', None, False, None),
+    (0x1022, 'MYANMAR LETTER SHAN A', 'Lo', 0, 'L', None, False, None),
+    (0x1023, 'MYANMAR LETTER I', 'Lo', 0, 'L', None, False, None),
+    (0x1024, 'MYANMAR LETTER II', 'Lo', 0, 'L', None, False, None),
+    (0x1025, 'MYANMAR LETTER U', 'Lo', 0, 'L', None, False, None),
+    (0x1026, 'MYANMAR LETTER UU', 'Lo', 0, 'L', None, False, None),
+    (0x1027, 'MYANMAR LETTER E', 'Lo', 0, 'L', None, False, None),
+    (0x1028, 'MYANMAR LETTER MON E', 'Lo', 0, 'L', None, False, None),
+    (0x1029, 'MYANMAR LETTER O', 'Lo', 0, 'L', None, False, None),
+    (0x102A, 'MYANMAR LETTER AU', 'Lo', 0, 'L', None, False, None),
+    (0x102B, 'MYANMAR VOWEL SIGN TALL AA', 'Mc', 0, 'L', None, False, None),
+    (0x102C, 'MYANMAR VOWEL SIGN AA', 'Mc', 0, 'L', None, False, None),
+    (0x102D, 'MYANMAR VOWEL SIGN I', 'Mn', 0, 'NSM', None, False, None),
+    (0x102E, 'MYANMAR VOWEL SIGN II', 'Mn', 0, 'NSM', None, False, None),
+    (0x102F, 'MYANMAR VOWEL SIGN U', 'Mn', 0, 'NSM', None, False, None),
+    (0x1030, 'MYANMAR VOWEL SIGN UU', 'Mn', 0, 'NSM', None, False, None),
+    (0x1031, 'MYANMAR VOWEL SIGN E', 'Mc', 0, 'L', None, False, None),
+    (0x1032, 'MYANMAR VOWEL SIGN AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x1033, 'MYANMAR VOWEL SIGN MON II', 'Mn', 0, 'NSM', None, False, None),
+    (0x1034, 'MYANMAR VOWEL SIGN MON O', 'Mn', 0, 'NSM', None, False, None),
+    (0x1035, 'MYANMAR VOWEL SIGN E ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x1036, 'MYANMAR SIGN ANUSVARA', 'Mn', 0, 'NSM', None, False, None),
+    (0x1037, 'MYANMAR SIGN DOT BELOW', 'Mn', 7, 'NSM', None, False, None),
+    (0x1038, 'MYANMAR SIGN VISARGA', 'Mc', 0, 'L', None, False, None),
+    (0x1039, 'MYANMAR SIGN VIRAMA', 'Mn', 9, 'NSM', None, False, None),
+    (0x103A, 'MYANMAR SIGN ASAT', 'Mn', 9, 'NSM', None, False, None),
+    (0x103B, 'MYANMAR CONSONANT SIGN MEDIAL YA', 'Mc', 0, 'L', None, False, None),
+    (0x103C, 'MYANMAR CONSONANT SIGN MEDIAL RA', 'Mc', 0, 'L', None, False, None),
+    (0x103D, 'MYANMAR CONSONANT SIGN MEDIAL WA', 'Mn', 0, 'NSM', None, False, None),
+    (0x103E, 'MYANMAR CONSONANT SIGN MEDIAL HA', 'Mn', 0, 'NSM', None, False, None),
+    (0x103F, 'MYANMAR LETTER GREAT SA', 'Lo', 0, 'L', None, False, None),
+    (0x1040, 'MYANMAR DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x1041, 'MYANMAR DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x1042, 'MYANMAR DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x1043, 'MYANMAR DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x1044, 'MYANMAR DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x1045, 'MYANMAR DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x1046, 'MYANMAR DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x1047, 'MYANMAR DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x1048, 'MYANMAR DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x1049, 'MYANMAR DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x104A, 'MYANMAR SIGN LITTLE SECTION', 'Po', 0, 'L', None, False, None),
+    (0x104B, 'MYANMAR SIGN SECTION', 'Po', 0, 'L', None, False, None),
+    (0x104C, 'MYANMAR SYMBOL LOCATIVE', 'Po', 0, 'L', None, False, None),
+    (0x104D, 'MYANMAR SYMBOL COMPLETED', 'Po', 0, 'L', None, False, None),
+    (0x104E, 'MYANMAR SYMBOL AFOREMENTIONED', 'Po', 0, 'L', None, False, None),
+    (0x104F, 'MYANMAR SYMBOL GENITIVE', 'Po', 0, 'L', None, False, None),
+    (0x1050, 'MYANMAR LETTER SHA', 'Lo', 0, 'L', None, False, None),
+    (0x1051, 'MYANMAR LETTER SSA', 'Lo', 0, 'L', None, False, None),
+    (0x1052, 'MYANMAR LETTER VOCALIC R', 'Lo', 0, 'L', None, False, None),
+    (0x1053, 'MYANMAR LETTER VOCALIC RR', 'Lo', 0, 'L', None, False, None),
+    (0x1054, 'MYANMAR LETTER VOCALIC L', 'Lo', 0, 'L', None, False, None),
+    (0x1055, 'MYANMAR LETTER VOCALIC LL', 'Lo', 0, 'L', None, False, None),
+    (0x1056, 'MYANMAR VOWEL SIGN VOCALIC R', 'Mc', 0, 'L', None, False, None),
+    (0x1057, 'MYANMAR VOWEL SIGN VOCALIC RR', 'Mc', 0, 'L', None, False, None),
+    (0x1058, 'MYANMAR VOWEL SIGN VOCALIC L', 'Mn', 0, 'NSM', None, False, None),
+    (0x1059, 'MYANMAR VOWEL SIGN VOCALIC LL', 'Mn', 0, 'NSM', None, False, None),
+    (0x105A, 'MYANMAR LETTER MON NGA', 'Lo', 0, 'L', None, False, None),
+    (0x105B, 'MYANMAR LETTER MON JHA', 'Lo', 0, 'L', None, False, None),
+    (0x105C, 'MYANMAR LETTER MON BBA', 'Lo', 0, 'L', None, False, None),
+    (0x105D, 'MYANMAR LETTER MON BBE', 'Lo', 0, 'L', None, False, None),
+    (0x105E, 'MYANMAR CONSONANT SIGN MON MEDIAL NA', 'Mn', 0, 'NSM', None, False, None),
+    (0x105F, 'MYANMAR CONSONANT SIGN MON MEDIAL MA', 'Mn', 0, 'NSM', None, False, None),
+    (0x1060, 'MYANMAR CONSONANT SIGN MON MEDIAL LA', 'Mn', 0, 'NSM', None, False, None),
+    (0x1061, 'MYANMAR LETTER SGAW KAREN SHA', 'Lo', 0, 'L', None, False, None),
+    (0x1062, 'MYANMAR VOWEL SIGN SGAW KAREN EU', 'Mc', 0, 'L', None, False, None),
+    (0x1063, 'MYANMAR TONE MARK SGAW KAREN HATHI', 'Mc', 0, 'L', None, False, None),
+    (0x1064, 'MYANMAR TONE MARK SGAW KAREN KE PHO', 'Mc', 0, 'L', None, False, None),
+    (0x1065, 'MYANMAR LETTER WESTERN PWO KAREN THA', 'Lo', 0, 'L', None, False, None),
+    (0x1066, 'MYANMAR LETTER WESTERN PWO KAREN PWA', 'Lo', 0, 'L', None, False, None),
+    (0x1067, 'MYANMAR VOWEL SIGN WESTERN PWO KAREN EU', 'Mc', 0, 'L', None, False, None),
+    (0x1068, 'MYANMAR VOWEL SIGN WESTERN PWO KAREN UE', 'Mc', 0, 'L', None, False, None),
+    (0x1069, 'MYANMAR SIGN WESTERN PWO KAREN TONE-1', 'Mc', 0, 'L', None, False, None),
+    (0x106A, 'MYANMAR SIGN WESTERN PWO KAREN TONE-2', 'Mc', 0, 'L', None, False, None),
+    (0x106B, 'MYANMAR SIGN WESTERN PWO KAREN TONE-3', 'Mc', 0, 'L', None, False, None),
+    (0x106C, 'MYANMAR SIGN WESTERN PWO KAREN TONE-4', 'Mc', 0, 'L', None, False, None),
+    (0x106D, 'MYANMAR SIGN WESTERN PWO KAREN TONE-5', 'Mc', 0, 'L', None, False, None),
+    (0x106E, 'MYANMAR LETTER EASTERN PWO KAREN NNA', 'Lo', 0, 'L', None, False, None),
+    (0x106F, 'MYANMAR LETTER EASTERN PWO KAREN YWA', 'Lo', 0, 'L', None, False, None),
+    (0x1070, 'MYANMAR LETTER EASTERN PWO KAREN GHWA', 'Lo', 0, 'L', None, False, None),
+    (0x1071, 'MYANMAR VOWEL SIGN GEBA KAREN I', 'Mn', 0, 'NSM', None, False, None),
+    (0x1072, 'MYANMAR VOWEL SIGN KAYAH OE', 'Mn', 0, 'NSM', None, False, None),
+    (0x1073, 'MYANMAR VOWEL SIGN KAYAH U', 'Mn', 0, 'NSM', None, False, None),
+    (0x1074, 'MYANMAR VOWEL SIGN KAYAH EE', 'Mn', 0, 'NSM', None, False, None),
+    (0x1075, 'MYANMAR LETTER SHAN KA', 'Lo', 0, 'L', None, False, None),
+    (0x1076, 'MYANMAR LETTER SHAN KHA', 'Lo', 0, 'L', None, False, None),
+    (0x1077, 'MYANMAR LETTER SHAN GA', 'Lo', 0, 'L', None, False, None),
+    (0x1078, 'MYANMAR LETTER SHAN CA', 'Lo', 0, 'L', None, False, None),
+    (0x1079, 'MYANMAR LETTER SHAN ZA', 'Lo', 0, 'L', None, False, None),
+    (0x107A, 'MYANMAR LETTER SHAN NYA', 'Lo', 0, 'L', None, False, None),
+    (0x107B, 'MYANMAR LETTER SHAN DA', 'Lo', 0, 'L', None, False, None),
+    (0x107C, 'MYANMAR LETTER SHAN NA', 'Lo', 0, 'L', None, False, None),
+    (0x107D, 'MYANMAR LETTER SHAN PHA', 'Lo', 0, 'L', None, False, None),
+    (0x107E, 'MYANMAR LETTER SHAN FA', 'Lo', 0, 'L', None, False, None),
+    (0x107F, 'MYANMAR LETTER SHAN BA', 'Lo', 0, 'L', None, False, None),
+    (0x1080, 'MYANMAR LETTER SHAN THA', 'Lo', 0, 'L', None, False, None),
+    (0x1081, 'MYANMAR LETTER SHAN HA', 'Lo', 0, 'L', None, False, None),
+    (0x1082, 'MYANMAR CONSONANT SIGN SHAN MEDIAL WA', 'Mn', 0, 'NSM', None, False, None),
+    (0x1083, 'MYANMAR VOWEL SIGN SHAN AA', 'Mc', 0, 'L', None, False, None),
+    (0x1084, 'MYANMAR VOWEL SIGN SHAN E', 'Mc', 0, 'L', None, False, None),
+    (0x1085, 'MYANMAR VOWEL SIGN SHAN E ABOVE', 'Mn', 0, 'NSM', None, False, None),
+    (0x1086, 'MYANMAR VOWEL SIGN SHAN FINAL Y', 'Mn', 0, 'NSM', None, False, None),
+    (0x1087, 'MYANMAR SIGN SHAN TONE-2', 'Mc', 0, 'L', None, False, None),
+    (0x1088, 'MYANMAR SIGN SHAN TONE-3', 'Mc', 0, 'L', None, False, None),
+    (0x1089, 'MYANMAR SIGN SHAN TONE-5', 'Mc', 0, 'L', None, False, None),
+    (0x108A, 'MYANMAR SIGN SHAN TONE-6', 'Mc', 0, 'L', None, False, None),
+    (0x108B, 'MYANMAR SIGN SHAN COUNCIL TONE-2', 'Mc', 0, 'L', None, False, None),
+    (0x108C, 'MYANMAR SIGN SHAN COUNCIL TONE-3', 'Mc', 0, 'L', None, False, None),
+    (0x108D, 'MYANMAR SIGN SHAN COUNCIL EMPHATIC TONE', 'Mn', 220, 'NSM', None, False, None),
+    (0x108E, 'MYANMAR LETTER RUMAI PALAUNG FA', 'Lo', 0, 'L', None, False, None),
+    (0x108F, 'MYANMAR SIGN RUMAI PALAUNG TONE-5', 'Mc', 0, 'L', None, False, None),
+    (0x1090, 'MYANMAR SHAN DIGIT ZERO', 'Nd', 0, 'L', 0, False, None),
+    (0x1091, 'MYANMAR SHAN DIGIT ONE', 'Nd', 0, 'L', 1, False, None),
+    (0x1092, 'MYANMAR SHAN DIGIT TWO', 'Nd', 0, 'L', 2, False, None),
+    (0x1093, 'MYANMAR SHAN DIGIT THREE', 'Nd', 0, 'L', 3, False, None),
+    (0x1094, 'MYANMAR SHAN DIGIT FOUR', 'Nd', 0, 'L', 4, False, None),
+    (0x1095, 'MYANMAR SHAN DIGIT FIVE', 'Nd', 0, 'L', 5, False, None),
+    (0x1096, 'MYANMAR SHAN DIGIT SIX', 'Nd', 0, 'L', 6, False, None),
+    (0x1097, 'MYANMAR SHAN DIGIT SEVEN', 'Nd', 0, 'L', 7, False, None),
+    (0x1098, 'MYANMAR SHAN DIGIT EIGHT', 'Nd', 0, 'L', 8, False, None),
+    (0x1099, 'MYANMAR SHAN DIGIT NINE', 'Nd', 0, 'L', 9, False, None),
+    (0x109A, 'MYANMAR SIGN KHAMTI TONE-1', 'Mc', 0, 'L', None, False, None),
+    (0x109B, 'MYANMAR SIGN KHAMTI TONE-3', 'Mc', 0, 'L', None, False, None),
+    (0x109C, 'MYANMAR VOWEL SIGN AITON A', 'Mc', 0, 'L', None, False, None),
+    (0x109D, 'MYANMAR VOWEL SIGN AITON AI', 'Mn', 0, 'NSM', None, False, None),
+    (0x109E, 'MYANMAR SYMBOL SHAN ONE', 'So', 0, 'L', None, False, None),
+    (0x109F, 'MYANMAR SYMBOL SHAN EXCLAMATION', 'So', 0, 'L', None, False, None),
+    (0x10A0, 'GEORGIAN CAPITAL LETTER AN', 'Lu', 0, 'L', None, False, 0x2D00),
+    (0x10A1, 'GEORGIAN CAPITAL LETTER BAN', 'Lu', 0, 'L', None, False, 0x2D01),
+    (0x10A2, 'GEORGIAN CAPITAL LETTER GAN', 'Lu', 0, 'L', None, False, 0x2D02),
+    (0x10A3, 'GEORGIAN CAPITAL LETTER DON', 'Lu', 0, 'L', None, False, 0x2D03),
+    (0x10A4, 'GEORGIAN CAPITAL LETTER EN', 'Lu', 0, 'L', None, False, 0x2D04),
+    (0x10A5, 'GEORGIAN CAPITAL LETTER VIN', 'Lu', 0, 'L', None, False, 0x2D05),
+    (0x10A6, 'GEORGIAN CAPITAL LETTER ZEN', 'Lu', 0, 'L', None, False, 0x2D06),
+    (0x10A7, 'GEORGIAN CAPITAL LETTER TAN', 'Lu', 0, 'L', None, False, 0x2D07),
+    (0x10A8, 'GEORGIAN CAPITAL LETTER IN', 'Lu', 0, 'L', None, False, 0x2D08),
+    (0x10A9, 'GEORGIAN CAPITAL LETTER KAN', 'Lu', 0, 'L', None, False, 0x2D09),
+    (0x10AA, 'GEORGIAN CAPITAL LETTER LAS', 'Lu', 0, 'L', None, False, 0x2D0A),
+    (0x10AB, 'GEORGIAN CAPITAL LETTER MAN', 'Lu', 0, 'L', None, False, 0x2D0B),
+    (0x10AC, 'GEORGIAN CAPITAL LETTER NAR', 'Lu', 0, 'L', None, False, 0x2D0C),
+    (0x10AD, 'GEORGIAN CAPITAL LETTER ON', 'Lu', 0, 'L', None, False, 0x2D0D),
+    (0x10AE, 'GEORGIAN CAPITAL LETTER PAR', 'Lu', 0, 'L', None, False, 0x2D0E),
+    (0x10AF, 'GEORGIAN CAPITAL LETTER ZHAR', 'Lu', 0, 'L', None, False, 0x2D0F),
+    (0x10B0, 'GEORGIAN CAPITAL LETTER RAE', 'Lu', 0, 'L', None, False, 0x2D10),
+    (0x10B1, 'GEORGIAN CAPITAL LETTER SAN', 'Lu', 0, 'L', None, False, 0x2D11),
+    (0x10B2, 'GEORGIAN CAPITAL LETTER TAR', 'Lu', 0, 'L', None, False, 0x2D12),
+    (0x10B3, 'GEORGIAN CAPITAL LETTER UN', 'Lu', 0, 'L', None, False, 0x2D13),
+    (0x10B4, 'GEORGIAN CAPITAL LETTER PHAR', 'Lu', 0, 'L', None, False, 0x2D14),
+    (0x10B5, 'GEORGIAN CAPITAL LETTER KHAR', 'Lu', 0, 'L', None, False, 0x2D15),
+    (0x10B6, 'GEORGIAN CAPITAL LETTER GHAN', 'Lu', 0, 'L', None, False, 0x2D16),
+    (0x10B7, 'GEORGIAN CAPITAL LETTER QAR', 'Lu', 0, 'L', None, False, 0x2D17),
+    (0x10B8, 'GEORGIAN CAPITAL LETTER SHIN', 'Lu', 0, 'L', None, False, 0x2D18),
+    (0x10B9, 'GEORGIAN CAPITAL LETTER CHIN', 'Lu', 0, 'L', None, False, 0x2D19),
+    (0x10BA, 'GEORGIAN CAPITAL LETTER CAN', 'Lu', 0, 'L', None, False, 0x2D1A),
+    (0x10BB, 'GEORGIAN CAPITAL LETTER JIL', 'Lu', 0, 'L', None, False, 0x2D1B),
+    (0x10BC, 'GEORGIAN CAPITAL LETTER CIL', 'Lu', 0, 'L', None, False, 0x2D1C),
+    (0x10BD, 'GEORGIAN CAPITAL LETTER CHAR', 'Lu', 0, 'L', None, False, 0x2D1D),
+    (0x10BE, 'GEORGIAN CAPITAL LETTER XAN', 'Lu', 0, 'L', None, False, 0x2D1E),
+    (0x10BF, 'GEORGIAN CAPITAL LETTER JHAN', 'Lu', 0, 'L', None, False, 0x2D1F),
+    (0x10C0, 'GEORGIAN CAPITAL LETTER HAE', 'Lu', 0, 'L', None, False, 0x2D20),
+    (0x10C1, 'GEORGIAN CAPITAL LETTER HE', 'Lu', 0, 'L', None, False, 0x2D21),
+    (0x10C2, 'GEORGIAN CAPITAL LETTER HIE', 'Lu', 0, 'L', None, False, 0x2D22),
+    (0x10C3, 'GEORGIAN CAPITAL LETTER WE', 'Lu', 0, 'L', None, False, 0x2D23),
+    (0x10C4, 'GEORGIAN CAPITAL LETTER HAR', 'Lu', 0, 'L', None, False, 0x2D24),
+    (0x10C5, 'GEORGIAN CAPITAL LETTER HOE', 'Lu', 0, 'L', None, False, 0x2D25),
+    (0x10C7, 'GEORGIAN CAPITAL LETTER YN', 'Lu', 0, 'L', None, False, 0x2D27),
+    (0x10CD, 'GEORGIAN CAPITAL LETTER AEN', 'Lu', 0, 'L', None, False, 0x2D2D),
+    (0x10D0, 'GEORGIAN LETTER AN', 'Ll', 0, 'L', None, False, None),
+    (0x10D1, 'GEORGIAN LETTER BAN', 'Ll', 0, 'L', None, False, None),
+    (0x10D2, 'GEORGIAN LETTER GAN', 'Ll', 0, 'L', None, False, None),
+    (0x10D3, 'GEORGIAN LETTER DON', 'Ll', 0, 'L', None, False, None),
+    (0x10D4, 'GEORGIAN LETTER EN', 'Ll', 0, 'L', None, False, None),
+    (0x10D5, 'GEORGIAN LETTER VIN', 'Ll', 0, 'L', None, False, None),
+    (0x10D6, 'GEORGIAN LETTER ZEN', 'Ll', 0, 'L', None, False, None),
+    (0x10D7, 'GEORGIAN LETTER TAN', 'Ll', 0, 'L', None, False, None),
+    (0x10D8, 'GEORGIAN LETTER IN', 'Ll', 0, 'L', None, False, None),
+    (0x10D9, 'GEORGIAN LETTER KAN', 'Ll', 0, 'L', None, False, None),
+    (0x10DA, 'GEORGIAN LETTER LAS', 'Ll', 0, 'L', None, False, None),
+    (0x10DB, 'GEORGIAN LETTER MAN', 'Ll', 0, 'L', None, False, None),
+    (0x10DC, 'GEORGIAN LETTER NAR', 'Ll', 0, 'L', None, False, None),
+    (0x10DD, 'GEORGIAN LETTER ON', 'Ll', 0, 'L', None, False, None),
+    (0x10DE, 'GEORGIAN LETTER PAR', 'Ll', 0, 'L', None, False, None),
+    (0x10DF, 'GEORGIAN LETTER ZHAR', 'Ll', 0, 'L', None, False, None),
+    (0x10E0, 'GEORGIAN LETTER RAE', 'Ll', 0, 'L', None, False, None),
+    (0x10E1, 'GEORGIAN LETTER SAN', 'Ll', 0, 'L', None, False, None),
+    (0x10E2, 'GEORGIAN LETTER TAR', 'Ll', 0, 'L', None, False, None),
+    (0x10E3, 'GEORGIAN LETTER UN', 'Ll', 0, 'L', None, False, None),
+    (0x10E4, 'GEORGIAN LETTER PHAR', 'Ll', 0, 'L', None, False, None),
+    (0x10E5, 'GEORGIAN LETTER KHAR', 'Ll', 0, 'L', None, False, None),
+    (0x10E6, 'GEORGIAN LETTER GHAN', 'Ll', 0, 'L', None, False, None),
+    (0x10E7, 'GEORGIAN LETTER QAR', 'Ll', 0, 'L', None, False, None),
+    (0x10E8, 'GEORGIAN LETTER SHIN', 'Ll', 0, 'L', None, False, None),
+    (0x10E9, 'GEORGIAN LETTER CHIN', 'Ll', 0, 'L', None, False, None),
+    (0x10EA, 'GEORGIAN LETTER CAN', 'Ll', 0, 'L', None, False, None),
+    (0x10EB, 'GEORGIAN LETTER JIL', 'Ll', 0, 'L', None, False, None),
+    (0x10EC, 'GEORGIAN LETTER CIL', 'Ll', 0, 'L', None, False, None),
+    (0x10ED, 'GEORGIAN LETTER CHAR', 'Ll', 0, 'L', None, False, None),
+    (0x10EE, 'GEORGIAN LETTER XAN', 'Ll', 0, 'L', None, False, None),
+    (0x10EF, 'GEORGIAN LETTER JHAN', 'Ll', 0, 'L', None, False, None),
+    (0x10F0, 'GEORGIAN LETTER HAE', 'Ll', 0, 'L', None, False, None),
+    (0x10F1, 'GEORGIAN LETTER HE', 'Ll', 0, 'L', None, False, None),
+    (0x10F2, 'GEORGIAN LETTER HIE', 'Ll', 0, 'L', None, False, None),
+    (0x10F3, 'GEORGIAN LETTER WE', 'Ll', 0, 'L', None, False, None),
+    (0x10F4, 'GEORGIAN LETTER HAR', 'Ll', 0, 'L', None, False, None),
+    (0x10F5, 'GEORGIAN LETTER HOE', 'Ll', 0, 'L', None, False, None),
+    (0x10F6, 'GEORGIAN LETTER FI', 'Ll', 0, 'L', None, False, None),
+    (0x10F7, 'GEORGIAN LETTER YN', 'Ll', 0, 'L', None, False, None),
+    (0x10F8, 'GEORGIAN LETTER ELIFI', 'Ll', 0, 'L', None, False, None),
+    (0x10F9, 'GEORGIAN LETTER TURNED GAN', 'Ll', 0, 'L', None, False, None),
+    (0x10FA, 'GEORGIAN LETTER AIN', 'Ll', 0, 'L', None, False, None),
+    (0x10FB, 'GEORGIAN PARAGRAPH SEPARATOR', 'Po', 0, 'L', None, False, None),
+    (0x10FC, 'MODIFIER LETTER GEORGIAN NAR', 'Lm', 0, 'L', None, False, None),
+    (0x10FD, 'GEORGIAN LETTER AEN', 'Ll', 0, 'L', None, False, None),
+    (0x10FE, 'GEORGIAN LETTER HARD SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x10FF, 'GEORGIAN LETTER LABIAL SIGN', 'Ll', 0, 'L', None, False, None),
+    (0x1100, 'HANGUL CHOSEONG KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1101, 'HANGUL CHOSEONG SSANGKIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1102, 'HANGUL CHOSEONG NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x1103, 'HANGUL CHOSEONG TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1104, 'HANGUL CHOSEONG SSANGTIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1105, 'HANGUL CHOSEONG RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x1106, 'HANGUL CHOSEONG MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x1107, 'HANGUL CHOSEONG PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1108, 'HANGUL CHOSEONG SSANGPIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1109, 'HANGUL CHOSEONG SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x110A, 'HANGUL CHOSEONG SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x110B, 'HANGUL CHOSEONG IEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x110C, 'HANGUL CHOSEONG CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x110D, 'HANGUL CHOSEONG SSANGCIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x110E, 'HANGUL CHOSEONG CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x110F, 'HANGUL CHOSEONG KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x1110, 'HANGUL CHOSEONG THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x1111, 'HANGUL CHOSEONG PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x1112, 'HANGUL CHOSEONG HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x1113, 'HANGUL CHOSEONG NIEUN-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1114, 'HANGUL CHOSEONG SSANGNIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x1115, 'HANGUL CHOSEONG NIEUN-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1116, 'HANGUL CHOSEONG NIEUN-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1117, 'HANGUL CHOSEONG TIKEUT-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1118, 'HANGUL CHOSEONG RIEUL-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x1119, 'HANGUL CHOSEONG SSANGRIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x111A, 'HANGUL CHOSEONG RIEUL-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x111B, 'HANGUL CHOSEONG KAPYEOUNRIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x111C, 'HANGUL CHOSEONG MIEUM-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x111D, 'HANGUL CHOSEONG KAPYEOUNMIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x111E, 'HANGUL CHOSEONG PIEUP-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x111F, 'HANGUL CHOSEONG PIEUP-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x1120, 'HANGUL CHOSEONG PIEUP-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1121, 'HANGUL CHOSEONG PIEUP-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1122, 'HANGUL CHOSEONG PIEUP-SIOS-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1123, 'HANGUL CHOSEONG PIEUP-SIOS-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1124, 'HANGUL CHOSEONG PIEUP-SIOS-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1125, 'HANGUL CHOSEONG PIEUP-SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1126, 'HANGUL CHOSEONG PIEUP-SIOS-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1127, 'HANGUL CHOSEONG PIEUP-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1128, 'HANGUL CHOSEONG PIEUP-CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x1129, 'HANGUL CHOSEONG PIEUP-THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x112A, 'HANGUL CHOSEONG PIEUP-PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x112B, 'HANGUL CHOSEONG KAPYEOUNPIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x112C, 'HANGUL CHOSEONG KAPYEOUNSSANGPIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x112D, 'HANGUL CHOSEONG SIOS-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x112E, 'HANGUL CHOSEONG SIOS-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x112F, 'HANGUL CHOSEONG SIOS-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1130, 'HANGUL CHOSEONG SIOS-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x1131, 'HANGUL CHOSEONG SIOS-MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x1132, 'HANGUL CHOSEONG SIOS-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1133, 'HANGUL CHOSEONG SIOS-PIEUP-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1134, 'HANGUL CHOSEONG SIOS-SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1135, 'HANGUL CHOSEONG SIOS-IEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x1136, 'HANGUL CHOSEONG SIOS-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1137, 'HANGUL CHOSEONG SIOS-CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x1138, 'HANGUL CHOSEONG SIOS-KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x1139, 'HANGUL CHOSEONG SIOS-THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x113A, 'HANGUL CHOSEONG SIOS-PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x113B, 'HANGUL CHOSEONG SIOS-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x113C, 'HANGUL CHOSEONG CHITUEUMSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x113D, 'HANGUL CHOSEONG CHITUEUMSSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x113E, 'HANGUL CHOSEONG CEONGCHIEUMSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x113F, 'HANGUL CHOSEONG CEONGCHIEUMSSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1140, 'HANGUL CHOSEONG PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1141, 'HANGUL CHOSEONG IEUNG-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x1142, 'HANGUL CHOSEONG IEUNG-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x1143, 'HANGUL CHOSEONG IEUNG-MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x1144, 'HANGUL CHOSEONG IEUNG-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1145, 'HANGUL CHOSEONG IEUNG-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1146, 'HANGUL CHOSEONG IEUNG-PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x1147, 'HANGUL CHOSEONG SSANGIEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x1148, 'HANGUL CHOSEONG IEUNG-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1149, 'HANGUL CHOSEONG IEUNG-CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x114A, 'HANGUL CHOSEONG IEUNG-THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x114B, 'HANGUL CHOSEONG IEUNG-PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x114C, 'HANGUL CHOSEONG YESIEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x114D, 'HANGUL CHOSEONG CIEUC-IEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x114E, 'HANGUL CHOSEONG CHITUEUMCIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x114F, 'HANGUL CHOSEONG CHITUEUMSSANGCIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1150, 'HANGUL CHOSEONG CEONGCHIEUMCIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1151, 'HANGUL CHOSEONG CEONGCHIEUMSSANGCIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x1152, 'HANGUL CHOSEONG CHIEUCH-KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x1153, 'HANGUL CHOSEONG CHIEUCH-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x1154, 'HANGUL CHOSEONG CHITUEUMCHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x1155, 'HANGUL CHOSEONG CEONGCHIEUMCHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x1156, 'HANGUL CHOSEONG PHIEUPH-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x1157, 'HANGUL CHOSEONG KAPYEOUNPHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x1158, 'HANGUL CHOSEONG SSANGHIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x1159, 'HANGUL CHOSEONG YEORINHIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x115A, 'HANGUL CHOSEONG KIYEOK-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x115B, 'HANGUL CHOSEONG NIEUN-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x115C, 'HANGUL CHOSEONG NIEUN-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x115D, 'HANGUL CHOSEONG NIEUN-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x115E, 'HANGUL CHOSEONG TIKEUT-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x115F, 'HANGUL CHOSEONG FILLER', 'Lo', 0, 'L', None, False, None),
+    (0x1160, 'HANGUL JUNGSEONG FILLER', 'Lo', 0, 'L', None, False, None),
+    (0x1161, 'HANGUL JUNGSEONG A', 'Lo', 0, 'L', None, False, None),
+    (0x1162, 'HANGUL JUNGSEONG AE', 'Lo', 0, 'L', None, False, None),
+    (0x1163, 'HANGUL JUNGSEONG YA', 'Lo', 0, 'L', None, False, None),
+    (0x1164, 'HANGUL JUNGSEONG YAE', 'Lo', 0, 'L', None, False, None),
+    (0x1165, 'HANGUL JUNGSEONG EO', 'Lo', 0, 'L', None, False, None),
+    (0x1166, 'HANGUL JUNGSEONG E', 'Lo', 0, 'L', None, False, None),
+    (0x1167, 'HANGUL JUNGSEONG YEO', 'Lo', 0, 'L', None, False, None),
+    (0x1168, 'HANGUL JUNGSEONG YE', 'Lo', 0, 'L', None, False, None),
+    (0x1169, 'HANGUL JUNGSEONG O', 'Lo', 0, 'L', None, False, None),
+    (0x116A, 'HANGUL JUNGSEONG WA', 'Lo', 0, 'L', None, False, None),
+    (0x116B, 'HANGUL JUNGSEONG WAE', 'Lo', 0, 'L', None, False, None),
+    (0x116C, 'HANGUL JUNGSEONG OE', 'Lo', 0, 'L', None, False, None),
+    (0x116D, 'HANGUL JUNGSEONG YO', 'Lo', 0, 'L', None, False, None),
+    (0x116E, 'HANGUL JUNGSEONG U', 'Lo', 0, 'L', None, False, None),
+    (0x116F, 'HANGUL JUNGSEONG WEO', 'Lo', 0, 'L', None, False, None),
+    (0x1170, 'HANGUL JUNGSEONG WE', 'Lo', 0, 'L', None, False, None),
+    (0x1171, 'HANGUL JUNGSEONG WI', 'Lo', 0, 'L', None, False, None),
+    (0x1172, 'HANGUL JUNGSEONG YU', 'Lo', 0, 'L', None, False, None),
+    (0x1173, 'HANGUL JUNGSEONG EU', 'Lo', 0, 'L', None, False, None),
+    (0x1174, 'HANGUL JUNGSEONG YI', 'Lo', 0, 'L', None, False, None),
+    (0x1175, 'HANGUL JUNGSEONG I', 'Lo', 0, 'L', None, False, None),
+    (0x1176, 'HANGUL JUNGSEONG A-O', 'Lo', 0, 'L', None, False, None),
+    (0x1177, 'HANGUL JUNGSEONG A-U', 'Lo', 0, 'L', None, False, None),
+    (0x1178, 'HANGUL JUNGSEONG YA-O', 'Lo', 0, 'L', None, False, None),
+    (0x1179, 'HANGUL JUNGSEONG YA-YO', 'Lo', 0, 'L', None, False, None),
+    (0x117A, 'HANGUL JUNGSEONG EO-O', 'Lo', 0, 'L', None, False, None),
+    (0x117B, 'HANGUL JUNGSEONG EO-U', 'Lo', 0, 'L', None, False, None),
+    (0x117C, 'HANGUL JUNGSEONG EO-EU', 'Lo', 0, 'L', None, False, None),
+    (0x117D, 'HANGUL JUNGSEONG YEO-O', 'Lo', 0, 'L', None, False, None),
+    (0x117E, 'HANGUL JUNGSEONG YEO-U', 'Lo', 0, 'L', None, False, None),
+    (0x117F, 'HANGUL JUNGSEONG O-EO', 'Lo', 0, 'L', None, False, None),
+    (0x1180, 'HANGUL JUNGSEONG O-E', 'Lo', 0, 'L', None, False, None),
+    (0x1181, 'HANGUL JUNGSEONG O-YE', 'Lo', 0, 'L', None, False, None),
+    (0x1182, 'HANGUL JUNGSEONG O-O', 'Lo', 0, 'L', None, False, None),
+    (0x1183, 'HANGUL JUNGSEONG O-U', 'Lo', 0, 'L', None, False, None),
+    (0x1184, 'HANGUL JUNGSEONG YO-YA', 'Lo', 0, 'L', None, False, None),
+    (0x1185, 'HANGUL JUNGSEONG YO-YAE', 'Lo', 0, 'L', None, False, None),
+    (0x1186, 'HANGUL JUNGSEONG YO-YEO', 'Lo', 0, 'L', None, False, None),
+    (0x1187, 'HANGUL JUNGSEONG YO-O', 'Lo', 0, 'L', None, False, None),
+    (0x1188, 'HANGUL JUNGSEONG YO-I', 'Lo', 0, 'L', None, False, None),
+    (0x1189, 'HANGUL JUNGSEONG U-A', 'Lo', 0, 'L', None, False, None),
+    (0x118A, 'HANGUL JUNGSEONG U-AE', 'Lo', 0, 'L', None, False, None),
+    (0x118B, 'HANGUL JUNGSEONG U-EO-EU', 'Lo', 0, 'L', None, False, None),
+    (0x118C, 'HANGUL JUNGSEONG U-YE', 'Lo', 0, 'L', None, False, None),
+    (0x118D, 'HANGUL JUNGSEONG U-U', 'Lo', 0, 'L', None, False, None),
+    (0x118E, 'HANGUL JUNGSEONG YU-A', 'Lo', 0, 'L', None, False, None),
+    (0x118F, 'HANGUL JUNGSEONG YU-EO', 'Lo', 0, 'L', None, False, None),
+    (0x1190, 'HANGUL JUNGSEONG YU-E', 'Lo', 0, 'L', None, False, None),
+    (0x1191, 'HANGUL JUNGSEONG YU-YEO', 'Lo', 0, 'L', None, False, None),
+    (0x1192, 'HANGUL JUNGSEONG YU-YE', 'Lo', 0, 'L', None, False, None),
+    (0x1193, 'HANGUL JUNGSEONG YU-U', 'Lo', 0, 'L', None, False, None),
+    (0x1194, 'HANGUL JUNGSEONG YU-I', 'Lo', 0, 'L', None, False, None),
+    (0x1195, 'HANGUL JUNGSEONG EU-U', 'Lo', 0, 'L', None, False, None),
+    (0x1196, 'HANGUL JUNGSEONG EU-EU', 'Lo', 0, 'L', None, False, None),
+    (0x1197, 'HANGUL JUNGSEONG YI-U', 'Lo', 0, 'L', None, False, None),
+    (0x1198, 'HANGUL JUNGSEONG I-A', 'Lo', 0, 'L', None, False, None),
+    (0x1199, 'HANGUL JUNGSEONG I-YA', 'Lo', 0, 'L', None, False, None),
+    (0x119A, 'HANGUL JUNGSEONG I-O', 'Lo', 0, 'L', None, False, None),
+    (0x119B, 'HANGUL JUNGSEONG I-U', 'Lo', 0, 'L', None, False, None),
+    (0x119C, 'HANGUL JUNGSEONG I-EU', 'Lo', 0, 'L', None, False, None),
+    (0x119D, 'HANGUL JUNGSEONG I-ARAEA', 'Lo', 0, 'L', None, False, None),
+    (0x119E, 'HANGUL JUNGSEONG ARAEA', 'Lo', 0, 'L', None, False, None),
+    (0x119F, 'HANGUL JUNGSEONG ARAEA-EO', 'Lo', 0, 'L', None, False, None),
+    (0x11A0, 'HANGUL JUNGSEONG ARAEA-U', 'Lo', 0, 'L', None, False, None),
+    (0x11A1, 'HANGUL JUNGSEONG ARAEA-I', 'Lo', 0, 'L', None, False, None),
+    (0x11A2, 'HANGUL JUNGSEONG SSANGARAEA', 'Lo', 0, 'L', None, False, None),
+    (0x11A3, 'HANGUL JUNGSEONG A-EU', 'Lo', 0, 'L', None, False, None),
+    (0x11A4, 'HANGUL JUNGSEONG YA-U', 'Lo', 0, 'L', None, False, None),
+    (0x11A5, 'HANGUL JUNGSEONG YEO-YA', 'Lo', 0, 'L', None, False, None),
+    (0x11A6, 'HANGUL JUNGSEONG O-YA', 'Lo', 0, 'L', None, False, None),
+    (0x11A7, 'HANGUL JUNGSEONG O-YAE', 'Lo', 0, 'L', None, False, None),
+    (0x11A8, 'HANGUL JONGSEONG KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11A9, 'HANGUL JONGSEONG SSANGKIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11AA, 'HANGUL JONGSEONG KIYEOK-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11AB, 'HANGUL JONGSEONG NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x11AC, 'HANGUL JONGSEONG NIEUN-CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x11AD, 'HANGUL JONGSEONG NIEUN-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11AE, 'HANGUL JONGSEONG TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x11AF, 'HANGUL JONGSEONG RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11B0, 'HANGUL JONGSEONG RIEUL-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11B1, 'HANGUL JONGSEONG RIEUL-MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x11B2, 'HANGUL JONGSEONG RIEUL-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11B3, 'HANGUL JONGSEONG RIEUL-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11B4, 'HANGUL JONGSEONG RIEUL-THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x11B5, 'HANGUL JONGSEONG RIEUL-PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x11B6, 'HANGUL JONGSEONG RIEUL-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11B7, 'HANGUL JONGSEONG MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x11B8, 'HANGUL JONGSEONG PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11B9, 'HANGUL JONGSEONG PIEUP-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11BA, 'HANGUL JONGSEONG SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11BB, 'HANGUL JONGSEONG SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11BC, 'HANGUL JONGSEONG IEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x11BD, 'HANGUL JONGSEONG CIEUC', 'Lo', 0, 'L', None, False, None),
+    (0x11BE, 'HANGUL JONGSEONG CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x11BF, 'HANGUL JONGSEONG KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x11C0, 'HANGUL JONGSEONG THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x11C1, 'HANGUL JONGSEONG PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x11C2, 'HANGUL JONGSEONG HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11C3, 'HANGUL JONGSEONG KIYEOK-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11C4, 'HANGUL JONGSEONG KIYEOK-SIOS-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11C5, 'HANGUL JONGSEONG NIEUN-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11C6, 'HANGUL JONGSEONG NIEUN-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x11C7, 'HANGUL JONGSEONG NIEUN-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11C8, 'HANGUL JONGSEONG NIEUN-PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11C9, 'HANGUL JONGSEONG NIEUN-THIEUTH', 'Lo', 0, 'L', None, False, None),
+    (0x11CA, 'HANGUL JONGSEONG TIKEUT-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11CB, 'HANGUL JONGSEONG TIKEUT-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11CC, 'HANGUL JONGSEONG RIEUL-KIYEOK-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11CD, 'HANGUL JONGSEONG RIEUL-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x11CE, 'HANGUL JONGSEONG RIEUL-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x11CF, 'HANGUL JONGSEONG RIEUL-TIKEUT-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11D0, 'HANGUL JONGSEONG SSANGRIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11D1, 'HANGUL JONGSEONG RIEUL-MIEUM-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11D2, 'HANGUL JONGSEONG RIEUL-MIEUM-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11D3, 'HANGUL JONGSEONG RIEUL-PIEUP-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11D4, 'HANGUL JONGSEONG RIEUL-PIEUP-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11D5, 'HANGUL JONGSEONG RIEUL-KAPYEOUNPIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11D6, 'HANGUL JONGSEONG RIEUL-SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11D7, 'HANGUL JONGSEONG RIEUL-PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11D8, 'HANGUL JONGSEONG RIEUL-KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x11D9, 'HANGUL JONGSEONG RIEUL-YEORINHIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11DA, 'HANGUL JONGSEONG MIEUM-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11DB, 'HANGUL JONGSEONG MIEUM-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11DC, 'HANGUL JONGSEONG MIEUM-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11DD, 'HANGUL JONGSEONG MIEUM-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11DE, 'HANGUL JONGSEONG MIEUM-SSANGSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11DF, 'HANGUL JONGSEONG MIEUM-PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11E0, 'HANGUL JONGSEONG MIEUM-CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x11E1, 'HANGUL JONGSEONG MIEUM-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11E2, 'HANGUL JONGSEONG KAPYEOUNMIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x11E3, 'HANGUL JONGSEONG PIEUP-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11E4, 'HANGUL JONGSEONG PIEUP-PHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x11E5, 'HANGUL JONGSEONG PIEUP-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11E6, 'HANGUL JONGSEONG KAPYEOUNPIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11E7, 'HANGUL JONGSEONG SIOS-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11E8, 'HANGUL JONGSEONG SIOS-TIKEUT', 'Lo', 0, 'L', None, False, None),
+    (0x11E9, 'HANGUL JONGSEONG SIOS-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11EA, 'HANGUL JONGSEONG SIOS-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11EB, 'HANGUL JONGSEONG PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11EC, 'HANGUL JONGSEONG IEUNG-KIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11ED, 'HANGUL JONGSEONG IEUNG-SSANGKIYEOK', 'Lo', 0, 'L', None, False, None),
+    (0x11EE, 'HANGUL JONGSEONG SSANGIEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x11EF, 'HANGUL JONGSEONG IEUNG-KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x11F0, 'HANGUL JONGSEONG YESIEUNG', 'Lo', 0, 'L', None, False, None),
+    (0x11F1, 'HANGUL JONGSEONG YESIEUNG-SIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11F2, 'HANGUL JONGSEONG YESIEUNG-PANSIOS', 'Lo', 0, 'L', None, False, None),
+    (0x11F3, 'HANGUL JONGSEONG PHIEUPH-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11F4, 'HANGUL JONGSEONG KAPYEOUNPHIEUPH', 'Lo', 0, 'L', None, False, None),
+    (0x11F5, 'HANGUL JONGSEONG HIEUH-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x11F6, 'HANGUL JONGSEONG HIEUH-RIEUL', 'Lo', 0, 'L', None, False, None),
+    (0x11F7, 'HANGUL JONGSEONG HIEUH-MIEUM', 'Lo', 0, 'L', None, False, None),
+    (0x11F8, 'HANGUL JONGSEONG HIEUH-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11F9, 'HANGUL JONGSEONG YEORINHIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11FA, 'HANGUL JONGSEONG KIYEOK-NIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x11FB, 'HANGUL JONGSEONG KIYEOK-PIEUP', 'Lo', 0, 'L', None, False, None),
+    (0x11FC, 'HANGUL JONGSEONG KIYEOK-CHIEUCH', 'Lo', 0, 'L', None, False, None),
+    (0x11FD, 'HANGUL JONGSEONG KIYEOK-KHIEUKH', 'Lo', 0, 'L', None, False, None),
+    (0x11FE, 'HANGUL JONGSEONG KIYEOK-HIEUH', 'Lo', 0, 'L', None, False, None),
+    (0x11FF, 'HANGUL JONGSEONG SSANGNIEUN', 'Lo', 0, 'L', None, False, None),
+    (0x1200, 'ETHIOPIC SYLLABLE HA', 'Lo', 0, 'L', None, False, None),
+    (0x1201, 'ETHIOPIC SYLLABLE HU', 'Lo', 0, 'L', None, False, None),
+    (0x1202, 'ETHIOPIC SYLLABLE HI', 'Lo', 0, 'L', None, False, None),
+    (0x1203, 'ETHIOPIC SYLLABLE HAA', 'Lo', 0, 'L', None, False, None),
+    (0x1204, 'ETHIOPIC SYLLABLE HEE', 'Lo', 0, 'L', None, False, None),
+    (0x1205, 'ETHIOPIC SYLLABLE HE', 'Lo', 0, 'L', None, False, None),
+    (0x1206, 'ETHIOPIC SYLLABLE HO', 'Lo', 0, 'L', None, False, None),
+    (0x1207, 'ETHIOPIC SYLLABLE HOA', 'Lo', 0, 'L', None, False, None),
+    (0x1208, 'ETHIOPIC SYLLABLE LA', 'Lo', 0, 'L', None, False, None),
+    (0x1209, 'ETHIOPIC SYLLABLE LU', 'Lo', 0, 'L', None, False, None),
+    (0x120A, 'ETHIOPIC SYLLABLE LI', 'Lo', 0, 'L', None, False, None),
+    (0x120B, 'ETHIOPIC SYLLABLE LAA', 'Lo', 0, 'L', None, False, None),
+    (0x120C, 'ETHIOPIC SYLLABLE LEE', 'Lo', 0, 'L', None, False, None),
+    (0x120D, 'ETHIOPIC SYLLABLE LE', 'Lo', 0, 'L', None, False, None),
+    (0x120E, 'ETHIOPIC SYLLABLE LO', 'Lo', 0, 'L', None, False, None),
+    (0x120F, 'ETHIOPIC SYLLABLE LWA', 'Lo', 0, 'L', None, False, None),
+    (0x1210, 'ETHIOPIC SYLLABLE HHA', 'Lo', 0, 'L', None, False, None),
+    (0x1211, 'ETHIOPIC SYLLABLE HHU', 'Lo', 0, 'L', None, False, None),
+    (0x1212, 'ETHIOPIC SYLLABLE HHI', 'Lo', 0, 'L', None, False, None),
+    (0x1213, 'ETHIOPIC SYLLABLE HHAA', 'Lo', 0, 'L', None, False, None),
+    (0x1214, 'ETHIOPIC SYLLABLE HHEE', 'Lo', 0, 'L', None, False, None),
+    (0x1215, 'ETHIOPIC SYLLABLE HHE', 'Lo', 0, 'L', None, False, None),
+    (0x1216, 'ETHIOPIC SYLLABLE HHO', 'Lo', 0, 'L', None, False, None),
+    (0x1217, 'ETHIOPIC SYLLABLE HHWA', 'Lo', 0, 'L', None, False, None),
+    (0x1218, 'ETHIOPIC SYLLABLE MA', 'Lo', 0, 'L', None, False, None),
+    (0x1219, 'ETHIOPIC SYLLABLE MU', 'Lo', 0, 'L', None, False, None),
+    (0x121A, 'ETHIOPIC SYLLABLE MI', 'Lo', 0, 'L', None, False, None),
+    (0x121B, 'ETHIOPIC SYLLABLE MAA', 'Lo', 0, 'L', None, False, None),
+    (0x121C, 'ETHIOPIC SYLLABLE MEE', 'Lo', 0, 'L', None, False, None),
+    (0x121D, 'ETHIOPIC SYLLABLE ME', 'Lo', 0, 'L', None, False, None),
+    (0x121E, 'ETHIOPIC SYLLABLE MO', 'Lo', 0, 'L', None, False, None),
+    (0x121F, 'ETHIOPIC SYLLABLE MWA', 'Lo', 0, 'L', None, False, None),
+    (0x1220, 'ETHIOPIC SYLLABLE SZA', 'Lo', 0, 'L', None, False, None),
+    (0x1221, 'ETHIOPIC SYLLABLE SZU', 'Lo', 0, 'L', None, False, None),
+    (0x1222, 'ETHIOPIC SYLLABLE SZI', 'Lo', 0, 'L', None, False, None),
+    (0x1223, 'ETHIOPIC SYLLABLE SZAA', 'Lo', 0, 'L', None, False, None),
+    (0x1224, 'ETHIOPIC SYLLABLE SZEE', 'Lo', 0, 'L', None, False, None),
+    (0x1225, 'ETHIOPIC SYLLABLE SZE', 'Lo', 0, 'L', None, False, None),
+    (0x1226, 'ETHIOPIC SYLLABLE SZO', 'Lo', 0, 'L', None, False, None),
+    (0x1227, 'ETHIOPIC SYLLABLE SZWA', 'Lo', 0, 'L', None, False, None),
+    (0x1228, 'ETHIOPIC SYLLABLE RA', 'Lo', 0, 'L', None, False, None),
+    (0x1229, 'ETHIOPIC SYLLABLE RU', 'Lo', 0, 'L', None, False, None),
+    (0x122A, 'ETHIOPIC SYLLABLE RI', 'Lo', 0, 'L', None, False, None),
+    (0x122B, 'ETHIOPIC SYLLABLE RAA', 'Lo', 0, 'L', None, False, None),
+    (0x122C, 'ETHIOPIC SYLLABLE REE', 'Lo', 0, 'L', None, False, None),
+    (0x122D, 'ETHIOPIC SYLLABLE RE', 'Lo', 0, 'L', None, False, None),
+    (0x122E, 'ETHIOPIC SYLLABLE RO', 'Lo', 0, 'L', None, False, None),
+    (0x122F, 'ETHIOPIC SYLLABLE RWA', 'Lo', 0, 'L', None, False, None),
+    (0x1230, 'ETHIOPIC SYLLABLE SA', 'Lo', 0, 'L', None, False, None),
+    (0x1231, 'ETHIOPIC SYLLABLE SU', 'Lo', 0, 'L', None, False, None),
+    (0x1232, 'ETHIOPIC SYLLABLE SI', 'Lo', 0, 'L', None, False, None),
+    (0x1233, 'ETHIOPIC SYLLABLE SAA', 'Lo', 0, 'L', None, False, None),
+    (0x1234, 'ETHIOPIC SYLLABLE SEE', 'Lo', 0, 'L', None, False, None),
+    (0x1235, 'ETHIOPIC SYLLABLE SE', 'Lo', 0, 'L', None, False, None),
+    (0x1236, 'ETHIOPIC SYLLABLE SO', 'Lo', 0, 'L', None, False, None),
+    (0x1237, 'ETHIOPIC SYLLABLE SWA', 'Lo', 0, 'L', None, False, None),
+    (0x1238, 'ETHIOPIC SYLLABLE SHA', 'Lo', 0, 'L', None, False, None),
+    (0x1239, 'ETHIOPIC SYLLABLE SHU', 'Lo', 0, 'L', None, False, None),
+    (0x123A, 'ETHIOPIC SYLLABLE SHI', 'Lo', 0, 'L', None, False, None),
+    (0x123B, 'ETHIOPIC SYLLABLE SHAA', 'Lo', 0, 'L', None, False, None),
+    (0x123C, 'ETHIOPIC SYLLABLE SHEE', 'Lo', 0, 'L', None, False, None),
+    (0x123D, 'ETHIOPIC SYLLABLE SHE', 'Lo', 0, 'L', None, False, None),
+    (0x123E, 'ETHIOPIC SYLLABLE SHO', 'Lo', 0, 'L', None, False, None),
+    (0x123F, 'ETHIOPIC SYLLABLE SHWA', 'Lo', 0, 'L', None, False, None),
+    (0x1240, 'ETHIOPIC SYLLABLE QA', 'Lo', 0, 'L', None, False, None),
+    (0x1241, 'ETHIOPIC SYLLABLE QU', 'Lo', 0, 'L', None, False, None),
+    (0x1242, 'ETHIOPIC SYLLABLE QI', 'Lo', 0, 'L', None, False, None),
+    (0x1243, 'ETHIOPIC SYLLABLE QAA', 'Lo', 0, 'L', None, False, None),
+    (0x1244, 'ETHIOPIC SYLLABLE QEE', 'Lo', 0, 'L', None, False, None),
+    (0x1245, 'ETHIOPIC SYLLABLE QE', 'Lo', 0, 'L', None, False, None),
+    (0x1246, 'ETHIOPIC SYLLABLE QO', 'Lo', 0, 'L', None, False, None),
+    (0x1247, 'ETHIOPIC SYLLABLE QOA', 'Lo', 0, 'L', None, False, None),
+    (0x1248, 'ETHIOPIC SYLLABLE QWA', 'Lo', 0, 'L', None, False, None),
+    (0x124A, 'ETHIOPIC SYLLABLE QWI', 'Lo', 0, 'L', None, False, None),
+    (0x124B, 'ETHIOPIC SYLLABLE QWAA', 'Lo', 0, 'L', None, False, None),
+    (0x124C, 'ETHIOPIC SYLLABLE QWEE', 'Lo', 0, 'L', None, False, None),
+    (0x124D, 'ETHIOPIC SYLLABLE QWE', 'Lo', 0, 'L', None, False, None),
+    (0x1250, 'ETHIOPIC SYLLABLE QHA', 'Lo', 0, 'L', None, False, None),
+    (0x1251, 'ETHIOPIC SYLLABLE QHU', 'Lo', 0, 'L', None, False, None),
+    (0x1252, 'ETHIOPIC SYLLABLE QHI', 'Lo', 0, 'L', None, False, None),
+    (0x1253, 'ETHIOPIC SYLLABLE QHAA', 'Lo', 0, 'L', None, False, None),
+    (0x1254, 'ETHIOPIC SYLLABLE QHEE', 'Lo', 0, 'L', None, False, None),
+    (0x1255, 'ETHIOPIC SYLLABLE QHE', 'Lo', 0, 'L', None, False, None),
+    (0x1256, 'ETHIOPIC SYLLABLE QHO', 'Lo', 0, 'L', None, False, None),
+    (0x1258, 'ETHIOPIC SYLLABLE QHWA', 'Lo', 0, 'L', None, False, None),
+    (0x125A, 'ETHIOPIC SYLLABLE QHWI', 'Lo', 0, 'L', None, False, None),
+    (0x125B, 'ETHIOPIC SYLLABLE QHWAA', 'Lo', 0, 'L', None, False, None),
+    (0x125C, 'ETHIOPIC SYLLABLE QHWEE', 'Lo', 0, 'L', None, False, None),
+    (0x125D, 'ETHIOPIC SYLLABLE QHWE', 'Lo', 0, 'L', None, False, None),
+    (0x1260, 'ETHIOPIC SYLLABLE BA', 'Lo', 0, 'L', None, False, None),
+    (0x1261, 'ETHIOPIC SYLLABLE BU', 'Lo', 0, 'L', None, False, None),
+    (0x1262, 'ETHIOPIC SYLLABLE BI', 'Lo', 0, 'L', None, False, None),
+    (0x1263, 'ETHIOPIC SYLLABLE BAA', 'Lo', 0, 'L', None, False, None),
+    (0x1264, 'ETHIOPIC SYLLABLE BEE', 'Lo', 0, 'L', None, False, None),
+    (0x1265, 'ETHIOPIC SYLLABLE BE', 'Lo', 0, 'L', None, False, None),
+    (0x1266, 'ETHIOPIC SYLLABLE BO', 'Lo', 0, 'L', None, False, None),
+    (0x1267, 'ETHIOPIC SYLLABLE BWA', 'Lo', 0, 'L', None, False, None),
+    (0x1268, 'ETHIOPIC SYLLABLE VA', 'Lo', 0, 'L', None, False, None),
+    (0x1269, 'ETHIOPIC SYLLABLE VU', 'Lo', 0, 'L', None, False, None),
+    (0x126A, 'ETHIOPIC SYLLABLE VI', 'Lo', 0, 'L', None, False, None),
+    (0x126B, 'ETHIOPIC SYLLABLE VAA', 'Lo', 0, 'L', None, False, None),
+    (0x126C, 'ETHIOPIC SYLLABLE VEE', 'Lo', 0, 'L', None, False, None),
+    (0x126D, 'ETHIOPIC SYLLABLE VE', 'Lo', 0, 'L', None, False, None),
+    (0x126E, 'ETHIOPIC SYLLABLE VO', 'Lo', 0, 'L', None, False, None),
+    (0x126F, 'ETHIOPIC SYLLABLE VWA', 'Lo', 0, 'L', None, False, None),
+    (0x1270, 'ETHIOPIC SYLLABLE TA', 'Lo', 0, 'L', None, False, None),
+    (0x1271, 'ETHIOPIC SYLLABLE TU', 'Lo', 0, 'L', None, False, None),
+    (0x1272, 'ETHIOPIC SYLLABLE TI', 'Lo', 0, 'L', None, False, None),
+    (0x1273, 'ETHIOPIC SYLLABLE TAA', 'Lo', 0, 'L', None, False, None),
+    (0x1274, 'ETHIOPIC SYLLABLE TEE', 'Lo', 0, 'L', None, False, None),
+    (0x1275, 'ETHIOPIC SYLLABLE TE', 'Lo', 0, 'L', None, False, None),
+    (0x1276, 'ETHIOPIC SYLLABLE TO', 'Lo', 0, 'L', None, False, None),
+    (0x1277, 'ETHIOPIC SYLLABLE TWA', 'Lo', 0, 'L', None, False, None),
+    (0x1278, 'ETHIOPIC SYLLABLE CA', 'Lo', 0, 'L', None, False, None),
+    (0x1279, 'ETHIOPIC SYLLABLE CU', 'Lo', 0, 'L', None, False, None),
+    (0x127A, 'ETHIOPIC SYLLABLE CI', 'Lo', 0, 'L', None, False, None),
+    (0x127B, 'ETHIOPIC SYLLABLE CAA', 'Lo', 0, 'L', None, False, None),
+    (0x127C, 'ETHIOPIC SYLLABLE CEE', 'Lo', 0, 'L', None, False, None),
+    (0x127D, 'ETHIOPIC SYLLABLE CE', 'Lo', 0, 'L', None, False, None),
+    (0x127E, 'ETHIOPIC SYLLABLE CO', 'Lo', 0, 'L', None, False, None),
+    (0x127F, 'ETHIOPIC SYLLABLE CWA', 'Lo', 0, 'L', None, False, None),
+    (0x1280, 'ETHIOPIC SYLLABLE XA', 'Lo', 0, 'L', None, False, None),
+    (0x1281, 'ETHIOPIC SYLLABLE XU', 'Lo', 0, 'L', None, False, None),
+    (0x1282, 'ETHIOPIC SYLLABLE XI', 'Lo', 0, 'L', None, False, None),
+    (0x1283, 'ETHIOPIC SYLLABLE XAA', 'Lo', 0, 'L', None, False, None),
+    (0x1284, 'ETHIOPIC SYLLABLE XEE', 'Lo', 0, 'L', None, False, None),
+    (0x1285, 'ETHIOPIC SYLLABLE XE', 'Lo', 0, 'L', None, False, None),
+    (0x1286, 'ETHIOPIC SYLLABLE XO', 'Lo', 0, 'L', None, False, None),
+    (0x1287, 'ETHIOPIC SYLLABLE XOA', 'Lo', 0, 'L', None, False, None),
+    (0x1288, 'ETHIOPIC SYLLABLE XWA', 'Lo', 0, 'L', None, False, None),
+    (0x128A, 'ETHIOPIC SYLLABLE XWI', 'Lo', 0, 'L', None, False, None),
+    (0x128B, 'ETHIOPIC SYLLABLE XWAA', 'Lo', 0, 'L', None, False, None),
+    (0x128C, 'ETHIOPIC SYLLABLE XWEE', 'Lo', 0, 'L', None, False, None),
+    (0x128D, 'ETHIOPIC SYLLABLE XWE', 'Lo', 0, 'L', None, False, None),
+    (0x1290, 'ETHIOPIC SYLLABLE NA', 'Lo', 0, 'L', None, False, None),
+    (0x1291, 'ETHIOPIC SYLLABLE NU', 'Lo', 0, 'L', None, False, None),
+    (0x1292, 'ETHIOPIC SYLLABLE NI', 'Lo', 0, 'L', None, False, None),
+    (0x1293, 'ETHIOPIC SYLLABLE NAA', 'Lo', 0, 'L', None, False, None),
+    (0x1294, 'ETHIOPIC SYLLABLE NEE', 'Lo', 0, 'L', None, False, None),
+    (0x1295, 'ETHIOPIC SYLLABLE NE', 'Lo', 0, 'L', None, False, None),
+    (0x1296, 'ETHIOPIC SYLLABLE NO', 'Lo', 0, 'L', None, False, None),
+    (0x1297, 'ETHIOPIC SYLLABLE NWA', 'Lo', 0, 'L', None, False, None),
+    (0x1298, 'ETHIOPIC SYLLABLE NYA', 'Lo', 0, 'L', None, False, None),
+    (0x1299, 'ETHIOPIC SYLLABLE NYU', 'Lo', 0, 'L', None, False, None),
+    (0x129A, 'ETHIOPIC SYLLABLE NYI', 'Lo', 0, 'L', None, False, None),
+    (0x129B, 'ETHIOPIC SYLLABLE NYAA', 'Lo', 0, 'L', None, False, None),
+    (0x129C, 'ETHIOPIC SYLLABLE NYEE', 'Lo', 0, 'L', None, False, None),
+    (0x129D, 'ETHIOPIC SYLLABLE NYE', 'Lo', 0, 'L', None, False, None),
+    (0x129E, 'ETHIOPIC SYLLABLE NYO', 'Lo', 0, 'L', None, False, None),
+    (0x129F, 'ETHIOPIC SYLLABLE NYWA', 'Lo', 0, 'L', None, False, None),
+    (0x12A0, 'ETHIOPIC SYLLABLE GLOTTAL A', 'Lo', 0, 'L', None, False, None),
+    (0x12A1, 'ETHIOPIC SYLLABLE GLOTTAL U', 'Lo', 0, 'L', None, False, None),
+    (0x12A2, 'ETHIOPIC SYLLABLE GLOTTAL I', 'Lo', 0, 'L', None, False, None),
+    (0x12A3, 'ETHIOPIC SYLLABLE GLOTTAL AA', 'Lo', 0, 'L', None, False, None),
+    (0x12A4, 'ETHIOPIC SYLLABLE GLOTTAL EE', 'Lo', 0, 'L', None, False, None),
+    (0x12A5, 'ETHIOPIC SYLLABLE GLOTTAL E', 'Lo', 0, 'L', None, False, None),
+    (0x12A6, 'ETHIOPIC SYLLABLE GLOTTAL O', 'Lo', 0, 'L', None, False, None),
+    (0x12A7, 'ETHIOPIC SYLLABLE GLOTTAL WA', 'Lo', 0, 'L', None, False, None),
+    (0x12A8, 'ETHIOPIC SYLLABLE KA', 'Lo', 0, 'L', None, False, None),
+    (0x12A9, 'ETHIOPIC SYLLABLE KU', 'Lo', 0, 'L', None, False, None),
+    (0x12AA, 'ETHIOPIC SYLLABLE KI', 'Lo', 0, 'L', None, False, None),
+    (0x12AB, 'ETHIOPIC SYLLABLE KAA', 'Lo', 0, 'L', None, False, None),
+    (0x12AC, 'ETHIOPIC SYLLABLE KEE', 'Lo', 0, 'L', None, False, None),
+    (0x12AD, 'ETHIOPIC SYLLABLE KE', 'Lo', 0, 'L', None, False, None),
+    (0x12AE, 'ETHIOPIC SYLLABLE KO', 'Lo', 0, 'L', None, False, None),
+    (0x12AF, 'ETHIOPIC SYLLABLE KOA', 'Lo', 0, 'L', None, False, None),
+    (0x12B0, 'ETHIOPIC SYLLABLE KWA', 'Lo', 0, 'L', None, False, None),
+    (0x12B2, 'ETHIOPIC SYLLABLE KWI', 'Lo', 0, 'L', None, False, None),
+    (0x12B3, 'ETHIOPIC SYLLABLE KWAA', 'Lo', 0, 'L', None, False, None),
+    (0x12B4, 'ETHIOPIC SYLLABLE KWEE', 'Lo', 0, 'L', None, False, None),
+    (0x12B5, 'ETHIOPIC SYLLABLE KWE', 'Lo', 0, 'L', None, False, None),
+    (0x12B8, 'ETHIOPIC SYLLABLE KXA', 'Lo', 0, 'L', None, False, None),
+    (0x12B9, 'ETHIOPIC SYLLABLE KXU', 'Lo', 0, 'L', None, False, None),
+    (0x12BA, 'ETHIOPIC SYLLABLE KXI', 'Lo', 0, 'L', None, False, None),
+    (0x12BB, 'ETHIOPIC SYLLABLE KXAA', 'Lo', 0, 'L', None, False, None),
+    (0x12BC, 'ETHIOPIC SYLLABLE KXEE', 'Lo', 0, 'L', None, False, None),
+    (0x12BD, 'ETHIOPIC SYLLABLE KXE', 'Lo', 0, 'L', None, False, None),
+    (0x12BE, 'ETHIOPIC SYLLABLE KXO', 'Lo', 0, 'L', None, False, None),
+    (0x12C0, 'ETHIOPIC SYLLABLE KXWA', 'Lo', 0, 'L', None, False, None),
+    (0x12C2, 'ETHIOPIC SYLLABLE KXWI', 'Lo', 0, 'L', None, False, None),
+    (0x12C3, 'ETHIOPIC SYLLABLE KXWAA', 'Lo', 0, 'L', None, False, None),
+    (0x12C4, 'ETHIOPIC SYLLABLE KXWEE', 'Lo', 0, 'L', None, False, None),
+    (0x12C5, 'ETHIOPIC SYLLABLE KXWE', 'Lo', 0, 'L', None, False, None),
+    (0x12C8, 'ETHIOPIC SYLLABLE WA', 'Lo', 0, 'L', None, False, None),
+    (0x12C9, 'ETHIOPIC SYLLABLE WU', 'Lo', 0, 'L', None, False, None),
+    (0x12CA, 'ETHIOPIC SYLLABLE WI', 'Lo', 0, 'L', None, False, None),
+    (0x12CB, 'ETHIOPIC SYLLABLE WAA', 'Lo', 0, 'L', None, False, None),
+    (0x12CC, 'ETHIOPIC SYLLABLE WEE', 'Lo', 0, 'L', None, False, None),
+    (0x12CD, 'ETHIOPIC SYLLABLE WE', 'Lo', 0, 'L', None, False, None),
+    (0x12CE, 'ETHIOPIC SYLLABLE WO', 'Lo', 0, 'L', None, False, None),
+    (0x12CF, 'ETHIOPIC SYLLABLE WOA', 'Lo', 0, 'L', None, False, None),
+    (0x12D0, 'ETHIOPIC SYLLABLE PHARYNGEAL A', 'Lo', 0, 'L', None, False, None),
+    (0x12D1, 'ETHIOPIC SYLLABLE PHARYNGEAL U', 'Lo', 0, 'L', None, False, None),
+    (0x12D2, 'ETHIOPIC SYLLABLE PHARYNGEAL I', 'Lo', 0, 'L', None, False, None),
+    (0x12D3, 'ETHIOPIC SYLLABLE PHARYNGEAL AA', 'Lo', 0, 'L', None, False, None),
+    (0x12D4, 'ETHIOPIC SYLLABLE PHARYNGEAL EE', 'Lo', 0, 'L', None, False, None),
+    (0x12D5, 'ETHIOPIC SYLLABLE PHARYNGEAL E', 'Lo', 0, 'L', None, False, None),
+    (0x12D6, 'ETHIOPIC SYLLABLE PHARYNGEAL O', 'Lo', 0, 'L', None, False, None),
+    (0x12D8, 'ETHIOPIC SYLLABLE ZA', 'Lo', 0, 'L', None, False, None),
+    (0x12D9, 'ETHIOPIC SYLLABLE ZU', 'Lo', 0, 'L', None, False, None),
+    (0x12DA, 'ETHIOPIC SYLLABLE ZI', 'Lo', 0, 'L', None, False, None),
+    (0x12DB, 'ETHIOPIC SYLLABLE ZAA', 'Lo', 0, 'L', None, False, None),
+    (0x12DC, 'ETHIOPIC SYLLABLE ZEE', 'Lo', 0, 'L', None, False, None),
+    (0x12DD, 'ETHIOPIC SYLLABLE ZE', 'Lo', 0, 'L', None, False, None),
+    (0x12DE, 'ETHIOPIC SYLLABLE ZO', 'Lo', 0, 'L', None, False, None),
+    (0x12DF, 'ETHIOPIC SYLLABLE ZWA', 'Lo', 0, 'L', None, False, None),
+    (0x12E0, 'ETHIOPIC SYLLABLE ZHA', 'Lo', 0, 'L', None, False, None),
+    (0x12E1, 'ETHIOPIC SYLLABLE ZHU', 'Lo', 0, 'L', None, False, None),
+    (0x12E2, 'ETHIOPIC SYLLABLE ZHI', 'Lo', 0, 'L', None, False, None),
+    (0x12E3, 'ETHIOPIC SYLLABLE ZHAA', 'Lo', 0, 'L', None, False, None),
+    (0x12E4, 'ETHIOPIC SYLLABLE ZHEE', 'Lo', 0, 'L', None, False, None),
+    (0x12E5, 'ETHIOPIC SYLLABLE ZHE', 'Lo', 0, 'L', None, False, None),
+    (0x12E6, 'ETHIOPIC SYLLABLE ZHO', 'Lo', 0, 'L', None, False, None),
+    (0x12E7, 'ETHIOPIC SYLLABLE ZHWA', 'Lo', 0, 'L', None, False, None),
+    (0x12E8, 'ETHIOPIC SYLLABLE YA', 'Lo', 0, 'L', None, False, None),
+    (0x12E9, 'ETHIOPIC SYLLABLE YU', 'Lo', 0, 'L', None, False, None),
+    (0x12EA, 'ETHIOPIC SYLLABLE YI', 'Lo', 0, 'L', None, False, None),
+    (0x12EB, 'ETHIOPIC SYLLABLE YAA', 'Lo', 0, 'L', None, False, None),
+    (0x12EC, 'ETHIOPIC SYLLABLE YEE', 'Lo', 0, 'L', None, False, None),
+    (0x12ED, 'ETHIOPIC SYLLABLE YE', 'Lo', 0, 'L', None, False, None),
+    (0x12EE, 'ETHIOPIC SYLLABLE YO', 'Lo', 0, 'L', None, False, None),
+    (0x12EF, 'ETHIOPIC SYLLABLE YOA', 'Lo', 0, 'L', None, False, None),
+    (0x12F0, 'ETHIOPIC SYLLABLE DA', 'Lo', 0, 'L', None, False, None),
+    (0x12F1, 'ETHIOPIC SYLLABLE DU', 'Lo', 0, 'L', None, False, None),
+    (0x12F2, 'ETHIOPIC SYLLABLE DI', 'Lo', 0, 'L', None, False, None),
+    (0x12F3, 'ETHIOPIC SYLLABLE DAA', 'Lo', 0, 'L', None, False, None),
+    (0x12F4, 'ETHIOPIC SYLLABLE DEE', 'Lo', 0, 'L', None, False, None),
+    (0x12F5, 'ETHIOPIC SYLLABLE DE', 'Lo', 0, 'L', None, False, None),
+    (0x12F6, 'ETHIOPIC SYLLABLE DO', 'Lo', 0, 'L', None, False, None),
+    (0x12F7, 'ETHIOPIC SYLLABLE DWA', 'Lo', 0, 'L', None, False, None),
+    (0x12F8, 'ETHIOPIC SYLLABLE DDA', 'Lo', 0, 'L', None, False, None),
+    (0x12F9, 'ETHIOPIC SYLLABLE DDU', 'Lo', 0, 'L', None, False, None),
+    (0x12FA, 'ETHIOPIC SYLLABLE DDI', 'Lo', 0, 'L', None, False, None),
+    (0x12FB, 'ETHIOPIC SYLLABLE DDAA', 'Lo', 0, 'L', None, False, None),
+    (0x12FC, 'ETHIOPIC SYLLABLE DDEE', 'Lo', 0, 'L', None, False, None),
+    (0x12FD, 'ETHIOPIC SYLLABLE DDE', 'Lo', 0, 'L', None, False, None),
+    (0x12FE, 'ETHIOPIC SYLLABLE DDO', 'Lo', 0, 'L', None, False, None),
+    (0x12FF, 'ETHIOPIC SYLLABLE DDWA', 'Lo', 0, 'L', None, False, None),
+    (0x1300, 'ETHIOPIC SYLLABLE JA', 'Lo', 0, 'L', None, False, None),
+    (0x1301, 'ETHIOPIC SYLLABLE JU', 'Lo', 0, 'L', None, False, None),
+    (0x1302, 'ETHIOPIC SYLLABLE JI', 'Lo', 0, 'L', None, False, None),
+    (0x1303, 'ETHIOPIC SYLLABLE JAA', 'Lo', 0, 'L', None, False, None),
+    (0x1304, 'ETHIOPIC SYLLABLE JEE', 'Lo', 0, 'L', None, False, None),
+    (0x1305, 'ETHIOPIC SYLLABLE JE', 'Lo', 0, 'L', None, False, None),
+    (0x1306, 'ETHIOPIC SYLLABLE JO', 'Lo', 0, 'L', None, False, None),
+    (0x1307, 'ETHIOPIC SYLLABLE JWA', 'Lo', 0, 'L', None, False, None),
+    (0x1308, 'ETHIOPIC SYLLABLE GA', 'Lo', 0, 'L', None, False, None),
+    (0x1309, 'ETHIOPIC SYLLABLE GU', 'Lo', 0, 'L', None, False, None),
+    (0x130A, 'ETHIOPIC SYLLABLE GI', 'Lo', 0, 'L', None, False, None),
+    (0x130B, 'ETHIOPIC SYLLABLE GAA', 'Lo', 0, 'L', None, False, None),
+    (0x130C, 'ETHIOPIC SYLLABLE GEE', 'Lo', 0, 'L', None, False, None),
+    (0x130D, 'ETHIOPIC SYLLABLE GE', 'Lo', 0, 'L', None, False, None),
+    (0x130E, 'ETHIOPIC SYLLABLE GO', 'Lo', 0, 'L', None, False, None),
+    (0x130F, 'ETHIOPIC SYLLABLE GOA', 'Lo', 0, 'L', None, False, None),
+    (0x1310, 'ETHIOPIC SYLLABLE GWA', 'Lo', 0, 'L', None, False, None),
+    (0x1312, 'ETHIOPIC SYLLABLE GWI', 'Lo', 0, 'L', None, False, None),
+    (0x1313, 'ETHIOPIC SYLLABLE GWAA', 'Lo', 0, 'L', None, False, None),
+    (0x1314, 'ETHIOPIC SYLLABLE GWEE', 'Lo', 0, 'L', None, False, None),
+    (0x1315, 'ETHIOPIC SYLLABLE GWE', 'Lo', 0, 'L', None, False, None),
+    (0x1318, 'ETHIOPIC SYLLABLE GGA', 'Lo', 0, 'L', None, False, None),
+    (0x1319, 'ETHIOPIC SYLLABLE GGU', 'Lo', 0, 'L', None, False, None),
+    (0x131A, 'ETHIOPIC SYLLABLE GGI', 'Lo', 0, 'L', None, False, None),
+    (0x131B, 'ETHIOPIC SYLLABLE GGAA', 'Lo', 0, 'L', None, False, None),
+    (0x131C, 'ETHIOPIC SYLLABLE GGEE', 'Lo', 0, 'L', None, False, None),
+    (0x131D, 'ETHIOPIC SYLLABLE GGE', 'Lo', 0, 'L', None, False, None),
+    (0x131E, 'ETHIOPIC SYLLABLE GGO', 'Lo', 0, 'L', None, False, None),
+    (0x131F, 'ETHIOPIC SYLLABLE GGWAA', 'Lo', 0, 'L', None, False, None),
+    (0x1320, 'ETHIOPIC SYLLABLE THA', 'Lo', 0, 'L', None, False, None),
+    (0x1321, 'ETHIOPIC SYLLABLE THU', 'Lo', 0, 'L', None, False, None),
+    (0x1322, 'ETHIOPIC SYLLABLE THI', 'Lo', 0, 'L', None, False, None),
+    (0x1323, 'ETHIOPIC SYLLABLE THAA', 'Lo', 0, 'L', None, False, None),
+    (0x1324, 'ETHIOPIC SYLLABLE THEE', 'Lo', 0, 'L', None, False, None),
+    (0x1325, 'ETHIOPIC SYLLABLE THE', 'Lo', 0, 'L', None, False, None),
+    (0x1326, 'ETHIOPIC SYLLABLE THO', 'Lo', 0, 'L', None, False, None),
+    (0x1327, 'ETHIOPIC SYLLABLE THWA', 'Lo', 0, 'L', None, False, None),
+    (0x1328, 'ETHIOPIC SYLLABLE CHA', 'Lo', 0, 'L', None, False, None),
+    (0x1329, 'ETHIOPIC SYLLABLE CHU', 'Lo', 0, 'L', None, False, None),
+    (0x132A, 'ETHIOPIC SYLLABLE CHI', 'Lo', 0, 'L', None, False, None),
+    (0x132B, 'ETHIOPIC SYLLABLE CHAA', 'Lo', 0, 'L', None, False, None),
+    (0x132C, 'ETHIOPIC SYLLABLE CHEE', 'Lo', 0, 'L', None, False, None),
+    (0x132D, 'ETHIOPIC SYLLABLE CHE', 'Lo', 0, 'L', None, False, None),
+    (0x132E, 'ETHIOPIC SYLLABLE CHO', 'Lo', 0, 'L', None, False, None),
+    (0x132F, 'ETHIOPIC SYLLABLE CHWA', 'Lo', 0, 'L', None, False, None),
+    (0x1330, 'ETHIOPIC SYLLABLE PHA', 'Lo', 0, 'L', None, False, None),
+    (0x1331, 'ETHIOPIC SYLLABLE PHU', 'Lo', 0, 'L', None, False, None),
+    (0x1332, 'ETHIOPIC SYLLABLE PHI', 'Lo', 0, 'L', None, False, None),
+    (0x1333, 'ETHIOPIC SYLLABLE PHAA', 'Lo', 0, 'L', None, False, None),
+    (0x1334, 'ETHIOPIC SYLLABLE PHEE', 'Lo', 0, 'L', None, False, None),
+    (0x1335, 'ETHIOPIC SYLLABLE PHE', 'Lo', 0, 'L', None, False, None),
+    (0x1336, 'ETHIOPIC SYLLABLE PHO', 'Lo', 0, 'L', None, False, None),
+    (0x1337, 'ETHIOPIC SYLLABLE PHWA', 'Lo', 0, 'L', None, False, None),
+    (0x1338, 'ETHIOPIC SYLLABLE TSA', 'Lo', 0, 'L', None, False, None),
+    (0x1339, 'ETHIOPIC SYLLABLE TSU', 'Lo', 0, 'L', None, False, None),
+    (0x133A, 'ETHIOPIC SYLLABLE TSI', 'Lo', 0, 'L', None, False, None),
+    (0x133B, 'ETHIOPIC SYLLABLE TSAA', 'Lo', 0, 'L', None, False, None),
+    (0x133C, 'ETHIOPIC SYLLABLE TSEE', 'Lo', 0, 'L', None, False, None),
+    (0x133D, 'ETHIOPIC SYLLABLE TSE', 'Lo', 0, 'L', None, False, None),
+    (0x133E, 'ETHIOPIC SYLLABLE TSO', 'Lo', 0, 'L', None, False, None),
+    (0x133F, 'ETHIOPIC SYLLABLE TSWA', 'Lo', 0, 'L', None, False, None),
+    (0x1340, 'ETHIOPIC SYLLABLE TZA', 'Lo', 0, 'L', None, False, None),
+    (0x1341, 'ETHIOPIC SYLLABLE TZU', 'Lo', 0, 'L', None, False, None),
+    (0x1342, 'ETHIOPIC SYLLABLE TZI', 'Lo', 0, 'L', None, False, None),
+    (0x1343, 'ETHIOPIC SYLLABLE TZAA', 'Lo', 0, 'L', None, False, None),
+    (0x1344, 'ETHIOPIC SYLLABLE TZEE', 'Lo', 0, 'L', None, False, None),
+    (0x1345, 'ETHIOPIC SYLLABLE TZE', 'Lo', 0, 'L', None, False, None),
+    (0x1346, 'ETHIOPIC SYLLABLE TZO', 'Lo', 0, 'L', None, False, None),
+    (0x1347, 'ETHIOPIC SYLLABLE TZOA', 'Lo', 0, 'L', None, False, None),
+    (0x1348, 'ETHIOPIC SYLLABLE FA', 'Lo', 0, 'L', None, False, None),
+    (0x1349, 'ETHIOPIC SYLLABLE FU', 'Lo', 0, 'L', None, False, None),
+    (0x134A, 'ETHIOPIC SYLLABLE FI', 'Lo', 0, 'L', None, False, None),
+    (0x134B, 'ETHIOPIC SYLLABLE FAA', 'Lo', 0, 'L', None, False, None),
+    (0x134C, 'ETHIOPIC SYLLABLE FEE', 'Lo', 0, 'L', None, False, None),
+    (0x134D, 'ETHIOPIC SYLLABLE FE', 'Lo', 0, 'L', None, False, None),
+    (0x134E, 'ETHIOPIC SYLLABLE FO', 'Lo', 0, 'L', None, False, None),
+    (0x134F, 'ETHIOPIC SYLLABLE FWA', 'Lo', 0, 'L', None, False, None),
+    (0x1350, 'ETHIOPIC SYLLABLE PA', 'Lo', 0, 'L', None, False, None),
+    (0x1351, 'ETHIOPIC SYLLABLE PU', 'Lo', 0, 'L', None, False, None),
+    (0x1352, 'ETHIOPIC SYLLABLE PI', 'Lo', 0, 'L', None, False, None),
+    (0x1353, 'ETHIOPIC SYLLABLE PAA', 'Lo', 0, 'L', None, False, None),
+    (0x1354, 'ETHIOPIC SYLLABLE PEE', 'Lo', 0, 'L', None, False, None),
+    (0x1355, 'ETHIOPIC SYLLABLE PE', 'Lo', 0, 'L', None, False, None),
+    (0x1356, 'ETHIOPIC SYLLABLE PO', 'Lo', 0, 'L', None, False, None),
+    (0x1357, 'ETHIOPIC SYLLABLE PWA', 'Lo', 0, 'L', None, False, None),
+    (0x1358, 'ETHIOPIC SYLLABLE RYA', 'Lo', 0, 'L', None, False, None),
+    (0x1359, 'ETHIOPIC SYLLABLE MYA', 'Lo', 0, 'L', None, False, None),
+    (0x135A, 'ETHIOPIC SYLLABLE FYA', 'Lo', 0, 'L', None, False, None),
+    (0x135D, 'ETHIOPIC COMBINING GEMINATION AND VOWEL LENGTH MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x135E, 'ETHIOPIC COMBINING VOWEL LENGTH MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x135F, 'ETHIOPIC COMBINING GEMINATION MARK', 'Mn', 230, 'NSM', None, False, None),
+    (0x1360, 'ETHIOPIC SECTION MARK', 'Po', 0, 'L', None, False, None),
+    (0x1361, 'ETHIOPIC WORDSPACE', 'Po', 0, 'L', None, False, None),
+    (0x1362, 'ETHIOPIC FULL STOP', 'Po', 0, 'L', None, False, None),
+    (0x1363, 'ETHIOPIC COMMA', 'Po', 0, 'L', None, False, None),
+    (0x1364, 'ETHIOPIC SEMICOLON', 'Po', 0, 'L', None, False, None),
+    (0x1365, 'ETHIOPIC COLON', 'Po', 0, 'L', None, False, None),
+    (0x1366, 'ETHIOPIC PREFACE COLON', 'Po', 0, 'L', None, False, None),
+    (0x1367, 'ETHIOPIC QUESTION MARK', 'Po', 0, 'L', None, False, None),
+    (0x1368, 'ETHIOPIC PARAGRAPH SEPARATOR', 'Po', 0, 'L', None, False, None),
+    (0x1369, 'ETHIOPIC DIGIT ONE', 'No', 0, 'L', None, False, None),
+    (0x136A, 'ETHIOPIC DIGIT TWO', 'No', 0, 'L', None, False, None),
+    (0x136B, 'ETHIOPIC DIGIT THREE', 'No', 0, 'L', None, False, None),
+    (0x136C, 'ETHIOPIC DIGIT FOUR', 'No', 0, 'L', None, False, None),
+    (0x136D, 'ETHIOPIC DIGIT FIVE', 'No', 0, 'L', None, False, None),
+    (0x136E, 'ETHIOPIC DIGIT SIX', 'No', 0, 'L', None, False, None),
+    (0x136F, 'ETHIOPIC DIGIT SEVEN', 'No', 0, 'L', None, False, None),
+    (0x1370, 'ETHIOPIC DIGIT EIGHT', 'No', 0, 'L', None, False, None),
+    (0x1371, 'ETHIOPIC DIGIT NINE', 'No', 0, 'L', None, False, None),
+    (0x1372, 'ETHIOPIC NUMBER TEN', 'No', 0, 'L', None, False, None),
+    (0x1373, 'ETHIOPIC NUMBER TWENTY', 'No', 0, 'L', None, False, None),
+    (0x1374, 'ETHIOPIC NUMBER THIRTY', 'No', 0, 'L', None, False, None),
+    (0x1375, 'ETHIOPIC NUMBER FORTY', 'No', 0, 'L', None, False, None),
+    (0x1376, 'ETHIOPIC NUMBER FIFTY', 'No', 0, 'L', None, False, None),
+    (0x1377, 'ETHIOPIC NUMBER SIXTY', 'No', 0, 'L', None, False, None),
+    (0x1378, 'ETHIOPIC NUMBER SEVENTY', 'No', 0, 'L', None, False, None),
+    (0x1379, 'ETHIOPIC NUMBER EIGHTY', 'No', 0, 'L', None, False, None),
+    (0x137A, 'ETHIOPIC NUMBER NINETY', 'No', 0, 'L', None, False, None),
+    (0x137B, 'ETHIOPIC NUMBER HUNDRED', 'No', 0, 'L', None, False, None),
+    (0x137C, 'ETHIOPIC NUMBER TEN THOUSAND', 'No', 0, 'L', None, False, None),
+    (0x1380, 'ETHIOPIC SYLLABLE SEBATBEIT MWA', 'Lo', 0, 'L', None, False, None),
+    (0x1381, 'ETHIOPIC SYLLABLE MWI', 'Lo', 0, 'L', None, False, None),
+    (0x1382, 'ETHIOPIC SYLLABLE MWEE', 'Lo', 0, 'L', None, False, None),
+    (0x1383, 'ETHIOPIC SYLLABLE MWE', 'Lo', 0, 'L', None, False, None),
+    (0x1384, 'ETHIOPIC SYLLABLE SEBATBEIT BWA', 'Lo', 0, 'L', None, False, None),
+    (0x1385, 'ETHIOPIC SYLLABLE BWI', 'Lo', 0, 'L', None, False, None),
+    (0x1386, 'ETHIOPIC SYLLABLE BWEE', 'Lo', 0, 'L', None, False, None),
+    (0x1387, 'ETHIOPIC SYLLABLE BWE', 'Lo', 0, 'L', None, False, None),
+    (0x1388, 'ETHIOPIC SYLLABLE SEBATBEIT FWA', 'Lo', 0, 'L', None, False, None),
+    (0x1389, 'ETHIOPIC SYLLABLE FWI', 'Lo', 0, 'L', None, False, None),
+    (0x138A, 'ETHIOPIC SYLLABLE FWEE', 'Lo', 0, 'L', None, False, None),
+    (0x138B, 'ETHIOPIC SYLLABLE FWE', 'Lo', 0, 'L', None, False, None),
+    (0x138C, 'ETHIOPIC SYLLABLE SEBATBEIT PWA', 'Lo', 0, 'L', None, False, None),
+    (0x138D, 'ETHIOPIC SYLLABLE PWI', 'Lo', 0, 'L', None, False, None),
+    (0x138E, 'ETHIOPIC SYLLABLE PWEE', 'Lo', 0, 'L', None, False, None),
+    (0x138F, 'ETHIOPIC SYLLABLE PWE', 'Lo', 0, 'L', None, False, None),
+    (0x1390, 'ETHIOPIC TONAL MARK YIZET', 'So', 0, 'ON', None, False, None),
+    (0x1391, 'ETHIOPIC TONAL MARK DERET', 'So', 0, 'ON', None, False, None),
+    (0x1392, 'ETHIOPIC TONAL MARK RIKRIK', 'So', 0, 'ON', None, False, None),
+    (0x1393, 'ETHIOPIC TONAL MARK SHORT RIKRIK', 'So', 0, 'ON', None, False, None),
+    (0x1394, 'ETHIOPIC TONAL MARK DIFAT', 'So', 0, 'ON', None, False, None),
+    (0x1395, 'ETHIOPIC TONAL MARK KENAT', 'So', 0, 'ON', None, False, None),
+    (0x1396, 'ETHIOPIC TONAL MARK CHIRET', 'So', 0, 'ON', None, False, None),
+    (0x1397, 'ETHIOPIC TONAL MARK HIDET', 'So', 0, 'ON', None, False, None),
+    (0x1398, 'ETHIOPIC TONAL MARK DERET-HIDET', 'So', 0, 'ON', None, False, None),
+    (0x1399, 'ETHIOPIC TONAL MARK KURT', 'So', 0, 'ON', None, False, None),
+    (0x13A0, 'CHEROKEE LETTER A', 'Lu', 0, 'L', None, False, 0xAB70),
+    (0x13A1, 'CHEROKEE LETTER E', 'Lu', 0, 'L', None, False, 0xAB71),
+    (0x13A2, 'CHEROKEE LETTER I', 'Lu', 0, 'L', None, False, 0xAB72),
+    (0x13A3, 'CHEROKEE LETTER O', 'Lu', 0, 'L', None, False, 0xAB73),
+    (0x13A4, 'CHEROKEE LETTER U', 'Lu', 0, 'L', None, False, 0xAB74),
+    (0x13A5, 'CHEROKEE LETTER V', 'Lu', 0, 'L', None, False, 0xAB75),
+    (0x13A6, 'CHEROKEE LETTER GA', 'Lu', 0, 'L', None, False, 0xAB76),
+    (0x13A7, 'CHEROKEE LETTER KA', 'Lu', 0, 'L', None, False, 0xAB77),
+    (0x13A8, 'CHEROKEE LETTER GE', 'Lu', 0, 'L', None, False, 0xAB78),
+    (0x13A9, 'CHEROKEE LETTER GI', 'Lu', 0, 'L', None, False, 0xAB79),
+    (0x13AA, 'CHEROKEE LETTER GO', 'Lu', 0, 'L', None, False, 0xAB7A),
+    (0x13AB, 'CHEROKEE LETTER GU', 'Lu', 0, 'L', None, False, 0xAB7B),
+    (0x13AC, 'CHEROKEE LETTER GV', 'Lu', 0, 'L', None, False, 0xAB7C),
+    (0x13AD, 'CHEROKEE LETTER HA', 'Lu', 0, 'L', None, False, 0xAB7D),
+    (0x13AE, 'CHEROKEE LETTER HE', 'Lu', 0, 'L', None, False, 0xAB7E),
+    (0x13AF, 'CHEROKEE LETTER HI', 'Lu', 0, 'L', None, False, 0xAB7F),
+    (0x13B0, 'CHEROKEE LETTER HO', 'Lu', 0, 'L', None, False, 0xAB80),
+    (0x13B1, 'CHEROKEE LETTER HU', 'Lu', 0, 'L', None, False, 0xAB81),
+    (0x13B2, 'CHEROKEE LETTER HV', 'Lu', 0, 'L', None, False, 0xAB82),
+    (0x13B3, 'CHEROKEE LETTER LA', 'Lu', 0, 'L', None, False, 0xAB83),
+    (0x13B4, 'CHEROKEE LETTER LE', 'Lu', 0, 'L', None, False, 0xAB84),
+    (0x13B5, 'CHEROKEE LETTER LI', 'Lu', 0, 'L', None, False, 0xAB85),
+    (0x13B6, 'CHEROKEE LETTER LO', 'Lu', 0, 'L', None, False, 0xAB86),
+    (0x13B7, 'CHEROKEE LETTER LU', 'Lu', 0, 'L', None, False, 0xAB87),
+    (0x13B8, 'CHEROKEE LETTER LV', 'Lu', 0, 'L', None, False, 0xAB88),
+    (0x13B9, 'CHEROKEE LETTER MA', 'Lu', 0, 'L', None, False, 0xAB89),
+    (0x13BA, 'CHEROKEE LETTER ME', 'Lu', 0, 'L', None, False, 0xAB8A),
+    (0x13BB, 'CHEROKEE LETTER MI', 'Lu', 0, 'L', None, False, 0xAB8B),
+    (0x13BC, 'CHEROKEE LETTER MO', 'Lu', 0, 'L', None, False, 0xAB8C),
+    (0x13BD, 'CHEROKEE LETTER MU', 'Lu', 0, 'L', None, False, 0xAB8D),
+    (0x13BE, 'CHEROKEE LETTER NA', 'Lu', 0, 'L', None, False, 0xAB8E),
+    (0x13BF, 'CHEROKEE LETTER HNA', 'Lu', 0, 'L', None, False, 0xAB8F),
+    (0x13C0, 'CHEROKEE LETTER NAH', 'Lu', 0, 'L', None, False, 0xAB90),
+    (0x13C1, 'CHEROKEE LETTER NE', 'Lu', 0, 'L', None, False, 0xAB91),
+    (0x13C2, 'CHEROKEE LETTER NI', 'Lu', 0, 'L', None, False, 0xAB92),
+    (0x13C3, 'CHEROKEE LETTER NO', 'Lu', 0, 'L', None, False, 0xAB93),
+    (0x13C4, 'CHEROKEE LETTER NU', 'Lu', 0, 'L', None, False, 0xAB94),
+    (0x13C5, 'CHEROKEE LETTER NV', 'Lu', 0, 'L', None, False, 0xAB95),
+    (0x13C6, 'CHEROKEE LETTER QUA', 'Lu', 0, 'L', None, False, 0xAB96),
+    (0x13C7, 'CHEROKEE LETTER QUE', 'Lu', 0, 'L', None, False, 0xAB97),
+    (0x13C8, 'CHEROKEE LETTER QUI', 'Lu', 0, 'L', None, False, 0xAB98),
+    (0x13C9, 'CHEROKEE LETTER QUO', 'Lu', 0, 'L', None, False, 0xAB99),
+    (0x13CA, 'CHEROKEE LETTER QUU', 'Lu', 0, 'L', None, False, 0xAB9A),
+    (0x13CB, 'CHEROKEE LETTER QUV', 'Lu', 0, 'L', None, False, 0xAB9B),
+    (0x13CC, 'CHEROKEE LETTER SA', 'Lu', 0, 'L', None, False, 0xAB9C),
+    (0x13CD, 'CHEROKEE LETTER S', 'Lu', 0, 'L', None, False, 0xAB9D),
+    (0x13CE, 'CHEROKEE LETTER SE', 'Lu', 0, 'L', None, False, 0xAB9E),
+    (0x13CF, 'CHEROKEE LETTER SI', 'Lu', 0, 'L', None, False, 0xAB9F),
+    (0x13D0, 'CHEROKEE LETTER SO', 'Lu', 0, 'L', None, False, 0xABA0),
+    (0x13D1, 'CHEROKEE LETTER SU', 'Lu', 0, 'L', None, False, 0xABA1),
+    (0x13D2, 'CHEROKEE LETTER SV', 'Lu', 0, 'L', None, False, 0xABA2),
+    (0x13D3, 'CHEROKEE LETTER DA', 'Lu', 0, 'L', None, False, 0xABA3),
+    (0x13D4, 'CHEROKEE LETTER TA', 'Lu', 0, 'L', None, False, 0xABA4),
+    (0x13D5, 'CHEROKEE LETTER DE', 'Lu', 0, 'L', None, False, 0xABA5),
+    (0x13D6, 'CHEROKEE LETTER TE', 'Lu', 0, 'L', None, False, 0xABA6),
+    (0x13D7, 'CHEROKEE LETTER DI', 'Lu', 0, 'L', None, False, 0xABA7),
+    (0x13D8, 'CHEROKEE LETTER TI', 'Lu', 0, 'L', None, False, 0xABA8),
+    (0x13D9, 'CHEROKEE LETTER DO', 'Lu', 0, 'L', None, False, 0xABA9),
+    (0x13DA, 'CHEROKEE LETTER DU', 'Lu', 0, 'L', None, False, 0xABAA),
+    (0x13DB, 'CHEROKEE LETTER DV', 'Lu', 0, 'L', None, False, 0xABAB),
+    (0x13DC, 'CHEROKEE LETTER DLA', 'Lu', 0, 'L', None, False, 0xABAC),
+    (0x13DD, 'CHEROKEE LETTER TLA', 'Lu', 0, 'L', None, False, 0xABAD),
+    (0x13DE, 'CHEROKEE LETTER TLE', 'Lu', 0, 'L', None, False, 0xABAE),
+    (0x13DF, 'CHEROKEE LETTER TLI', 'Lu', 0, 'L', None, False, 0xABAF),
+    (0x13E0, 'CHEROKEE LETTER TLO', 'Lu', 0, 'L', None, False, 0xABB0),
+    (0x13E1, 'CHEROKEE LETTER TLU', 'Lu', 0, 'L', None, False, 0xABB1),
+    (0x13E2, 'CHEROKEE LETTER TLV', 'Lu', 0, 'L', None, False, 0xABB2),
+    (0x13E3, 'CHEROKEE LETTER TSA', 'Lu', 0, 'L', None, False, 0xABB3),
+    (0x13E4, 'CHEROKEE LETTER TSE', 'Lu', 0, 'L', None, False, 0xABB4),
+    (0x13E5, 'CHEROKEE LETTER TSI', 'Lu', 0, 'L', None, False, 0xABB5),
+    (0x13E6, 'CHEROKEE LETTER TSO', 'Lu', 0, 'L', None, False, 0xABB6),
+    (0x13E7, 'CHEROKEE LETTER TSU', 'Lu', 0, 'L', None, False, 0xABB7),
+    (0x13E8, 'CHEROKEE LETTER TSV', 'Lu', 0, 'L', None, False, 0xABB8),
+    (0x13E9, 'CHEROKEE LETTER WA', 'Lu', 0, 'L', None, False, 0xABB9),
+    (0x13EA, 'CHEROKEE LETTER WE', 'Lu', 0, 'L', None, False, 0xABBA),
+    (0x13EB, 'CHEROKEE LETTER WI', 'Lu', 0, 'L', None, False, 0xABBB),
+    (0x13EC, 'CHEROKEE LETTER WO', 'Lu', 0, 'L', None, False, 0xABBC),
+    (0x13ED, 'CHEROKEE LETTER WU', 'Lu', 0, 'L', None, False, 0xABBD),
+    (0x13EE, 'CHEROKEE LETTER WV', 'Lu', 0, 'L', None, False, 0xABBE),
+    (0x13EF, 'CHEROKEE LETTER YA', 'Lu', 0, 'L', None, False, 0xABBF),
+    (0x13F0, 'CHEROKEE LETTER YE', 'Lu', 0, 'L', None, False, 0x13F8),
+    (0x13F1, 'CHEROKEE LETTER YI', 'Lu', 0, 'L', None, False, 0x13F9),
+    (0x13F2, 'CHEROKEE LETTER YO', 'Lu', 0, 'L', None, False, 0x13FA),
+    (0x13F3, 'CHEROKEE LETTER YU', 'Lu', 0, 'L', None, False, 0x13FB),
+    (0x13F4, 'CHEROKEE LETTER YV', 'Lu', 0, 'L', None, False, 0x13FC),
+    (0x13F5, 'CHEROKEE LETTER MV', 'Lu', 0, 'L', None, False, 0x13FD),
+    (0x13F8, 'CHEROKEE SMALL LETTER YE', 'Ll', 0, 'L', None, False, None),
+    (0x13F9, 'CHEROKEE SMALL LETTER YI', 'Ll', 0, 'L', None, False, None),
+    (0x13FA, 'CHEROKEE SMALL LETTER YO', 'Ll', 0, 'L', None, False, None),
+    (0x13FB, 'CHEROKEE SMALL LETTER YU', 'Ll', 0, 'L', None, False, None),
+    (0x13FC, 'CHEROKEE SMALL LETTER YV', 'Ll', 0, 'L', None, False, None),
+    (0x13FD, 'CHEROKEE SMALL LETTER MV', 'Ll', 0, 'L', None, False, None),
+)
+
+
+def lookup(code_point):
+    lo, hi = 0, len(_PROPERTIES)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if _PROPERTIES[mid][0] < code_point:
+            lo = mid + 1
+        else:
+            hi = mid
+    if lo < len(_PROPERTIES) and _PROPERTIES[lo][0] == code_point:
+        return _PROPERTIES[lo]
+    return None
@@ -0,0 +1,170 @@
+"""
+Profiling support: running benchmarks under a profiler and post-processing the profiles.
+"""
+
+import pstats
+import re
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from blackbench.utils import err
+
+if TYPE_CHECKING:
+    from blackbench import Benchmark
+
+THIS_DIR = Path(__file__).parent
+HARNESS = THIS_DIR / "misc" / "profile-harness.py"
+
+# (filename, line number, function name) as used by pstats.
+FuncKey = Tuple[str, int, str]
+
+
+def short_filename(filename: str) -> str:
+    """Strip the (environment specific) prefix from paths to installed modules."""
+    normalized = filename.replace("\\", "/")
+    if "/site-packages/" in normalized:
+        return normalized.rsplit("/site-packages/", maxsplit=1)[1]
+    match = re.search(r"/lib/python[\d.]*/(.+)$", normalized)
+    if match:
+        return match.group(1)
+    return normalized.rsplit("/", maxsplit=1)[-1]
+
+
+def func_label(func: FuncKey) -> str:
+    filename, _, name = func
+    if filename == "~":
+        # Built-in functions have no file, their name looks like "<built-in method ...>"
+        # and sometimes includes a memory address which is useless for comparisons.
+        return re.sub(r" at 0x[0-9a-fA-F]+", "", name)
+    return f"{short_filename(filename)}:{name}"
+
+
+def profile_benchmark(
+    bm: "Benchmark",
+    script: Path,
+    output_base: Path,
+    *,
+    loops: int,
+    sampling_interval: Optional[float] = None,
+    python: str = sys.executable,
+) -> Optional[Path]:
+    """
+    Run the benchmark under cProfile, writing `{output_base}.pstats` and the collapsed
+    stacks to `{output_base}.collapsed`. The collapsed stacks come from the sampling
+    profiler if a sampling interval is given and are otherwise derived from the cProfile
+    call graph. Returns the pstats path or None if the benchmark failed.
+    """
+    script.write_text(bm.code, encoding="utf8")
+    output_base.parent.mkdir(parents=True, exist_ok=True)
+    stats_path = output_base.with_name(output_base.name + ".pstats")
+    collapsed_path = output_base.with_name(output_base.name + ".collapsed")
+
+    # fmt: off
+    cmd = [
+        python, str(HARNESS), str(script), "--loops", str(loops), "--pstats", str(stats_path)
+    ]
+    # fmt: on
+    if sampling_interval:
+        cmd.extend(["--collapsed", str(collapsed_path), "--interval", str(sampling_interval)])
+    try:
+        subprocess.run(cmd, check=True)
+    except subprocess.CalledProcessError:
+        err("Failed to profile benchmark ^^^")
+        return None
+
+    if not sampling_interval:
+        write_collapsed_stacks(pstats.Stats(str(stats_path)), collapsed_path)
+    return stats_path
+
+
+def collapse_stats(stats: pstats.Stats, *, threshold: float = 1e-4) -> Dict[str, int]:
+    """
+    Derive collapsed stacks (in microseconds) from a deterministic profile.
+
+    cProfile doesn't record full stacks, only caller -> callee edges, so every function's
+    time is distributed over its callers in proportion to the time spent through each
+    edge (like flameprof does). Branches with less than `threshold` of the total time
+    are dropped to keep the output (and the walk) manageable.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    children: Dict[FuncKey, Dict[FuncKey, float]] = defaultdict(dict)
+    roots = []
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers and "_lsprof.Profiler" not in func[2]:
+            # (Profiler.disable() is recorded too, but that's just noise.)
+            roots.append(func)
+        for caller, edge in callers.items():
+            children[caller][func] = edge[3]
+
+    total = sum(raw[root][3] for root in roots)
+    stacks: Counter = Counter()
+
+    def walk(func: FuncKey, stack: List[str], share: float) -> None:
+        _, _, tottime, cumtime, _ = raw[func]
+        if cumtime <= 0 or len(stack) > 250:
+            return
+        stack = [*stack, func_label(func)]
+        ratio = min(share / cumtime, 1.0)
+        stacks[";".join(stack)] += round(tottime * ratio * 1e6)
+        for child, edge_time in children[func].items():
+            child_share = edge_time * ratio
+            if child_share >= total * threshold and func_label(child) not in stack:
+                walk(child, stack, child_share)
+
+    for root in sorted(roots):
+        walk(root, [], raw[root][3])
+    return {stack: us for stack, us in stacks.items() if us > 0}
+
+
+def write_collapsed_stacks(stats: pstats.Stats, path: Path) -> None:
+    with open(path, "w", encoding="utf8") as f:
+        for stack, us in sorted(collapse_stats(stats).items()):
+            f.write(f"{stack} {us}\n")
+
+
+@dataclass(frozen=True)
+class FunctionDelta:
+    label: str
+    baseline_self: float
+    candidate_self: float
+    baseline_cumulative: float
+    candidate_cumulative: float
+
+    @property
+    def self_delta(self) -> float:
+        return self.candidate_self - self.baseline_self
+
+    @property
+    def cumulative_delta(self) -> float:
+        return self.candidate_cumulative - self.baseline_cumulative
+
+
+def _aggregate(stats: pstats.Stats, loops: int) -> Dict[str, Tuple[float, float]]:
+    # Line numbers are ignored and paths are shortened so the same function can be
+    # matched across environments (and versions of Black).
+    times: Dict[str, Tuple[float, float]] = {}
+    for func, (_, _, tottime, cumtime, _) in stats.stats.items():  # type: ignore[attr-defined]
+        label = func_label(func)
+        prev_self, prev_cumulative = times.get(label, (0.0, 0.0))
+        times[label] = (prev_self + tottime / loops, prev_cumulative + cumtime / loops)
+    return times
+
+
+def diff_stats(baseline: pstats.Stats, candidate: pstats.Stats, loops: int) -> List[FunctionDelta]:
+    """
+    Compare two profiles function by function (per loop). The deltas are sorted by their
+    contribution to the total change, i.e. by how much their self time changed since the
+    self times add up to the total time.
+    """
+    base_times = _aggregate(baseline, loops)
+    cand_times = _aggregate(candidate, loops)
+    deltas = []
+    for label in base_times.keys() | cand_times.keys():
+        base_self, base_cumulative = base_times.get(label, (0.0, 0.0))
+        cand_self, cand_cumulative = cand_times.get(label, (0.0, 0.0))
+        deltas.append(FunctionDelta(label, base_self, cand_self, base_cumulative, cand_cumulative))
+    return sorted(deltas, key=lambda d: (-d.self_delta, d.label))
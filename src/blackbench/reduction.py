@@ -0,0 +1,190 @@
+"""
+Target reduction: delta debugging a target down to the statements that are needed to
+reproduce a slowdown between two environments, see `blackbench reduce`.
+"""
+
+import ast
+import io
+import json
+import re
+import subprocess
+import tokenize
+from pathlib import Path
+from types import TracebackType
+from typing import Callable, List, Optional, Sequence, Set, Tuple, Type
+
+THIS_DIR = Path(__file__).parent
+HARNESS = THIS_DIR / "misc" / "reduce-harness.py"
+
+
+class FormattingTimer:
+    """
+    Times formatting under another interpreter. The harness is kept running between
+    calls as importing Black takes way longer than formatting a reduced target.
+    """
+
+    def __init__(self, python: str, mode: str = "", *, repeat: int = 3) -> None:
+        cmd = [python, str(HARNESS), "--mode", mode, "--repeat", str(repeat)]
+        # fmt: off
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            encoding="utf8",
+        )
+        # fmt: on
+
+    def __call__(self, code: str) -> Optional[float]:
+        """Return the best formatting time in seconds, or None if Black failed."""
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        try:
+            self._proc.stdin.write(json.dumps(code) + "\n")
+            self._proc.stdin.flush()
+        except BrokenPipeError:
+            pass
+        line = self._proc.stdout.readline()
+        if not line:
+            stderr = self._proc.stderr.read() if self._proc.stderr else ""
+            raise RuntimeError(f"the timing harness exited unexpectedly:\n{stderr.strip()}")
+        best: Optional[float] = json.loads(line).get("time")
+        return best
+
+    def close(self) -> None:
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        self._proc.wait()
+        if self._proc.stdout:
+            self._proc.stdout.close()
+        if self._proc.stderr:
+            self._proc.stderr.close()
+
+    def __enter__(self) -> "FormattingTimer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+def _clause_header(lines: List[str], keyword: str, after: int, first: int) -> Optional[int]:
+    # The header is somewhere between the end of the previous clause and the first line of
+    # the clause's body (they're the same line for `else: ...`), comments aside.
+    header = re.compile(rf"\s*{keyword}\s*:")
+    for lineno in range(after, first):
+        if header.match(lines[lineno]):
+            return lineno
+    return None
+
+
+def all_statement_spans(source: str) -> List[Tuple[int, int]]:
+    """
+    Return the line spans (0-based, end exclusive) of every statement, nested ones
+    included, and of every except, else, and finally clause. They're ordered by where
+    they start (outer statements first).
+    """
+    lines = source.splitlines()
+    spans = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, (ast.stmt, ast.excepthandler)):
+            decorators = getattr(node, "decorator_list", [])
+            start = min([node.lineno, *(d.lineno for d in decorators)]) - 1
+            end = getattr(node, "end_lineno", None) or start + 1
+            spans.add((start, end))
+        # The else and finally clauses aren't nodes themselves, but they can go too. An
+        # elif is the If statement in the else clause, it's covered already.
+        previous: List[ast.AST] = []
+        for field in ("body", "handlers", "orelse", "finalbody"):
+            clause = getattr(node, field, None)
+            if not isinstance(clause, list) or not clause:
+                continue
+            if field in ("orelse", "finalbody") and previous:
+                keyword = "else" if field == "orelse" else "finally"
+                after = previous[-1].end_lineno  # type: ignore[attr-defined]
+                header = _clause_header(lines, keyword, after, clause[0].lineno)
+                if header is not None:
+                    spans.add((header, clause[-1].end_lineno))
+            previous = clause
+    return sorted(spans, key=lambda span: (span[0], -span[1]))
+
+
+def filler_spans(source: str) -> List[Tuple[int, int]]:
+    """Return the line spans (0-based, end exclusive) of runs of blank or comment-only lines."""
+    trivia = {tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT, tokenize.INDENT, tokenize.DEDENT}
+    code_lines: Set[int] = set()
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type not in trivia and token.type != tokenize.ENDMARKER:
+            code_lines.update(range(token.start[0] - 1, token.end[0]))
+    spans: List[Tuple[int, int]] = []
+    for lineno in range(len(source.splitlines())):
+        if lineno in code_lines:
+            continue
+        if spans and spans[-1][1] == lineno:
+            spans[-1] = (spans[-1][0], lineno + 1)
+        else:
+            spans.append((lineno, lineno + 1))
+    return spans
+
+
+def remove_spans(source: str, spans: Sequence[Tuple[int, int]]) -> str:
+    lines = source.splitlines(keepends=True)
+    removed = {lineno for start, end in spans for lineno in range(start, end)}
+    return "".join(line for lineno, line in enumerate(lines) if lineno not in removed)
+
+
+def _parses(source: str) -> bool:
+    try:
+        ast.parse(source)
+    except (SyntaxError, ValueError):
+        return False
+    return True
+
+
+def reduce_source(
+    source: str,
+    interesting: Callable[[str], bool],
+    *,
+    on_reduction: Optional[Callable[[str], None]] = None,
+) -> str:
+    """
+    Remove as many statements as possible while the code still parses and is still
+    interesting. Like ddmin, large chunks of statements are tried first and the chunk
+    size is halved until single statements are tried. This is repeated until a pass
+    doesn't remove anything. Removals that leave a block empty don't parse and are
+    skipped, the whole block has to go instead. Blank and comment-only lines are removed
+    the same way once no more statements can be.
+    """
+    for find_spans in (all_statement_spans, filler_spans):
+        source = _reduce_spans(source, find_spans, interesting, on_reduction)
+    return source
+
+
+def _reduce_spans(
+    source: str,
+    find_spans: Callable[[str], List[Tuple[int, int]]],
+    interesting: Callable[[str], bool],
+    on_reduction: Optional[Callable[[str], None]],
+) -> str:
+    reduced = True
+    while reduced:
+        reduced = False
+        spans = find_spans(source)
+        chunk = max(len(spans) // 2, 1)
+        while True:
+            i = 0
+            while i < len(spans):
+                code = remove_spans(source, spans[i : i + chunk])
+                if code != source and _parses(code) and interesting(code):
+                    source = code
+                    reduced = True
+                    if on_reduction is not None:
+                        on_reduction(source)
+                    # The remaining statements have moved up, the next chunk starts at i.
+                    spans = find_spans(source)
+                else:
+                    i += chunk
+            if chunk == 1:
+                break
+            chunk //= 2
+    return source
@@ -0,0 +1,222 @@
+"""
+Static HTML trend reports over a results history database.
+"""
+
+import html
+import math
+import statistics
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from blackbench.history import HistoryEntry, ResultsStore
+from blackbench.stats import detect_change_points
+from blackbench.utils import format_value
+
+WIDTH = 760
+HEIGHT = 260
+MARGIN = (20, 20, 40, 90)  # top, right, bottom, left
+Z_95 = 1.96
+
+STYLE = """
+body { font-family: sans-serif; margin: 2em auto; max-width: 820px; color: #222; }
+table { border-collapse: collapse; margin: 1em 0; }
+th, td { padding: 0.25em 0.75em; text-align: left; border-bottom: 1px solid #ddd; }
+td.slower { color: #c0392b; }
+td.faster { color: #27ae60; }
+svg text { font-size: 11px; fill: #555; }
+.band { fill: #3498db; fill-opacity: 0.2; stroke: none; }
+.mean { fill: none; stroke: #2471a3; stroke-width: 1.5; }
+.segment { stroke: #888; stroke-width: 1; }
+.change { stroke: #c0392b; stroke-dasharray: 4 3; }
+.change-label { fill: #c0392b; }
+.axis { stroke: #aaa; }
+"""
+
+
+@dataclass(frozen=True)
+class ChangePoint:
+    benchmark: str
+    index: int  # the position of the first entry of the new segment
+    before: HistoryEntry  # the last entry of the previous segment
+    after: HistoryEntry  # the first entry of the new segment
+    change: float  # relative change between the segment means
+
+    @property
+    def label(self) -> str:
+        versions = f"black {self.before.black_version} → {self.after.black_version}"
+        return f"{versions} ({self.change:+.1%})"
+
+
+def confidence_interval(entry: HistoryEntry) -> Tuple[float, float]:
+    """The 95% confidence interval of the mean (normal approximation)."""
+    half = Z_95 * entry.stdev / math.sqrt(len(entry.values))
+    return entry.mean - half, entry.mean + half
+
+
+def find_change_points(benchmark: str, entries: Sequence[HistoryEntry]) -> List[ChangePoint]:
+    means = [e.mean for e in entries]
+    bounds = [0, *detect_change_points(means), len(means)]
+    segment_means = [statistics.fmean(means[a:b]) for a, b in zip(bounds, bounds[1:])]
+    return [
+        ChangePoint(benchmark, index, entries[index - 1], entries[index], after / before - 1)
+        for index, before, after in zip(bounds[1:-1], segment_means, segment_means[1:])
+    ]
+
+
+def render_chart(entries: Sequence[HistoryEntry], change_points: Sequence[ChangePoint]) -> str:
+    """Render the trend of a benchmark as an inline SVG chart."""
+    top, right, bottom, left = MARGIN
+    intervals = [confidence_interval(e) for e in entries]
+    low = min(lo for lo, _ in intervals)
+    high = max(hi for _, hi in intervals)
+    if high == low:
+        low, high = low * 0.99 or -1.0, high * 1.01 or 1.0
+    padding = (high - low) * 0.05
+    low, high = low - padding, high + padding
+    unit = entries[0].unit
+
+    def x(index: float) -> float:
+        if len(entries) == 1:
+            return left + (WIDTH - left - right) / 2
+        return left + index * (WIDTH - left - right) / (len(entries) - 1)
+
+    def y(value: float) -> float:
+        return top + (high - value) * (HEIGHT - top - bottom) / (high - low)
+
+    def points(coords: Sequence[Tuple[float, float]]) -> str:
+        return " ".join(f"{px:.1f},{py:.1f}" for px, py in coords)
+
+    parts = [f'<svg width="{WIDTH}" height="{HEIGHT}" xmlns="http://www.w3.org/2000/svg">']
+    parts.append(
+        f'<line class="axis" x1="{left}" y1="{HEIGHT - bottom}"'
+        f' x2="{WIDTH - right}" y2="{HEIGHT - bottom}"/>'
+    )
+    for value in (low + padding, (low + high) / 2, high - padding):
+        parts.append(
+            f'<text x="{left - 6}" y="{y(value) + 4:.1f}" text-anchor="end">'
+            f"{html.escape(format_value(value, unit))}</text>"
+        )
+    for index in sorted({0, len(entries) - 1}):
+        parts.append(
+            f'<text x="{x(index):.1f}" y="{HEIGHT - bottom + 16}" text-anchor="middle">'
+            f"{html.escape(entries[index].timestamp[:10])}</text>"
+        )
+
+    band = [(x(i), y(hi)) for i, (_, hi) in enumerate(intervals)]
+    band += [(x(i), y(lo)) for i, (lo, _) in reversed(list(enumerate(intervals)))]
+    parts.append(f'<polygon class="band" points="{points(band)}"/>')
+
+    # The segment means between change points make the step changes easy to spot.
+    bounds = [0, *(cp.index for cp in change_points), len(entries)]
+    for start, end in zip(bounds, bounds[1:]):
+        mean = statistics.fmean(e.mean for e in entries[start:end])
+        parts.append(
+            f'<line class="segment" x1="{x(start):.1f}" y1="{y(mean):.1f}"'
+            f' x2="{x(end - 1):.1f}" y2="{y(mean):.1f}"/>'
+        )
+
+    means = [(x(i), y(e.mean)) for i, e in enumerate(entries)]
+    parts.append(f'<polyline class="mean" points="{points(means)}"/>')
+    for (px, py), entry, (lo, hi) in zip(means, entries, intervals):
+        tooltip = (
+            f"{entry.timestamp[:19]}, black {entry.black_version}:"
+            f" {format_value(entry.mean, unit)} (95% CI: {format_value(lo, unit)}"
+            f" - {format_value(hi, unit)}, {len(entry.values)} values, {entry.host})"
+        )
+        parts.append(
+            f'<circle cx="{px:.1f}" cy="{py:.1f}" r="3" fill="#2471a3">'
+            f"<title>{html.escape(tooltip)}</title></circle>"
+        )
+
+    for number, cp in enumerate(change_points):
+        cx = (x(cp.index - 1) + x(cp.index)) / 2
+        parts.append(
+            f'<line class="change" x1="{cx:.1f}" y1="{top}" x2="{cx:.1f}" y2="{HEIGHT - bottom}"/>'
+        )
+        # Alternate the label rows so neighbouring change points don't overlap.
+        ty = top + 10 + 14 * (number % 2)
+        parts.append(
+            f'<text class="change-label" x="{cx + 4:.1f}" y="{ty}">{html.escape(cp.label)}</text>'
+        )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+def _anchor(name: str) -> str:
+    return "bm-" + "".join(c if c.isalnum() else "-" for c in name)
+
+
+def render_report(store: ResultsStore, *, title: Optional[str] = None) -> Tuple[str, int]:
+    """
+    Render a self-contained HTML page with a chart per benchmark. Returns the page and
+    how many change points were detected.
+    """
+    title = title or f"blackbench trends ({store.path.name})"
+    sections = []
+    all_change_points: List[ChangePoint] = []
+    names = store.benchmark_names()
+    for name in names:
+        entries = store.history(name)
+        change_points = find_change_points(name, entries)
+        all_change_points.extend(change_points)
+        latest = entries[-1]
+        sections.append(
+            f'<h2 id="{_anchor(name)}">{html.escape(name)}</h2>\n'
+            f"<p>{len(entries)} results, latest: {format_value(latest.mean, latest.unit)}"
+            f" (black {html.escape(str(latest.black_version))},"
+            f" {html.escape(latest.timestamp[:19])})</p>\n" + render_chart(entries, change_points)
+        )
+
+    rows = []
+    for cp in all_change_points:
+        css = "slower" if cp.change > 0 else "faster"
+        rows.append(
+            f'<tr><td><a href="#{_anchor(cp.benchmark)}">{html.escape(cp.benchmark)}</a></td>'
+            f"<td>{html.escape(str(cp.before.black_version))}</td>"
+            f"<td>{html.escape(str(cp.after.black_version))}</td>"
+            f"<td>{html.escape(cp.after.timestamp[:19])}</td>"
+            f'<td class="{css}">{cp.change:+.1%}</td></tr>'
+        )
+    if rows:
+        summary = (
+            "<table>\n<tr><th>Benchmark</th><th>Before</th><th>After</th><th>First seen</th>"
+            "<th>Change</th></tr>\n" + "\n".join(rows) + "\n</table>"
+        )
+    else:
+        summary = "<p>No change points detected.</p>"
+    index = "\n".join(
+        f'<li><a href="#{_anchor(name)}">{html.escape(name)}</a></li>' for name in names
+    )
+
+    page = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{html.escape(title)}</title>
+<style>{STYLE}</style>
+</head>
+<body>
+<h1>{html.escape(title)}</h1>
+<p>Generated {datetime.now().isoformat(sep=" ", timespec="seconds")}. The shaded bands are
+95% confidence intervals of the mean, the dashed lines are detected change points.</p>
+<h2>Change points</h2>
+{summary}
+<h2>Benchmarks</h2>
+<ul>
+{index}
+</ul>
+{chr(10).join(sections)}
+</body>
+</html>
+"""
+    return page, len(all_change_points)
+
+
+def write_report(store: ResultsStore, output_dir: Path) -> Tuple[Path, int]:
+    output_dir.mkdir(parents=True, exist_ok=True)
+    page, change_point_count = render_report(store)
+    path = output_dir / "index.html"
+    path.write_text(page, encoding="utf8")
+    return path, change_point_count
@@ -5,7 +5,9 @@
 from dataclasses import dataclass
 from functools import cached_property
 from pathlib import Path
+from typing import Tuple
 
+from blackbench.modes import with_default_argument
 from blackbench.utils import _gen_python_files
 
 THIS_DIR = Path(__file__).parent
@@ -19,6 +21,10 @@ class Target:
     path: Path
     micro: bool
     description: str = ""
+    # Very large files that take a long time, only run when asked for (-t stress).
+    stress: bool = False
+    # Only selected by name or directory (eg. -t mined), never as part of a group.
+    ungrouped: bool = False
 
     @property
     def name(self) -> str:
@@ -31,6 +37,10 @@ class Task:
     name: str
     source: Path
     description: str
+    # The kind of files the task can take as input, targets of other kinds are skipped.
+    suffixes: Tuple[str, ...] = (".py", ".pyi")
+    # Every value is a single call, so their percentiles are reported as latencies.
+    latency: bool = False
 
     @cached_property
     def template(self) -> str:
@@ -39,19 +49,35 @@ def template(self) -> str:
     def create_benchmark_script(self, name: str, target: Target) -> str:
         return self.template.format(name=name, target=str(target.path))
 
+    def supports(self, target: Target) -> bool:
+        return target.path.suffix in self.suffixes
+
 
 @dataclass
 class FormatTask(Task):
     custom_mode: str = ""
+    # Added to the benchmark names if set, see --mode-matrix.
+    mode_tag: str = ""
 
     def create_benchmark_script(self, name: str, target: Target) -> str:
-        return self.template.format(name=name, target=str(target.path), mode=self.custom_mode)
+        mode = self.custom_mode
+        if target.path.suffix == ".pyi":
+            mode = with_default_argument(mode, "is_pyi", "True")
+        return self.template.format(name=name, target=str(target.path), mode=mode)
 
 
 _flit_files = [
     *_gen_python_files(NORMAL_DIR / "flit"),
     *_gen_python_files(NORMAL_DIR / "flit_core"),
 ]
+_stub_files = _gen_python_files(NORMAL_DIR / "stubs")
+# Written by `blackbench mine` (when told to write them here), see blackbench.mining.
+_mined_files = _gen_python_files(MICRO_DIR / "mined") if (MICRO_DIR / "mined").exists() else []
+# Written by `blackbench reduce` (when told to write them here), see blackbench.reduction.
+_reduced_files = (
+    _gen_python_files(MICRO_DIR / "reduced") if (MICRO_DIR / "reduced").exists() else []
+)
+_notebook_files = _gen_python_files(NORMAL_DIR / "notebooks", suffixes=(".ipynb",))
 _targets = [
     *[
         Target(path, micro=False, description=f"Black source code from 21.6b0 (#{n})")
@@ -61,6 +87,38 @@ def create_benchmark_script(self, name: str, target: Target) -> str:
         Target(path, micro=False, description=f"Flit source code from 3.2.0 (#{n})")
         for n, path in enumerate(_flit_files, start=1)
     ],
+    *[
+        Target(path, micro=False, description=f"Typeshed standard library stubs (#{n})")
+        for n, path in enumerate(_stub_files, start=1)
+    ],
+    Target(
+        NORMAL_DIR / "stress" / "mypy" / "checker.py",
+        micro=False,
+        description="mypy's type checker from 2.4.0, one of the biggest modules out there",
+        stress=True,
+    ),
+    Target(
+        NORMAL_DIR / "stress" / "libcst" / "matchers.py",
+        micro=False,
+        description="LibCST's (generated) matchers from 1.0.1, 100s of dataclasses",
+        stress=True,
+    ),
+    Target(
+        NORMAL_DIR / "stress" / "generated" / "descriptor_pb2.py",
+        micro=False,
+        description="A protobuf module as generated by an older protoc",
+        stress=True,
+    ),
+    Target(
+        NORMAL_DIR / "stress" / "generated" / "unicode_table.py",
+        micro=False,
+        description="A generated lookup table, a single 4000+ line tuple literal",
+        stress=True,
+    ),
+    *[
+        Target(path, micro=False, description=f"Jupyter notebook, code and analysis (#{n})")
+        for n, path in enumerate(_notebook_files, start=1)
+    ],
     Target(MICRO_DIR / "dict-literal.py", micro=True, description="A long dictionary literal"),
     Target(
         MICRO_DIR / "comments.py",
@@ -78,10 +136,56 @@ def create_benchmark_script(self, name: str, target: Target) -> str:
         micro=True,
         description="A list containing 100s of sometimes comma separated strings",
     ),
+    Target(
+        MICRO_DIR / "long-strings.py",
+        micro=True,
+        description="Long string literals and explicit concatenation that need splitting",
+    ),
+    Target(MICRO_DIR / "fstrings.py", micro=True, description="Lots of long f-strings"),
+    Target(
+        MICRO_DIR / "implicit-concatenation.py",
+        micro=True,
+        description="Implicitly concatenated strings, mostly as call arguments",
+    ),
+    Target(
+        MICRO_DIR / "docstrings.py",
+        micro=True,
+        description="Docstrings with odd indentation, quotes, and trailing whitespace",
+    ),
+    *[
+        Target(
+            path,
+            micro=True,
+            description=f"Pathological input found by mining (#{n})",
+            ungrouped=True,
+        )
+        for n, path in enumerate(_mined_files, start=1)
+    ],
+    *[
+        Target(
+            path,
+            micro=True,
+            description=f"Target reduced to reproduce a slowdown (#{n})",
+            ungrouped=True,
+        )
+        for n, path in enumerate(_reduced_files, start=1)
+    ],
+    Target(
+        MICRO_DIR / "magics.ipynb",
+        micro=True,
+        description="Notebook cells full of line / cell magics, shell escapes, and help syntax",
+    ),
+    Target(
+        MICRO_DIR / "notebook-cells.ipynb",
+        micro=True,
+        description="A notebook with 100s of tiny cells",
+    ),
 ]
 targets = {t.name: t for t in _targets}
-normal_targets = [t for t in targets.values() if not t.micro]
-micro_targets = [t for t in targets.values() if t.micro]
+normal_targets = [t for t in targets.values() if not t.micro and not t.stress and not t.ungrouped]
+micro_targets = [t for t in targets.values() if t.micro and not t.ungrouped]
+stress_targets = [t for t in targets.values() if t.stress]
+ungrouped_targets = [t for t in targets.values() if t.ungrouped]
 
 _tasks = [
     FormatTask(
@@ -94,6 +198,23 @@ def create_benchmark_script(self, name: str, target: Target) -> str:
         TASK_DIR / "format-fast-template.py",
         description="Standard Black run but safety checks are *disabled*",
     ),
+    FormatTask(
+        "fmt-strings",
+        TASK_DIR / "format-strings-template.py",
+        description="Like fmt but with the (preview) string processing transformers enabled",
+    ),
+    FormatTask(
+        "fmt-ipynb",
+        TASK_DIR / "format-ipynb-template.py",
+        description="Like fmt but for Jupyter notebooks (needs black[jupyter])",
+        suffixes=(".ipynb",),
+    ),
+    FormatTask(
+        "edit",
+        TASK_DIR / "edit-template.py",
+        description="Standard Black run after each of a sequence of small edits, timed per edit",
+        latency=True,
+    ),
     Task("parse", TASK_DIR / "parse-template.py", description="Only do blib2to3 parsing"),
 ]
 tasks = {task.name: task for task in _tasks}
@@ -0,0 +1,282 @@
+"""
+Statistics helpers for analyzing (and comparing) benchmark results.
+"""
+
+import math
+import random
+import statistics
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import pyperf
+
+
+def _rank(values: Sequence[float]) -> Tuple[List[float], List[int]]:
+    """Return the 1-based ranks (ties averaged) and the sizes of every tie group."""
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties: List[int] = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def mann_whitney_u(baseline: Sequence[float], candidate: Sequence[float]) -> float:
+    """
+    One-sided Mann-Whitney U test, returns the p-value for the hypothesis that the
+    candidate values tend to be larger (i.e. slower) than the baseline values.
+
+    Uses the normal approximation with tie and continuity corrections, which is fine
+    for the number of values pyperf usually collects.
+    """
+    nx, ny = len(baseline), len(candidate)
+    if not nx or not ny:
+        raise ValueError("both samples must contain at least one value")
+
+    n = nx + ny
+    ranks, ties = _rank([*baseline, *candidate])
+    u = sum(ranks[nx:]) - ny * (ny + 1) / 2
+    mean = nx * ny / 2
+    tie_term = sum(t**3 - t for t in ties) / (n * (n - 1)) if n > 1 else 0.0
+    variance = nx * ny / 12 * ((n + 1) - tie_term)
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def holm_bonferroni(pvalues: Sequence[float]) -> List[float]:
+    """Adjust p-values for multiple comparisons with the Holm-Bonferroni method."""
+    m = len(pvalues)
+    adjusted = [0.0] * m
+    running_max = 0.0
+    for step, index in enumerate(sorted(range(m), key=pvalues.__getitem__)):
+        running_max = max(running_max, min(1.0, (m - step) * pvalues[index]))
+        adjusted[index] = running_max
+    return adjusted
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    unit: str
+    baseline: float
+    candidate: float
+    p_value: float
+    adjusted_p_value: float
+
+    @property
+    def change(self) -> float:
+        """The relative change of the candidate's mean (positive means slower)."""
+        return (self.candidate - self.baseline) / self.baseline
+
+    def is_regression(self, max_slowdown: float, alpha: float) -> bool:
+        return self.adjusted_p_value < alpha and self.change > max_slowdown
+
+
+def _p_value(baseline: pyperf.Benchmark, candidate: pyperf.Benchmark) -> float:
+    base_values, cand_values = baseline.get_values(), candidate.get_values()
+    if baseline.get_unit() == "integer" and len({*base_values}) == len({*cand_values}) == 1:
+        # Deterministic counts (eg. instructions from `blackbench count`) have no noise,
+        # any difference at all is real.
+        return 0.0 if cand_values[0] > base_values[0] else 1.0
+    return mann_whitney_u(base_values, cand_values)
+
+
+def compare_suites(
+    baseline: pyperf.BenchmarkSuite, candidate: pyperf.BenchmarkSuite
+) -> List[Comparison]:
+    """Compare all of the benchmarks present in both suites, in alphabetical order."""
+    candidates: Dict[str, pyperf.Benchmark] = {
+        bm.get_name(): bm for bm in candidate.get_benchmarks()
+    }
+    pairs = [
+        (bm, candidates[bm.get_name()])
+        for bm in sorted(baseline.get_benchmarks(), key=lambda b: b.get_name())
+        if bm.get_name() in candidates
+    ]
+    pvalues = [_p_value(base, cand) for base, cand in pairs]
+    adjusted = holm_bonferroni(pvalues)
+    return [
+        Comparison(
+            base.get_name(),
+            base.get_unit(),
+            statistics.fmean(base.get_values()),
+            statistics.fmean(cand.get_values()),
+            p,
+            adjusted_p,
+        )
+        for (base, cand), p, adjusted_p in zip(pairs, pvalues, adjusted)
+    ]
+
+
+def detect_change_points(
+    series: Sequence[float], *, min_size: int = 2, penalty: Optional[float] = None
+) -> List[int]:
+    """
+    Find where the mean of `series` shifts with PELT (Killick et al., 2012) using the
+    normal mean-change cost, returning the indices that start a new segment.
+
+    The noise level is estimated from the differences between successive values, which
+    is robust to the shifts themselves. The penalty defaults to the BIC (2 * log(n)).
+    Segments have at least `min_size` values so a single outlier isn't a change.
+    """
+    n = len(series)
+    if n < 2 * min_size:
+        return []
+    diffs = [abs(b - a) for a, b in zip(series, series[1:])]
+    sigma = 1.4826 * statistics.median(diffs) / math.sqrt(2)
+    if sigma == 0:
+        # Noiseless (eg. instruction count) series, practically every change is real.
+        sigma = 1e-6 * (max(abs(v) for v in series) or 1.0)
+    beta = 2 * math.log(n) if penalty is None else penalty
+
+    # Centered and scaled to keep the cumulative sums (and their differences) precise.
+    center = statistics.fmean(series)
+    sums, squares = [0.0], [0.0]
+    for value in series:
+        scaled = (value - center) / sigma
+        sums.append(sums[-1] + scaled)
+        squares.append(squares[-1] + scaled * scaled)
+
+    def cost(start: int, end: int) -> float:
+        total = sums[end] - sums[start]
+        return squares[end] - squares[start] - total * total / (end - start)
+
+    best: Dict[int, float] = {0: -beta}
+    previous: Dict[int, int] = {}
+    candidates = [0]
+    for end in range(min_size, n + 1):
+        new = end - min_size
+        if new in best and new not in candidates:
+            candidates.append(new)
+        totals = {start: best[start] + cost(start, end) for start in candidates}
+        start = min(totals, key=lambda s: totals[s])
+        best[end] = totals[start] + beta
+        previous[end] = start
+        # PELT: a start that can't beat the optimum now never will.
+        candidates = [s for s in candidates if totals[s] <= best[end]]
+
+    change_points = []
+    end = n
+    while end > 0:
+        end = previous[end]
+        if end:
+            change_points.append(end)
+    return sorted(change_points)
+
+
+LATENCY_PERCENTILES = (50, 95, 99)
+
+
+def latency_percentiles(values: Sequence[float]) -> Dict[str, float]:
+    """Return the p50, p95, and p99 of the values (interpolated between the closest values)."""
+    if len(values) == 1:
+        return {f"p{p}": values[0] for p in LATENCY_PERCENTILES}
+    cut_points = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{p}": cut_points[p - 1] for p in LATENCY_PERCENTILES}
+
+
+def geometric_mean(values: Sequence[float]) -> float:
+    return math.exp(statistics.fmean(math.log(v) for v in values))
+
+
+def scaling_exponent(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """
+    Fit y = a * x^k by least squares (in log-log space) and return k. For runtime vs line
+    length, 0 means the width doesn't matter and -1 that halving the width doubles the
+    runtime.
+    """
+    log_xs = [math.log(x) for x in xs]
+    log_ys = [math.log(y) for y in ys]
+    mean_x = statistics.fmean(log_xs)
+    mean_y = statistics.fmean(log_ys)
+    spread = sum((x - mean_x) ** 2 for x in log_xs)
+    if not spread:
+        raise ValueError("at least two distinct x values are needed")
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(log_xs, log_ys)) / spread
+
+
+def bootstrap_geomean_ci(
+    samples: Sequence[Sequence[float]],
+    *,
+    confidence: float = 0.95,
+    resamples: int = 1000,
+    seed: int = 0,
+) -> Tuple[float, float]:
+    """
+    Estimate a confidence interval for the geometric mean of the sample means by
+    resampling each sample's values (with replacement). The RNG is seeded so the
+    interval is reproducible for the same data.
+    """
+    rng = random.Random(seed)
+    estimates = sorted(
+        geometric_mean([statistics.fmean(rng.choices(s, k=len(s))) for s in samples])
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    low = estimates[int(tail * (resamples - 1))]
+    high = estimates[math.ceil((1 - tail) * (resamples - 1))]
+    return low, high
+
+
+@dataclass(frozen=True)
+class Summary:
+    group: str
+    count: int
+    unit: str
+    geomean: float
+    low: float
+    high: float
+
+    def as_metadata(self) -> Dict[str, Union[int, float]]:
+        prefix = f"geomean-{self.group}"
+        return {
+            prefix: self.geomean,
+            f"{prefix}-low": self.low,
+            f"{prefix}-high": self.high,
+            f"{prefix}-count": self.count,
+        }
+
+
+def summarize_suite(suite: pyperf.BenchmarkSuite) -> List[Summary]:
+    """
+    Summarize a suite into geometric means (of the benchmark means) for the whole suite,
+    the micro, normal, and stress target groups, every task, and every variant (if there are
+    several). Grouping relies on the metadata injected by run_suite so older result files
+    only get the suite-wide summary.
+    """
+    groups: Dict[str, List[pyperf.Benchmark]] = {"all": [], "micro": [], "normal": [], "stress": []}
+    variants: Dict[str, List[pyperf.Benchmark]] = {}
+    for bm in suite.get_benchmarks():
+        metadata = bm.get_metadata()
+        groups["all"].append(bm)
+        if "target-group" in metadata:
+            groups[metadata["target-group"]].append(bm)
+        if "task" in metadata:
+            groups.setdefault(f"task-{metadata['task']}", []).append(bm)
+        variants.setdefault(f"variant-{metadata.get('variant', 'default')}", []).append(bm)
+    if len(variants) > 1:
+        groups.update(variants)
+
+    summaries = []
+    for group, benchmarks in groups.items():
+        if not benchmarks:
+            continue
+        units = {bm.get_unit() for bm in benchmarks}
+        if len(units) != 1:
+            # A geometric mean over different units is meaningless.
+            continue
+        samples = [bm.get_values() for bm in benchmarks]
+        geomean = geometric_mean([statistics.fmean(s) for s in samples])
+        low, high = bootstrap_geomean_ci(samples)
+        summaries.append(Summary(group, len(benchmarks), units.pop(), geomean, low, high))
+    return summaries
@@ -0,0 +1,93 @@
+import ast
+import keyword
+import random
+import tokenize
+from io import StringIO
+from pathlib import Path
+
+import pyperf
+
+import black
+
+# Every value is a single edit and format so the values form a latency distribution. The
+# edits are the same (and in the same order) in every worker process.
+runner = pyperf.Runner(values=10, loops=1)
+mode = black.FileMode({mode})
+
+
+class Buffer:
+    """A file open in an editor, formatted (eg. on save) after every small edit."""
+
+    def __init__(self, code):
+        self.code = code
+        self.edits = 0
+        self.rng = random.Random(0)
+
+    def tokens(self, *types):
+        tokens = tokenize.generate_tokens(StringIO(self.code).readline)
+        return [t for t in tokens if t.type in types]
+
+    def replace(self, changes):
+        lines = self.code.splitlines(keepends=True)
+        # Right to left so the columns of the earlier changes on a line stay correct.
+        for (row, col), old, new in sorted(changes, reverse=True):
+            line = lines[row - 1]
+            lines[row - 1] = line[:col] + new + line[col + len(old) :]
+        return "".join(lines)
+
+    def insert_line(self):
+        statements = [n for n in ast.walk(ast.parse(self.code)) if isinstance(n, ast.stmt)]
+        node = self.rng.choice(statements)
+        lineno = min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])])
+        line = self.code.splitlines(keepends=True)[lineno - 1]
+        indent = line[: len(line) - len(line.lstrip())]
+        new = "%sedited_%d = %d\n" % (indent, self.edits, self.edits)
+        return self.replace([((lineno, 0), "", new)])
+
+    def rename_identifier(self):
+        names = [t for t in self.tokens(tokenize.NAME) if not keyword.iskeyword(t.string)]
+        name = self.rng.choice(sorted(set(t.string for t in names)))
+        renamed = "%s_%d" % (name, self.edits)
+        return self.replace([(t.start, name, renamed) for t in names if t.string == name])
+
+    def change_literal(self):
+        token = self.rng.choice(self.tokens(tokenize.NUMBER, tokenize.STRING))
+        if token.type == tokenize.NUMBER:
+            return self.replace([(token.start, token.string, str(self.edits))])
+        # Add a character right after the (maybe prefixed, maybe triple) opening quote.
+        quote = min(i for i in (token.string.find("'"), token.string.find('"')) if i >= 0)
+        quote += 3 if token.string[quote : quote + 3] in ("'''", '"""') else 1
+        row, col = token.start
+        return self.replace([((row, col + quote), "", "x")])
+
+    def edit(self):
+        kinds = [self.insert_line, self.rename_identifier, self.change_literal]
+        self.edits += 1
+        for _ in range(100):
+            try:
+                code = kinds[self.edits % len(kinds)]()
+                ast.parse(code)
+            except (IndexError, SyntaxError, ValueError, tokenize.TokenError):
+                # Eg. a soft keyword was renamed or there's nothing to change.
+                continue
+            self.code = code
+            return
+        # Otherwise the value would time formatting unchanged code.
+        raise RuntimeError("couldn't make edit #%d to the target" % self.edits)
+
+
+def edit_and_format(loops, buffer):
+    total = 0.0
+    for _ in range(loops):
+        buffer.edit()
+        t0 = pyperf.perf_counter()
+        try:
+            buffer.code = black.format_file_contents(buffer.code, fast=False, mode=mode)
+        except black.NothingChanged:
+            pass
+        total += pyperf.perf_counter() - t0
+    return total
+
+
+buffer = Buffer(Path(r"{target}").read_text(encoding="utf8"))
+runner.bench_time_func("{name}", edit_and_format, buffer)
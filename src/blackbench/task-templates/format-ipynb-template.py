@@ -0,0 +1,26 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pyperf
+
+import black
+
+# Notebook support needs the jupyter extra (black[jupyter]), fail early without it.
+import IPython  # noqa: F401
+import tokenize_rt  # noqa: F401
+
+runner = pyperf.Runner()
+code = Path(r"{target}").read_text(encoding="utf8")
+mode = replace(black.FileMode({mode}), is_ipynb=True)
+
+
+def format_func(code):
+    try:
+        black.format_file_contents(code, fast=False, mode=mode)
+    except black.NothingChanged:
+        pass
+
+
+# Unlike the fmt task, no newlines are added: the safety checks run for every code cell
+# whether it changed or not.
+runner.bench_func("{name}", format_func, code)
@@ -0,0 +1,37 @@
+from dataclasses import fields
+from pathlib import Path
+
+import pyperf
+
+import black
+
+runner = pyperf.Runner()
+code = Path(r"{target}").read_text(encoding="utf8")
+
+
+def string_processing_mode(**kwargs):
+    # The string transformers started out behind their own flag, then became part of the
+    # preview style, and are now an unstable preview feature that has to be enabled. The
+    # custom configuration may set these too, so it's merged instead of passed alongside.
+    names = {{field.name for field in fields(black.FileMode)}}
+    if "enabled_features" in names:
+        features = {{*kwargs.get("enabled_features", ()), black.mode.Preview.string_processing}}
+        return black.FileMode(**{{**kwargs, "preview": True, "enabled_features": features}})
+    if "experimental_string_processing" in names:
+        return black.FileMode(**{{**kwargs, "experimental_string_processing": True}})
+    return black.FileMode(**{{**kwargs, "preview": True}})
+
+
+mode = string_processing_mode({mode})
+
+
+def format_func(code):
+    try:
+        black.format_file_contents(code, fast=False, mode=mode)
+    except black.NothingChanged:
+        pass
+
+
+# Add newlines that Black will strip out to force safety checks to run (see the fmt task).
+code = code + "\n\n\n"
+runner.bench_func("{name}", format_func, code)
@@ -2,7 +2,7 @@
 from contextlib import contextmanager
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Any, Dict, Generator, List
+from typing import Any, Dict, Generator, List, Sequence
 
 import click
 
@@ -33,13 +33,34 @@ def managed_workdir() -> Generator[Path, None, None]:
             log("Cleaning up.")
 
 
-def _gen_python_files(path: Path) -> List[Path]:
+def _gen_python_files(path: Path, suffixes: Sequence[str] = (".py", ".pyi")) -> List[Path]:
     files = []
     for entry in os.scandir(path):
         entry_path = Path(entry.path)
-        if entry_path.suffix in (".py", ".pyi") and entry.is_file():
+        if entry_path.suffix in suffixes and entry.is_file():
             files.append(entry_path)
         elif entry.is_dir():
-            files.extend(_gen_python_files(entry_path))
+            files.extend(_gen_python_files(entry_path, suffixes))
 
     return sorted(files)
+
+
+def format_value(value: float, unit: str = "second") -> str:
+    """Format a benchmark value using three significant digits like pyperf does."""
+    if unit != "second":
+        return f"{value:,.0f}" if unit == "integer" else f"{value:,.0f} {unit}s"
+
+    for factor, suffix in ((1.0, "sec"), (1e-3, "ms"), (1e-6, "us"), (1e-9, "ns")):
+        if abs(value) >= factor:
+            break
+    scaled = value / factor
+    digits = 2 if abs(scaled) < 10 else 1 if abs(scaled) < 100 else 0
+    return f"{scaled:.{digits}f} {suffix}"
+
+
+def print_table(rows: Sequence[Sequence[str]]) -> None:
+    """Print rows as left-aligned columns, the first row being the (bold) header."""
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for index, row in enumerate(rows):
+        line = "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        click.secho(line, bold=not index)
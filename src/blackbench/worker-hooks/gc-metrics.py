@@ -0,0 +1,84 @@
+# Collects allocation and garbage collection metrics while the benchmarked function runs.
+# The totals of each process are appended to a JSON Lines file next to the script.
+import atexit
+import gc
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pyperf
+
+_gc_metrics: Dict[str, float] = {
+    "calls": 0,
+    "alloc-blocks-delta": 0,
+    "alloc-blocks-peak": 0,
+    "gc-collections-gen0": 0,
+    "gc-collections-gen1": 0,
+    "gc-collections-gen2": 0,
+    "gc-collected": 0,
+    "gc-time": 0.0,
+}
+_gc_metrics_state = {"started": 0.0, "peak": 0}
+_gc_metrics_path = Path(__file__).with_suffix(".gc-metrics.jsonl")
+
+
+def _gc_metrics_callback(phase: str, info: Dict[str, int]) -> None:
+    if phase == "start":
+        blocks = sys.getallocatedblocks()
+        _gc_metrics_state["peak"] = max(_gc_metrics_state["peak"], blocks)
+        _gc_metrics_state["started"] = time.perf_counter()
+    else:
+        _gc_metrics["gc-time"] += time.perf_counter() - _gc_metrics_state["started"]
+        _gc_metrics[f"gc-collections-gen{info['generation']}"] += 1
+        _gc_metrics["gc-collected"] += info["collected"]
+
+
+def _gc_metrics_measure(calls: int, func: Callable, *args: Any) -> Any:
+    before = sys.getallocatedblocks()
+    _gc_metrics_state["peak"] = before
+    gc.callbacks.append(_gc_metrics_callback)
+    try:
+        return func(*args)
+    finally:
+        gc.callbacks.remove(_gc_metrics_callback)
+        after = sys.getallocatedblocks()
+        peak = max(_gc_metrics_state["peak"], after) - before
+        _gc_metrics["calls"] += calls
+        _gc_metrics["alloc-blocks-delta"] += after - before
+        _gc_metrics["alloc-blocks-peak"] = max(_gc_metrics["alloc-blocks-peak"], peak)
+
+
+def _gc_metrics_dump() -> None:
+    # The pyperf master process never calls the benchmarked function.
+    if _gc_metrics["calls"]:
+        with open(_gc_metrics_path, "a", encoding="utf8") as f:
+            f.write(json.dumps(_gc_metrics) + "\n")
+
+
+_gc_metrics_bench_func = pyperf.Runner.bench_func
+_gc_metrics_bench_time_func = pyperf.Runner.bench_time_func
+
+
+def _gc_metrics_patched_bench_func(
+    self: pyperf.Runner, name: str, func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(*func_args: Any) -> Any:
+        return _gc_metrics_measure(1, func, *func_args)
+
+    return _gc_metrics_bench_func(self, name, wrapper, *args, **kwargs)
+
+
+def _gc_metrics_patched_bench_time_func(
+    self: pyperf.Runner, name: str, time_func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(loops: int, *func_args: Any) -> Any:
+        return _gc_metrics_measure(loops, time_func, loops, *func_args)
+
+    return _gc_metrics_bench_time_func(self, name, wrapper, *args, **kwargs)
+
+
+pyperf.Runner.bench_func = _gc_metrics_patched_bench_func
+pyperf.Runner.bench_time_func = _gc_metrics_patched_bench_time_func
+atexit.register(_gc_metrics_dump)
@@ -0,0 +1,58 @@
+# Runs the benchmarked function under a non-default garbage collector configuration:
+# "disabled", "frozen" (everything alive before the first call is gc.freeze()-d), or
+# "threshold=N" (generation 0 threshold). blackbench overrides GC_MODE after this code.
+import gc
+from typing import Any, Callable
+
+import pyperf
+
+GC_MODE = "default"
+_gc_mode_state = {"frozen": False}
+
+
+def _gc_mode_measure(func: Callable, *args: Any) -> Any:
+    if GC_MODE == "frozen" and not _gc_mode_state["frozen"]:
+        # Freeze once the benchmark has been set up, like a long running service would
+        # after importing and configuring everything.
+        gc.collect()
+        gc.freeze()
+        _gc_mode_state["frozen"] = True
+
+    enabled = gc.isenabled()
+    thresholds = gc.get_threshold()
+    if GC_MODE == "disabled":
+        gc.disable()
+    elif GC_MODE.startswith("threshold="):
+        gc.set_threshold(int(GC_MODE.split("=", 1)[1]), *thresholds[1:])
+    try:
+        return func(*args)
+    finally:
+        gc.set_threshold(*thresholds)
+        if enabled:
+            gc.enable()
+
+
+_gc_mode_bench_func = pyperf.Runner.bench_func
+_gc_mode_bench_time_func = pyperf.Runner.bench_time_func
+
+
+def _gc_mode_patched_bench_func(
+    self: pyperf.Runner, name: str, func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(*func_args: Any) -> Any:
+        return _gc_mode_measure(func, *func_args)
+
+    return _gc_mode_bench_func(self, name, wrapper, *args, **kwargs)
+
+
+def _gc_mode_patched_bench_time_func(
+    self: pyperf.Runner, name: str, time_func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(loops: int, *func_args: Any) -> Any:
+        return _gc_mode_measure(time_func, loops, *func_args)
+
+    return _gc_mode_bench_time_func(self, name, wrapper, *args, **kwargs)
+
+
+pyperf.Runner.bench_func = _gc_mode_patched_bench_func
+pyperf.Runner.bench_time_func = _gc_mode_patched_bench_time_func
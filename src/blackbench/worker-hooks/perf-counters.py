@@ -0,0 +1,113 @@
+# Counts Linux perf events (via the perf_event_open syscall) while the benchmarked
+# function runs. The totals of each process are appended to a JSON Lines file next to
+# the script. blackbench overrides PERF_EVENTS after this code.
+import atexit
+import ctypes
+import fcntl
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import pyperf
+
+PERF_EVENTS: Sequence[str] = ()
+
+# name -> (perf_type_id, config), see linux/perf_event.h
+_PERF_EVENT_CODES = {
+    "cycles": (0, 0),
+    "instructions": (0, 1),
+    "cache-references": (0, 2),
+    "cache-misses": (0, 3),
+    "branches": (0, 4),
+    "branch-misses": (0, 5),
+    "task-clock": (1, 1),
+    "page-faults": (1, 2),
+    "context-switches": (1, 3),
+    "cpu-migrations": (1, 4),
+}
+_PERF_SYSCALLS = {"x86_64": 298, "aarch64": 241, "i386": 336, "i686": 336, "ppc64le": 319}
+_PERF_IOC_ENABLE = 0x2400
+_PERF_IOC_DISABLE = 0x2401
+_PERF_IOC_RESET = 0x2403
+# disabled, exclude_kernel, exclude_hv
+_PERF_FLAGS = 1 << 0 | 1 << 5 | 1 << 6
+# PERF_FORMAT_TOTAL_TIME_ENABLED | PERF_FORMAT_TOTAL_TIME_RUNNING so multiplexed
+# counters can be scaled.
+_PERF_READ_FORMAT = 1 | 2
+
+_perf_counters: Dict[str, float] = {"calls": 0}
+_perf_counters_fds: List[Tuple[str, int]] = []
+_perf_counters_path = Path(__file__).with_suffix(".perf-counters.jsonl")
+
+
+def _perf_counters_open(event: str) -> int:
+    perf_type, config = _PERF_EVENT_CODES[event]
+    # The original (version 0) 64 byte perf_event_attr, understood by every kernel.
+    attr = ctypes.create_string_buffer(64)
+    struct.pack_into(
+        "IIQQQQQ", attr, 0, perf_type, 64, config, 0, 0, _PERF_READ_FORMAT, _PERF_FLAGS
+    )
+    libc = ctypes.CDLL(None, use_errno=True)
+    number = _PERF_SYSCALLS.get(os.uname().machine)
+    if number is None:
+        raise OSError(f"perf_event_open isn't supported on {os.uname().machine}")
+    # Measure the calling thread on any CPU, no group.
+    fd = libc.syscall(number, attr, 0, -1, -1, 0)
+    if fd < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, f"perf_event_open failed for {event!r}: {os.strerror(errno)}")
+    return int(fd)
+
+
+def _perf_counters_measure(calls: int, func: Callable, *args: Any) -> Any:
+    if not _perf_counters_fds:
+        _perf_counters_fds.extend((event, _perf_counters_open(event)) for event in PERF_EVENTS)
+    for _, fd in _perf_counters_fds:
+        fcntl.ioctl(fd, _PERF_IOC_RESET, 0)
+        fcntl.ioctl(fd, _PERF_IOC_ENABLE, 0)
+    try:
+        return func(*args)
+    finally:
+        for _, fd in _perf_counters_fds:
+            fcntl.ioctl(fd, _PERF_IOC_DISABLE, 0)
+        for event, fd in _perf_counters_fds:
+            value, enabled, running = struct.unpack("QQQ", os.read(fd, 24))
+            scaled = value * enabled / running if running else 0.0
+            _perf_counters[event] = _perf_counters.get(event, 0.0) + scaled
+        _perf_counters["calls"] += calls
+
+
+def _perf_counters_dump() -> None:
+    # The pyperf master process never calls the benchmarked function.
+    if _perf_counters["calls"]:
+        with open(_perf_counters_path, "a", encoding="utf8") as f:
+            f.write(json.dumps(_perf_counters) + "\n")
+
+
+_perf_counters_bench_func = pyperf.Runner.bench_func
+_perf_counters_bench_time_func = pyperf.Runner.bench_time_func
+
+
+def _perf_counters_patched_bench_func(
+    self: pyperf.Runner, name: str, func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(*func_args: Any) -> Any:
+        return _perf_counters_measure(1, func, *func_args)
+
+    return _perf_counters_bench_func(self, name, wrapper, *args, **kwargs)
+
+
+def _perf_counters_patched_bench_time_func(
+    self: pyperf.Runner, name: str, time_func: Callable, *args: Any, **kwargs: Any
+) -> Any:
+    def wrapper(loops: int, *func_args: Any) -> Any:
+        return _perf_counters_measure(loops, time_func, loops, *func_args)
+
+    return _perf_counters_bench_time_func(self, name, wrapper, *args, **kwargs)
+
+
+pyperf.Runner.bench_func = _perf_counters_patched_bench_func
+pyperf.Runner.bench_time_func = _perf_counters_patched_bench_time_func
+atexit.register(_perf_counters_dump)
@@ -0,0 +1,166 @@
+"""
+A file-based work queue for sharding benchmarks over several machines.
+
+The queue is a directory (on a shared filesystem like NFS, or just local for testing)
+with one JSON file per benchmark job. Jobs move through `pending/`, `claimed/`, and
+finally `done/` (which holds the pyperf result) or `failed/`. Claiming a job is an atomic
+rename, so any number of workers can pull from the same queue without coordination. The
+manifest is written last, workers wait for it before claiming anything.
+
+While running a job, workers regularly touch its `.worker` file in `claimed/` as a
+heartbeat. Jobs whose worker stopped sending heartbeats (it crashed, or the machine went
+away) are moved back to `pending/` by the coordinator.
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pyperf
+
+MANIFEST = "manifest.json"
+STATES = ("pending", "claimed", "done", "failed")
+# In seconds, the coordinator's claim timeout must be comfortably longer than this.
+HEARTBEAT_INTERVAL = 30.0
+# Results can only be merged if all of these match, timings from different CPUs,
+# Python builds, or versions (and builds) of Black aren't comparable.
+# fmt: off
+HOST_KEYS = (
+    "cpu_model_name", "python_implementation", "python_version", "black-version", "black-build",
+)
+# fmt: on
+
+HostSignature = Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Job:
+    id: str
+    name: str
+    code: str
+    metadata: Dict[str, str]
+
+
+def _tmp_path(path: Path) -> Path:
+    # Readers never see partial files: dotfiles are ignored and renames are atomic.
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+def _write_atomically(path: Path, data: str) -> None:
+    tmp = _tmp_path(path)
+    tmp.write_text(data, encoding="utf8")
+    os.replace(tmp, path)
+
+
+def _listing(directory: Path) -> List[Path]:
+    return sorted(p for p in directory.glob("*.json") if not p.name.startswith("."))
+
+
+class WorkQueue:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def exists(self) -> bool:
+        return (self.path / MANIFEST).exists()
+
+    def create(self, jobs: Sequence[Job], pyperf_args: Sequence[str]) -> None:
+        for state in STATES:
+            (self.path / state).mkdir(parents=True, exist_ok=True)
+        for job in jobs:
+            _write_atomically(self.path / "pending" / f"{job.id}.json", json.dumps(asdict(job)))
+        manifest = {"jobs": [job.id for job in jobs], "pyperf-args": list(pyperf_args)}
+        _write_atomically(self.path / MANIFEST, json.dumps(manifest, indent=2))
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        manifest: Dict[str, Any] = json.loads((self.path / MANIFEST).read_text("utf8"))
+        return manifest
+
+    def claim(self, worker: str) -> Optional[Job]:
+        """Claim the next pending job, returning None if there are none left."""
+        for pending in _listing(self.path / "pending"):
+            claimed = self.path / "claimed" / pending.name
+            try:
+                os.rename(pending, claimed)
+            except FileNotFoundError:
+                continue  # Another worker was faster.
+            (self.path / "claimed" / f"{pending.stem}.worker").write_text(worker, "utf8")
+            return Job(**json.loads(claimed.read_text("utf8")))
+        return None
+
+    def heartbeat(self, job: Job) -> None:
+        """Mark a claimed job as still being worked on."""
+        try:
+            os.utime(self.path / "claimed" / f"{job.id}.worker")
+        except FileNotFoundError:
+            pass  # It was re-queued, the result will still be accepted.
+
+    def requeue_stale(self, timeout: float) -> List[Job]:
+        """
+        Move claimed jobs without a heartbeat in the last `timeout` seconds back to the
+        pending jobs, returning them.
+        """
+        stale = []
+        for claimed in _listing(self.path / "claimed"):
+            marker = claimed.with_suffix(".worker")
+            try:
+                # The worker file is written right after the claim (the rename updates the
+                # job's ctime), so use the latter if the worker died in between.
+                last_seen = marker.stat().st_mtime if marker.exists() else claimed.stat().st_ctime
+                job = Job(**json.loads(claimed.read_text("utf8")))
+            except FileNotFoundError:
+                continue  # Completed in the meantime.
+            if time.time() - last_seen <= timeout:
+                continue
+            try:
+                os.rename(claimed, self.path / "pending" / claimed.name)
+            except FileNotFoundError:
+                continue
+            try:
+                marker.unlink()
+            except FileNotFoundError:
+                pass
+            stale.append(job)
+        return stale
+
+    def _release(self, job: Job) -> None:
+        for suffix in (".json", ".worker"):
+            try:
+                (self.path / "claimed" / f"{job.id}{suffix}").unlink()
+            except FileNotFoundError:
+                pass  # Re-queued while running (see requeue_stale).
+
+    def complete(self, job: Job, result: pyperf.Benchmark) -> None:
+        path = self.path / "done" / f"{job.id}.json"
+        result.dump(str(_tmp_path(path)), replace=True)
+        os.replace(_tmp_path(path), path)
+        self._release(job)
+
+    def fail(self, job: Job, worker: str, reason: str) -> None:
+        failure = {**asdict(job), "worker": worker, "reason": reason}
+        _write_atomically(self.path / "failed" / f"{job.id}.json", json.dumps(failure))
+        self._release(job)
+
+    def counts(self) -> Dict[str, int]:
+        return {state: len(_listing(self.path / state)) for state in STATES}
+
+    def results(self) -> List[pyperf.Benchmark]:
+        return [pyperf.Benchmark.load(str(path)) for path in _listing(self.path / "done")]
+
+    def failures(self) -> List[Dict[str, str]]:
+        return [json.loads(path.read_text("utf8")) for path in _listing(self.path / "failed")]
+
+
+def host_signature(bm: pyperf.Benchmark) -> HostSignature:
+    metadata = bm.get_metadata()
+    return tuple(str(metadata.get(key, "unknown")) for key in HOST_KEYS)
+
+
+def group_by_host(benchmarks: Sequence[pyperf.Benchmark]) -> Dict[HostSignature, List[str]]:
+    groups: Dict[HostSignature, List[str]] = {}
+    for bm in benchmarks:
+        groups.setdefault(host_signature(bm), []).append(bm.get_name())
+    return groups
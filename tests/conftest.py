@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, Iterator, List, Union
+from unittest.mock import patch
 
 import click
 import pytest
@@ -9,6 +10,13 @@
 import blackbench
 
 
+@pytest.fixture(autouse=True)
+def quiet_host() -> Iterator[None]:
+    # The host noise depends on whatever else is running on the testing machine.
+    with patch("blackbench.measure_noise", return_value=0.0):
+        yield
+
+
 @pytest.fixture
 def tmp_result(tmp_path: Path) -> Path:
     os.chdir(tmp_path)
@@ -0,0 +1 @@
+result = [[[[[[1, 2, 3]]]]]]
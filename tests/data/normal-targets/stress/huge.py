@@ -0,0 +1,5 @@
+TABLE = (
+    (1, "one"),
+    (2, "two"),
+    (3, "three"),
+)
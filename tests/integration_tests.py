@@ -5,9 +5,14 @@
 # tests in here but I don't need one more test file right now.
 
 import json
+import os
+import pstats
+import sys
+import threading
+from contextlib import nullcontext
 from io import StringIO
 from pathlib import Path
-from typing import List, Set
+from typing import Callable, List, Set
 from unittest.mock import patch
 
 import black
@@ -15,7 +20,8 @@
 import pytest
 
 import blackbench
-from blackbench import Target, __version__
+from blackbench import Benchmark, Target, __version__
+from blackbench.interpreters import Interpreter
 
 from .utils import (
     DATA_DIR,
@@ -23,11 +29,14 @@
     TEST_MICRO_PATH,
     TEST_MICRO_TARGETS,
     TEST_NORMAL_TARGETS,
+    WINDOWS,
     bm_run_mock_helper,
     fast_run,
+    few_values_run,
     get_subprocess_run_commands,
     log_benchmarks,
     replace_resources,
+    replace_targets,
 )
 
 
@@ -40,12 +49,16 @@ def compare_json_data(good_name: str, actual_path: Path) -> None:
     good_suite = pyperf.BenchmarkSuite.loads(good_path.read_text("utf8"))
     actual_suite = pyperf.BenchmarkSuite.loads(actual_path.read_text("utf8"))
     for bm in good_suite:
-        actual_bm = actual_suite.get_benchmark(bm.get_name())
+        actual_metadata = actual_suite.get_benchmark(bm.get_name()).get_metadata()
         # fmt: off
         bm.update_metadata({
-            "description": actual_bm.get_metadata()["description"],
+            "description": actual_metadata["description"],
             "blackbench-version": __version__,
-            "black-version": black.__version__
+            "black-version": black.__version__,
+            "black-build": "compiled" if blackbench.interpreters.is_compiled(black) else "pure",
+            "task": actual_metadata["task"],
+            "target-group": actual_metadata["target-group"],
+            **{k: v for k, v in actual_metadata.items() if k.startswith(("geomean-", "host-"))},
         })
         # fmt: on
     with StringIO() as fakefile:
@@ -71,6 +84,12 @@ def test_info_cmd(run_cmd):
 
 Micro targets:
   1. tiny [1 lines] - very tiny indeed
+
+Stress targets (not included in all):
+  1. stress/huge [5 lines] - d
+
+Other targets (only run when selected by name or directory):
+  1. mined/slow [1 lines] - e
 """
     assert results.output == good
 
@@ -112,7 +131,8 @@ def test_run_cmd(tmp_result: Path, run_cmd):
     ])
     # fmt: on
     with patch("subprocess.run", wraps=mock) as sub_run, replace_resources():
-        result = run_cmd(["run", str(tmp_result)])
+        with patch("blackbench.measure_noise", return_value=0.012):
+            result = run_cmd(["run", str(tmp_result)])
     commands = get_subprocess_run_commands(sub_run)
 
     assert not result.exit_code
@@ -121,21 +141,41 @@ def test_run_cmd(tmp_result: Path, run_cmd):
         assert len(cmd) == 4
         assert "--fast" not in cmd
     compare_json_data("all.results.json", tmp_result)
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    groups = [bm.get_metadata()["target-group"] for bm in suite.get_benchmarks()]
+    assert sorted(groups) == ["micro", "normal", "normal", "normal"]
+    for bm in suite.get_benchmarks():
+        metadata = bm.get_metadata()
+        assert metadata["task"] == "fmt"
+        assert metadata["host-noise"] == 0.012
+        assert metadata["geomean-all-count"] == 4
+        assert (
+            metadata["geomean-all-low"] <= metadata["geomean-all"] <= metadata["geomean-all-high"]
+        )
 
     output_lines = result.output.splitlines()
-    assert len(output_lines) == 15
+    assert len(output_lines) == 23
     assert "ERROR" not in result.output and "WARNING" not in result.output
     assert output_lines[0].startswith("[*] Versions: blackbench: ")
     assert output_lines[1] == "[*] Checked configuration and everything's all good!"
-    assert output_lines[2].startswith("[*] Created temporary workdir at `")
-    assert output_lines[3] == "[*] Alright, let's start!"
-    assert output_lines[4] == "[*] Running `fmt-goodbye-internet` benchmark (1/4)"
-    assert output_lines[6] == "[*] Running `fmt-hello-world` benchmark (2/4)"
-    assert output_lines[8] == "[*] Running `fmt-i/heard/you/like/nested` benchmark (3/4)"
-    assert output_lines[10] == "[*] Running `fmt-tiny` microbenchmark (4/4)"
-    assert output_lines[-3] == "[*] Cleaning up."
+    assert output_lines[2].startswith("[*] Host: cpu-model: ")
+    assert output_lines[3] == "[*] Host noise: 1.2% (threshold: 10.0%)."
+    assert output_lines[4].startswith("[*] Created temporary workdir at `")
+    assert output_lines[5] == "[*] Alright, let's start!"
+    assert output_lines[6] == f"[*] Results are streamed to `{tmp_result}.jsonl` as they come in."
+    assert output_lines[7] == "[*] Running `fmt-goodbye-internet` benchmark (1/4)"
+    assert output_lines[9] == "[*] Running `fmt-hello-world` benchmark (2/4)"
+    assert output_lines[11] == "[*] Running `fmt-i/heard/you/like/nested` benchmark (3/4)"
+    assert output_lines[13] == "[*] Running `fmt-tiny` microbenchmark (4/4)"
+    assert output_lines[-8] == "[*] Cleaning up."
+    assert output_lines[-7].startswith("[*] Suite summary (geometric mean")
+    summary_groups = [line.split()[0] for line in output_lines[-6:-2]]
+    assert summary_groups == ["all", "micro", "normal", "task-fmt"]
+    assert output_lines[-5] == "    micro (1): 551 us [535 us - 566 us]"
     assert output_lines[-2] == "[*] Results dumped."
     assert output_lines[-1].startswith("[*] Blackbench run finished in")
+    # The stream is consolidated into the final result file and then removed.
+    assert not Path(f"{tmp_result}.jsonl").exists()
 
 
 def test_run_cmd_with_fast(tmp_result: Path, run_cmd):
@@ -170,6 +210,46 @@ def test_run_cmd_with_nonall_group(tmp_result: Path, run_cmd, group: str):
         assert all(bm.target.micro for bm in logged)
 
 
+def test_run_cmd_with_stress_group(tmp_result: Path, run_cmd):
+    with replace_resources(), log_benchmarks(mock=True) as logged:
+        run_cmd(["run", str(tmp_result)])
+    assert all(not bm.target.stress for bm in logged)
+
+    with replace_resources(), patch("subprocess.run", fast_run):
+        result = run_cmd(["run", str(tmp_result), "-t", "stress", "--max-time", "60"])
+    assert not result.exit_code, result.output
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == ["fmt-stress/huge"]
+    assert suite.get_benchmarks()[0].get_metadata()["target-group"] == "stress"
+    assert "[*] Suite summary" in result.output and "    stress (1): " in result.output
+
+
+def test_run_cmd_with_ungrouped_targets(tmp_result: Path, run_cmd):
+    with replace_resources(), log_benchmarks(mock=True) as logged:
+        run_cmd(["run", str(tmp_result), "-t", "all"])
+    assert "fmt-mined/slow" not in [bm.name for bm in logged]
+
+    with replace_resources(), log_benchmarks(mock=True) as logged:
+        run_cmd(["run", str(tmp_result), "-t", "mined"])
+    assert [bm.name for bm in logged] == ["fmt-mined/slow"]
+
+
+def test_run_cmd_with_target_directory(tmp_result: Path, run_cmd):
+    with replace_resources(), log_benchmarks(mock=True) as logged:
+        result = run_cmd(["run", str(tmp_result), "-t", "i/heard", "-t", "goodbye-internet"])
+
+    assert not result.exit_code, result.output
+    assert [bm.name for bm in logged] == ["fmt-goodbye-internet", "fmt-i/heard/you/like/nested"]
+    # Stubs are formatted as such without having to ask.
+    assert "black.FileMode(is_pyi=True)" in logged[0].code
+    assert "black.FileMode()" in logged[1].code
+
+    with replace_resources():
+        result = run_cmd(["run", str(tmp_result), "-t", "i/hear"])
+    assert result.exit_code == 2
+    assert "'i/hear' is not one of the target groups" in result.output
+
+
 # fmt: off
 @pytest.mark.parametrize("values, expected", [
     (["hello-world"], {"hello-world"}),
@@ -184,6 +264,69 @@ def test_run_cmd_targets_opt(run_cmd, tmp_result: Path, values: List[str], expec
         assert {bm.target.name for bm in logged} == expected
 
 
+def test_run_cmd_with_gc_modes(run_cmd, tmp_result: Path) -> None:
+    with replace_resources():
+        with log_benchmarks(mock=True) as logged:
+            args = ["--gc-mode", "default", "--gc-mode", "disabled", "--gc-mode", "threshold=0100"]
+            result = run_cmd(["run", str(tmp_result), "-t", "tiny", "--gc-metrics", *args])
+        assert result.exit_code == 0, result.output
+    assert [bm.name for bm in logged] == [
+        "fmt-tiny",
+        "fmt[gc=disabled]-tiny",
+        "fmt[gc=threshold=100]-tiny",
+    ]
+    assert [len(bm.hooks) for bm in logged] == [1, 2, 2]
+    assert "GC_MODE = 'disabled'" in logged[1].code
+
+
+def test_run_cmd_with_mode_matrix(run_cmd, tmp_result: Path) -> None:
+    with replace_resources():
+        with log_benchmarks(mock=True) as logged:
+            # fmt: off
+            result = run_cmd([
+                "run", str(tmp_result), "-t", "tiny", "--format-config", "is_pyi=True",
+                "--mode-matrix", "line_length=[88, 120]", "--mode-matrix", "preview=True",
+            ])
+            # fmt: on
+        assert result.exit_code == 0, result.output
+    assert [bm.name for bm in logged] == [
+        "fmt[ll=88]-tiny",
+        "fmt[ll=120]-tiny",
+        "fmt[preview=True]-tiny",
+    ]
+    assert "black.FileMode(is_pyi=True, line_length=120)" in logged[1].code
+    metadata = blackbench.benchmark_metadata(logged[1], black.__version__, False)
+    assert metadata["variant"] == "ll=120"
+    assert metadata["format-config"] == "is_pyi=True, line_length=120"
+
+
+@pytest.mark.parametrize(
+    "matrix, message",
+    [
+        ("line_length=[88,", "is not a valid mode matrix: invalid syntax"),
+        ("line_length=['wide']", "Invalid black.Mode configuration: line_length='wide'"),
+    ],
+)
+def test_run_cmd_with_invalid_mode_matrix(
+    run_cmd, tmp_result: Path, matrix: str, message: str
+) -> None:
+    result = run_cmd(["run", str(tmp_result), "--mode-matrix", matrix])
+    assert result.exit_code == 2
+    assert message in result.output
+
+
+def test_run_cmd_with_invalid_gc_mode(run_cmd, tmp_result: Path) -> None:
+    result = run_cmd(["run", str(tmp_result), "--gc-mode", "threshold=-1"])
+    assert result.exit_code == 2
+    assert "is not a valid GC mode" in result.output
+
+
+def test_run_cmd_with_invalid_perf_counters(run_cmd, tmp_result: Path) -> None:
+    result = run_cmd(["run", str(tmp_result), "--perf-counters", "instructions,nope"])
+    assert result.exit_code == 2
+    assert "nope isn't a supported perf event" in result.output
+
+
 @pytest.mark.parametrize("option", ["targets", "task"])
 def test_custom_resource_types_with_invalid(run_cmd, option: str):
     result = run_cmd(["run", f"--{option}", "yeah-no"])
@@ -206,6 +349,66 @@ def test_run_cmd_with_format_config(tmp_result: Path, run_cmd):
     compare_json_data("micro-tiny.json", tmp_result)
 
 
+def test_run_cmd_with_strings_task(tmp_result: Path, run_cmd) -> None:
+    # The custom configuration may overlap with how string processing gets enabled.
+    config = "preview=True, enabled_features=set(), experimental_string_processing=False"
+    fields = black.FileMode.__dataclass_fields__
+    config = ", ".join(kw for kw in config.split(", ") if kw.split("=")[0] in fields)
+    with patch("subprocess.run", fast_run):
+        # fmt: off
+        result = run_cmd([
+            "run", str(tmp_result), "--task", "fmt-strings", "-t", "long-strings",
+            "--format-config", config,
+        ])
+        # fmt: on
+
+    assert result.exit_code == 0, result.output
+    assert "ERROR" not in result.output and "WARNING" not in result.output
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == ["fmt-strings-long-strings"]
+
+
+def test_run_cmd_with_notebook_task(tmp_result: Path, run_cmd) -> None:
+    pytest.importorskip("IPython")
+    pytest.importorskip("tokenize_rt")
+    with patch("subprocess.run", fast_run):
+        # Only the notebooks are compatible with the task, the rest are skipped.
+        result = run_cmd(["run", str(tmp_result), "--task", "fmt-ipynb", "-t", "micro"])
+
+    assert result.exit_code == 0, result.output
+    assert "ERROR" not in result.output and "WARNING" not in result.output
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == ["fmt-ipynb-magics", "fmt-ipynb-notebook-cells"]
+
+
+def test_run_cmd_with_edit_task(tmp_result: Path, run_cmd) -> None:
+    with patch("subprocess.run", few_values_run), replace_targets():
+        result = run_cmd(["run", str(tmp_result), "--task", "edit", "-t", "hello-world"])
+
+    assert result.exit_code == 0, result.output
+    assert "[*] Latency per call: p50 " in result.output
+    bm = pyperf.BenchmarkSuite.load(str(tmp_result)).get_benchmark("edit-hello-world")
+    values = bm.get_values()
+    assert len(values) == 10 and bm.get_nrun() == 2
+    metadata = bm.get_metadata()
+    assert min(values) <= metadata["latency-p50"] <= metadata["latency-p95"]
+    assert metadata["latency-p95"] <= metadata["latency-p99"] <= max(values)
+
+
+@pytest.mark.parametrize("loops_args", [["--loops", "3"], ["--loops=3"], ["-l3"], ["--loop", "3"]])
+def test_run_cmd_with_edit_task_and_loops(tmp_result: Path, run_cmd, loops_args) -> None:
+    result = run_cmd(["run", str(tmp_result), "--task", "edit", "--", *loops_args])
+    assert result.exit_code == 2
+    assert "ERROR: The `edit` task times every call on its own" in result.output
+
+
+def test_run_cmd_with_incompatible_targets(tmp_result: Path, run_cmd) -> None:
+    result = run_cmd(["run", str(tmp_result), "--task", "fmt", "-t", "magics"])
+    assert result.exit_code == 2
+    assert "None of the selected targets can be used with the `fmt` task" in result.output
+    assert not tmp_result.exists()
+
+
 def test_run_cmd_with_broken_format_config(tmp_result: Path, run_cmd) -> None:
     result = run_cmd(["run", tmp_result, "--format-config", "ça va bien?"])
     assert result.exit_code == 2
@@ -252,6 +455,25 @@ def test_run_cmd_with_preexisting_file_but_continue(tmp_result: Path, run_cmd):
     assert tmp_result.read_text("utf8") != "aaaa"
 
 
+@pytest.mark.parametrize("answer", ["n", "y"])
+def test_run_cmd_with_leftover_stream(tmp_result: Path, run_cmd, answer: str) -> None:
+    stream = Path(f"{tmp_result}.jsonl")
+    blackbench.formats.append_to_stream(
+        stream, pyperf.Benchmark.load(str(DATA_DIR / "micro-tiny.json"))
+    )
+
+    with patch("subprocess.run", fast_run), replace_resources():
+        result = run_cmd(["run", str(tmp_result), "-t", "tiny"], input=answer)
+    assert "can be recovered with `blackbench consolidate " in result.output
+    assert f"Do you want to discard them and continue? [y/N]: {answer}" in result.output
+    if answer == "n":
+        assert result.exit_code == 1
+        assert stream.exists() and not tmp_result.exists()
+    else:
+        assert result.exit_code == 0, result.output
+        assert not stream.exists() and tmp_result.exists()
+
+
 def test_run_cmd_with_pyperf_args(tmp_result: Path, run_cmd):
     # TODO: maybe check via pyperf results instead of checking subprocess args
     mock = bm_run_mock_helper([DATA_DIR / "micro-tiny.json"])
@@ -292,3 +514,537 @@ def test_run_cmd_with_partial_failure(run_cmd, tmp_result: Path) -> None:
         "WARNING: Results dumped (at least one benchmark is missing due to failure)"
         in result.output
     )
+
+
+@pytest.mark.parametrize("noise_check, exit_code", [("warn", 0), ("refuse", 2)])
+def test_run_cmd_with_noisy_host(
+    tmp_result: Path, run_cmd, noise_check: str, exit_code: int
+) -> None:
+    mock = bm_run_mock_helper([DATA_DIR / "micro-tiny.json"])
+    with patch("subprocess.run", wraps=mock), replace_resources():
+        with patch("blackbench.measure_noise", return_value=0.25):
+            # fmt: off
+            result = run_cmd([
+                "run", tmp_result, "-t", "tiny", "--noise-check", noise_check,
+                "--noise-threshold", "5",
+            ])
+            # fmt: on
+    assert result.exit_code == exit_code, result.output
+    assert "Host noise is 25.0%, above the 5.0% threshold" in result.output
+    assert tmp_result.exists() == (noise_check == "warn")
+
+
+@pytest.mark.skipif(WINDOWS, reason="symlinks need special privileges on Windows")
+def test_run_cmd_with_pythons(tmp_result: Path, run_cmd) -> None:
+    # A fake virtual environment that's really the current interpreter.
+    venv = tmp_result.parent / "venv"
+    (venv / "bin").mkdir(parents=True)
+    (venv / "bin" / "python").symlink_to(sys.executable)
+
+    with patch("subprocess.run", fast_run), replace_resources():
+        result = run_cmd(
+            ["run", tmp_result, "-t", "tiny", "--python", sys.executable, "--python", venv]
+        )
+    assert result.exit_code == 0, result.output
+    assert result.output.count("[*] Interpreter: ") == 2
+
+    # Both interpreters are the same version with the same Black, so they're numbered.
+    tag = f"py={sys.version_info[0]}.{sys.version_info[1]}-black{black.__version__}"
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == [f"fmt[{tag}-1]-tiny", f"fmt[{tag}-2]-tiny"]
+    venv_bm = suite.get_benchmark(f"fmt[{tag}-2]-tiny")
+    assert venv_bm.get_metadata()["variant"] == f"{tag}-2"
+    assert f"variant-{tag}-1" in result.output
+    assert "Variant comparison" in result.output
+
+
+@pytest.mark.skipif(WINDOWS, reason="the fake interpreter is a shell script")
+def test_run_cmd_with_broken_python(tmp_result: Path, run_cmd) -> None:
+    broken = tmp_result.parent / "venv"
+    (broken / "bin").mkdir(parents=True)
+    (broken / "bin" / "python").write_text("#!/bin/sh\necho 'No module named black'; exit 1\n")
+    (broken / "bin" / "python").chmod(0o755)
+    result = run_cmd(["run", tmp_result, "--python", broken])
+    assert result.exit_code == 2
+    assert "(are Black and pyperf installed?)" in result.output
+    assert "No module named black" in result.output
+
+
+def test_line_length_sweep_cmd(tmp_result: Path, run_cmd) -> None:
+    with patch("subprocess.run", fast_run), replace_resources():
+        # fmt: off
+        result = run_cmd([
+            "line-length-sweep", tmp_result, "--task", "fmt", "-t", "tiny",
+            "--line-lengths", "88,40",
+        ])
+        # fmt: on
+    assert result.exit_code == 0, result.output
+    assert "[*] Line length scaling (relative to a line length of 88):" in result.output
+    assert "Target  ll=40" in result.output
+
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == ["fmt[ll=40]-tiny", "fmt[ll=88]-tiny"]
+    assert suite.get_benchmarks()[0].get_metadata()["format-config"] == "line_length=40"
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--task", "paint"], "The line length doesn't matter for the `paint` task"),
+        (["--reference", "101"], "The reference line length (101) must be one of"),
+        (["--line-lengths", "88"], "At least two different line lengths are needed"),
+    ],
+)
+def test_line_length_sweep_cmd_with_invalid_args(
+    tmp_result: Path, run_cmd, args: List[str], message: str
+) -> None:
+    with patch("subprocess.run", fast_run), replace_resources():
+        result = run_cmd(["line-length-sweep", tmp_result, "--task", "fmt", "-t", "tiny", *args])
+    assert result.exit_code == 2
+    assert message in result.output
+
+
+def test_compare_compiled_cmd(tmp_result: Path, run_cmd) -> None:
+    # Setting up the environments needs network access, use the current interpreter instead.
+    def fake_venv(cache_dir: Path, version: str, *, compiled: bool, python: str) -> Interpreter:
+        return Interpreter(sys.executable, "cpython", "3.11.4", version, compiled)
+
+    with patch("subprocess.run", fast_run), replace_resources():
+        with patch("blackbench.black_venv", side_effect=fake_venv) as black_venv:
+            # fmt: off
+            result = run_cmd([
+                "compare-compiled", tmp_result, "-t", "tiny", "--black-version", "22.1.0",
+                "--cache-dir", tmp_result.parent, "--noise-check", "off",
+            ])
+            # fmt: on
+    assert result.exit_code == 0, result.output
+    assert black_venv.call_count == 2
+    assert "[*] Compiled speedup: " in result.output
+    assert "Host noise" not in result.output
+
+    suite = pyperf.BenchmarkSuite.load(str(tmp_result))
+    assert suite.get_benchmark_names() == ["fmt[black=pure]-tiny", "fmt[black=compiled]-tiny"]
+    for bm, build in zip(suite.get_benchmarks(), ("pure", "compiled")):
+        assert bm.get_metadata()["black-build"] == build
+        assert bm.get_metadata()["black-version"] == "22.1.0"
+
+
+def test_compare_compiled_cmd_without_wheel(tmp_result: Path, run_cmd) -> None:
+    error = RuntimeError("there's no compiled wheel of Black 22.1.0 for this platform")
+    pure = Interpreter(sys.executable, "cpython", "3.11.4", "22.1.0")
+    with patch("blackbench.black_venv", side_effect=[pure, error]):
+        result = run_cmd(["compare-compiled", tmp_result, "--black-version", "22.1.0"])
+    assert result.exit_code == 2
+    assert "Couldn't set up compiled Black 22.1.0: there's no compiled wheel" in result.output
+
+
+def test_compare_compiled_cmd_checks_pyperf_args_per_environment(tmp_result: Path, run_cmd) -> None:
+    venvs = [
+        Interpreter(f"/venvs/{build}/bin/python", "cpython", "3.11.4", "22.1.0")
+        for build in ("pure", "compiled")
+    ]
+    with patch("blackbench.black_venv", side_effect=venvs):
+        with patch("blackbench.check_pyperf_args", side_effect=[None, SystemExit(2)]) as check:
+            # fmt: off
+            result = run_cmd([
+                "compare-compiled", tmp_result, "--task", "parse", "--format-config",
+                "line_length=1", "--black-version", "22.1.0", "--", "--values", "3",
+            ])
+            # fmt: on
+    assert result.exit_code == 2
+    assert "WARNING: Ignoring `--format-config` option" in result.output
+    assert [call.args[1] for call in check.call_args_list] == [venv.path for venv in venvs]
+
+
+def test_run_cmd_with_store(tmp_result: Path, run_cmd) -> None:
+    store = tmp_result.parent / "results.db"
+    for _ in range(2):
+        mock = bm_run_mock_helper([DATA_DIR / "micro-tiny.json"])
+        with patch("subprocess.run", wraps=mock), replace_resources():
+            result = run_cmd(["run", str(tmp_result), "-t", "tiny", "--store", store], input="y")
+        assert not result.exit_code
+        assert f"[*] Results recorded in history store `{store}`." in result.output
+
+    name = pyperf.Benchmark.load(str(DATA_DIR / "micro-tiny.json")).get_name()
+    result = run_cmd(["history", name, "--store", store])
+    assert not result.exit_code
+    lines = result.output.splitlines()
+    assert lines[0] == name
+    assert len(lines) == 3
+    assert f"black {black.__version__}" in lines[1]
+    assert "(+0.0%)" in lines[2]
+
+
+def test_coordinator_and_worker_cmds(tmp_path: Path, run_cmd) -> None:
+    queue_dir = tmp_path / "queue"
+    # The worker is started first and waits for the coordinator to create the queue.
+    worker_args = ["worker", str(queue_dir), "--name", "box-1", "--poll-interval", "0.05"]
+    worker = threading.Thread(
+        target=blackbench.main, args=(worker_args,), kwargs={"standalone_mode": False}
+    )
+    with patch("subprocess.run", fast_run), replace_resources():
+        worker.start()
+        # fmt: off
+        result = run_cmd([
+            "coordinator", queue_dir, tmp_path / "merged.json", "-t", "tiny", "-t", "hello-world",
+            "--poll-interval", "0.05",
+        ])
+        # fmt: on
+        worker.join(timeout=60)
+    assert not worker.is_alive()
+    assert result.exit_code == 0, result.output
+    assert "Queued 2 benchmarks" in result.output
+    assert "2/2 done, 0 failed" in result.output
+
+    suite = pyperf.BenchmarkSuite.load(str(tmp_path / "merged.json"))
+    assert sorted(suite.get_benchmark_names()) == ["fmt-hello-world", "fmt-tiny"]
+    for bm in suite.get_benchmarks():
+        assert bm.get_metadata()["worker"] == "box-1"
+        assert bm.get_metadata()["task"] == "fmt"
+
+
+def test_coordinator_cmd_with_stale_claim(tmp_path: Path, run_cmd) -> None:
+    queue = blackbench.WorkQueue(tmp_path / "queue")
+    with replace_resources():
+        bm = Benchmark(blackbench.resources.tasks["fmt"], blackbench.resources.targets["tiny"])
+    queue.create([blackbench.Job("0001", bm.name, bm.code, {})], [])
+    # A worker claimed the job and then went away without a trace.
+    assert queue.claim("box-0") is not None
+    os.utime(queue.path / "claimed" / "0001.worker", (0, 0))
+
+    # The new worker waits for the claimed job instead of exiting right away.
+    worker_args = ["worker", str(queue.path), "--name", "box-1", "--poll-interval", "0.05"]
+    worker = threading.Thread(
+        target=blackbench.main, args=(worker_args,), kwargs={"standalone_mode": False}
+    )
+    with patch("subprocess.run", fast_run):
+        worker.start()
+        cmd = ["coordinator", queue.path, tmp_path / "merged.json", "--poll-interval", "0.05"]
+        result = run_cmd(cmd)
+        worker.join(timeout=60)
+    assert not worker.is_alive()
+    assert result.exit_code == 0, result.output
+    assert "Re-queued `fmt-tiny` (job 0001) since its worker stopped responding." in result.output
+
+    suite = pyperf.BenchmarkSuite.load(str(tmp_path / "merged.json"))
+    assert suite.get_benchmarks()[0].get_metadata()["worker"] == "box-1"
+
+
+def test_coordinator_cmd_with_incompatible_hosts(tmp_path: Path, run_cmd) -> None:
+    queue = blackbench.WorkQueue(tmp_path / "queue")
+    bm = pyperf.Benchmark.load(str(DATA_DIR / "micro-tiny.json"))
+    jobs = [blackbench.Job(f"000{i}", f"fmt-tiny-{i}", "", {}) for i in range(2)]
+    queue.create(jobs, [])
+    for cpu in ("Intel Core i7", "AMD Ryzen 7"):
+        job = queue.claim("box")
+        assert job is not None
+        runs = [
+            pyperf.Run(
+                run.values,
+                metadata={**run.get_metadata(), "name": job.name, "cpu_model_name": cpu},
+                collect_metadata=False,
+            )
+            for run in bm.get_runs()
+            if run.values
+        ]
+        queue.complete(job, pyperf.Benchmark(runs))
+    assert queue.claim("box") is None
+
+    # An existing queue is resumed, with every job done it's merged right away.
+    result = run_cmd(["coordinator", queue.path, tmp_path / "merged.json"])
+    assert result.exit_code == 1
+    assert "Resuming the existing queue" in result.output
+    assert "Refusing to merge results from incompatible hosts" in result.output
+    assert "cpu_model_name=AMD Ryzen 7" in result.output
+    assert not (tmp_path / "merged.json").exists()
+
+
+def test_consolidate_cmd(tmp_path: Path, run_cmd) -> None:
+    suite = pyperf.BenchmarkSuite.load(str(DATA_DIR / "all.results.json"))
+    stream = tmp_path / "interrupted.json.jsonl"
+    for bm in suite.get_benchmarks()[:2]:
+        blackbench.formats.append_to_stream(stream, bm)
+
+    result = run_cmd(["consolidate", stream])
+    assert result.exit_code == 0, result.output
+    consolidated = pyperf.BenchmarkSuite.load(str(tmp_path / "interrupted.json"))
+    assert consolidated.get_benchmark_names() == suite.get_benchmark_names()[:2]
+
+    (tmp_path / "empty.jsonl").write_text("", encoding="utf8")
+    result = run_cmd(["consolidate", tmp_path / "empty.jsonl", tmp_path / "empty.json"])
+    assert result.exit_code == 1
+    assert "No results found" in result.output
+
+
+def test_convert_cmd(tmp_path: Path, run_cmd) -> None:
+    source = DATA_DIR / "all.results.json"
+    compact = tmp_path / "results.bbr"
+    result = run_cmd(["convert", source, compact, "--compression", "gzip"])
+    assert result.exit_code == 0, result.output
+    assert "Converted 4 benchmarks" in result.output
+    assert compact.stat().st_size < source.stat().st_size
+
+    back = tmp_path / "results.json"
+    assert run_cmd(["convert", compact, back]).exit_code == 0
+    expected = pyperf.BenchmarkSuite.load(str(source))
+    for bm in pyperf.BenchmarkSuite.load(str(back)).get_benchmarks():
+        assert bm.get_values() == expected.get_benchmark(bm.get_name()).get_values()
+
+    # Compact files can be used directly, eg. by the check command.
+    assert run_cmd(["check", source, compact]).exit_code == 0
+
+
+def test_convert_cmd_with_invalid_source(tmp_path: Path, run_cmd) -> None:
+    source = tmp_path / "broken.json"
+    source.write_text("{", encoding="utf8")
+    result = run_cmd(["convert", source, tmp_path / "results.bbr"])
+    assert result.exit_code == 1
+    assert "Couldn't load results from" in result.output
+
+
+def test_history_cmd_with_unknown_benchmark(tmp_path: Path, run_cmd) -> None:
+    store = tmp_path / "results.db"
+    with blackbench.ResultsStore(store) as results_store:
+        suite = pyperf.BenchmarkSuite.loads((DATA_DIR / "all.results.json").read_text("utf8"))
+        results_store.record_suite(suite, {})
+
+    result = run_cmd(["history", "fmt-nope", "--store", store])
+    assert result.exit_code == 1
+    assert "ERROR: No results for 'fmt-nope' are recorded" in result.output
+
+
+def test_report_cmd(tmp_path: Path, run_cmd) -> None:
+    store = tmp_path / "results.db"
+    bm = pyperf.Benchmark.load(str(DATA_DIR / "micro-tiny.json"))
+    with blackbench.ResultsStore(store) as results_store:
+        for index in range(12):
+            version, factor = ("22.1", 1.0) if index < 6 else ("22.3", 1.25)
+            runs = [
+                pyperf.Run(
+                    [v * factor for v in run.values],
+                    metadata={**run.get_metadata(), "black-version": version},
+                    collect_metadata=False,
+                )
+                for run in bm.get_runs()
+                if run.values
+            ]
+            results_store.record_suite(pyperf.BenchmarkSuite([pyperf.Benchmark(runs)]), {})
+
+    output_dir = tmp_path / "report"
+    result = run_cmd(["report", store, "--html", output_dir])
+    assert result.exit_code == 0, result.output
+    assert "(1 change points detected)" in result.output
+    page = (output_dir / "index.html").read_text("utf8")
+    assert page.count("<svg") == 1
+    assert "black 22.1 → 22.3 (+25.0%)" in page
+
+    empty = tmp_path / "empty.db"
+    blackbench.ResultsStore(empty).close()
+    result = run_cmd(["report", empty, "--html", output_dir])
+    assert result.exit_code == 1
+    assert "No results are recorded" in result.output
+
+
+def scaled_results(source: Path, dest: Path, factor: float) -> Path:
+    data = json.loads(source.read_text("utf8"))
+    for bm in data["benchmarks"]:
+        for run in bm["runs"]:
+            if "values" in run:
+                run["values"] = [v * factor for v in run["values"]]
+    dest.write_text(json.dumps(data), "utf8")
+    return dest
+
+
+def test_count_cmd(tmp_path: Path, run_cmd) -> None:
+    # Neither hardware counters nor Valgrind can be assumed to be available.
+    dumps = []
+    for count in (1_000_000.0, 1_010_000.0):
+        dump = tmp_path / f"{int(count)}.json"
+        with replace_resources(), patch("blackbench.detect_backend", return_value="perf"):
+            with patch("blackbench.count_instructions", return_value=count) as counter:
+                result = run_cmd(["count", dump, "-t", "tiny", "--loops", "3"])
+        assert result.exit_code == 0, result.output
+        assert counter.call_args[1] == {"loops": 3, "backend": "perf"}
+        dumps.append(dump)
+
+    suite = pyperf.BenchmarkSuite.load(str(dumps[0]))
+    bm = suite.get_benchmark("fmt-tiny")
+    assert bm.get_unit() == "integer"
+    assert bm.get_values() == (1_000_000.0,)
+    assert bm.get_metadata()["instructions-backend"] == "perf"
+    assert bm.get_metadata()["task"] == "fmt"
+
+    # Counts are noiseless so even a 1% change is significant.
+    assert run_cmd(["check", *dumps, "--max-slowdown", "0.5%"]).exit_code == 1
+    assert run_cmd(["check", *dumps, "--max-slowdown", "2%"]).exit_code == 0
+
+
+def test_count_cmd_without_backend(tmp_path: Path, run_cmd) -> None:
+    with patch("blackbench.detect_backend", return_value=None):
+        result = run_cmd(["count", tmp_path / "counts.json"])
+    assert result.exit_code == 2
+    assert "Can't count instructions" in result.output
+
+
+@pytest.mark.parametrize(
+    "factor, max_slowdown, code", [(1.0, "0%", 0), (1.5, "60%", 0), (1.5, "3%", 1)]
+)
+def test_check_cmd(tmp_path: Path, run_cmd, factor: float, max_slowdown: str, code: int) -> None:
+    baseline = DATA_DIR / "all.results.json"
+    candidate = scaled_results(baseline, tmp_path / "candidate.json", factor)
+    result = run_cmd(["check", baseline, candidate, "--max-slowdown", max_slowdown])
+
+    assert result.exit_code == code
+    if code:
+        lines = result.output.splitlines()
+        assert lines[0].split() == ["Benchmark", "Baseline", "Candidate", "Change", "p-value"]
+        assert "+50.0%" in lines[1]
+        assert "ERROR: 4 of 4 benchmarks regressed by more than 3.0%" in result.output
+    else:
+        assert "No significant regressions" in result.output
+
+
+def test_check_cmd_with_invalid_results(tmp_path: Path, run_cmd) -> None:
+    empty_stream = tmp_path / "empty.json.jsonl"
+    empty_stream.touch()
+    result = run_cmd(["check", DATA_DIR / "all.results.json", empty_stream])
+    assert result.exit_code == 2
+    assert f"Couldn't load results from `{empty_stream}`" in result.output
+
+
+@pytest.mark.parametrize("sampling", [False, True], ids=["cprofile", "sampling"])
+def test_profile_cmd(tmp_path: Path, run_cmd, sampling: bool) -> None:
+    cmd = ["profile", tmp_path, "--task", "paint", "-t", "tiny", "-t", "hello-world"]
+    cmd.extend(["--loops", "1000"])
+    if sampling:
+        cmd.extend(["--sampling", "--sampling-interval", "0.1"])
+    with replace_resources():
+        result = run_cmd(cmd)
+
+    assert not result.exit_code, result.output
+    assert "[*] Profiling `paint-hello-world` (1/2)" in result.output
+    for i, name in enumerate(("paint-hello-world", "paint-tiny"), start=1):
+        stats = pstats.Stats(str(tmp_path / f"{name}.pstats"))
+        assert any(func[2] == "paint_func" for func in stats.stats)  # type: ignore
+        collapsed = (tmp_path / f"{name}.collapsed").read_text("utf8")
+        if not sampling:
+            assert f"profile-harness.py:call_func;{i}.py:paint_func " in collapsed
+
+
+def test_profile_diff_cmd(tmp_path: Path, run_cmd) -> None:
+    cmd = ["profile-diff", tmp_path, "--baseline", sys.executable, "--candidate", sys.executable]
+    cmd.extend(["--task", "paint", "-t", "tiny", "--loops", "1000", "--top", "3"])
+    with replace_resources():
+        result = run_cmd(cmd)
+
+    assert not result.exit_code, result.output
+    assert "[*] Total (per loop): " in result.output
+    assert "Function  " in result.output
+    assert (tmp_path / "baseline" / "paint-tiny.pstats").exists()
+    assert (tmp_path / "candidate" / "paint-tiny.pstats").exists()
+    report = (tmp_path / "paint-tiny.diff.tsv").read_text("utf8").splitlines()
+    assert report[0].split("\t")[0] == "function"
+    (paint_func,) = [line.split("\t") for line in report if line.startswith("1.py:paint_func\t")]
+    assert all(float(time) > 0 for time in paint_func[1:])
+
+
+def test_profile_diff_cmd_without_baseline_time(tmp_path: Path, run_cmd) -> None:
+    cmd = ["profile-diff", tmp_path, "--baseline", sys.executable, "--candidate", sys.executable]
+    cmd.extend(["--task", "paint", "-t", "tiny", "--loops", "1"])
+    with replace_resources(), patch("blackbench.diff_stats", return_value=[]):
+        result = run_cmd(cmd)
+
+    assert not result.exit_code, result.output
+    assert "[*] Total (per loop): 0.00 ns -> 0.00 ns (n/a)" in result.output
+
+
+def test_profile_diff_cmd_with_invalid_env(tmp_path: Path, run_cmd) -> None:
+    result = run_cmd(["profile-diff", tmp_path, "--baseline", tmp_path, "--candidate", "nah"])
+    assert result.exit_code == 2
+    assert "is a directory but not a virtual environment" in result.output
+
+
+def test_mine_cmd(tmp_path: Path, run_cmd, monkeypatch) -> None:
+    (tmp_path / "cwd").mkdir()
+    cmd = ["mine", "-t", "hello-world", "-t", "goodbye-internet", "-o", str(tmp_path / "out")]
+    cmd.extend(["--candidates", "10", "--keep", "2", "--seed", "3"])
+    with replace_targets():
+        result = run_cmd(cmd)
+
+    assert not result.exit_code, result.output
+    assert "[*] Seeded from 2 targets, median cost per token: " in result.output
+    assert "[*] Timed 10/10 candidates." in result.output
+    mined = sorted((tmp_path / "out").iterdir())
+    assert len(mined) == 2
+    for path in mined:
+        code = path.read_text("utf8")
+        assert code.startswith("# Mined with `blackbench mine --seed 3` from ")
+        assert f"mined/{path.stem}" in result.output
+        try:
+            black.format_file_contents(code, fast=False, mode=black.FileMode())
+        except black.NothingChanged:
+            pass
+
+    # Nothing is written into the package unless asked to.
+    monkeypatch.chdir(tmp_path / "cwd")
+    with replace_targets():
+        result = run_cmd(["mine", "-t", "hello-world", "--candidates", "2", "--keep", "1"])
+    assert not result.exit_code, result.output
+    assert len(list(Path.cwd().glob("*.py"))) == 1
+
+    with replace_targets():
+        result = run_cmd(["mine", "-t", "hello-world", "--format-config", "nope"])
+    assert result.exit_code == 2
+    assert "Invalid black.Mode configuration: nope" in result.output
+
+
+def fake_timers(slow_on: str) -> Callable:
+    """Pretend the candidate (the second timer created) is twice as slow on some code."""
+    created = []
+
+    def create(python: str, mode: str, *, repeat: int) -> nullcontext:
+        factor = 2 if created else 1
+        created.append(python)
+        return nullcontext(lambda code: len(code) * (factor if slow_on in code else 1))
+
+    return create
+
+
+def test_reduce_cmd(tmp_path: Path, run_cmd, monkeypatch) -> None:
+    # Without -o, the reduced target is written to the current directory.
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "reduced-hello-world.py"
+    cmd = ["reduce", "-t", "hello-world", "--baseline", sys.executable]
+    cmd.extend(["--candidate", sys.executable])
+    with replace_targets(), patch("blackbench.FormattingTimer", fake_timers("open_ += 1")):
+        result = run_cmd(cmd)
+
+    assert not result.exit_code, result.output
+    assert "[*] Reducing `hello-world` (74 lines, 2.00x slower)." in result.output
+    assert "[*] Reduced to " in result.output
+    code = output.read_text("utf8")
+    assert code.startswith("# Reduced with `blackbench reduce -t hello-world` from 74 lines.\n")
+    _, reduced = code.split("\n\n", maxsplit=1)
+    # Only what's needed to keep the (fake) slowdown is left.
+    assert reduced == (
+        "def cal_open_issues_over_time(days, issues):\n"
+        "    for day in days:\n"
+        "        for i in issues:\n"
+        "            if i.created_at.date() <= day:\n"
+        "                if i.closed_at is None:\n"
+        "                    open_ += 1\n"
+    )
+
+
+def test_reduce_cmd_without_slowdown(run_cmd) -> None:
+    cmd = ["reduce", "-t", "hello-world", "--baseline", sys.executable]
+    cmd.extend(["--candidate", sys.executable])
+    with replace_targets(), patch("blackbench.FormattingTimer", fake_timers("nowhere")):
+        result = run_cmd(cmd)
+    assert result.exit_code == 1
+    assert "The candidate isn't slower than the baseline on `hello-world` (1.00x)" in result.output
+
+    with replace_targets():
+        result = run_cmd(["reduce", "-t", "micro", *cmd[3:]])
+    assert result.exit_code == 2
+    assert "Only a single target can be reduced, 'micro' is a group of targets." in result.output
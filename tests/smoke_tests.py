@@ -15,6 +15,17 @@
 
 @pytest.mark.parametrize("task", resources.tasks.keys())
 def test_provided_tasks(task: str, tmp_path: Path, tmp_result: Path, run_cmd):
+    if task == "fmt-ipynb":
+        pytest.importorskip("IPython")
+        pytest.importorskip("tokenize_rt")
+        # There's no notebook among the test targets, use the smallest provided one.
+        cmd = ["run", str(tmp_result), "--task", task, "-t", "notebook-cells"]
+        with patch("subprocess.run", fast_run):
+            result = run_cmd(cmd)
+        assert not result.exit_code
+        assert "ERROR" not in result.output and "WARNING" not in result.output
+        return
+
     cmd = ["run", str(tmp_result), "--task", task, "-t", "tiny"]
     if task.startswith("fmt"):
         cmd.extend(["--format-config", "is_pyi=True"])
@@ -33,9 +44,19 @@ def test_provided_targets(tmp_result: Path, run_cmd, target: Target):
     # don't @ me about internal APIs and whatnot, it's fine (take it from a maintainer of black
     # :P). Although seriously please try to avoid using Black's internal APIs as much as possible
     # because their external usages makes maintenance harder :/
+    mode = black.FileMode(is_pyi=target.path.suffix == ".pyi")
+    if target.path.suffix == ".ipynb":
+        pytest.importorskip("IPython")
+        pytest.importorskip("tokenize_rt")
+        mode = black.FileMode(is_ipynb=True)
     code = target.path.read_text("utf8")
+    if target.stress:
+        # Formatting these takes way too long for a smoke test, parsing will have to do.
+        black.lib2to3_parse(code)
+        return
+
     try:
-        black.format_file_contents(code, fast=False, mode=black.FileMode())
+        black.format_file_contents(code, fast=False, mode=mode)
     except black.NothingChanged:
         pass
 
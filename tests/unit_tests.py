@@ -1,18 +1,30 @@
 # mypy: disallow_untyped_defs=False
 # mypy: disallow_incomplete_defs=False
 
+import ast
+import cProfile
+import itertools
+import json
+import pstats
+import random
+import subprocess
+import sys
 from dataclasses import replace
+from io import StringIO
 from pathlib import Path
+from types import ModuleType
 from typing import Dict, Optional
 from unittest.mock import patch
 
 import click
+import pyperf
 import pytest
 
 import blackbench
 from blackbench import Benchmark
 
 from .utils import (
+    DATA_DIR,
     DIR_SEP,
     PAINT_TASK,
     TASKS_DIR,
@@ -96,6 +108,113 @@ def test_task_create_benchmark(task_name: str) -> None:
     assert bm.description == f"{task.description} + "
 
 
+@pytest.mark.parametrize(
+    "format_config, expected",
+    [
+        ("", "is_pyi=True"),
+        ("line_length=100", "line_length=100, is_pyi=True"),
+        ("is_pyi=False", "is_pyi=False"),
+    ],
+)
+def test_task_create_benchmark_with_stub(format_config: str, expected: str) -> None:
+    task = replace(TEST_TASKS["fmt"], custom_mode=format_config)
+    target = blackbench.Target(TEST_NORMAL_PATH / "goodbye-internet.pyi", micro=False)
+    with replace_resources():
+        bm = Benchmark(task, target)
+    assert f"black.FileMode({expected})" in bm.code
+
+
+def fake_pyperf_run(value: float, timeout_after: int = 0):
+    """A subprocess.run replacement that writes a single value benchmark."""
+    calls = []
+
+    def run(cmd, *args, **kwargs):
+        calls.append(cmd)
+        if timeout_after and len(calls) > timeout_after:
+            raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+        run = pyperf.Run([value], metadata={"name": "x", "unit": "second"}, collect_metadata=False)
+        output = cmd[cmd.index("--output") + 1]
+        pyperf.Benchmark([run]).dump(output)
+
+    return run, calls
+
+
+@pytest.mark.parametrize(
+    "value, pyperf_args, timeout_after, expected",
+    [
+        (0.01, ["--fast"], 0, ["--fast"]),
+        (2.0, [], 0, ["--processes", "3", "--values", "3"]),
+        (
+            2.0,
+            ["--fast", "--affinity", "2"],
+            0,
+            ["--affinity", "2", "--processes", "4", "--values", "2"],
+        ),
+        (2.0, ["-p", "2"], 0, ["-p", "2"]),
+        (2.0, ["--processes", "10", "--values", "1"], 0, ["--processes", "6", "--values", "1"]),
+        (
+            2.0,
+            ["--values=5", "--affinity", "2"],
+            0,
+            ["--affinity", "2", "--processes", "2", "--values", "5"],
+        ),
+        (20.0, [], 0, None),
+        (2.0, [], 1, None),
+    ],
+    ids=[
+        "fits",
+        "capped",
+        "capped-fast",
+        "fits-user-processes",
+        "capped-user-processes",
+        "capped-user-values",
+        "single-call",
+        "timeout",
+    ],
+)
+def test_run_capped(tmp_path: Path, value, pyperf_args, timeout_after, expected) -> None:
+    run, calls = fake_pyperf_run(value, timeout_after)
+    result_file = tmp_path / "1.json"
+    with patch("subprocess.run", run):
+        blackbench.run_capped(["python", "1.py"], result_file, pyperf_args, max_time=30)
+
+    assert calls[0][-1] == "--debug-single-value" and "--fast" not in calls[0]
+    if expected is None:
+        # Only the single timed call is kept.
+        assert len(calls) == 1 + bool(timeout_after)
+    else:
+        assert len(calls) == 2
+        assert calls[1][4:] == expected
+    assert pyperf.Benchmark.load(str(result_file)).get_values() == (value,)
+
+
+@pytest.mark.parametrize(
+    "pyperf_args, fast, expected",
+    [
+        (("--values", "3"), False, ["--values", "3"]),
+        (("--values", "3"), True, ["--values", "3", "--fast"]),
+        (("--fast",), True, ["--fast"]),
+    ],
+)
+def test_prep_pyperf_args(pyperf_args, fast, expected) -> None:
+    assert blackbench.prep_pyperf_args(pyperf_args, fast) == expected
+
+
+def test_run_config() -> None:
+    target = blackbench.Target(TEST_MICRO_PATH / "ello.py", micro=True, description="")
+    with replace_resources():
+        config = blackbench.run_config(
+            PAINT_TASK, [target], "line_length=1", pyperf_args=["--fast"], max_time=None
+        )
+    assert config == {
+        "task": "paint",
+        "targets": ["ello"],
+        "format-config": "line_length=1",
+        "pyperf-args": ["--fast"],
+        "max-time": None,
+    }
+
+
 def test_managed_workdir(tmp_path, capsys):
     with patch("tempfile.tempdir", str(tmp_path)), pytest.raises(RuntimeError):
         with blackbench.utils.managed_workdir():
@@ -134,3 +253,525 @@ def test_target_name_has_no_backslashes() -> None:
     target = blackbench.resources.normal_targets[0]
     assert target.name.count("/") == 1
     assert not target.name.count("\\")
+
+
+def test_results_store_roundtrip(tmp_path: Path) -> None:
+    suite = pyperf.BenchmarkSuite.loads((DATA_DIR / "all.results.json").read_text("utf8"))
+    with blackbench.ResultsStore(tmp_path / "history.db") as store:
+        store.record_suite(suite, {"task": "fmt"})
+        store.record_suite(suite, {"task": "fmt"})
+        names = store.benchmark_names()
+        assert names == sorted(bm.get_name() for bm in suite.get_benchmarks())
+
+        bm = suite.get_benchmark(names[0])
+        entries = store.history(names[0])
+        assert len(entries) == 2
+        assert entries[0].values == list(bm.get_values())
+        assert entries[0].mean == pytest.approx(bm.mean())
+        assert entries[0].host == "acer-ubuntu"
+        assert entries[0].unit == "second"
+        assert not store.history(names[0], black_version="0.0")
+
+
+@pytest.mark.parametrize(
+    "value, unit, expected",
+    [
+        (1.5, "second", "1.50 sec"),
+        (0.0432, "second", "43.2 ms"),
+        (0.479, "second", "479 ms"),
+        (2.5e-6, "second", "2.50 us"),
+        (1024, "byte", "1,024 bytes"),
+    ],
+)
+def test_format_value(value: float, unit: str, expected: str) -> None:
+    assert blackbench.utils.format_value(value, unit) == expected
+
+
+def test_mann_whitney_u() -> None:
+    baseline = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98, 1.01]
+    slower = [v * 1.2 for v in baseline]
+    assert blackbench.stats.mann_whitney_u(baseline, slower) < 0.001
+    assert blackbench.stats.mann_whitney_u(slower, baseline) > 0.999
+    assert 0.3 < blackbench.stats.mann_whitney_u(baseline, baseline) < 0.7
+    assert blackbench.stats.mann_whitney_u([1.0, 1.0], [1.0, 1.0]) == 1.0
+
+
+def test_holm_bonferroni() -> None:
+    adjusted = blackbench.stats.holm_bonferroni([0.01, 0.04, 0.03, 0.5])
+    assert adjusted == pytest.approx([0.04, 0.09, 0.09, 0.5])
+
+
+def test_detect_change_points() -> None:
+    rng = random.Random(1)
+    series = [rng.gauss(1.0, 0.02) for _ in range(15)] + [rng.gauss(1.1, 0.02) for _ in range(10)]
+    series += [rng.gauss(1.05, 0.02) for _ in range(10)]
+    assert blackbench.stats.detect_change_points(series) == [15, 25]
+    noise = [rng.gauss(1.0, 0.02) for _ in range(40)]
+    assert blackbench.stats.detect_change_points(noise) == []
+    # Noiseless series (eg. instruction counts) are handled too.
+    assert blackbench.stats.detect_change_points([5.0] * 6 + [6.0] * 6) == [6]
+    assert blackbench.stats.detect_change_points([1e9] * 6 + [1.001e9] * 6) == [6]
+    assert blackbench.stats.detect_change_points([1.0] * 6) == []
+    assert blackbench.stats.detect_change_points([1.0, 2.0]) == []
+
+
+def test_summarize_suite() -> None:
+    suite = pyperf.BenchmarkSuite.loads((DATA_DIR / "all.results.json").read_text("utf8"))
+    # Older result files don't have the metadata required for grouping.
+    (summary,) = blackbench.stats.summarize_suite(suite)
+    assert summary.group == "all"
+    assert summary.count == 4
+    means = [bm.mean() for bm in suite.get_benchmarks()]
+    assert summary.geomean == pytest.approx(blackbench.stats.geometric_mean(means))
+    assert min(means) < summary.low < summary.geomean < summary.high < max(means)
+    assert blackbench.stats.summarize_suite(suite) == [summary], "CI should be reproducible"
+
+    for bm in suite.get_benchmarks():
+        bm.update_metadata({"task": "paint", "target-group": "normal"})
+    groups = [s.group for s in blackbench.stats.summarize_suite(suite)]
+    assert groups == ["all", "normal", "task-paint"]
+
+
+def test_collapse_stats() -> None:
+    def leaf() -> int:
+        return sum(range(20_000))
+
+    def middle() -> None:
+        for _ in range(5):
+            leaf()
+
+    def root() -> None:
+        middle()
+        leaf()
+
+    # A clock that ticks once per profiler event keeps this independent of machine load.
+    ticks = itertools.count()
+    profiler = cProfile.Profile(lambda: next(ticks), 1e-3)
+    profiler.runcall(root)
+    stacks = blackbench.profiling.collapse_stats(pstats.Stats(profiler))
+
+    prefix = "unit_tests.py:root"
+    assert all(stack.startswith(prefix) for stack in stacks)
+    via_middle = stacks[f"{prefix};unit_tests.py:middle;unit_tests.py:leaf"]
+    direct = stacks[f"{prefix};unit_tests.py:leaf"]
+    # middle() calls leaf() five times as often, the time should be distributed to match.
+    assert via_middle == pytest.approx(5 * direct)
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("/venv/lib/python3.9/site-packages/black/linegen.py", "black/linegen.py"),
+        ("C:\\Python39\\lib\\site-packages\\black\\nodes.py", "black/nodes.py"),
+        ("/usr/lib/python3.8/tokenize.py", "tokenize.py"),
+        ("/tmp/blackbench-workdir-1234/1.py", "1.py"),
+    ],
+)
+def test_short_filename(filename: str, expected: str) -> None:
+    assert blackbench.profiling.short_filename(filename) == expected
+
+
+def test_diff_stats() -> None:
+    def work(n: int) -> int:
+        return sum(range(n))
+
+    def shared() -> None:
+        work(10_000)
+
+    def baseline() -> None:
+        shared()
+
+    def candidate() -> None:
+        shared()
+        work(1_000_000)
+
+    profiles = []
+    for func in (baseline, candidate):
+        profiler = cProfile.Profile()
+        profiler.runcall(func)
+        profiles.append(pstats.Stats(profiler))
+
+    deltas = blackbench.profiling.diff_stats(*profiles, loops=1)
+    by_label = {d.label: d for d in deltas}
+    # The two root functions have different names so they're treated as different.
+    assert by_label["unit_tests.py:baseline"].candidate_cumulative == 0
+    assert by_label["unit_tests.py:candidate"].baseline_cumulative == 0
+    # The extra sum(range(...)) call should be the biggest contributor to the regression.
+    assert deltas[0].label == "<built-in method builtins.sum>"
+    assert deltas[0].self_delta > 0
+    assert by_label["unit_tests.py:work"].candidate_cumulative >= deltas[0].candidate_self
+    assert deltas == sorted(deltas, key=lambda d: -d.self_delta)
+
+
+def run_hooked_garbage_benchmark(script: Path, *hooks: blackbench.hooks.WorkerHook) -> None:
+    body = (
+        "import pyperf\n"
+        "def func():\n"
+        "    [[object()] for _ in range(10_000)]\n"
+        "pyperf.Runner().bench_func('garbage', func)\n"
+    )
+    prologue = "".join(hook.render() + "\n\n" for hook in hooks)
+    script.write_text(prologue + body, encoding="utf8")
+    # fmt: off
+    subprocess.run(
+        [sys.executable, str(script), "-p", "2", "-l", "1", "-n", "2", "-w", "0", "--quiet",
+         "--output", str(script.with_suffix(".json"))],
+        check=True,
+    )
+    # fmt: on
+
+
+def test_gc_metrics_hook(tmp_path: Path) -> None:
+    hook = blackbench.hooks.GCMetricsHook()
+    script = tmp_path / "1.py"
+    run_hooked_garbage_benchmark(script, hook)
+
+    metadata = hook.collect(script)
+    assert len((tmp_path / "1.gc-metrics.jsonl").read_text("utf8").splitlines()) == 2
+    assert metadata["gc-collections-gen0"] > 0
+    assert metadata["gc-time"] > 0
+    assert metadata["alloc-blocks-peak"] > 0
+    assert "collections (gen 0 / 1 / 2)" in str(hook.summarize(metadata))
+    assert hook.collect(tmp_path / "2.py") == {}
+
+
+@pytest.mark.parametrize("mode", ["disabled", "frozen", "threshold=100000"])
+def test_gc_mode_hook(tmp_path: Path, mode: str) -> None:
+    hook = blackbench.hooks.GCModeHook(mode)
+    assert hook.tag == f"gc={mode}"
+    assert blackbench.hooks.GCModeHook("default").tag is None
+    metrics = blackbench.hooks.GCMetricsHook()
+    script = tmp_path / "1.py"
+    run_hooked_garbage_benchmark(script, hook, metrics)
+
+    collections = metrics.collect(script)["gc-collections-gen0"]
+    if mode == "frozen":
+        assert collections > 0
+    else:
+        assert collections == 0
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="perf events are Linux-only")
+def test_perf_counters_hook(tmp_path: Path) -> None:
+    # Hardware counters usually aren't available in VMs / containers, software ones are.
+    hook = blackbench.hooks.PerfCountersHook(["task-clock", "page-faults"])
+    script = tmp_path / "1.py"
+    run_hooked_garbage_benchmark(script, hook)
+
+    metadata = hook.collect(script)
+    assert set(metadata) == {"perf-task-clock", "perf-page-faults"}
+    assert metadata["perf-task-clock"] > 0
+    assert str(hook.summarize(metadata)).startswith("Perf counters (per call):")
+
+
+def test_host_fingerprint() -> None:
+    info = blackbench.host.fingerprint()
+    assert info["host-cpu-model"]
+    for value in info.values():
+        assert isinstance(value, (int, float, str)) and value != ""
+    assert blackbench.host.measure_noise(samples=5, warmups=1) >= 0
+
+    hints = blackbench.host.stability_hints(
+        {"host-cpu-governor": "powersave", "host-isolated-cpus": "2-3", "host-load-avg": 3.5}
+    )
+    assert hints == [
+        "the CPU frequency governor 'powersave' changes the frequency on the fly",
+        "the load average is 3.5",
+    ]
+
+
+def test_tag_interpreters() -> None:
+    Interpreter = blackbench.interpreters.Interpreter
+    py38 = Interpreter("/py38/bin/python", "cpython", "3.8.12", "22.1.0")
+    py311 = Interpreter("/py311/bin/python", "cpython", "3.11.4", "22.1.0")
+    pypy = Interpreter("/pypy/bin/python", "pypy", "3.9.16", "22.1.0")
+    tags = [i.tag for i in blackbench.interpreters.tag_interpreters([py38, py311, pypy])]
+    assert tags == ["py=3.8", "py=3.11", "py=pypy3.9"]
+
+    old = replace(py311, path="/old/bin/python", black_version="21.12b0")
+    tags = [i.tag for i in blackbench.interpreters.tag_interpreters([py311, old])]
+    assert tags == ["py=3.11-black22.1.0", "py=3.11-black21.12b0"]
+    tags = [i.tag for i in blackbench.interpreters.tag_interpreters([py38, py38])]
+    assert tags == ["py=3.8-black22.1.0-1", "py=3.8-black22.1.0-2"]
+
+
+SEED_SOURCE = """\
+import os
+
+
+@decorator
+def function(argument, *, keyword=None):
+    values = [call(argument), {"key": keyword}]
+    return values and os.path.join(*values)
+
+
+CONSTANT = {
+    "a": 1,
+    "b": (2, 3),  # comment
+}
+"""
+
+
+def test_statement_spans() -> None:
+    assert blackbench.mining.statement_spans(SEED_SOURCE) == [(0, 1), (3, 7), (9, 13)]
+
+
+def test_count_tokens() -> None:
+    count_tokens = blackbench.mining.count_tokens
+    assert count_tokens("x = [1, 2]  # comment\n") == 8
+    # Layout isn't counted, so spreading code over more lines changes nothing.
+    assert count_tokens("if x:\n    y = (\n        1\n    )\n") == count_tokens("if x: y = (1)\n")
+
+
+@pytest.mark.parametrize("mutation", blackbench.mining.MUTATIONS)
+def test_mining_mutations(mutation: str) -> None:
+    mutate = blackbench.mining.MUTATIONS[mutation]
+    outputs = set()
+    for seed in range(5):
+        code = mutate(SEED_SOURCE, random.Random(seed))
+        ast.parse(code)
+        outputs.add(code)
+        # Mutations are deterministic for a given seed.
+        assert code == mutate(SEED_SOURCE, random.Random(seed))
+    assert outputs != {SEED_SOURCE}
+
+
+def test_generate_candidates() -> None:
+    seeds = {"a": SEED_SOURCE, "b": "x = [1, 2, 3]\n"}
+    candidates = blackbench.mining.generate_candidates(seeds, 20, random.Random(0), max_lines=3)
+    assert len(candidates) == 20
+    for candidate in candidates:
+        ast.parse(candidate.code)
+        name, *mutations = candidate.origin.split("+")
+        assert name in seeds and 1 <= len(mutations) <= 3
+        assert set(mutations) <= set(blackbench.mining.MUTATIONS)
+        # The function and CONSTANT are longer than 3 lines, so they never make it in.
+        assert "def function" not in candidate.code and "CONSTANT" not in candidate.code
+
+
+REDUCIBLE_SOURCE = """\
+import os
+
+# Slow stuff.
+
+def function(argument):
+    if argument:
+        fast(argument)
+        slow(argument)
+    else:
+        fast()
+    return argument
+
+
+CONSTANT = slow(1)
+"""
+
+
+def test_all_statement_spans() -> None:
+    spans = blackbench.reduction.all_statement_spans(REDUCIBLE_SOURCE)
+    assert spans == [(0, 1), (4, 11), (5, 10), (6, 7), (7, 8), (8, 10), (9, 10), (10, 11), (13, 14)]
+    assert blackbench.reduction.filler_spans(REDUCIBLE_SOURCE) == [(1, 4), (11, 13)]
+
+
+def test_all_statement_spans_with_clauses() -> None:
+    source = (
+        "if a:\n"  # 0
+        "    pass\n"
+        "else:\n"  # 2
+        "    elsewhere = 1\n"
+        "if b:\n"  # 4
+        "    pass\n"
+        "elif c:\n"  # 6
+        "    pass\n"
+        "try:\n"  # 8
+        "    pass\n"
+        "except E:\n"  # 10
+        "    pass\n"
+        "# else: not this one\n"
+        "else: pass\n"  # 13
+        "finally:\n"  # 14
+        "    pass\n"
+    )
+    spans = blackbench.reduction.all_statement_spans(source)
+    # The else clauses of the first if and the try, and the finally clause. The elif is a
+    # statement of its own and there's no else clause for the second if.
+    clauses = {(2, 4), (13, 14), (14, 16)}
+    statements = {(0, 4), (1, 2), (3, 4), (4, 8), (5, 6), (6, 8), (7, 8)}
+    statements |= {(8, 16), (9, 10), (10, 12), (11, 12), (13, 14), (15, 16)}
+    assert set(spans) == clauses | statements
+
+
+def test_reduce_source() -> None:
+    tested = []
+
+    def interesting(code: str) -> bool:
+        tested.append(code)
+        return "slow(argument)" in code
+
+    reduced = blackbench.reduction.reduce_source(REDUCIBLE_SOURCE, interesting)
+    assert reduced == "def function(argument):\n    if argument:\n        slow(argument)\n"
+    # Code that doesn't parse (eg. an empty block) is never tested.
+    for code in tested:
+        ast.parse(code)
+
+
+def test_formatting_timer() -> None:
+    with blackbench.reduction.FormattingTimer(sys.executable, "line_length=1", repeat=2) as timer:
+        assert timer("x = [1, 2, 3]\n") > 0
+        # Black failing to format the code isn't fatal.
+        assert timer("print 'hello'\n") is None
+        assert timer("def f(): pass\n") > 0
+
+
+def test_scaling_exponent() -> None:
+    scaling_exponent = blackbench.stats.scaling_exponent
+    assert scaling_exponent([40, 80, 160], [4.0, 2.0, 1.0]) == pytest.approx(-1)
+    assert scaling_exponent([40, 80, 160], [3.0, 3.0, 3.0]) == pytest.approx(0)
+    with pytest.raises(ValueError):
+        scaling_exponent([88, 88], [1.0, 2.0])
+
+
+def test_latency_percentiles() -> None:
+    latency_percentiles = blackbench.stats.latency_percentiles
+    values = [float(n) for n in range(1, 102)]
+    assert latency_percentiles(values) == {"p50": 51.0, "p95": 96.0, "p99": 100.0}
+    assert latency_percentiles([0.5]) == {"p50": 0.5, "p95": 0.5, "p99": 0.5}
+
+
+def test_mode_configs() -> None:
+    mode_configs = blackbench.modes.mode_configs
+    configs = mode_configs(
+        ["line_length=[79, 120], magic_trailing_comma=(True, False)"], "is_pyi=True"
+    )
+    assert [c.tag for c in configs] == [
+        "ll=79,mtc=True",
+        "ll=79,mtc=False",
+        "ll=120,mtc=True",
+        "ll=120,mtc=False",
+    ]
+    assert configs[1].config == "is_pyi=True, line_length=79, magic_trailing_comma=False"
+
+    versions = "{black.TargetVersion.PY38, black.TargetVersion.PY39}"
+    configs = mode_configs([f"target_versions={versions}, line_length=100", "is_pyi=True"])
+    assert [c.tag for c in configs] == ["tv=PY38+PY39,ll=100", "pyi=True"]
+    assert configs[0].config == f"target_versions={versions}, line_length=100"
+    assert [c.tag for c in mode_configs(["line_length=88"])] == ["ll=88"]
+
+    for matrix in ("line_length=[]", "88", "**{}", "line_length=", ""):
+        with pytest.raises(ValueError):
+            blackbench.modes.expand_mode_matrix(matrix)
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("black/__init__.py", False),
+        ("black/__init__.cpython-311-x86_64-linux-gnu.so", True),
+        ("black/__init__.cp311-win_amd64.pyd", True),
+    ],
+)
+def test_is_compiled(filename: str, expected: bool) -> None:
+    module = ModuleType("black")
+    module.__file__ = f"/site-packages/{filename}"
+    assert blackbench.interpreters.is_compiled(module) is expected
+
+
+def test_parse_cachegrind_total(tmp_path: Path) -> None:
+    output = tmp_path / "cachegrind.out"
+    output.write_text(
+        "desc: I1 cache: 32768 B, 64 B, 8-way associative\n"
+        "cmd: python count-harness.py 1.py --loops 5\n"
+        "events: Ir\n"
+        "fl=???\nfn=0x0000000000001100\n0 1234\n"
+        "summary: 987654321\n",
+        encoding="utf8",
+    )
+    assert blackbench.counting.parse_cachegrind_total(output) == 987654321
+    output.write_text("events: Ir\n", encoding="utf8")
+    with pytest.raises(ValueError):
+        blackbench.counting.parse_cachegrind_total(output)
+
+
+def test_count_harness_without_counters(tmp_path: Path) -> None:
+    script = tmp_path / "1.py"
+    script.write_text(
+        "import pyperf\n"
+        "calls = []\n"
+        "pyperf.Runner().bench_func('counted', calls.append, 1)\n"
+        "print(len(calls))\n",
+        encoding="utf8",
+    )
+    output = tmp_path / "1.count.json"
+    # fmt: off
+    proc = subprocess.run(
+        [sys.executable, str(blackbench.counting.HARNESS), str(script), "--loops", "4",
+         "--backend", "none", "--output", str(output)],
+        check=True, stdout=subprocess.PIPE, encoding="utf8",
+    )
+    # fmt: on
+    assert proc.stdout.strip() == "5"
+    assert json.loads(output.read_text("utf8")) == {
+        "name": "counted",
+        "loops": 4,
+        "instructions": None,
+    }
+
+
+def test_results_stream(tmp_path: Path) -> None:
+    stream = blackbench.formats.stream_path(tmp_path / "results.json")
+    assert stream.name == "results.json.jsonl"
+    suite = pyperf.BenchmarkSuite.load(str(DATA_DIR / "all.results.json"))
+    for bm in suite.get_benchmarks():
+        blackbench.formats.append_to_stream(stream, bm)
+        # Every line is a complete pyperf JSON document.
+        last_line = stream.read_text("utf8").splitlines()[-1]
+        assert pyperf.BenchmarkSuite.loads(last_line).get_benchmark_names() == [bm.get_name()]
+
+    consolidated = blackbench.formats.read_stream(stream)
+    assert consolidated is not None
+    assert consolidated.get_benchmark_names() == suite.get_benchmark_names()
+    for bm in suite.get_benchmarks():
+        assert consolidated.get_benchmark(bm.get_name()).get_values() == bm.get_values()
+
+    # An interrupted write leaves a truncated last line behind, which is skipped.
+    with open(stream, "a", encoding="utf8") as f:
+        f.write('{"benchmarks": [{"runs"')
+    consolidated = blackbench.formats.read_stream(stream)
+    assert consolidated is not None
+    assert len(consolidated) == len(suite)
+
+
+def suite_as_json(suite: pyperf.BenchmarkSuite) -> Dict:
+    with StringIO() as f:
+        suite.dump(f)
+        return json.loads(f.getvalue())
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_compact_results_roundtrip(tmp_path: Path, compression: str) -> None:
+    suite = pyperf.BenchmarkSuite.load(str(DATA_DIR / "all.results.json"))
+    path = tmp_path / "results.bbr"
+    try:
+        blackbench.formats.dump_compact(suite, path, compression)
+    except RuntimeError:
+        pytest.skip("zstd isn't available")
+
+    assert blackbench.formats.is_compact_results(path)
+    assert not blackbench.formats.is_compact_results(DATA_DIR / "all.results.json")
+    # Everything (values, warmups, and metadata) should survive the trip.
+    assert suite_as_json(blackbench.formats.load_results(path)) == suite_as_json(suite)
+
+    with blackbench.formats.CompactResults(path) as results:
+        assert results.get_benchmark_names() == suite.get_benchmark_names()
+        for bm in suite.get_benchmarks():
+            name = bm.get_name()
+            assert tuple(results.get_values(name)) == bm.get_values()
+            assert results.get_unit(name) == bm.get_unit()
+            assert results.get_metadata(name) == json.loads(json.dumps(bm.get_metadata()))
+
+
+def test_compact_results_with_invalid_file(tmp_path: Path) -> None:
+    path = tmp_path / "results.bbr"
+    path.write_bytes(b"BBR\x07\x00\x00\x00\x00")
+    with pytest.raises(ValueError, match="unsupported format version"):
+        blackbench.formats.CompactResults(path)
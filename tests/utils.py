@@ -47,9 +47,17 @@
         description="c",
     ),
     "tiny": Target(TEST_MICRO_PATH / "tiny.py", micro=True, description="very tiny indeed"),
+    "mined/slow": Target(
+        TEST_MICRO_PATH / "mined" / "slow.py", micro=True, description="e", ungrouped=True
+    ),
+    "stress/huge": Target(
+        TEST_NORMAL_PATH / "stress" / "huge.py", micro=False, description="d", stress=True
+    ),
 }
-TEST_MICRO_TARGETS = [t for t in TEST_TARGETS.values() if t.micro]
-TEST_NORMAL_TARGETS = [t for t in TEST_TARGETS.values() if not t.micro]
+TEST_MICRO_TARGETS = [t for t in TEST_TARGETS.values() if t.micro and not t.ungrouped]
+TEST_NORMAL_TARGETS = [t for t in TEST_TARGETS.values() if not t.micro and not t.stress]
+TEST_STRESS_TARGETS = [t for t in TEST_TARGETS.values() if t.stress]
+TEST_UNGROUPED_TARGETS = [t for t in TEST_TARGETS.values() if t.ungrouped]
 
 PAINT_TASK = TEST_TASKS["paint"]
 
@@ -74,11 +82,17 @@ def replace_targets() -> Iterator:
     targets_patcher = patch("blackbench.resources.targets", TEST_TARGETS)
     normal_targets_patcher = patch("blackbench.resources.normal_targets", TEST_NORMAL_TARGETS)
     micro_targets_patcher = patch("blackbench.resources.micro_targets", TEST_MICRO_TARGETS)
+    stress_targets_patcher = patch("blackbench.resources.stress_targets", TEST_STRESS_TARGETS)
+    ungrouped_targets_patcher = patch(
+        "blackbench.resources.ungrouped_targets", TEST_UNGROUPED_TARGETS
+    )
     normal_dir_patcher.start()
     micro_dir_patcher.start()
     targets_patcher.start()
     normal_targets_patcher.start()
     micro_targets_patcher.start()
+    stress_targets_patcher.start()
+    ungrouped_targets_patcher.start()
     try:
         yield
     finally:
@@ -87,6 +101,8 @@ def replace_targets() -> Iterator:
         targets_patcher.stop()
         normal_targets_patcher.stop()
         micro_targets_patcher.stop()
+        stress_targets_patcher.stop()
+        ungrouped_targets_patcher.stop()
 
 
 def bm_run_mock_helper(mock_results: List[Path]) -> Callable:
@@ -126,6 +142,12 @@ def fast_run(cmd: List[str], *args: Any, **kwargs: Any) -> subprocess.CompletedP
     return _original_run(cmd, *args, **kwargs)
 
 
+def few_values_run(cmd: List[str], *args: Any, **kwargs: Any) -> subprocess.CompletedProcess:
+    # Unlike fast_run, the loops are left alone (eg. the edit task's single call per value).
+    cmd.extend(["-w", "0", "-p", "2", "--values", "5"])
+    return _original_run(cmd, *args, **kwargs)
+
+
 def get_subprocess_run_commands(mock: Mock) -> List[List[str]]:
     return [call_args[0][0] for call_args in mock.call_args_list[1:]]
 